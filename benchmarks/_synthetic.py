@@ -0,0 +1,90 @@
+"""
+Synthetic road networks and place names for benchmarks.
+Single responsibility: Reproducible OSMnx-shaped grid graphs, place names and the src import path.
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+for _path in (REPO_ROOT / "src", REPO_ROOT):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import networkx as nx
+
+# Grid origin near central Addis Ababa and spacing of roughly 110 m
+ORIGIN_LAT = 9.0
+ORIGIN_LON = 38.75
+SPACING_DEG = 0.001
+
+_HIGHWAYS = ("residential", "residential", "tertiary", "secondary", "primary")
+
+_SYLLABLES = ("a", "ba", "bo", "le", "me", "ske", "ka", "za", "nchi", "pi", "assa", "ra", "t",
+              "ki", "lo", "go", "te", "ge", "na", "gna", "se", "ar", "bet", "me", "dha", "ne", "lem")
+_FEATURES = ("", "", "", "Square", "Road", "School", "Hospital", "Church", "Market", "Hotel", "Cafe")
+
+
+def grid_graph(size: int = 100, seed: int = 1, removed_fraction: float = 0.1) -> nx.MultiGraph:
+    """
+    Build a jittered square street grid with OSMnx-style attributes.
+
+    Args:
+        size: Nodes per side (the graph has size * size nodes)
+        seed: Random seed
+        removed_fraction: Share of edges removed to create dead ends and detours
+
+    Returns:
+        MultiGraph with node 'x'/'y' and edge 'length'/'highway'/'name'
+    """
+    rng = random.Random(seed)
+    graph = nx.MultiGraph()
+
+    for i in range(size):
+        for j in range(size):
+            graph.add_node(
+                1000 + i * size + j,
+                y=ORIGIN_LAT + i * SPACING_DEG + rng.uniform(-2e-4, 2e-4),
+                x=ORIGIN_LON + j * SPACING_DEG + rng.uniform(-2e-4, 2e-4),
+            )
+
+    for i in range(size):
+        for j in range(size):
+            u = 1000 + i * size + j
+            for di, dj in ((0, 1), (1, 0)):
+                if i + di >= size or j + dj >= size:
+                    continue
+                if rng.random() < removed_fraction:
+                    continue
+                v = 1000 + (i + di) * size + j + dj
+                du, dv = graph.nodes[u], graph.nodes[v]
+                straight = math.hypot((du['y'] - dv['y']) * 110574, (du['x'] - dv['x']) * 109951)
+                graph.add_edge(
+                    u, v,
+                    length=straight * rng.uniform(1.0, 1.3),
+                    highway=rng.choice(_HIGHWAYS),
+                    name=f"Street {i}" if di == 0 else f"Avenue {j}",
+                )
+
+    return graph
+
+
+def random_pairs(graph, count: int, seed: int = 2):
+    """Reproducible (start, goal) node pairs."""
+    rng = random.Random(seed)
+    nodes = sorted(graph.nodes)
+    return [tuple(rng.sample(nodes, 2)) for _ in range(count)]
+
+
+def place_names(count: int = 20000, seed: int = 3):
+    """Reproducible, distinct Amharic-sounding place names of one to three words."""
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < count:
+        words = ["".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+                 for _ in range(rng.randint(1, 2))]
+        feature = rng.choice(_FEATURES)
+        names.add(" ".join(words + [feature] if feature else words))
+    return sorted(names)
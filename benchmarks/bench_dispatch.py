@@ -0,0 +1,111 @@
+"""
+Benchmark: nearest-available-vehicle dispatch.
+Single responsibility: Report vehicle index update rate and k-nearest query latency against a full search.
+
+Usage:
+    python benchmarks/bench_dispatch.py [--size 100] [--vehicles 1000] [--queries 300]
+"""
+
+import argparse
+import math
+import time
+
+from _synthetic import grid_graph
+
+import numpy as np
+
+from core.compact_graph import CompactGraph
+from core.compact_graph_adapter import CompactGraphAdapter
+from core.vehicle_index import VehicleIndex
+from algorithms.dijkstra import shortest_path_tree
+from services.dispatch_service import DispatchService
+from shared.calculators.generic_path_calculator import GenericPathCalculator
+
+
+def percentiles_us(samples):
+    """p50 and p99 of a list of durations in seconds, in microseconds."""
+    values = np.array(samples) * 1e6
+    return float(np.percentile(values, 50)), float(np.percentile(values, 99))
+
+
+def full_search_costs(compact, index, incident, k):
+    """Reference ranking: a complete shortest path tree, then sort every vehicle."""
+    distances, _, _ = shortest_path_tree(compact, {incident: 0.0})
+    costs = []
+    for vehicle_id in index.vehicle_ids():
+        node = compact.index_of(index.node_of(vehicle_id))
+        costs.append(distances.get(node, math.inf))
+    return sorted(costs)[:k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100, help="grid nodes per side")
+    parser.add_argument("--vehicles", type=int, default=1000, help="synthetic vehicles")
+    parser.add_argument("--queries", type=int, default=300, help="dispatch queries per k")
+    parser.add_argument("--updates", type=int, default=200000, help="position updates to time")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    compact = CompactGraph.from_networkx(grid_graph(args.size), version="benchmark")
+    node_ids = compact.node_id_list()
+    rng = np.random.default_rng(args.seed)
+
+    index = VehicleIndex(compact)
+    start_nodes = rng.integers(0, compact.num_nodes, size=args.vehicles)
+    index.update_many((vehicle, node_ids[node]) for vehicle, node in enumerate(start_nodes.tolist()))
+
+    # Vehicles drive to neighboring nodes, as a position feed would report them
+    neighbor_lists = compact.neighbor_lists()
+    moves = rng.integers(0, args.vehicles, size=args.updates).tolist()
+    choices = rng.random(args.updates).tolist()
+    updates = []
+    current = start_nodes.tolist()
+    for vehicle, choice in zip(moves, choices):
+        neighbors = neighbor_lists[current[vehicle]]
+        if neighbors:
+            current[vehicle] = neighbors[int(choice * len(neighbors))]
+        updates.append((vehicle, node_ids[current[vehicle]]))
+
+    started = time.perf_counter()
+    for vehicle, node in updates:
+        index.update(vehicle, node)
+    single_rate = len(updates) / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for offset in range(0, len(updates), args.vehicles):
+        index.update_many(updates[offset:offset + args.vehicles])
+    batch_rate = len(updates) / (time.perf_counter() - started)
+
+    service = DispatchService(CompactGraphAdapter(compact), index, GenericPathCalculator())
+    incidents = rng.integers(0, compact.num_nodes, size=args.queries).tolist()
+
+    print(f"{compact.num_nodes} nodes, {compact.num_arcs} arcs, {len(index)} vehicles")
+    print(f"updates/s: {single_rate:,.0f} single, {batch_rate:,.0f} batched")
+    print("latency (us)        p50        p99   settled nodes")
+    mismatches = 0
+    for k in (1, 5, 10):
+        latency, settled = [], []
+        for number, incident in enumerate(incidents):
+            started = time.perf_counter()
+            result = service.nearest_vehicles(node_ids[incident], k)
+            latency.append(time.perf_counter() - started)
+            settled.append(len(result["visited_nodes"]))
+            found = [vehicle["cost"] for vehicle in result["vehicles"]]
+            if number < 20 and not np.allclose(found, full_search_costs(compact, index, incident, k)):
+                mismatches += 1
+        p50, p99 = percentiles_us(latency)
+        print(f"dispatch k={k:<4}{p50:>10.1f}{p99:>11.1f}{np.mean(settled):>16.0f}")
+
+    full_latency = []
+    for incident in incidents[:50]:
+        started = time.perf_counter()
+        full_search_costs(compact, index, incident, 1)
+        full_latency.append(time.perf_counter() - started)
+    p50, p99 = percentiles_us(full_latency)
+    print(f"{'full search':<14}{p50:>10.1f}{p99:>11.1f}{compact.num_nodes:>16}")
+    print(f"rankings differing from the full search: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: hub labeling distance oracle.
+Single responsibility: Report label build time, index size and query latency against Dijkstra.
+
+Usage:
+    python benchmarks/bench_hub_labels.py [--size 60] [--queries 2000]
+"""
+
+import argparse
+import math
+import tempfile
+import time
+from pathlib import Path
+
+from _synthetic import grid_graph
+
+import numpy as np
+
+from core.compact_graph import CompactGraph
+from core.hub_labels import HubLabelIndex
+from algorithms.dijkstra import shortest_path_tree
+
+
+def percentiles_us(samples):
+    """p50 and p99 of a list of durations in seconds, in microseconds."""
+    values = np.array(samples) * 1e6
+    return float(np.percentile(values, 50)), float(np.percentile(values, 99))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=60, help="grid nodes per side")
+    parser.add_argument("--queries", type=int, default=2000, help="distance queries")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    compact = CompactGraph.from_networkx(grid_graph(args.size), version="benchmark")
+    rng = np.random.default_rng(args.seed)
+    pairs = rng.integers(0, compact.num_nodes, size=(args.queries, 2)).tolist()
+
+    started = time.perf_counter()
+    built = HubLabelIndex.build(compact)
+    build_time = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as directory:
+        built.save(Path(directory))
+        labels = HubLabelIndex.load(Path(directory), compact, mmap=True)
+
+        label_latency = []
+        for source, target in pairs:
+            started = time.perf_counter()
+            labels.distance_index(source, target)
+            label_latency.append(time.perf_counter() - started)
+
+        dijkstra_latency, mismatches = [], 0
+        for source, target in pairs[:min(len(pairs), 200)]:
+            started = time.perf_counter()
+            distances, _, _ = shortest_path_tree(compact, {source: 0.0}, stop_at=target)
+            dijkstra_latency.append(time.perf_counter() - started)
+            expected = distances.get(target, math.inf)
+            found = labels.distance_index(source, target)
+            if not math.isclose(found, expected, rel_tol=1e-6, abs_tol=1e-3):
+                mismatches += 1
+
+        node_ids = compact.node_id_list()
+        path_latency = []
+        for source, target in pairs[:50]:
+            started = time.perf_counter()
+            labels.path(node_ids[source], node_ids[target])
+            path_latency.append(time.perf_counter() - started)
+
+        sizes = np.diff(labels.offsets)
+        print(f"{compact.num_nodes} nodes, {compact.num_arcs} arcs")
+        print(f"build: {build_time:.1f} s")
+        print(f"index: {labels.nbytes / 1e6:.2f} MB, {labels.num_entries} entries, "
+              f"label size mean {sizes.mean():.1f} / max {sizes.max()}")
+        print("latency (us)      p50        p99")
+        for name, samples in (("hub labels", label_latency), ("dijkstra", dijkstra_latency),
+                              ("label path", path_latency)):
+            p50, p99 = percentiles_us(samples)
+            print(f"{name:<12}{p50:>10.1f}{p99:>11.1f}")
+        print(f"distance mismatches vs Dijkstra: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark: place-name autocomplete and fuzzy search.
+Single responsibility: Report latency of the autocomplete and trigram indexes against the linear scans they replace.
+
+Usage:
+    python benchmarks/bench_place_search.py [--names 20000] [--queries 500]
+"""
+
+import argparse
+import random
+import time
+from difflib import get_close_matches
+
+from _synthetic import place_names
+
+import numpy as np
+
+import core  # noqa: F401  (services and core import each other; core must load first)
+from services.autocomplete_index import AutocompleteIndex
+from services.trigram_index import TrigramIndex
+
+
+def percentiles_us(samples):
+    """p50 and p99 of a list of durations in seconds, in microseconds."""
+    values = np.array(samples) * 1e6
+    return float(np.percentile(values, 50)), float(np.percentile(values, 99))
+
+
+def linear_complete(names, query, limit):
+    """Reference: the prefix and word-prefix passes the GUI used to run per key release."""
+    query = query.lower()
+    found = [name for name in names if name.lower().startswith(query)]
+    starts = set(found)
+    for name in names:
+        if name not in starts and any(word.startswith(query) for word in name.lower().split()):
+            found.append(name)
+    return found[:limit]
+
+
+def misspell(rng, word):
+    """Replace one letter of a word with a vowel or a romanization look-alike."""
+    letters = list(word)
+    letters[rng.randrange(len(letters))] = rng.choice("aeiouzsq")
+    return "".join(letters)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--names", type=int, default=20000, help="synthetic place names")
+    parser.add_argument("--queries", type=int, default=500, help="typed prefixes to complete")
+    parser.add_argument("--limit", type=int, default=10, help="suggestions per query")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    names = place_names(args.names)
+    started = time.perf_counter()
+    index = AutocompleteIndex(names)
+    build_time = time.perf_counter() - started
+
+    # Prefixes of one to six characters, as typed one key at a time
+    rng = random.Random(args.seed)
+    queries = []
+    for _ in range(args.queries):
+        word = rng.choice(rng.choice(names).split())
+        queries.append(word[:rng.randint(1, min(6, len(word)))])
+
+    latency = []
+    for query in queries:
+        started = time.perf_counter()
+        index.complete(query, args.limit)
+        latency.append(time.perf_counter() - started)
+
+    linear_latency, mismatches = [], 0
+    for query in queries[:50]:
+        started = time.perf_counter()
+        expected = linear_complete(names, query, len(names))
+        linear_latency.append(time.perf_counter() - started)
+        result = index.complete(query, args.limit)
+        if set(result) - set(expected) or len(result) != min(args.limit, len(expected)):
+            mismatches += 1
+
+    started = time.perf_counter()
+    fuzzy_index = TrigramIndex(names)
+    fuzzy_build_time = time.perf_counter() - started
+
+    # Whole words with a typo, as passed to fuzzy search when nothing completes
+    typos = [misspell(rng, rng.choice(rng.choice(names).split()).lower()) for _ in range(args.queries)]
+    fuzzy_latency = []
+    for query in typos:
+        started = time.perf_counter()
+        fuzzy_index.search(query, args.limit)
+        fuzzy_latency.append(time.perf_counter() - started)
+
+    difflib_latency = []
+    for query in typos[:20]:
+        started = time.perf_counter()
+        get_close_matches(query, names, n=args.limit, cutoff=0.6)
+        difflib_latency.append(time.perf_counter() - started)
+
+    print(f"{len(index)} names, autocomplete built in {build_time * 1e3:.0f} ms, "
+          f"trigram index in {fuzzy_build_time * 1e3:.0f} ms")
+    print("latency (us)        p50        p99")
+    for label, samples in (("sorted array", latency), ("linear passes", linear_latency),
+                           ("trigram fuzzy", fuzzy_latency), ("difflib fuzzy", difflib_latency)):
+        p50, p99 = percentiles_us(samples)
+        print(f"{label:<14}{p50:>10.1f}{p99:>11.1f}")
+    print(f"queries whose matches differ from the linear passes: {mismatches} of {len(linear_latency)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: priority queues for Dijkstra-family searches.
+Single responsibility: Compare heap operations per second, peak heap size and A* throughput.
+
+Usage:
+    python benchmarks/bench_priority_queues.py [--size 230] [--trees 5] [--queries 100]
+
+The default 230 x 230 grid has about as many nodes as the Addis Ababa
+drive network.
+"""
+
+import argparse
+import time
+
+from _synthetic import grid_graph, random_pairs
+
+from core.compact_graph import CompactGraph
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+from algorithms.astar_improved import AStarAlgorithm
+from shared.utils.priority_queues import PRIORITY_QUEUES, create_priority_queue
+
+
+def dijkstra_heap_operations(compact, source, queue):
+    """Grow a full shortest path tree, returning (pushes, pops, settled nodes, peak queue size)."""
+    neighbor_lists = compact.neighbor_lists()
+    arc_offsets = compact.arc_offsets()
+    weights = compact.arc_lengths()
+    cost = [float("inf")] * compact.num_nodes
+    settled = [False] * compact.num_nodes
+
+    cost[source] = 0.0
+    queue.push(source, 0.0)
+    pushes, pops, settled_count, peak = 1, 0, 0, 1
+
+    while queue:
+        _, current = queue.pop()
+        pops += 1
+        if settled[current]:
+            continue
+        settled[current] = True
+        settled_count += 1
+
+        distance = cost[current]
+        offset = arc_offsets[current]
+        for position, neighbor in enumerate(neighbor_lists[current]):
+            candidate = distance + weights[offset + position]
+            if candidate < cost[neighbor] and not settled[neighbor]:
+                cost[neighbor] = candidate
+                queue.push(neighbor, candidate)
+                pushes += 1
+                size = len(queue)
+                if size > peak:
+                    peak = size
+
+    return pushes, pops, settled_count, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=230, help="grid nodes per side")
+    parser.add_argument("--trees", type=int, default=5, help="full Dijkstra trees per queue")
+    parser.add_argument("--queries", type=int, default=100, help="A* queries per queue")
+    args = parser.parse_args()
+
+    graph = grid_graph(args.size)
+    compact = CompactGraph.from_networkx(graph)
+    adapter = NetworkXGraphAdapter(graph, compact_graph=compact)
+    pairs = random_pairs(graph, args.queries)
+    sources = [compact.index_of(start) for start, _ in pairs[:args.trees]]
+
+    # Build cached neighbor/weight lists outside the timings
+    AStarAlgorithm().find_path(*pairs[0], adapter, max_paths=1)
+
+    print(f"{compact.num_nodes} nodes, {compact.num_arcs} arcs")
+    print(f"{'queue':<9}{'heap ops/s':>12}{'peak size':>11}{'pops/settled':>14}{'A* queries/s':>14}")
+    for kind in PRIORITY_QUEUES:
+        queue = create_priority_queue(kind, compact.num_nodes)
+        operations, peak, pops, settled = 0, 0, 0, 0
+        started = time.perf_counter()
+        for source in sources:
+            queue.clear()
+            pushes, tree_pops, tree_settled, tree_peak = dijkstra_heap_operations(compact, source, queue)
+            operations += pushes + tree_pops
+            pops += tree_pops
+            settled += tree_settled
+            peak = max(peak, tree_peak)
+        tree_time = time.perf_counter() - started
+
+        algorithm = AStarAlgorithm(priority_queue=kind)
+        started = time.perf_counter()
+        for start, goal in pairs:
+            algorithm.find_path(start, goal, adapter, max_paths=1)
+        query_time = time.perf_counter() - started
+
+        print(f"{kind:<9}{operations / tree_time:>12.0f}{peak:>11}{pops / settled:>14.2f}"
+              f"{len(pairs) / query_time:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: per-query dictionaries vs the reusable search workspace.
+Single responsibility: Compare query throughput and GC pauses of A*, BFS and DFS.
+
+Usage:
+    python benchmarks/bench_search_workspace.py [--size 120] [--queries 200]
+"""
+
+import argparse
+import gc
+import time
+
+from _synthetic import grid_graph, random_pairs
+
+from core.compact_graph import CompactGraph
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+from algorithms.astar_improved import AStarAlgorithm
+from algorithms.bfs import BFSAlgorithm
+from algorithms.dfs_classic import ClassicDFSAlgorithm
+
+
+class GCPauseRecorder:
+    """Collects the duration of every garbage collection via gc.callbacks."""
+
+    def __init__(self):
+        self.pauses = []
+        self._started = None
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._started = time.perf_counter()
+        elif self._started is not None:
+            self.pauses.append(time.perf_counter() - self._started)
+            self._started = None
+
+    def __enter__(self):
+        gc.collect()
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self)
+
+
+def run(algorithm_factory, graph, pairs, max_paths):
+    """Run all queries and return (queries/s, GC pause total ms, max ms, collections)."""
+    algorithm = algorithm_factory()
+    with GCPauseRecorder() as recorder:
+        started = time.perf_counter()
+        for start, goal in pairs:
+            algorithm.find_path(start, goal, graph, max_paths=max_paths)
+        elapsed = time.perf_counter() - started
+
+    pauses = recorder.pauses
+    return (len(pairs) / elapsed, sum(pauses) * 1000.0,
+            max(pauses, default=0.0) * 1000.0, len(pauses))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=120, help="grid nodes per side")
+    parser.add_argument("--queries", type=int, default=200, help="queries per algorithm")
+    parser.add_argument("--max-paths", type=int, default=1, help="paths requested per query")
+    args = parser.parse_args()
+
+    graph = grid_graph(args.size)
+    compact = CompactGraph.from_networkx(graph)
+    pairs = random_pairs(graph, args.queries)
+    variants = {
+        "dict": NetworkXGraphAdapter(graph),
+        "workspace": NetworkXGraphAdapter(graph, compact_graph=compact),
+    }
+    algorithms = {
+        "A*": AStarAlgorithm,
+        "BFS": BFSAlgorithm,
+        "DFS": ClassicDFSAlgorithm,
+    }
+
+    # Warm up cached lists (neighbors, weights, heuristic) outside the timings
+    for adapter in variants.values():
+        for factory in algorithms.values():
+            factory().find_path(*pairs[0], adapter, max_paths=1)
+
+    print(f"{graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges, "
+          f"{len(pairs)} queries, max_paths={args.max_paths}")
+    print(f"{'algorithm':<10}{'variant':<11}{'queries/s':>10}{'gc total ms':>13}"
+          f"{'gc max ms':>11}{'gcs':>6}")
+    for name, factory in algorithms.items():
+        for variant, adapter in variants.items():
+            rate, total, longest, count = run(factory, adapter, pairs, args.max_paths)
+            print(f"{name:<10}{variant:<11}{rate:>10.1f}{total:>13.2f}{longest:>11.2f}{count:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: coordinate snapping throughput.
+Single responsibility: Report points per second of batch and per-point snapping on the grid index.
+
+Usage:
+    python benchmarks/bench_snapping.py [--size 150] [--points 200000] [--chunk 50000]
+"""
+
+import argparse
+import time
+
+from _synthetic import grid_graph, ORIGIN_LAT, ORIGIN_LON, SPACING_DEG
+
+import numpy as np
+
+from core.compact_graph import CompactGraph
+from core.spatial_index import SpatialGridIndex
+from shared.utils.geo import utm_project
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=150, help="grid nodes per side")
+    parser.add_argument("--points", type=int, default=200000, help="coordinates to snap")
+    parser.add_argument("--chunk", type=int, default=50000, help="points per vectorized chunk")
+    parser.add_argument("--cell", type=float, default=150.0, help="grid cell size in meters")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    compact = CompactGraph.from_networkx(grid_graph(args.size), version="benchmark")
+    started = time.perf_counter()
+    index = SpatialGridIndex.build(compact, args.cell)
+    build_time = time.perf_counter() - started
+
+    # A manifest-like spread over the network, with a few points outside it
+    rng = np.random.default_rng(args.seed)
+    extent = args.size * SPACING_DEG
+    lats = ORIGIN_LAT + rng.uniform(-0.02, 1.02, args.points) * extent
+    lons = ORIGIN_LON + rng.uniform(-0.02, 1.02, args.points) * extent
+
+    started = time.perf_counter()
+    nearest, distances = index.nearest_many(lats, lons, args.chunk)
+    batch_rate = args.points / (time.perf_counter() - started)
+
+    sample = min(args.points, 20000)
+    lat_list, lon_list = lats[:sample].tolist(), lons[:sample].tolist()
+    started = time.perf_counter()
+    for lat, lon in zip(lat_list, lon_list):
+        index.nearest(lat, lon)
+    scalar_rate = sample / (time.perf_counter() - started)
+
+    # Brute-force check on a sample
+    check = min(args.points, 1000)
+    x, y = utm_project(lats[:check], lons[:check])
+    brute = np.hypot(compact.x[None, :] - x[:, None], compact.y[None, :] - y[:, None]).min(axis=1)
+    mismatches = int(np.count_nonzero(~np.isclose(brute, distances[:check])))
+
+    print(f"{compact.num_nodes} nodes, {index.columns} x {index.rows} cells of {args.cell:.0f} m, "
+          f"built in {build_time * 1e3:.1f} ms ({index.nbytes / 1e3:.0f} kB)")
+    print(f"batch snap_many: {batch_rate:>12,.0f} points/s (chunks of {args.chunk})")
+    print(f"per-point:       {scalar_rate:>12,.0f} points/s")
+    print(f"snap distance p50 {np.percentile(distances, 50):.1f} m, max {distances.max():.1f} m")
+    print(f"distance mismatches vs brute force: {mismatches} of {check}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Precompute routes between the known locations.
+Single responsibility: Run every configured algorithm between every pair of LOCATIONS and save the route table.
+
+Usage:
+    python build_route_table.py [--algorithms bfs dfs astar] [--max-paths 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from core.addis_ababa_adapter import AddisAbabaAdapter
+from config.settings import ROUTE_TABLE_ALGORITHMS, ROUTE_TABLE_DIR, ROUTE_TABLE_MAX_PATHS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--algorithms", nargs="+", default=list(ROUTE_TABLE_ALGORITHMS),
+                        help="algorithms to precompute")
+    parser.add_argument("--max-paths", type=int, default=ROUTE_TABLE_MAX_PATHS,
+                        help="routes stored per pair and algorithm")
+    args = parser.parse_args()
+
+    adapter = AddisAbabaAdapter()
+    count = len(adapter.location_model.locations)
+
+    def progress(algorithm, start_index, goal_index):
+        if goal_index == 0:
+            print(f"{algorithm:>6}: from location {start_index + 1}/{count}", flush=True)
+
+    started = time.perf_counter()
+    table = adapter.build_route_table(args.algorithms, args.max_paths, progress)
+    elapsed = time.perf_counter() - started
+
+    routes = len(table.path_offsets) - 1
+    print(f"{routes} routes for {count * (count - 1)} location pairs and {len(table.algorithms)} algorithms "
+          f"in {elapsed:.1f} s ({table.nbytes / 1024:.0f} KiB) -> {ROUTE_TABLE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from .settings import *
 __all__ = [
     "CACHE_DIR",
     "GRAPH_CACHE_FILE", 
+    "COMPACT_GRAPH_DIR",
     "DEFAULT_CITY",
     "NETWORK_TYPE",
     "SIMPLIFY_GRAPH",
@@ -20,6 +21,15 @@ __all__ = [
     "EXPLORED_ALPHA",
     "PRIMARY_LINE_WIDTH",
     "ALTERNATIVE_LINE_WIDTH",
+    "FREE_FLOW_SPEED_KMH",
+    "HOURLY_SPEED_FACTORS",
+    "ARTERIAL_HIGHWAY_CLASSES",
+    "DEFAULT_DEPARTURE_TIME",
+    "TRUCK_CLASS_PENALTIES",
+    "TURN_RESTRICTIONS_FILE",
+    "TURN_PENALTIES",
+    "MAJOR_ROAD_CLASSES",
+    "MAJOR_ROAD_LEFT_TURN_PENALTY",
     "LOCATIONS",
     "CONSTRAINT_MESSAGES"
 ]
@@ -9,6 +9,7 @@ from typing import Dict, Tuple
 # Cache Configuration
 CACHE_DIR = Path("cache/osmnx")
 GRAPH_CACHE_FILE = CACHE_DIR / "addis_ababa.graphml"
+COMPACT_GRAPH_DIR = CACHE_DIR / "compact"
 
 # Map Configuration
 DEFAULT_CITY = "Addis Ababa, Ethiopia"
@@ -34,6 +35,121 @@ DEFAULT_MAX_TIME = None      # seconds; optional time constraint
 # Average travel speed used for time estimation (km/h)
 AVERAGE_SPEED_KMH = 30.0
 
+# Time-dependent travel times
+# Free-flow speed per OSM highway class (km/h)
+FREE_FLOW_SPEED_KMH: Dict[str, float] = {
+    "motorway": 80.0,
+    "trunk": 60.0,
+    "primary": 50.0,
+    "secondary": 40.0,
+    "tertiary": 35.0,
+    "unclassified": 30.0,
+    "residential": 25.0,
+    "living_street": 15.0,
+    "service": 15.0,
+    "other": 25.0
+}
+
+# Share of free-flow speed reached at each hour of the day (index = hour)
+HOURLY_SPEED_FACTORS: Dict[str, Tuple[float, ...]] = {
+    # Arterials carry commuter traffic and see the deepest peaks
+    "arterial": (
+        0.95, 0.95, 0.95, 0.95, 0.90, 0.80, 0.60, 0.40, 0.35, 0.50, 0.65, 0.65,
+        0.55, 0.55, 0.65, 0.60, 0.50, 0.35, 0.35, 0.50, 0.70, 0.85, 0.90, 0.95
+    ),
+    "local": (
+        1.00, 1.00, 1.00, 1.00, 0.95, 0.90, 0.80, 0.65, 0.60, 0.70, 0.80, 0.80,
+        0.75, 0.75, 0.80, 0.80, 0.70, 0.60, 0.60, 0.70, 0.85, 0.95, 1.00, 1.00
+    )
+}
+ARTERIAL_HIGHWAY_CLASSES = ("motorway", "trunk", "primary", "secondary")
+
+# Departure time used when none is given (seconds after midnight)
+DEFAULT_DEPARTURE_TIME = 8 * 3600
+
+# Weight profiles
+# Travel time multipliers for streets the "truck" profile should avoid
+TRUCK_CLASS_PENALTIES: Dict[str, float] = {
+    "residential": 5.0,
+    "living_street": 10.0,
+    "service": 5.0
+}
+
+# Turn costs (edge-based routing)
+# OSM turn restrictions, as a list of from_way/via_node/to_way objects or an Overpass response
+TURN_RESTRICTIONS_FILE = CACHE_DIR / "turn_restrictions.json"
+
+# Delay per turn type in seconds; profiles in meters convert it at AVERAGE_SPEED_KMH
+TURN_PENALTIES: Dict[str, float] = {
+    "straight": 0.0,
+    "right": 2.0,
+    "left": 5.0,
+    "u_turn": 30.0
+}
+# Turns are only penalized where a road of these classes meets the intersection;
+# turns between minor streets are free, so those nodes need no turn-expanded search state
+TURN_PENALTY_ROAD_CLASSES = ("motorway", "trunk", "primary", "secondary")
+# Left turns cross oncoming traffic, which costs extra where a major road meets the intersection (seconds)
+MAJOR_ROAD_CLASSES = ("motorway", "trunk", "primary")
+MAJOR_ROAD_LEFT_TURN_PENALTY = 8.0
+
+# Multi-stop route optimization
+# Seconds of local search spent improving the visit order
+MULTI_STOP_TIME_BUDGET = 2.0
+
+# Vehicle dispatch
+# Vehicles ranked per incident when no count is given
+DISPATCH_VEHICLE_COUNT = 3
+
+# Geocoding
+# Columnar index of named places (names and coordinates) used to resolve location names offline
+PLACE_INDEX_DIR = CACHE_DIR / "place_index"
+# Fall back to Nominatim for names missing from the local index (a blocking network call per
+# query; the place index itself is still downloaded once when no cache exists)
+ALLOW_NETWORK_GEOCODING = False
+# Minimum similarity (0-1) of a fuzzy place-name match
+GEOCODER_FUZZY_CUTOFF = 0.8
+# Trigram-index candidates a fuzzy geocoder lookup scores with difflib
+GEOCODER_FUZZY_CANDIDATES = 100
+# Named places label the road node nearest to them when it is at most this far away (meters)
+REVERSE_GEOCODE_PLACE_RADIUS = 60.0
+
+# Route caching
+# Results of find_optimal_paths kept in memory, least recently used evicted first
+ROUTE_CACHE_MAX_ENTRIES = 256
+# Upper bound on the estimated memory of cached results (bytes)
+ROUTE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# SQLite store of routes and distance-matrix rows, shared across restarts and worker processes
+ROUTE_STORE_FILE = CACHE_DIR / "route_store.sqlite"
+# Stored payloads above this size are compacted in the background, least recently used first (bytes)
+ROUTE_STORE_MAX_BYTES = 256 * 1024 * 1024
+# Full shortest path trees kept for the most queried origins (airport, depots, landmarks)
+ORIGIN_TREE_CACHE_SIZE = 16
+# Upper bound on the memory of all cached trees (bytes; about 12 bytes per node per tree)
+ORIGIN_TREE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Queries from an origin before its tree is built in the background
+ORIGIN_TREE_MIN_QUERIES = 3
+# Build trees for the LOCATIONS below at startup, in the background
+ORIGIN_TREE_WARM_LOCATIONS = True
+# Precomputed routes between every pair of LOCATIONS (built by build_route_table.py)
+ROUTE_TABLE_DIR = CACHE_DIR / "route_table"
+# Algorithms whose results are precomputed (Classic DFS reads the "dfs" results)
+ROUTE_TABLE_ALGORITHMS = ("bfs", "dfs", "astar")
+# Routes stored per pair and algorithm: the primary route and its alternatives
+ROUTE_TABLE_MAX_PATHS = 5
+
+# Search internals
+# Priority queue used by A* and Dijkstra on the compact graph:
+# "heapq" (binary heap), "indexed" (decrease-key heap) or "radix" (monotone integer keys;
+# weighted A* searches fall back to "heapq")
+PRIORITY_QUEUE = "heapq"
+# Worker processes for A* alternative-route searches (0 runs them one after another)
+PARALLEL_ALTERNATIVE_WORKERS = 0
+# Cell edge length of the grid index used for snapping coordinates to nodes (meters)
+SPATIAL_INDEX_CELL_METERS = 150.0
+# Points per vectorized chunk when snapping coordinates in bulk
+SNAP_CHUNK_SIZE = 50000
+
 EXPLORED_LINE_WIDTH = 0.8
 EXPLORED_ALPHA = 0.25
 PRIMARY_LINE_WIDTH = 4
@@ -53,6 +169,16 @@ LOCATIONS: Dict[str, Tuple[float, float]] = {
     "Megenagna": (9.0497, 38.8014)
 }
 
+# Emergency facilities by category, for nearest-facility routing: the OSM tags
+# selecting each category. Facilities are downloaded from OpenStreetMap once per
+# category and cached in FACILITY_CACHE_DIR (snapped to the road network and
+# partitioned once per category)
+FACILITY_CATEGORIES: Dict[str, Dict[str, str]] = {
+    "hospital": {"amenity": "hospital"},
+    "fire_station": {"amenity": "fire_station"},
+}
+FACILITY_CACHE_DIR = CACHE_DIR / "facilities"
+
 # Constraint Handling Messages
 CONSTRAINT_MESSAGES = {
     "unknown_location": "Error: Could not find location - {}",
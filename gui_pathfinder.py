@@ -26,7 +26,8 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from src.controllers.generic_pathfinding_controller import GenericPathfindingController
 from src.controllers.classic_dfs_controller import ClassicDFSController
 from src.controllers.astar_controller import AStarController
-from src.services.place_index_service import PlaceIndexService
+from src.services.autocomplete_index import AutocompleteIndex
+from src.services.trigram_index import TrigramIndex
 
 
 class PathFinderGUI:
@@ -34,9 +35,7 @@ class PathFinderGUI:
         self.root = root
         self.root.title("Path Finder - Addis Ababa")
         self.root.geometry("1400x800")
-        
-        # Initialize place index (downloads + caches Addis Ababa place names)
-        self.place_index = PlaceIndexService()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Initialize controllers
         self.bfs_controller = GenericPathfindingController()
@@ -44,6 +43,9 @@ class PathFinderGUI:
         from core.addis_ababa_adapter import AddisAbabaAdapter
         adapter = AddisAbabaAdapter()
         self.astar_controller = AStarController(adapter)
+        
+        # Place index of the adapter (downloaded + cached once), shared instead of loaded twice
+        self.place_index = adapter.place_index
         # Store last successful pathfinding result for web map visualization
         self.last_result = None
         
@@ -64,6 +66,12 @@ class PathFinderGUI:
         # Combine static locations with dynamic OSM-based index for suggestions
         osm_locations = self.place_index.get_all_names()
         self.locations = list(dict.fromkeys(static_locations + osm_locations))
+        # Curated names rank ahead of OSM names with the same match quality
+        curated = set(static_locations)
+        self.autocomplete = AutocompleteIndex(
+            self.locations, [0 if loc in curated else 1 for loc in self.locations]
+        )
+        self.fuzzy_index = TrigramIndex(self.locations)
         
         # Original location mapping for display
         self.original_locations = [
@@ -366,12 +374,16 @@ class PathFinderGUI:
 
     def _update_search_suggestions(self, entry_type, current):
         """Update the search suggestions in real-time."""
-        # Find all locations that contain the current input
-        matches = [loc for loc in self.locations if current in loc.lower()]
+        # Names or words of names starting with the current input, then names containing it
+        matches = self.autocomplete.complete(current, 10)
+        if len(matches) < 10:
+            for name in self.autocomplete.contains(current, 10):
+                if name not in matches:
+                    matches.append(name)
 
         # If no matches, try fuzzy matching
         if not matches:
-            matches = get_close_matches(current, self.locations, n=5, cutoff=0.4)
+            matches = [name for name, _ in self.fuzzy_index.search(current, 5, cutoff=0.5)]
 
         if not matches:
             # Nothing to show
@@ -889,9 +901,8 @@ class PathFinderGUI:
         location_lower = location_input.lower()
         
         # Check exact matches
-        for location in self.locations:
-            if location.lower() == location_lower:
-                return True
+        if self.autocomplete.lookup(location_input) is not None:
+            return True
         
         # Check if it's in the location mapping
         if location_lower in self.location_mapping:
@@ -904,47 +915,20 @@ class PathFinderGUI:
         if not user_input or len(user_input) < 2:
             return []
         
-        user_input_lower = user_input.lower()
-        suggestions = []
-        
-        # Priority 1: Locations starting with the first 2-3 letters
-        for location in self.locations:
-            location_lower = location.lower()
-            if location_lower.startswith(user_input_lower):
-                suggestions.append(location)
-                if len(suggestions) >= max_suggestions:
-                    return suggestions
-        
-        # Priority 2: Locations containing the input as a word
-        for location in self.locations:
-            location_lower = location.lower()
-            words = location_lower.split()
-            for word in words:
-                if word.startswith(user_input_lower) and location not in suggestions:
-                    suggestions.append(location)
-                    if len(suggestions) >= max_suggestions:
-                        return suggestions
+        # Priority 1-2: Locations starting with the input, then locations with a word starting with it
+        suggestions = self.autocomplete.complete(user_input, max_suggestions)
         
         # Priority 3: Locations containing the input anywhere
-        for location in self.locations:
-            location_lower = location.lower()
-            if user_input_lower in location_lower and location not in suggestions:
-                suggestions.append(location)
-                if len(suggestions) >= max_suggestions:
-                    return suggestions
-        
-        # Priority 4: Fuzzy matching for similar sounding names
         if len(suggestions) < max_suggestions:
-            from difflib import get_close_matches
-            fuzzy_matches = get_close_matches(user_input_lower, [loc.lower() for loc in self.locations], 
-                                            n=max_suggestions - len(suggestions), cutoff=0.4)
-            
-            # Convert back to original case
-            for match in fuzzy_matches:
-                for location in self.locations:
-                    if location.lower() == match and location not in suggestions:
-                        suggestions.append(location)
-                        break
+            for location in self.autocomplete.contains(user_input, max_suggestions):
+                if location not in suggestions:
+                    suggestions.append(location)
+        
+        # Priority 4: Fuzzy matching for similar sounding names and spelling variants
+        if len(suggestions) < max_suggestions:
+            for location, _ in self.fuzzy_index.search(user_input, max_suggestions, cutoff=0.5):
+                if location not in suggestions:
+                    suggestions.append(location)
         
         return suggestions[:max_suggestions]
     
@@ -1121,6 +1105,12 @@ class PathFinderGUI:
         
         # Reset map
         self.load_initial_map()
+        
+    def on_close(self):
+        """Stop background workers of every controller's adapter, then close the window."""
+        for controller in (self.bfs_controller, self.dfs_controller, self.astar_controller):
+            controller.domain_adapter.close()
+        self.root.destroy()
 
 
 def main():
@@ -8,9 +8,13 @@ the PathfindingAlgorithmInterface for consistency.
 from .bfs import BFSAlgorithm
 from .dfs_classic import ClassicDFSAlgorithm
 from .astar_improved import AStarAlgorithm as AStarImprovedAlgorithm
+from .time_dependent_astar import TimeDependentAStarAlgorithm
+from .turn_aware_astar import TurnAwareAStarAlgorithm
 
 __all__ = [
     "BFSAlgorithm", 
     "ClassicDFSAlgorithm",
-    "AStarImprovedAlgorithm"
+    "AStarImprovedAlgorithm",
+    "TimeDependentAStarAlgorithm",
+    "TurnAwareAStarAlgorithm"
 ]
\ No newline at end of file
@@ -5,26 +5,48 @@ Based on the provided JavaScript implementation, adapted for Python architecture
 
 import heapq
 import math
-from typing import List, Set, Optional, Iterator, Dict, Any
+import time
+from typing import List, Set, Optional, Iterator, Dict, Any, Callable, Tuple
 
 from core.graph_interface import (
     GraphInterface, ConstraintInterface, PathfindingAlgorithmInterface
 )
+from config.settings import COMPACT_GRAPH_DIR, PARALLEL_ALTERNATIVE_WORKERS, PRIORITY_QUEUE
+from core.search_workspace import borrow_workspace
+from core.spatial_index import EdgeSnap
+from algorithms.metric_heuristic import MetricHeuristic
+from algorithms.parallel_alternatives import ParallelAlternativeSearch
+from shared.utils.geo import haversine_m
 
 
 class AStarAlgorithm(PathfindingAlgorithmInterface):
     """A* algorithm implementation with heuristic search and constraint support."""
     
-    def __init__(self, message_handler=None, max_paths: int = 5):
+    def __init__(self, message_handler=None, max_paths: int = 5,
+                 heuristic: Optional[Callable[[int, int, GraphInterface], float]] = None,
+                 priority_queue: Optional[str] = None,
+                 parallel_workers: Optional[int] = None):
         """
         Initialize A* with optional parameters.
         
         Args:
             message_handler: Optional message handler
             max_paths: Maximum number of paths to find
+            heuristic: Optional custom heuristic (node, goal, graph) -> cost;
+                defaults to the metric heuristic on projected coordinates
+            priority_queue: Open-list queue for compact searches
+                ("heapq", "indexed" or "radix"; defaults to PRIORITY_QUEUE);
+                "radix" only serves monotone searches, see _open_list_kind
+            parallel_workers: Worker processes for alternative searches
+                (0 = sequential; defaults to PARALLEL_ALTERNATIVE_WORKERS)
         """
         self.message_handler = message_handler
         self.max_paths = max_paths
+        self.heuristic = heuristic
+        self.priority_queue = priority_queue or PRIORITY_QUEUE
+        self.parallel_workers = PARALLEL_ALTERNATIVE_WORKERS if parallel_workers is None else parallel_workers
+        self._parallel_searches: Dict[Tuple[int, int], ParallelAlternativeSearch] = {}
+        self._metric_heuristics: Dict[Tuple[int, int], MetricHeuristic] = {}
         self._last_visited_nodes = set()
         self._all_found_paths = []
         self._open_list = []
@@ -38,6 +60,43 @@ class AStarAlgorithm(PathfindingAlgorithmInterface):
         """Get all paths found during the search."""
         return self._all_found_paths
     
+    def reset_tracking(self) -> None:
+        """Forget the visited nodes and paths of earlier searches."""
+        self._last_visited_nodes = set()
+        self._all_found_paths = []
+        self._open_list = []
+        self._closed_list = set()
+    
+    def prepare(self, graph: GraphInterface) -> None:
+        """
+        Build the metric heuristic for a graph's weights ahead of the first query.
+        
+        Args:
+            graph: Graph implementation (no-op without a compact view)
+        """
+        if self.heuristic is None:
+            self._metric_heuristic(graph)
+    
+    def find_weighted_path(self, start: int, goal: int, graph: GraphInterface, heuristic_weight: float,
+                           constraints: Optional[List[ConstraintInterface]] = None) -> Optional[List[int]]:
+        """
+        Run a single A* search with an inflated or deflated heuristic.
+        
+        Visited nodes are added to get_visited_nodes() without resetting it;
+        call reset_tracking() first to observe one search alone.
+        
+        Args:
+            start: Start node
+            goal: Goal node
+            graph: Graph implementation
+            heuristic_weight: Weight multiplier for the heuristic
+            constraints: List of constraints
+            
+        Returns:
+            Path if found, None otherwise
+        """
+        return self._astar_with_weighted_heuristic(graph, start, goal, constraints, heuristic_weight)
+    
     def find_path(self, start: int, goal: int, graph: GraphInterface,
                   constraints: Optional[List[ConstraintInterface]] = None,
                   max_paths: Optional[int] = None) -> List[List[int]]:
@@ -64,11 +123,7 @@ class AStarAlgorithm(PathfindingAlgorithmInterface):
                 self.message_handler.handle_info("Start and goal are the same")
             return [[start]]
         
-        # Reset tracking
-        self._last_visited_nodes = set()
-        self._all_found_paths = []
-        self._open_list = []
-        self._closed_list = set()
+        self.reset_tracking()
         
         # Find paths using A*
         all_paths = []
@@ -110,10 +165,191 @@ class AStarAlgorithm(PathfindingAlgorithmInterface):
         for path in paths:
             yield path
     
+    def find_paths_anytime(self, start: int, goal: int, graph: GraphInterface,
+                           constraints: Optional[List[ConstraintInterface]] = None,
+                           initial_weight: float = 2.5,
+                           weight_step: float = 0.5,
+                           callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                           time_budget: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Find paths using Anytime Repairing A* (ARA*).
+        
+        Starts with an inflated heuristic weight to publish a first route
+        quickly, then lowers the weight step by step. Each iteration reuses
+        the g-scores, parents and open list of the previous one, so only
+        states whose cost actually improved are expanded again.
+        
+        Args:
+            start: Start node
+            goal: Goal node
+            graph: Graph implementation
+            constraints: List of constraints to validate against
+            initial_weight: Heuristic inflation of the first iteration
+            weight_step: Amount the weight is lowered after each iteration
+            callback: Optional callable receiving every published solution
+            time_budget: Optional wall-clock budget in seconds
+            
+        Yields:
+            Solution dictionaries with the path, its cost, the weight used
+            and the suboptimality bound (1.0 means proven optimal)
+        """
+        if not graph.node_exists(start) or not graph.node_exists(goal):
+            if self.message_handler:
+                self.message_handler.handle_error(f"Start or goal node not found")
+            return
+        
+        started_at = time.perf_counter()
+        
+        if start == goal:
+            solution = self._anytime_solution([start], 0.0, 1.0, 1.0, started_at)
+            if callback:
+                callback(solution)
+            yield solution
+            return
+        
+        # Reset tracking
+        self._last_visited_nodes = set()
+        self._all_found_paths = []
+        
+        # Search state shared by every ARA* iteration
+        g_scores = {start: 0.0}
+        parents = {start: None}
+        open_keys = {}
+        closed_set = set()
+        incons_set = set()
+        heuristic = self._goal_heuristic(graph, goal)
+        
+        weight = max(1.0, initial_weight)
+        open_keys[start] = weight * heuristic(start)
+        best_cost = math.inf
+        
+        while True:
+            self._improve_path(graph, goal, weight, g_scores, parents, open_keys,
+                               closed_set, incons_set, heuristic)
+            
+            if g_scores.get(goal, math.inf) == math.inf:
+                # The goal is unreachable, no lower weight can change that
+                return
+            
+            # Parents of the goal's ancestors may have improved after the goal
+            # was reached, so the path can be cheaper than the goal's g-score
+            path = self._reconstruct_path(parents, goal)
+            goal_cost = sum(graph.get_edge_weight(u, v) for u, v in zip(path, path[1:]))
+            
+            # Suboptimality bound from the cheapest unexpanded state
+            frontier = [g_scores[n] + heuristic(n) for n in list(open_keys) + list(incons_set)]
+            lower_bound = min(frontier) if frontier else goal_cost
+            bound = min(weight, goal_cost / lower_bound) if lower_bound > 0 else weight
+            bound = max(1.0, bound)
+            
+            if goal_cost < best_cost or bound == 1.0:
+                if self._validate_path(path, graph, constraints):
+                    improved = goal_cost < best_cost
+                    best_cost = goal_cost
+                    if improved:
+                        self._all_found_paths.append(path)
+                    self._last_visited_nodes.update(path)
+                    solution = self._anytime_solution(path, goal_cost, weight, bound, started_at)
+                    if callback:
+                        callback(solution)
+                    yield solution
+            
+            if bound <= 1.0:
+                return
+            if time_budget is not None and time.perf_counter() - started_at >= time_budget:
+                return
+            
+            # Lower the weight and repair the search for the next iteration
+            weight = max(1.0, weight - weight_step)
+            for node in incons_set:
+                open_keys[node] = 0.0
+            incons_set.clear()
+            for node in open_keys:
+                open_keys[node] = g_scores[node] + weight * heuristic(node)
+            closed_set.clear()
+    
+    def _improve_path(self, graph: GraphInterface, goal: int, weight: float,
+                      g_scores: Dict[int, float], parents: Dict[int, Optional[int]],
+                      open_keys: Dict[int, float], closed_set: Set[int], incons_set: Set[int],
+                      heuristic: Callable[[int], float]) -> None:
+        """
+        Run one ARA* iteration until the goal cost is proven for this weight.
+        
+        Args:
+            graph: Graph implementation
+            goal: Goal node
+            weight: Heuristic inflation of this iteration
+            g_scores: Best known cost per node (kept between iterations)
+            parents: Parent pointers for path reconstruction
+            open_keys: Open list as node -> inflated f_score
+            closed_set: Nodes expanded during this iteration
+            incons_set: Improved nodes that were already closed
+            heuristic: Heuristic towards the goal
+        """
+        # Lazy-deletion heap rebuilt from the open list
+        open_heap = [(key, node) for node, key in open_keys.items()]
+        heapq.heapify(open_heap)
+        
+        while open_heap:
+            current_f, current = open_heap[0]
+            if open_keys.get(current) != current_f:
+                # Stale entry left behind by a key update
+                heapq.heappop(open_heap)
+                continue
+            
+            # Stop once nothing on the open list can improve the goal
+            if g_scores.get(goal, math.inf) <= current_f:
+                break
+            
+            heapq.heappop(open_heap)
+            del open_keys[current]
+            closed_set.add(current)
+            
+            # Track visited nodes for visualization
+            self._last_visited_nodes.add(current)
+            current_g = g_scores[current]
+            
+            for neighbor in graph.get_neighbors(current):
+                tentative_g = current_g + graph.get_edge_weight(current, neighbor)
+                
+                if tentative_g < g_scores.get(neighbor, math.inf):
+                    g_scores[neighbor] = tentative_g
+                    parents[neighbor] = current
+                    
+                    if neighbor in closed_set:
+                        incons_set.add(neighbor)
+                    else:
+                        key = tentative_g + weight * heuristic(neighbor)
+                        open_keys[neighbor] = key
+                        heapq.heappush(open_heap, (key, neighbor))
+                        self._last_visited_nodes.add(neighbor)
+    
+    def _reconstruct_path(self, parents: Dict[int, Optional[int]], goal: int) -> List[int]:
+        """Rebuild a path by following parent pointers back from the goal."""
+        path = []
+        node = goal
+        while node is not None:
+            path.append(node)
+            node = parents[node]
+        path.reverse()
+        return path
+    
+    def _anytime_solution(self, path: List[int], cost: float, weight: float,
+                          bound: float, started_at: float) -> Dict[str, Any]:
+        """Build the record published for one ARA* solution."""
+        return {
+            "path": path,
+            "cost": cost,
+            "heuristic_weight": weight,
+            "suboptimality_bound": bound,
+            "is_optimal": bound <= 1.0,
+            "elapsed_seconds": time.perf_counter() - started_at
+        }
+    
     def _astar_search(self, graph: GraphInterface, start: int, goal: int,
                       constraints: Optional[List[ConstraintInterface]]) -> Optional[List[int]]:
         """
-        Perform A* search using Manhattan distance heuristic.
+        Perform A* search using the metric distance heuristic.
         
         Args:
             graph: Graph implementation
@@ -124,11 +360,16 @@ class AStarAlgorithm(PathfindingAlgorithmInterface):
         Returns:
             Optimal path if found, None otherwise
         """
+        compact = graph.get_compact_graph()
+        if compact is not None and compact.has_node(start) and compact.has_node(goal):
+            return self._astar_search_compact(graph, compact, start, goal, 1.0)
+        
         # Priority queue: (f_score, g_score, node_id, path)
         open_list = [(0, 0, start, [start])]
         closed_set = set()
         g_scores = {start: 0}
-        f_scores = {start: self._heuristic(graph, start, goal)}
+        heuristic = self._goal_heuristic(graph, goal)
+        f_scores = {start: heuristic(start)}
         
         while open_list:
             # Get node with lowest f_score
@@ -153,14 +394,12 @@ class AStarAlgorithm(PathfindingAlgorithmInterface):
                     continue
                 
                 # Calculate tentative g_score
-                edge_data = graph.get_edge_data(current, neighbor)
-                edge_weight = edge_data.get('length', 1.0) if edge_data else 1.0
-                tentative_g = current_g + edge_weight
+                tentative_g = current_g + graph.get_edge_weight(current, neighbor)
                 
                 # Check if this path to neighbor is better
                 if neighbor not in g_scores or tentative_g < g_scores[neighbor]:
                     g_scores[neighbor] = tentative_g
-                    f_scores[neighbor] = tentative_g + self._heuristic(graph, neighbor, goal)
+                    f_scores[neighbor] = tentative_g + heuristic(neighbor)
                     new_path = path + [neighbor]
                     
                     heapq.heappush(open_list, (f_scores[neighbor], tentative_g, neighbor, new_path))
@@ -170,10 +409,281 @@ class AStarAlgorithm(PathfindingAlgorithmInterface):
         
         return None
     
+    def _astar_search_compact(self, graph: GraphInterface, compact, start: int, goal: int,
+                              heuristic_weight: float) -> Optional[List[int]]:
+        """
+        A* over the compact graph using the thread's search workspace.
+        
+        Same search as _astar_search, but labels live in preallocated,
+        epoch-stamped arrays indexed by dense node id, and the path is
+        rebuilt from parent labels instead of being copied into every heap
+        entry, so a query allocates little more than its heap. The open
+        list is the workspace's queue of the configured kind.
+        
+        Args:
+            graph: Graph implementation (supplies weights and heuristic)
+            compact: Compact view of the graph
+            start: Start node
+            goal: Goal node
+            heuristic_weight: Weight multiplier for heuristic
+            
+        Returns:
+            Path if found, None otherwise
+        """
+        source = compact.index_of(start)
+        target = compact.index_of(goal)
+        neighbor_lists = compact.neighbor_lists()
+        arc_offsets = compact.arc_offsets()
+        weights = graph.get_arc_weights()
+        if weights is None:
+            weights = compact.arc_lengths()
+        heuristic = self._goal_index_heuristic(graph, compact, target)
+        
+        with borrow_workspace(compact.num_nodes) as workspace:
+            epoch = workspace.epoch
+            stamp, closed, cost, parent = workspace.stamp, workspace.closed, workspace.cost, workspace.parent
+            touched = workspace.touched
+            
+            stamp[source] = epoch
+            cost[source] = 0.0
+            parent[source] = -1
+            touched[0] = source
+            touched_count = 1
+            
+            # Open list holds dense ids keyed by f; g is read from the workspace
+            open_list = workspace.priority_queue(
+                self._open_list_kind(heuristic_weight <= 1.0 and self.heuristic is None)
+            )
+            push, pop = open_list.push, open_list.pop
+            push(source, heuristic_weight * heuristic(source))
+            found = False
+            
+            while open_list:
+                _, current = pop()
+                
+                if current == target:
+                    found = True
+                    break
+                
+                if closed[current] == epoch:
+                    continue
+                closed[current] = epoch
+                current_g = cost[current]
+                
+                offset = arc_offsets[current]
+                for position, neighbor in enumerate(neighbor_lists[current]):
+                    if closed[neighbor] == epoch:
+                        continue
+                    
+                    tentative_g = current_g + weights[offset + position]
+                    if stamp[neighbor] != epoch:
+                        if tentative_g == math.inf:
+                            continue
+                        stamp[neighbor] = epoch
+                        touched[touched_count] = neighbor
+                        touched_count += 1
+                    elif tentative_g >= cost[neighbor]:
+                        continue
+                    
+                    cost[neighbor] = tentative_g
+                    parent[neighbor] = current
+                    push(neighbor, tentative_g + heuristic_weight * heuristic(neighbor))
+            
+            workspace.touched_count = touched_count
+            self._last_visited_nodes.update(compact.to_node_ids(workspace.visited()))
+            
+            if not found:
+                return None
+            return compact.to_node_ids(workspace.path_to(target))
+    
+    def find_path_between_edges(self, start_snap: EdgeSnap, goal_snap: EdgeSnap,
+                                graph: GraphInterface) -> Optional[Tuple[float, List[int]]]:
+        """
+        Find the optimal route between two points snapped onto edges.
+        
+        Both end nodes of the start edge enter the open list with their
+        partial-edge cost as initial g, and an end node of the goal edge
+        completes a route with its remaining partial-edge cost. The
+        heuristic is the metric lower bound to the snapped goal point
+        itself, which stays consistent: the partial edge costs at least
+        the scaled straight-line distance along it.
+        
+        Args:
+            start_snap: Snapped start point
+            goal_snap: Snapped goal point
+            graph: Graph implementation with a compact view
+            
+        Returns:
+            (cost, path) with the path as original node ids from an end node
+            of the start edge to an end node of the goal edge, or None if no
+            route exists
+        """
+        compact = graph.get_compact_graph()
+        metric = self._metric_heuristic(graph)
+        if compact is None or metric is None:
+            if self.message_handler:
+                self.message_handler.handle_error("Edge snapping needs a compact graph")
+            return None
+        
+        self._last_visited_nodes = set()
+        self._all_found_paths = []
+        result = self._astar_search_edges(compact, metric, start_snap, goal_snap, graph.get_arc_weights())
+        if result is not None:
+            self._all_found_paths.append(result[1])
+        return result
+    
+    def _astar_search_edges(self, compact, metric: MetricHeuristic, start_snap: EdgeSnap,
+                            goal_snap: EdgeSnap, weights) -> Optional[Tuple[float, List[int]]]:
+        """Multi-source A* from a start edge's end nodes to a goal edge's end nodes."""
+        if weights is None:
+            weights = compact.arc_lengths()
+        neighbor_lists = compact.neighbor_lists()
+        arc_offsets = compact.arc_offsets()
+        arrival_costs = goal_snap.endpoint_costs(weights)
+        
+        x, y = compact.xy_lists()
+        goal_x, goal_y, scale = goal_snap.x, goal_snap.y, metric.scale
+        hypot = math.hypot
+        
+        best_cost = start_snap.direct_cost(goal_snap, weights)
+        best_node = -1
+        
+        with borrow_workspace(compact.num_nodes) as workspace:
+            epoch = workspace.epoch
+            stamp, closed, cost, parent = workspace.stamp, workspace.closed, workspace.cost, workspace.parent
+            touched = workspace.touched
+            touched_count = 0
+            
+            # The straight-line estimate to the goal point is consistent
+            open_list = workspace.priority_queue(self._open_list_kind(True))
+            push, pop = open_list.push, open_list.pop
+            for source, initial in start_snap.endpoint_costs(weights).items():
+                stamp[source] = epoch
+                cost[source] = initial
+                parent[source] = -1
+                touched[touched_count] = source
+                touched_count += 1
+                push(source, initial + scale * hypot(x[source] - goal_x, y[source] - goal_y))
+            
+            while open_list:
+                current_f, current = pop()
+                
+                # Nothing left on the open list can beat the best arrival
+                if current_f >= best_cost:
+                    break
+                
+                if closed[current] == epoch:
+                    continue
+                closed[current] = epoch
+                current_g = cost[current]
+                
+                if current in arrival_costs and current_g + arrival_costs[current] < best_cost:
+                    best_cost = current_g + arrival_costs[current]
+                    best_node = current
+                
+                offset = arc_offsets[current]
+                for position, neighbor in enumerate(neighbor_lists[current]):
+                    if closed[neighbor] == epoch:
+                        continue
+                    
+                    tentative_g = current_g + weights[offset + position]
+                    if stamp[neighbor] != epoch:
+                        if tentative_g == math.inf:
+                            continue
+                        stamp[neighbor] = epoch
+                        touched[touched_count] = neighbor
+                        touched_count += 1
+                    elif tentative_g >= cost[neighbor]:
+                        continue
+                    
+                    cost[neighbor] = tentative_g
+                    parent[neighbor] = current
+                    push(neighbor, tentative_g + scale * hypot(x[neighbor] - goal_x, y[neighbor] - goal_y))
+            
+            workspace.touched_count = touched_count
+            self._last_visited_nodes.update(compact.to_node_ids(workspace.visited()))
+            
+            if best_node >= 0:
+                return best_cost, compact.to_node_ids(workspace.path_to(best_node))
+        
+        if best_cost == math.inf:
+            return None
+        # Both points lie on the same edge: drive along it
+        ends = [start_snap.tail, start_snap.head]
+        if goal_snap.fraction < start_snap.fraction:
+            ends.reverse()
+        return best_cost, compact.to_node_ids(ends)
+    
+    def _open_list_kind(self, monotone: bool) -> str:
+        """
+        Queue kind for one compact search.
+        
+        The radix heap clamps a key below the last popped key to it, so it
+        keeps the search order only when f never decreases along the search:
+        the metric heuristic is consistent, and stays so when scaled by a
+        weight of at most 1. Inflated or custom heuristics use the binary
+        heap instead.
+        
+        Args:
+            monotone: Whether popped keys never decrease in this search
+            
+        Returns:
+            Queue name for SearchWorkspace.priority_queue
+        """
+        if self.priority_queue == "radix" and not monotone:
+            return "heapq"
+        return self.priority_queue
+    
+    def _goal_index_heuristic(self, graph: GraphInterface, compact, target: int) -> Callable[[int], float]:
+        """Heuristic towards a dense goal id, taking dense node ids."""
+        if self.heuristic is not None:
+            custom = self.heuristic
+            node_ids = compact.node_id_list()
+            goal = node_ids[target]
+            return lambda node_index: custom(node_ids[node_index], goal, graph)
+        
+        return self._metric_heuristic(graph).for_goal_index(target)
+    
+    def _goal_heuristic(self, graph: GraphInterface, goal: int) -> Callable[[int], float]:
+        """
+        Build the heuristic function towards a goal for one search.
+        
+        Uses the custom heuristic if one was given, otherwise the metric
+        heuristic when the graph has a compact view, otherwise _heuristic.
+        
+        Args:
+            graph: Graph implementation
+            goal: Goal node
+            
+        Returns:
+            Function mapping a node to its estimated cost to the goal
+        """
+        if self.heuristic is not None:
+            custom = self.heuristic
+            return lambda node: custom(node, goal, graph)
+        
+        metric = self._metric_heuristic(graph)
+        if metric is not None and metric.compact.has_node(goal):
+            return metric.for_goal(goal)
+        
+        return lambda node: self._heuristic(graph, node, goal)
+    
+    def _metric_heuristic(self, graph: GraphInterface) -> Optional[MetricHeuristic]:
+        """Get the metric heuristic for the graph's compact view and weights (cached)."""
+        compact = graph.get_compact_graph()
+        if compact is None:
+            return None
+        
+        arc_weights = graph.get_arc_weights()
+        key = (id(compact), id(arc_weights))
+        if key not in self._metric_heuristics:
+            self._metric_heuristics[key] = MetricHeuristic(compact, arc_weights)
+        return self._metric_heuristics[key]
+    
     def _heuristic(self, graph: GraphInterface, node1: int, node2: int) -> float:
         """
         Calculate heuristic distance between two nodes.
-        Uses Euclidean distance for geographic coordinates.
+        Uses great-circle distance in meters from the node coordinates.
         
         Args:
             graph: Graph implementation
@@ -188,14 +698,10 @@ class AStarAlgorithm(PathfindingAlgorithmInterface):
             node1_data = graph.get_node_data(node1)
             node2_data = graph.get_node_data(node2)
             
-            # Calculate Euclidean distance
-            lat1, lon1 = node1_data['y'], node1_data['x']
-            lat2, lon2 = node2_data['y'], node2_data['x']
-            
-            return math.sqrt((lat2 - lat1)**2 + (lon2 - lon1)**2)
-        except:
-            # Fallback to unit distance
-            return 1.0
+            return haversine_m(node1_data['y'], node1_data['x'], node2_data['y'], node2_data['x'])
+        except (KeyError, TypeError):
+            # No coordinates, fall back to an uninformed search
+            return 0.0
     
     def _find_alternative_paths(self, graph: GraphInterface, start: int, goal: int,
                                primary_path: List[int], constraints: Optional[List[ConstraintInterface]],
@@ -218,13 +724,10 @@ class AStarAlgorithm(PathfindingAlgorithmInterface):
         
         # For A*, use different heuristic weights for alternatives
         heuristic_weights = [0.5, 1.5, 2.0, 0.8]  # Different heuristic multipliers
+        heuristic_weights = heuristic_weights[:max(0, max_alternatives)]
         
-        for i in range(min(max_alternatives, len(heuristic_weights))):
-            weight = heuristic_weights[i]
-            alt_path = self._astar_with_weighted_heuristic(
-                graph, start, goal, constraints, weight
-            )
-            
+        # Searches are independent; candidates are filtered in weight order either way
+        for alt_path in self._weighted_candidates(graph, start, goal, constraints, heuristic_weights):
             if alt_path and self._validate_path(alt_path, graph, constraints):
                 # Check if it's different enough from existing paths
                 is_different = True
@@ -239,6 +742,56 @@ class AStarAlgorithm(PathfindingAlgorithmInterface):
         
         return alternatives
     
+    def _weighted_candidates(self, graph: GraphInterface, start: int, goal: int,
+                             constraints: Optional[List[ConstraintInterface]],
+                             heuristic_weights: List[float]) -> List[Optional[List[int]]]:
+        """
+        Run one weighted A* search per heuristic weight.
+        
+        Uses the process pool when parallel workers are configured and the
+        graph has a compact view; custom heuristics may not be picklable, so
+        they always run in this process.
+        
+        Returns:
+            Path or None per weight, in input order
+        """
+        compact = graph.get_compact_graph()
+        parallel = (self.parallel_workers > 0 and len(heuristic_weights) > 1
+                    and self.heuristic is None and compact is not None
+                    and compact.has_node(start) and compact.has_node(goal))
+        if not parallel:
+            return [self.find_weighted_path(start, goal, graph, weight, constraints)
+                    for weight in heuristic_weights]
+        
+        results = self._parallel_search(graph).search(start, goal, heuristic_weights)
+        for _, visited in results:
+            self._last_visited_nodes.update(visited)
+        return [path for path, _ in results]
+    
+    def _parallel_search(self, graph: GraphInterface) -> ParallelAlternativeSearch:
+        """Get the process pool for a graph's compact view and weights, starting one per pair."""
+        compact = graph.get_compact_graph()
+        weights = graph.get_arc_weights()
+        key = (id(compact), id(weights))
+        search = self._parallel_searches.get(key)
+        if search is None:
+            search = ParallelAlternativeSearch(compact, weights, self.parallel_workers,
+                                               COMPACT_GRAPH_DIR, self.priority_queue)
+            self._parallel_searches[key] = search
+        return search
+    
+    def close(self) -> None:
+        """Shut down any worker processes started for parallel alternatives."""
+        for search in self._parallel_searches.values():
+            search.close()
+        self._parallel_searches.clear()
+    
+    def __enter__(self) -> 'AStarAlgorithm':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def _astar_with_weighted_heuristic(self, graph: GraphInterface, start: int, goal: int,
                                      constraints: Optional[List[ConstraintInterface]], 
                                      heuristic_weight: float) -> Optional[List[int]]:
@@ -255,11 +808,16 @@ class AStarAlgorithm(PathfindingAlgorithmInterface):
         Returns:
             Alternative path if found, None otherwise
         """
+        compact = graph.get_compact_graph()
+        if compact is not None and compact.has_node(start) and compact.has_node(goal):
+            return self._astar_search_compact(graph, compact, start, goal, heuristic_weight)
+        
         # Priority queue: (f_score, g_score, node_id, path)
         open_list = [(0, 0, start, [start])]
         closed_set = set()
         g_scores = {start: 0}
-        f_scores = {start: heuristic_weight * self._heuristic(graph, start, goal)}
+        heuristic = self._goal_heuristic(graph, goal)
+        f_scores = {start: heuristic_weight * heuristic(start)}
         
         while open_list:
             # Get node with lowest f_score
@@ -284,14 +842,12 @@ class AStarAlgorithm(PathfindingAlgorithmInterface):
                     continue
                 
                 # Calculate tentative g_score
-                edge_data = graph.get_edge_data(current, neighbor)
-                edge_weight = edge_data.get('length', 1.0) if edge_data else 1.0
-                tentative_g = current_g + edge_weight
+                tentative_g = current_g + graph.get_edge_weight(current, neighbor)
                 
                 # Check if this path to neighbor is better
                 if neighbor not in g_scores or tentative_g < g_scores[neighbor]:
                     g_scores[neighbor] = tentative_g
-                    f_scores[neighbor] = tentative_g + heuristic_weight * self._heuristic(graph, neighbor, goal)
+                    f_scores[neighbor] = tentative_g + heuristic_weight * heuristic(neighbor)
                     new_path = path + [neighbor]
                     
                     heapq.heappush(open_list, (f_scores[neighbor], tentative_g, neighbor, new_path))
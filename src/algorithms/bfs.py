@@ -4,12 +4,14 @@ Completely domain-agnostic and reusable for any graph type.
 """
 
 from collections import deque
-from typing import List, Set, Optional, Iterator
+from itertools import islice
+from typing import List, Set, Optional, Iterator, Tuple
 from abc import ABC
 
 from core.graph_interface import (
     GraphInterface, ConstraintInterface, PathfindingAlgorithmInterface
 )
+from core.search_workspace import SearchWorkspace, borrow_workspace
 
 
 class BFSAlgorithm(PathfindingAlgorithmInterface):
@@ -50,18 +52,23 @@ class BFSAlgorithm(PathfindingAlgorithmInterface):
                 self.message_handler.handle_info("Start and goal are the same")
             return [[start]]
         
-        # Build parent tree for path reconstruction
-        distance, parents, visited = self._build_parent_tree(start, goal, graph)
+        compact = graph.get_compact_graph()
+        if compact is not None and compact.has_node(start) and compact.has_node(goal):
+            all_paths, visited = self._compact_shortest_paths(compact, start, goal, max_paths or 1)
+        else:
+            # Build parent tree for path reconstruction
+            distance, parents, visited = self._build_parent_tree(start, goal, graph)
+            
+            # Find all optimal paths
+            all_paths = []
+            if goal in distance:
+                self._backtrack_paths(goal, [goal], all_paths, start, max_paths or 1, parents)
         
-        if goal not in distance:
+        if not all_paths:
             if self.message_handler:
                 self.message_handler.handle_info("No path found between nodes")
             return []
         
-        # Find all optimal paths
-        all_paths = []
-        self._backtrack_paths(goal, [goal], all_paths, start, max_paths or 1, parents)
-        
         # Validate paths against constraints
         valid_paths = []
         for path in all_paths:
@@ -92,15 +99,20 @@ class BFSAlgorithm(PathfindingAlgorithmInterface):
             yield [start]
             return
         
-        # Build parent tree
-        distance, parents = self._build_parent_tree(start, goal, graph)
-        
-        if goal not in distance:
-            return
+        compact = graph.get_compact_graph()
+        if compact is not None and compact.has_node(start) and compact.has_node(goal):
+            candidates = self._stream_compact_paths(compact, start, goal)
+        else:
+            # Build parent tree
+            distance, parents, _ = self._build_parent_tree(start, goal, graph)
+            
+            if goal not in distance:
+                return
+            candidates = self._stream_backtrack(goal, [goal], start, parents)
         
         # Stream backtrack with validation
         path_count = 0
-        for path in self._stream_backtrack(goal, [goal], start, parents):
+        for path in candidates:
             if max_paths and path_count >= max_paths:
                 break
             if self._validate_path(path, graph, constraints):
@@ -131,6 +143,91 @@ class BFSAlgorithm(PathfindingAlgorithmInterface):
         
         return distance, parents, visited
     
+    def _compact_shortest_paths(self, compact, start: int, goal: int,
+                                max_paths: int) -> Tuple[List[List[int]], Set[int]]:
+        """
+        Find up to max_paths shortest paths on the compact graph.
+        
+        Returns:
+            Tuple of (paths, visited nodes)
+        """
+        source, target = compact.index_of(start), compact.index_of(goal)
+        with borrow_workspace(compact.num_nodes) as workspace:
+            reached = self._build_level_tree(compact, workspace, source, target)
+            visited = set(compact.to_node_ids(workspace.visited()))
+            if not reached:
+                return [], visited
+            paths = list(islice(self._compact_backtrack(compact, workspace, source, target), max_paths))
+        return paths, visited
+    
+    def _stream_compact_paths(self, compact, start: int, goal: int) -> Iterator[List[int]]:
+        """Stream shortest paths on the compact graph (holds the workspace while suspended)."""
+        source, target = compact.index_of(start), compact.index_of(goal)
+        with borrow_workspace(compact.num_nodes) as workspace:
+            if self._build_level_tree(compact, workspace, source, target):
+                yield from self._compact_backtrack(compact, workspace, source, target)
+    
+    def _build_level_tree(self, compact, workspace: SearchWorkspace, source: int, target: int) -> bool:
+        """
+        BFS over dense ids, recording each reached node's level in the workspace.
+        
+        Parent lists are not stored: the parents of a node at level d are
+        exactly its neighbors labelled with level d - 1, which backtracking
+        recovers from the adjacency.
+        
+        Returns:
+            True if the target was reached
+        """
+        neighbor_lists = compact.neighbor_lists()
+        epoch = workspace.epoch
+        stamp, level, touched = workspace.stamp, workspace.cost, workspace.touched
+        
+        stamp[source] = epoch
+        level[source] = 0
+        touched[0] = source
+        touched_count = 1
+        queue = deque([source])
+        reached = False
+        
+        while queue:
+            current = queue.popleft()
+            
+            if current == target:
+                reached = True
+                break
+            
+            next_level = level[current] + 1
+            for neighbor in neighbor_lists[current]:
+                if stamp[neighbor] != epoch:
+                    stamp[neighbor] = epoch
+                    level[neighbor] = next_level
+                    touched[touched_count] = neighbor
+                    touched_count += 1
+                    queue.append(neighbor)
+        
+        workspace.touched_count = touched_count
+        return reached
+    
+    def _compact_backtrack(self, compact, workspace: SearchWorkspace,
+                           source: int, target: int) -> Iterator[List[int]]:
+        """Yield shortest paths (original node ids) by walking levels back from the target."""
+        neighbor_lists = compact.neighbor_lists()
+        node_ids = compact.node_id_list()
+        epoch, stamp, level = workspace.epoch, workspace.stamp, workspace.cost
+        
+        stack = [(target, [target])]
+        while stack:
+            node, current_path = stack.pop()
+            if node == source:
+                yield [node_ids[i] for i in reversed(current_path)]
+                continue
+            
+            parent_level = level[node] - 1
+            parents = [neighbor for neighbor in neighbor_lists[node]
+                       if stamp[neighbor] == epoch and level[neighbor] == parent_level]
+            for parent in reversed(parents):
+                stack.append((parent, current_path + [parent]))
+    
     def _backtrack_paths(self, node: int, current_path: List[int], all_paths: List[List[int]], 
                         start_node: int, max_paths: int, parents: dict) -> None:
         """Recursive backtrack to find all paths."""
@@ -4,11 +4,12 @@ Based on the user's provided DFS example, integrated with generic architecture.
 Works reliably for weighted graphs with constraint support.
 """
 
-from typing import List, Set, Optional, Iterator, Dict, Any
+from typing import List, Set, Optional, Iterator, Dict, Any, Tuple
 
 from core.graph_interface import (
     GraphInterface, ConstraintInterface, PathfindingAlgorithmInterface
 )
+from core.search_workspace import borrow_workspace
 
 
 class ClassicDFSAlgorithm(PathfindingAlgorithmInterface):
@@ -138,6 +139,12 @@ class ClassicDFSAlgorithm(PathfindingAlgorithmInterface):
         Returns:
             Path from start to goal, or None if not found
         """
+        compact = graph.get_compact_graph()
+        if compact is not None and compact.has_node(start) and compact.has_node(goal):
+            path, explored = self._compact_dfs(compact, start, goal, set(), 0)
+            self._last_visited_nodes.update(explored)
+            return path
+        
         # Initialize stack with start node
         stack = [start]
         visited = set()
@@ -238,6 +245,11 @@ class ClassicDFSAlgorithm(PathfindingAlgorithmInterface):
         Returns:
             Alternative path, or None if not found
         """
+        compact = graph.get_compact_graph()
+        if compact is not None and compact.has_node(start) and compact.has_node(goal):
+            path, _ = self._compact_dfs(compact, start, goal, avoided_nodes, attempt % 3)
+            return path
+        
         stack = [start]
         visited = set()
         came_from = {}
@@ -281,6 +293,73 @@ class ClassicDFSAlgorithm(PathfindingAlgorithmInterface):
         
         return None
     
+    def _compact_dfs(self, compact, start: int, goal: int, avoided_nodes: Set[int],
+                     neighbor_order_strategy: int) -> Tuple[Optional[List[int]], List[int]]:
+        """
+        Stack-based DFS over dense ids using the thread's search workspace.
+        
+        Same traversal as _dfs_search/_dfs_with_avoidance, with the visited
+        set and came_from map replaced by epoch-stamped workspace arrays.
+        Compact neighbor lists are sorted by node id, so the "normal" and
+        "sorted" strategies visit neighbors in the same order.
+        
+        Args:
+            compact: Compact view of the graph
+            start: Start node
+            goal: Goal node
+            avoided_nodes: Original node ids to avoid
+            neighbor_order_strategy: 0 normal, 1 reverse, 2 sorted by node id
+            
+        Returns:
+            Tuple of (path or None, explored original node ids)
+        """
+        source, target = compact.index_of(start), compact.index_of(goal)
+        neighbor_lists = compact.neighbor_lists()
+        reverse_order = neighbor_order_strategy == 1
+        
+        with borrow_workspace(compact.num_nodes) as workspace:
+            epoch = workspace.epoch
+            stamp, parent, touched = workspace.stamp, workspace.parent, workspace.touched
+            
+            # Avoided nodes are pre-stamped so the traversal treats them as visited
+            for node in avoided_nodes:
+                if compact.has_node(node):
+                    index = compact.index_of(node)
+                    if index != source:
+                        stamp[index] = epoch
+            
+            stamp[source] = epoch
+            parent[source] = -1
+            touched[0] = source
+            touched_count = 1
+            stack = [source]
+            found = False
+            
+            while stack:
+                current = stack.pop()
+                
+                if current == target:
+                    found = True
+                    break
+                
+                neighbors = neighbor_lists[current]
+                if reverse_order:
+                    neighbors = reversed(neighbors)
+                
+                for neighbor in neighbors:
+                    if stamp[neighbor] != epoch:
+                        stamp[neighbor] = epoch
+                        parent[neighbor] = current
+                        touched[touched_count] = neighbor
+                        touched_count += 1
+                        stack.append(neighbor)
+            
+            workspace.touched_count = touched_count
+            explored = compact.to_node_ids(workspace.visited())
+            path = compact.to_node_ids(workspace.path_to(target)) if found else None
+        
+        return path, explored
+    
     def _paths_too_similar(self, path1: List[int], path2: List[int], threshold: float = 0.8) -> bool:
         """
         Check if two paths are too similar.
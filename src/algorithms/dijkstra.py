@@ -0,0 +1,171 @@
+"""
+Dijkstra shortest path trees on the compact graph.
+Single responsibility: Label-setting distance computation shared by other searches.
+"""
+
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config.settings import PRIORITY_QUEUE
+from core.compact_graph import CompactGraph
+from core.search_workspace import borrow_workspace
+from core.spatial_index import EdgeSnap
+
+
+def shortest_path_tree(compact: CompactGraph, sources: Dict[int, float],
+                       weights: Optional[List[float]] = None,
+                       stop_at: Optional[int] = None,
+                       max_distance: float = math.inf,
+                       queue_kind: Optional[str] = None,
+                       targets: Optional[Iterable[int]] = None,
+                       stop_when: Optional[Callable[[int, float], bool]] = None
+                       ) -> Tuple[Dict[int, float], Dict[int, Optional[int]], float]:
+    """
+    Grow a shortest path tree from one or more sources.
+
+    The compact graph stores both directions of every edge, so the tree
+    grown from a goal also gives distances *to* that goal.
+
+    Args:
+        compact: Compact graph
+        sources: Dense source node -> initial distance
+        weights: Per-arc weights (defaults to arc lengths)
+        stop_at: Dense node whose settlement ends the search
+        max_distance: Do not settle nodes farther than this
+        queue_kind: Priority queue to use (defaults to PRIORITY_QUEUE)
+        targets: Dense nodes whose settlement, once all are settled, ends
+            the search (one-to-many queries)
+        stop_when: Called with each settled dense node and its distance;
+            returning True ends the search (e.g. after k hits)
+
+    Returns:
+        (distances, parents, radius): distances and tree parents of the
+        settled nodes, and the largest settled distance. Every node that
+        was not settled is at least radius away.
+    """
+    if weights is None:
+        weights = compact.arc_lengths()
+    neighbor_lists = compact.neighbor_lists()
+    arc_offsets = compact.arc_offsets()
+
+    remaining = set(targets) if targets is not None else None
+    if remaining is not None and not remaining:
+        remaining = None
+    distances: Dict[int, float] = {}
+    settled_parents: Dict[int, Optional[int]] = {}
+    radius = 0.0
+
+    with borrow_workspace(compact.num_nodes) as workspace:
+        epoch = workspace.epoch
+        stamp, closed, cost, parent = workspace.stamp, workspace.closed, workspace.cost, workspace.parent
+        queue = workspace.priority_queue(queue_kind or PRIORITY_QUEUE)
+        push, pop = queue.push, queue.pop
+
+        for node, distance in sources.items():
+            stamp[node] = epoch
+            cost[node] = distance
+            parent[node] = -1
+            push(node, distance)
+
+        while queue:
+            _, current = pop()
+            if closed[current] == epoch:
+                continue
+            distance = cost[current]
+            if distance > max_distance:
+                break
+
+            closed[current] = epoch
+            distances[current] = distance
+            settled_parents[current] = parent[current] if parent[current] >= 0 else None
+            radius = distance
+            if current == stop_at:
+                break
+            if remaining is not None:
+                remaining.discard(current)
+                if not remaining:
+                    break
+            if stop_when is not None and stop_when(current, distance):
+                break
+
+            offset = arc_offsets[current]
+            for position, neighbor in enumerate(neighbor_lists[current]):
+                if closed[neighbor] == epoch:
+                    continue
+                neighbor_distance = distance + weights[offset + position]
+                if stamp[neighbor] != epoch:
+                    if neighbor_distance == math.inf:
+                        continue
+                    stamp[neighbor] = epoch
+                elif neighbor_distance >= cost[neighbor]:
+                    continue
+                cost[neighbor] = neighbor_distance
+                parent[neighbor] = current
+                push(neighbor, neighbor_distance)
+        else:
+            # Exhausted the component: every unsettled node is unreachable
+            radius = math.inf
+
+    return distances, settled_parents, radius
+
+
+def shortest_path_between_edges(compact: CompactGraph, source: EdgeSnap, target: EdgeSnap,
+                                weights: Optional[List[float]] = None,
+                                queue_kind: Optional[str] = None
+                                ) -> Optional[Tuple[float, List[int]]]:
+    """
+    Shortest route between two points snapped onto edges.
+
+    The search starts from both end nodes of the source edge, seeded with
+    the partial-edge cost from the snapped point, and a target end node
+    counts its remaining partial-edge cost on arrival. It stops once the
+    settled distance reaches the best arrival found, since no later
+    arrival can be cheaper. Two points on the same edge may also be joined
+    directly along it.
+
+    Args:
+        compact: Compact graph
+        source: Snapped start point
+        target: Snapped goal point
+        weights: Per-arc weights (defaults to arc lengths)
+        queue_kind: Priority queue to use (defaults to PRIORITY_QUEUE)
+
+    Returns:
+        (cost, path) with the path as original node ids from an end node of
+        the source edge to an end node of the target edge, or None if the
+        edges are not connected
+    """
+    if weights is None:
+        weights = compact.arc_lengths()
+    arrival_costs = target.endpoint_costs(weights)
+
+    best_cost = source.direct_cost(target, weights)
+    best_node: Optional[int] = None
+
+    def arrive(node: int, distance: float) -> bool:
+        nonlocal best_cost, best_node
+        if distance >= best_cost:
+            return True
+        if node in arrival_costs and distance + arrival_costs[node] < best_cost:
+            best_cost, best_node = distance + arrival_costs[node], node
+        return False
+
+    _, parents, _ = shortest_path_tree(compact, source.endpoint_costs(weights), weights,
+                                       queue_kind=queue_kind, stop_when=arrive)
+
+    if best_node is None:
+        if best_cost == math.inf:
+            return None
+        # Along the shared edge, towards whichever end the goal lies
+        ends = [source.tail, source.head]
+        if target.fraction < source.fraction:
+            ends.reverse()
+        return best_cost, compact.to_node_ids(ends)
+
+    path = []
+    current: Optional[int] = best_node
+    while current is not None:
+        path.append(current)
+        current = parents[current]
+    path.reverse()
+    return best_cost, compact.to_node_ids(path)
@@ -0,0 +1,118 @@
+"""
+Parallel alternative-route searches.
+Single responsibility: Run independent weighted A* searches in a process pool over a shared read-only graph.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from core.compact_graph import CompactGraph
+from core.compact_graph_adapter import CompactGraphAdapter
+
+if TYPE_CHECKING:
+    # astar_improved imports this module, so the algorithm is imported in the worker
+    from algorithms.astar_improved import AStarAlgorithm
+
+# Per-process search state, set once by _init_worker
+_worker_graph: Optional[CompactGraphAdapter] = None
+_worker_algorithm: Optional["AStarAlgorithm"] = None
+
+
+def _init_worker(cache_dir: Optional[str], version: str, compact: Optional[CompactGraph],
+                 arc_weights, priority_queue: str) -> None:
+    """
+    Load the shared graph in a worker process.
+
+    Memory-mapping the cached arrays lets every worker share the operating
+    system's page cache instead of holding its own copy; the pickled graph
+    is only sent when no matching cache exists. The algorithm and its
+    metric heuristic are built here once and reused by every task.
+    """
+    from algorithms.astar_improved import AStarAlgorithm
+
+    global _worker_graph, _worker_algorithm
+    if compact is None:
+        compact = CompactGraph.load(Path(cache_dir), version=version, mmap=True)
+    _worker_graph = CompactGraphAdapter(compact, arc_weights)
+    _worker_algorithm = AStarAlgorithm(priority_queue=priority_queue, parallel_workers=0)
+    _worker_algorithm.prepare(_worker_graph)
+
+
+def _run_weighted_search(start: int, goal: int,
+                         heuristic_weight: float) -> Tuple[Optional[List[int]], List[int]]:
+    """Run one weighted A* search in a worker; returns (path, visited nodes)."""
+    _worker_algorithm.reset_tracking()
+    path = _worker_algorithm.find_weighted_path(start, goal, _worker_graph, heuristic_weight)
+    return path, list(_worker_algorithm.get_visited_nodes())
+
+
+class ParallelAlternativeSearch:
+    """
+    Process pool running weighted A* searches on one compact graph and weight set.
+
+    Workers are started on the first search and keep the graph loaded
+    between queries. Results come back in the order the heuristic weights
+    were given, so callers can filter them exactly like sequential results.
+    """
+
+    def __init__(self, compact: CompactGraph, arc_weights=None, workers: Optional[int] = None,
+                 cache_dir: Optional[Path] = None, priority_queue: str = "heapq"):
+        """
+        Initialize the pool configuration.
+
+        Args:
+            compact: Compact graph to search
+            arc_weights: Optional per-arc weight list aligned with compact
+            workers: Number of worker processes (None uses the CPU count)
+            cache_dir: Directory holding compact's cached arrays, if saved
+            priority_queue: Open-list queue used by the workers
+        """
+        self.compact = compact
+        self.arc_weights = arc_weights
+        self.workers = workers
+        self.cache_dir = cache_dir
+        self.priority_queue = priority_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def search(self, start: int, goal: int,
+               heuristic_weights: Sequence[float]) -> List[Tuple[Optional[List[int]], List[int]]]:
+        """
+        Run one weighted A* search per heuristic weight concurrently.
+
+        Args:
+            start: Start node
+            goal: Goal node
+            heuristic_weights: Heuristic multipliers, one search each
+
+        Returns:
+            (path or None, visited nodes) per weight, in input order
+        """
+        executor = self._get_executor()
+        count = len(heuristic_weights)
+        return list(executor.map(_run_weighted_search, [start] * count, [goal] * count,
+                                 heuristic_weights))
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the pool on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=self._worker_graph_source() + (self.arc_weights, self.priority_queue),
+            )
+        return self._executor
+
+    def _worker_graph_source(self) -> Tuple[Optional[str], str, Optional[CompactGraph]]:
+        """Point workers at the cached arrays if they match, else ship the graph."""
+        if self.cache_dir is not None:
+            cached = CompactGraph.load(self.cache_dir, version=self.compact.version, mmap=True)
+            if cached is not None and cached.num_arcs == self.compact.num_arcs:
+                return str(self.cache_dir), self.compact.version, None
+        return None, self.compact.version, self.compact
@@ -0,0 +1,194 @@
+"""
+Time-dependent A* algorithm implementation.
+Finds earliest-arrival routes on hourly speed profiles for a given departure time.
+"""
+
+import heapq
+import math
+from typing import List, Optional, Iterator, Dict, Any
+
+from core.graph_interface import (
+    GraphInterface, ConstraintInterface, PathfindingAlgorithmInterface
+)
+from core.speed_profiles import SpeedProfileTable
+from algorithms.metric_heuristic import MetricHeuristic
+from config.settings import DEFAULT_DEPARTURE_TIME
+
+
+class TimeDependentAStarAlgorithm(PathfindingAlgorithmInterface):
+    """Earliest-arrival A* over time-dependent edge travel times."""
+
+    def __init__(self, speed_profiles: SpeedProfileTable, message_handler=None,
+                 departure_time: float = DEFAULT_DEPARTURE_TIME):
+        """
+        Initialize with the speed profiles of the road network.
+
+        Args:
+            speed_profiles: Travel time profiles (carry the compact graph)
+            message_handler: Optional message handler
+            departure_time: Default departure time in seconds after midnight
+        """
+        self.speed_profiles = speed_profiles
+        self.compact = speed_profiles.compact
+        self.message_handler = message_handler
+        self.departure_time = departure_time
+        self._last_visited_nodes = set()
+        self._last_route: Optional[Dict[str, Any]] = None
+        self._heuristic: Optional[MetricHeuristic] = None
+
+    def get_visited_nodes(self) -> set:
+        """Get the set of visited nodes from the last search."""
+        return self._last_visited_nodes
+
+    def get_last_route(self) -> Optional[Dict[str, Any]]:
+        """Get the timing details of the last route found."""
+        return self._last_route
+
+    def find_path(self, start: int, goal: int, graph: GraphInterface,
+                  constraints: Optional[List[ConstraintInterface]] = None,
+                  max_paths: Optional[int] = None) -> List[List[int]]:
+        """
+        Find the earliest-arrival path for the default departure time.
+
+        Args:
+            start: Start node
+            goal: Goal node
+            graph: Graph implementation
+            constraints: List of constraints to validate against
+            max_paths: Unused, a time-dependent search yields one route
+
+        Returns:
+            List with the earliest-arrival path, or empty if none
+        """
+        route = self.find_route(start, goal, self.departure_time)
+        if not route:
+            return []
+
+        path = route["path"]
+        if not self._validate_path(path, graph, constraints):
+            return []
+
+        if self.message_handler:
+            minutes = route["travel_time_seconds"] / 60.0
+            self.message_handler.handle_success(f"Found time-dependent route ({minutes:.1f} min)")
+
+        return [path]
+
+    def find_paths_streaming(self, start: int, goal: int, graph: GraphInterface,
+                           constraints: Optional[List[ConstraintInterface]] = None,
+                           max_paths: Optional[int] = None) -> Iterator[List[int]]:
+        """
+        Find paths using streaming generator.
+
+        Yields:
+            The earliest-arrival path, if any
+        """
+        for path in self.find_path(start, goal, graph, constraints, max_paths):
+            yield path
+
+    def find_route(self, start: int, goal: int, departure_time: float) -> Optional[Dict[str, Any]]:
+        """
+        Find the earliest-arrival route when leaving at a given time.
+
+        Labels are arrival times. Because every arc's arrival function is
+        FIFO, the first time a node is settled is its earliest arrival, so
+        the search stays label-setting like plain A*. The heuristic is the
+        metric heuristic over each arc's travel time at its fastest hour.
+
+        Args:
+            start: Start node
+            goal: Goal node
+            departure_time: Departure time in seconds after midnight
+
+        Returns:
+            Dictionary with path, per-node arrival times and travel time,
+            or None if the goal is unreachable
+        """
+        compact = self.compact
+        if not compact.has_node(start) or not compact.has_node(goal):
+            if self.message_handler:
+                self.message_handler.handle_error(f"Start or goal node not found")
+            return None
+
+        source = compact.index_of(start)
+        target = compact.index_of(goal)
+
+        # Reset tracking
+        self._last_visited_nodes = set()
+        self._last_route = None
+
+        neighbor_lists = compact.neighbor_lists()
+        arc_offsets = compact.arc_offsets()
+        arrival_time = self.speed_profiles.arrival_time
+        heuristic = self._travel_time_heuristic()
+        neighbor_estimates = heuristic.neighbor_estimates
+
+        arrivals = {source: departure_time}
+        parents = {source: None}
+        closed_set = set()
+        open_list = [(departure_time + heuristic.estimate(source, target), departure_time, source)]
+
+        while open_list:
+            _, current_time, current = heapq.heappop(open_list)
+
+            if current in closed_set:
+                continue
+            closed_set.add(current)
+
+            if current == target:
+                break
+
+            offset = arc_offsets[current]
+            estimates = neighbor_estimates(current, target)
+            for position, neighbor in enumerate(neighbor_lists[current]):
+                if neighbor in closed_set:
+                    continue
+
+                neighbor_time = arrival_time(offset + position, current_time)
+                if neighbor_time < arrivals.get(neighbor, math.inf):
+                    arrivals[neighbor] = neighbor_time
+                    parents[neighbor] = current
+                    heapq.heappush(open_list, (neighbor_time + estimates[position], neighbor_time, neighbor))
+
+        self._last_visited_nodes = set(compact.to_node_ids(arrivals))
+
+        if target not in closed_set:
+            if self.message_handler:
+                self.message_handler.handle_info("No path found between nodes")
+            return None
+
+        path_indices = []
+        node = target
+        while node is not None:
+            path_indices.append(node)
+            node = parents[node]
+        path_indices.reverse()
+
+        self._last_route = {
+            "path": compact.to_node_ids(path_indices),
+            "arrival_times": [arrivals[node] for node in path_indices],
+            "departure_time": departure_time,
+            "arrival_time": arrivals[target],
+            "travel_time_seconds": arrivals[target] - departure_time
+        }
+        return self._last_route
+
+    def _travel_time_heuristic(self) -> MetricHeuristic:
+        """Metric heuristic over the fastest travel time of every arc (built once)."""
+        if self._heuristic is None:
+            fastest = self.compact.length * self.speed_profiles.pace.min(axis=1)[self.compact.highway]
+            self._heuristic = MetricHeuristic(self.compact, fastest)
+        return self._heuristic
+
+    def _validate_path(self, path: List[int], graph: GraphInterface,
+                      constraints: Optional[List[ConstraintInterface]]) -> bool:
+        """Validate path against all constraints."""
+        if not constraints:
+            return True
+
+        for constraint in constraints:
+            is_valid, _ = constraint.validate(path, graph)
+            if not is_valid:
+                return False
+
+        return True
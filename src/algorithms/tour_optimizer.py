@@ -0,0 +1,301 @@
+"""
+Multi-stop visit order optimization.
+Single responsibility: Order stops on a cost matrix with construction plus 2-opt/Or-opt local search.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+# Or-opt moves segments of up to this many consecutive stops
+OR_OPT_MAX_SEGMENT = 3
+
+
+@dataclass
+class TourProblem:
+    """
+    A single-vehicle routing problem over a cost matrix.
+
+    Index 0 is the depot (start). With a capacity the vehicle returns to
+    the depot to reload whenever the next stop would not fit, so one
+    order can contain several trips. Time windows are soft: arriving
+    early waits, arriving late is penalized per second.
+    """
+    costs: Sequence[Sequence[float]]
+    travel_times: Optional[Sequence[Sequence[float]]] = None
+    return_to_start: bool = True
+    demands: Optional[Sequence[float]] = None
+    capacity: Optional[float] = None
+    time_windows: Optional[Sequence[Optional[Tuple[float, float]]]] = None
+    service_times: Optional[Sequence[float]] = None
+    start_time: float = 0.0
+
+    @property
+    def size(self) -> int:
+        """Number of locations including the depot."""
+        return len(self.costs)
+
+
+@dataclass
+class TourSolution:
+    """Visit order and its evaluation."""
+    order: List[int]
+    trips: List[List[int]]
+    cost: float
+    lateness: float
+    arrival_times: List[float] = field(default_factory=list)
+    iterations: int = 0
+
+    @property
+    def feasible(self) -> bool:
+        """True if every time window is met."""
+        return self.lateness <= 0.0
+
+
+class TourOptimizer:
+    """Nearest-neighbor construction improved by 2-opt and Or-opt under a time budget."""
+
+    def __init__(self, time_budget: float = 2.0, lateness_penalty: float = 1000.0):
+        """
+        Initialize the optimizer.
+
+        Args:
+            time_budget: Seconds of local search per solve
+            lateness_penalty: Objective cost per second of time window violation
+        """
+        self.time_budget = time_budget
+        self.lateness_penalty = lateness_penalty
+
+    def solve(self, problem: TourProblem) -> TourSolution:
+        """
+        Find a good visit order.
+
+        Args:
+            problem: Problem to solve
+
+        Returns:
+            Best solution found within the time budget
+
+        Raises:
+            ValueError: If a single stop's demand exceeds the capacity
+        """
+        if problem.capacity is not None and problem.demands is not None:
+            if any(demand > problem.capacity for demand in problem.demands[1:]):
+                raise ValueError("A stop's demand exceeds the vehicle capacity")
+
+        deadline = time.perf_counter() + self.time_budget
+        order = self._nearest_neighbor(problem)
+        constrained = ((problem.capacity is not None and problem.demands is not None)
+                       or problem.time_windows is not None)
+        if constrained:
+            order, iterations = self._improve_simulated(problem, order, deadline)
+        else:
+            order, iterations = self._improve_by_delta(problem, order, deadline)
+
+        cost, lateness, trips, arrivals = self.evaluate(problem, order)
+        return TourSolution(order, trips, cost, lateness, arrivals, iterations)
+
+    def evaluate(self, problem: TourProblem, order: Sequence[int]
+                 ) -> Tuple[float, float, List[List[int]], List[float]]:
+        """
+        Simulate driving an order.
+
+        Args:
+            problem: Problem the order belongs to
+            order: Stop indices (excluding the depot) in visit order
+
+        Returns:
+            (cost, lateness seconds, trips, arrival time per visited stop)
+        """
+        costs = problem.costs
+        times = problem.travel_times or costs
+        demands, capacity = problem.demands, problem.capacity
+        windows, service = problem.time_windows, problem.service_times
+
+        cost, lateness, load = 0.0, 0.0, 0.0
+        clock = problem.start_time
+        previous = 0
+        trips: List[List[int]] = [[]]
+        arrivals: List[float] = []
+
+        for stop in order:
+            demand = demands[stop] if demands is not None else 0.0
+            if capacity is not None and trips[-1] and load + demand > capacity:
+                # Back to the depot to reload
+                cost += costs[previous][0]
+                clock += times[previous][0]
+                previous, load = 0, 0.0
+                trips.append([])
+
+            cost += costs[previous][stop]
+            clock += times[previous][stop]
+            if windows is not None and windows[stop] is not None:
+                earliest, latest = windows[stop]
+                if clock < earliest:
+                    clock = earliest
+                elif clock > latest:
+                    lateness += clock - latest
+            arrivals.append(clock)
+            if service is not None:
+                clock += service[stop]
+
+            load += demand
+            previous = stop
+            trips[-1].append(stop)
+
+        if problem.return_to_start:
+            cost += costs[previous][0]
+        return cost, lateness, trips, arrivals
+
+    def _objective(self, problem: TourProblem, order: Sequence[int]) -> float:
+        """Cost plus the lateness penalty."""
+        cost, lateness, _, _ = self.evaluate(problem, order)
+        return cost + self.lateness_penalty * lateness
+
+    @staticmethod
+    def _nearest_neighbor(problem: TourProblem) -> List[int]:
+        """Greedy order: always drive to the closest unvisited stop."""
+        costs = problem.costs
+        unvisited = set(range(1, problem.size))
+        order, current = [], 0
+        while unvisited:
+            current = min(unvisited, key=lambda stop: (costs[current][stop], stop))
+            unvisited.remove(current)
+            order.append(current)
+        return order
+
+    def _improve_by_delta(self, problem: TourProblem, order: List[int],
+                          deadline: float) -> Tuple[List[int], int]:
+        """
+        2-opt and Or-opt local search priced by cost deltas.
+
+        Without capacity or time windows a move only changes the arcs at
+        its ends (and the direction of a reversed segment), so every
+        candidate is priced in O(1) from prefix sums of the tour's arc
+        costs in both directions. An improving move is applied at once and
+        the scan carries on with the next candidate; passes repeat until
+        one finds no improvement or the time budget runs out.
+
+        Returns:
+            (improved order, number of candidates priced)
+        """
+        size = len(order)
+        if size < 2:
+            return order, 0
+
+        # Location `end` stands for the route's end: the depot, or nowhere for open routes
+        end = problem.size
+        arc = [list(row) + [row[0] if problem.return_to_start else 0.0] for row in problem.costs]
+        tour = [0] + list(order) + [end]
+        forward, backward = self._prefix_costs(arc, tour)
+        iterations = 0
+
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+
+            # 2-opt: reverse tour[i..j]
+            for i in range(1, size):
+                for j in range(i + 1, size + 1):
+                    iterations += 1
+                    before, first, last, after = tour[i - 1], tour[i], tour[j], tour[j + 1]
+                    delta = (arc[before][last] + arc[first][after] - arc[before][first] - arc[last][after]
+                             + (backward[j] - backward[i]) - (forward[j] - forward[i]))
+                    if delta < -1e-9:
+                        tour[i:j + 1] = tour[i:j + 1][::-1]
+                        forward, backward = self._prefix_costs(arc, tour)
+                        improved = True
+                    if iterations % 256 == 0 and time.perf_counter() >= deadline:
+                        return tour[1:-1], iterations
+
+            # Or-opt: move tour[i..i+length-1] between two other consecutive locations
+            for length in range(1, min(OR_OPT_MAX_SEGMENT, size - 1) + 1):
+                i = 1
+                while i + length - 1 <= size:
+                    first, last = tour[i], tour[i + length - 1]
+                    before, after = tour[i - 1], tour[i + length]
+                    removal = arc[before][after] - arc[before][first] - arc[last][after]
+                    for position in range(size + 1):
+                        if i - 1 <= position <= i + length - 1:
+                            continue
+                        iterations += 1
+                        left, right = tour[position], tour[position + 1]
+                        delta = removal + arc[left][first] + arc[last][right] - arc[left][right]
+                        if delta < -1e-9:
+                            segment = tour[i:i + length]
+                            rest = tour[:i] + tour[i + length:]
+                            insert_at = position + 1 if position < i else position + 1 - length
+                            tour = rest[:insert_at] + segment + rest[insert_at:]
+                            forward, backward = self._prefix_costs(arc, tour)
+                            improved = True
+                            break
+                        if iterations % 256 == 0 and time.perf_counter() >= deadline:
+                            return tour[1:-1], iterations
+                    i += 1
+
+        return tour[1:-1], iterations
+
+    def _improve_simulated(self, problem: TourProblem, order: List[int],
+                           deadline: float) -> Tuple[List[int], int]:
+        """
+        2-opt and Or-opt local search with every candidate simulated in full.
+
+        Capacity reloads and time windows make a move's effect depend on
+        the whole order, so candidates are evaluated by evaluate(). As in
+        _improve_by_delta, an improving move is applied and the scan
+        continues instead of starting over.
+
+        Returns:
+            (improved order, number of candidates evaluated)
+        """
+        size = len(order)
+        best = self._objective(problem, order)
+        iterations = 0
+
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+            for i in range(size - 1):
+                for j in range(i + 1, size):
+                    iterations += 1
+                    candidate = order[:i] + order[i:j + 1][::-1] + order[j + 1:]
+                    value = self._objective(problem, candidate)
+                    if value < best - 1e-9:
+                        order, best = candidate, value
+                        improved = True
+                    if iterations % 256 == 0 and time.perf_counter() >= deadline:
+                        return order, iterations
+
+            for length in range(1, min(OR_OPT_MAX_SEGMENT, size - 1) + 1):
+                for i in range(size - length + 1):
+                    k = 0
+                    while k <= size - length:
+                        if k != i:
+                            iterations += 1
+                            rest = order[:i] + order[i + length:]
+                            candidate = rest[:k] + order[i:i + length] + rest[k:]
+                            value = self._objective(problem, candidate)
+                            if value < best - 1e-9:
+                                order, best = candidate, value
+                                improved = True
+                            if iterations % 256 == 0 and time.perf_counter() >= deadline:
+                                return order, iterations
+                        k += 1
+
+        return order, iterations
+
+    @staticmethod
+    def _prefix_costs(arc: List[List[float]], tour: List[int]) -> Tuple[List[float], List[float]]:
+        """
+        Prefix sums of a tour's arc costs driven forwards and backwards.
+
+        forward[k] - forward[i] is the cost of driving tour[i..k] in order,
+        backward[k] - backward[i] the cost of driving it reversed.
+        """
+        forward = [0.0] * (len(tour) - 1)
+        backward = [0.0] * (len(tour) - 1)
+        for position in range(1, len(tour) - 1):
+            a, b = tour[position - 1], tour[position]
+            forward[position] = forward[position - 1] + arc[a][b]
+            backward[position] = backward[position - 1] + arc[b][a]
+        return forward, backward
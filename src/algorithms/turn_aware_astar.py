@@ -0,0 +1,227 @@
+"""
+Turn-aware A* algorithm implementation.
+Searches the edge-based graph so turn penalties and turn restrictions are honored.
+"""
+
+import heapq
+import math
+from typing import List, Optional, Iterator, Dict, Any, Tuple
+
+from core.graph_interface import (
+    GraphInterface, ConstraintInterface, PathfindingAlgorithmInterface
+)
+from core.edge_based_graph import EdgeBasedGraph
+from algorithms.metric_heuristic import MetricHeuristic
+from config.settings import AVERAGE_SPEED_KMH
+
+
+class TurnAwareAStarAlgorithm(PathfindingAlgorithmInterface):
+    """A* over arc states with turn costs, guided by the metric heuristic of the weights."""
+
+    def __init__(self, edge_graph: EdgeBasedGraph, message_handler=None,
+                 meters_per_second: float = AVERAGE_SPEED_KMH / 3.6):
+        """
+        Initialize with the edge-based expansion of the road network.
+
+        Args:
+            edge_graph: Turn costs and restrictions in seconds (carries the compact graph)
+            message_handler: Optional message handler
+            meters_per_second: Speed converting turn delays for weights in meters
+        """
+        self.edge_graph = edge_graph
+        self.compact = edge_graph.compact
+        self.message_handler = message_handler
+        self.meters_per_second = meters_per_second
+        self._metric_heuristics: Dict[Tuple[int, int], MetricHeuristic] = {}
+        self._last_visited_nodes = set()
+        self._last_route: Optional[Dict[str, Any]] = None
+
+    def get_visited_nodes(self) -> set:
+        """Get the set of visited nodes from the last search."""
+        return self._last_visited_nodes
+
+    def get_last_route(self) -> Optional[Dict[str, Any]]:
+        """Get the cost breakdown of the last route found."""
+        return self._last_route
+
+    def find_path(self, start: int, goal: int, graph: GraphInterface,
+                  constraints: Optional[List[ConstraintInterface]] = None,
+                  max_paths: Optional[int] = None) -> List[List[int]]:
+        """
+        Find the cheapest path including turn costs.
+
+        Args:
+            start: Start node
+            goal: Goal node
+            graph: Graph implementation
+            constraints: List of constraints to validate against
+            max_paths: Unused, the search yields one route
+
+        Returns:
+            List with the cheapest path, or empty if none
+        """
+        turn_cost_scale = 1.0 if graph.get_weight_unit() == "seconds" else self.meters_per_second
+        route = self.find_route(start, goal, graph.get_arc_weights(), turn_cost_scale)
+        if not route:
+            return []
+
+        path = route["path"]
+        if not self._validate_path(path, graph, constraints):
+            return []
+
+        if self.message_handler:
+            self.message_handler.handle_success(
+                f"Found turn-aware route ({route['distance']:.0f}m, "
+                f"{route['turn_cost'] / turn_cost_scale:.0f}s turn delay)"
+            )
+
+        return [path]
+
+    def find_paths_streaming(self, start: int, goal: int, graph: GraphInterface,
+                           constraints: Optional[List[ConstraintInterface]] = None,
+                           max_paths: Optional[int] = None) -> Iterator[List[int]]:
+        """
+        Find paths using streaming generator.
+
+        Yields:
+            The cheapest turn-aware path, if any
+        """
+        for path in self.find_path(start, goal, graph, constraints, max_paths):
+            yield path
+
+    def find_route(self, start: int, goal: int, arc_weights=None,
+                   turn_cost_scale: float = 1.0) -> Optional[Dict[str, Any]]:
+        """
+        Find the cheapest route from start to goal including turn costs.
+
+        The metric heuristic of the weights ignores turns; turn costs are
+        never negative, so it stays a consistent lower bound. It is built
+        once per set of weights and reused by every query. The search keeps
+        one label per incoming arc only at branching nodes and one label per
+        node everywhere else.
+
+        Args:
+            start: Start node
+            goal: Goal node
+            arc_weights: Per-arc weights of a weight profile as a list
+                (defaults to lengths)
+            turn_cost_scale: Weight units per second of turn delay
+                (1 for weights in seconds, a speed for weights in meters)
+
+        Returns:
+            Dictionary with path, cost, distance and turn_cost, or None if
+            the goal is unreachable
+        """
+        compact = self.compact
+        if not compact.has_node(start) or not compact.has_node(goal):
+            if self.message_handler:
+                self.message_handler.handle_error(f"Start or goal node not found")
+            return None
+
+        source = compact.index_of(start)
+        target = compact.index_of(goal)
+
+        # Reset tracking
+        self._last_visited_nodes = set()
+        self._last_route = None
+
+        arc_lengths = compact.arc_lengths()
+        weights = arc_lengths if arc_weights is None else arc_weights
+
+        heuristic = self._metric_heuristic(arc_weights).for_goal_index(target)
+
+        neighbor_lists = compact.neighbor_lists()
+        arc_offsets = compact.arc_offsets()
+        turn_costs, turn_offsets = self.edge_graph.turn_cost_lists()
+        branching = self.edge_graph.branching_nodes()
+        num_arcs = compact.num_arcs
+
+        # State keys: arc id for arc states, num_arcs + node for node states
+        start_key = num_arcs + source
+        g_scores = {start_key: 0.0}
+        parents = {start_key: None}
+        closed_set = set()
+        # Entries: (f, g, state key, node, incoming arc or -1 for node states)
+        open_list = [(heuristic(source), 0.0, start_key, source, -1)]
+        goal_key = None
+
+        while open_list:
+            _, current_g, current_key, current, in_arc = heapq.heappop(open_list)
+
+            if current_key in closed_set:
+                continue
+            closed_set.add(current_key)
+
+            if current == target:
+                goal_key = current_key
+                break
+
+            offset = arc_offsets[current]
+            turn_offset = turn_offsets[in_arc] if in_arc >= 0 else -1
+            for position, neighbor in enumerate(neighbor_lists[current]):
+                arc = offset + position
+                turn = turn_costs[turn_offset + position] if turn_offset >= 0 else 0.0
+                if turn == math.inf:
+                    continue
+                turn *= turn_cost_scale
+
+                neighbor_g = current_g + turn + weights[arc]
+                if branching[neighbor]:
+                    neighbor_key, neighbor_in_arc = arc, arc
+                else:
+                    neighbor_key, neighbor_in_arc = num_arcs + neighbor, -1
+
+                if neighbor_key in closed_set:
+                    continue
+                if neighbor_g < g_scores.get(neighbor_key, math.inf):
+                    g_scores[neighbor_key] = neighbor_g
+                    parents[neighbor_key] = current_key
+                    heapq.heappush(open_list, (neighbor_g + heuristic(neighbor), neighbor_g, neighbor_key,
+                                               neighbor, neighbor_in_arc))
+
+        indices = compact.indices
+        visited = {key - num_arcs if key >= num_arcs else int(indices[key]) for key in g_scores}
+        self._last_visited_nodes = set(compact.to_node_ids(visited))
+
+        if goal_key is None:
+            if self.message_handler:
+                self.message_handler.handle_info("No path found between nodes")
+            return None
+
+        path_indices = []
+        key = goal_key
+        while key is not None:
+            path_indices.append(key - num_arcs if key >= num_arcs else int(indices[key]))
+            key = parents[key]
+        path_indices.reverse()
+
+        path_arcs = [compact.arc_between(u, v) for u, v in zip(path_indices, path_indices[1:])]
+        cost = g_scores[goal_key]
+
+        self._last_route = {
+            "path": compact.to_node_ids(path_indices),
+            "cost": cost,
+            "distance": sum(arc_lengths[arc] for arc in path_arcs),
+            "turn_cost": cost - sum(weights[arc] for arc in path_arcs)
+        }
+        return self._last_route
+
+    def _metric_heuristic(self, arc_weights) -> MetricHeuristic:
+        """Get the metric heuristic for a set of arc weights (cached)."""
+        key = (id(self.compact), id(arc_weights))
+        if key not in self._metric_heuristics:
+            self._metric_heuristics[key] = MetricHeuristic(self.compact, arc_weights)
+        return self._metric_heuristics[key]
+
+    def _validate_path(self, path: List[int], graph: GraphInterface,
+                      constraints: Optional[List[ConstraintInterface]]) -> bool:
+        """Validate path against all constraints."""
+        if not constraints:
+            return True
+
+        for constraint in constraints:
+            is_valid, _ = constraint.validate(path, graph)
+            if not is_valid:
+                return False
+
+        return True
@@ -3,10 +3,14 @@ A* pathfinding controller with Addis Ababa constraints and visualization support
 Integrates the improved A* algorithm with domain-specific components.
 """
 
-from typing import Optional, Dict, Any, List
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Callable, Iterator, Union
 
 from core.addis_ababa_adapter import AddisAbabaAdapter
 from algorithms.astar_improved import AStarAlgorithm
+from algorithms.time_dependent_astar import TimeDependentAStarAlgorithm
+from core.speed_profiles import seconds_after_midnight
+from config.settings import DEFAULT_DEPARTURE_TIME
 from shared.constraints.node_limit_constraint import NodeLimitConstraint
 from shared.constraints.distance_constraint import DistanceConstraint
 from shared.constraints.time_constraint import TimeConstraint
@@ -60,13 +64,23 @@ class AStarController:
             average_speed_m_per_s = 8.3
             constraints.append(TimeConstraint(max_time, self.domain_adapter.path_calculator, average_speed_m_per_s))
         
-        # Find paths using A*
-        paths = self.astar_algorithm.find_path(
-            start_node, goal_node, 
-            self.domain_adapter.graph_adapter, 
-            constraints,
-            max_paths=5
-        )
+        # Routes between known locations are precomputed; use them if they all meet the constraints
+        paths = self.domain_adapter.get_precomputed_paths("astar", start_node, goal_node, 5)
+        if paths is not None and not all(
+            constraint.validate(path, self.domain_adapter.graph_adapter)[0]
+            for path in paths for constraint in constraints
+        ):
+            paths = None
+        precomputed = paths is not None
+        
+        if not precomputed:
+            # Find paths using A*
+            paths = self.astar_algorithm.find_path(
+                start_node, goal_node, 
+                self.domain_adapter.graph_adapter, 
+                constraints,
+                max_paths=5
+            )
         
         if not paths:
             return {
@@ -75,8 +89,8 @@ class AStarController:
                 "paths": []
             }
         
-        # Get visited nodes for visualization
-        visited_nodes = self.astar_algorithm.get_visited_nodes()
+        # Get visited nodes for visualization (precomputed routes have none)
+        visited_nodes = set() if precomputed else self.astar_algorithm.get_visited_nodes()
         
         # Prepare results
         results = {
@@ -87,30 +101,163 @@ class AStarController:
             "goal_location": goal_location,
             "start_node": start_node,
             "goal_node": goal_node,
-            "all_found_paths": self.astar_algorithm.get_all_found_paths(),
+            "all_found_paths": paths if precomputed else self.astar_algorithm.get_all_found_paths(),
             "visited_nodes": visited_nodes,
             "algorithm": "A*"
         }
         
-        # Calculate path statistics
-        results["statistics"] = self.domain_adapter.path_calculator.get_path_statistics(
-            paths, self.domain_adapter.graph_adapter.graph
+        # Calculate path costs and statistics in one pass
+        path_costs = self.domain_adapter.path_calculator.evaluate_paths(paths, self.domain_adapter.graph_adapter)
+        results["statistics"] = path_costs.statistics()
+        
+        # Add human-readable street segments
+        results.update(self.domain_adapter.summarize_paths(results["paths"]))
+        results["path_costs"] = path_costs.costs.tolist()
+        
+        return results
+    
+    def find_paths_anytime(self, start_location: str, goal_location: str,
+                           initial_weight: float = 2.5,
+                           callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                           time_budget: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Find improving paths using anytime A* (ARA*).
+        
+        The first result arrives after a cheap, greedy search; every later
+        result is a better route with a tighter suboptimality bound, ending
+        with a proven-optimal route unless the time budget runs out.
+        
+        Args:
+            start_location: Start location name
+            goal_location: Goal location name
+            initial_weight: Heuristic inflation of the first search
+            callback: Optional callable receiving every result dictionary
+            time_budget: Optional wall-clock budget in seconds
+        
+        Yields:
+            Result dictionaries, one per improved solution
+        """
+        try:
+            # Convert locations to nodes
+            start_node = self.domain_adapter.get_nearest_node(start_location)
+            goal_node = self.domain_adapter.get_nearest_node(goal_location)
+        except Exception as e:
+            result = {
+                "success": False,
+                "message": f"Could not find location: {e}",
+                "paths": []
+            }
+            if callback:
+                callback(result)
+            yield result
+            return
+        
+        solutions = self.astar_algorithm.find_paths_anytime(
+            start_node, goal_node,
+            self.domain_adapter.graph_adapter,
+            initial_weight=initial_weight,
+            time_budget=time_budget
         )
         
-        # Add human-readable node names
-        results["path_names"] = []
-        results["path_costs"] = []
-        for path in results["paths"]:
-            path_names = [self.domain_adapter.get_node_name(node) for node in path]
-            results["path_names"].append(path_names)
+        for solution in solutions:
+            path = solution["path"]
+            result = {
+                "success": True,
+                "paths": [path],
+                "primary_path": path,
+                "start_location": start_location,
+                "goal_location": goal_location,
+                "start_node": start_node,
+                "goal_node": goal_node,
+                "visited_nodes": self.astar_algorithm.get_visited_nodes(),
+                "path_costs": [solution["cost"]],
+                "heuristic_weight": solution["heuristic_weight"],
+                "suboptimality_bound": solution["suboptimality_bound"],
+                "is_optimal": solution["is_optimal"],
+                "elapsed_seconds": solution["elapsed_seconds"],
+                "algorithm": "ARA*"
+            }
+            if callback:
+                callback(result)
+            yield result
+    
+    def find_time_dependent_path(self, start_location: str, goal_location: str,
+                                 departure_time: Optional[Union[float, datetime]] = None,
+                                 max_time: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Find the earliest-arrival path for a departure time.
+        
+        Edge travel times follow the hourly speed profiles of each road
+        class instead of one average speed for all roads.
+        
+        Args:
+            start_location: Start location name
+            goal_location: Goal location name
+            departure_time: Seconds after midnight or datetime (defaults to the morning peak)
+            max_time: Maximum travel time (seconds)
             
-            # Calculate path cost
-            cost = self.domain_adapter.path_calculator.calculate_path_cost(
-                path, self.domain_adapter.graph_adapter.graph
-            )
-            results["path_costs"].append(cost)
+        Returns:
+            Dictionary with path results, arrival times and travel time
+        """
+        try:
+            # Convert locations to nodes
+            start_node = self.domain_adapter.get_nearest_node(start_location)
+            goal_node = self.domain_adapter.get_nearest_node(goal_location)
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Could not find location: {e}",
+                "paths": []
+            }
         
-        return results
+        departure_s = seconds_after_midnight(
+            DEFAULT_DEPARTURE_TIME if departure_time is None else departure_time
+        )
+        td_algorithm = TimeDependentAStarAlgorithm(
+            self.domain_adapter.graph_model.speed_profiles,
+            self.domain_adapter.message_handler,
+            departure_time=departure_s
+        )
+        route = td_algorithm.find_route(start_node, goal_node, departure_s)
+        
+        if not route:
+            return {
+                "success": False,
+                "message": "No paths found between the specified nodes",
+                "paths": []
+            }
+        
+        if max_time is not None and route["travel_time_seconds"] > max_time:
+            return {
+                "success": False,
+                "message": (
+                    f"Estimated travel time ({route['travel_time_seconds'] / 60.0:.1f} min) "
+                    f"exceeds maximum ({max_time / 60.0:.1f} min)"
+                ),
+                "paths": []
+            }
+        
+        path = route["path"]
+        return {
+            "success": True,
+            "paths": [path],
+            "primary_path": path,
+            "start_location": start_location,
+            "goal_location": goal_location,
+            "start_node": start_node,
+            "goal_node": goal_node,
+            "visited_nodes": td_algorithm.get_visited_nodes(),
+            "departure_time": route["departure_time"],
+            "arrival_time": route["arrival_time"],
+            "arrival_times": route["arrival_times"],
+            "travel_time_seconds": route["travel_time_seconds"],
+            "path_costs": [
+                self.domain_adapter.path_calculator.calculate_path_cost(
+                    path, self.domain_adapter.graph_adapter
+                )
+            ],
+            "algorithm": "Time-dependent A*"
+        }
     
     def find_paths_with_constraints(self, start_location: str, goal_location: str,
                                   max_paths: int = 5,
@@ -179,18 +326,11 @@ class AStarController:
             "algorithm": "A*"
         }
         
-        # Add human-readable node names
-        results["path_names"] = []
-        results["path_costs"] = []
-        for path in results["paths"]:
-            path_names = [self.domain_adapter.get_node_name(node) for node in path]
-            results["path_names"].append(path_names)
-            
-            # Calculate path cost
-            cost = self.domain_adapter.path_calculator.calculate_path_cost(
-                path, self.domain_adapter.graph_adapter.graph
-            )
-            results["path_costs"].append(cost)
+        # Add human-readable street segments
+        results.update(self.domain_adapter.summarize_paths(results["paths"]))
+        results["path_costs"] = self.domain_adapter.path_calculator.calculate_path_costs(
+            results["paths"], self.domain_adapter.graph_adapter
+        )
         
         return results
     
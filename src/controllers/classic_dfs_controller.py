@@ -66,8 +66,11 @@ class ClassicDFSController:
                 "paths": []
             }
         
-        # First, try without constraints to get basic paths
-        basic_paths = self.classic_dfs.find_path(start_node, goal_node, self.domain_adapter.graph_adapter, [], max_paths)
+        # First, try without constraints to get basic paths (precomputed between known locations)
+        basic_paths = self.domain_adapter.get_precomputed_paths("dfs", start_node, goal_node, max_paths)
+        precomputed = basic_paths is not None
+        if not precomputed:
+            basic_paths = self.classic_dfs.find_path(start_node, goal_node, self.domain_adapter.graph_adapter, [], max_paths)
         
         if not basic_paths:
             return {
@@ -77,7 +80,8 @@ class ClassicDFSController:
             }
         
         # Get visited nodes from Classic DFS
-        visited_nodes = self.classic_dfs.get_visited_nodes()
+        visited_nodes = set() if precomputed else self.classic_dfs.get_visited_nodes()
+        all_found_paths = basic_paths if precomputed else self.classic_dfs.get_all_found_paths()
         
         # Create Addis Ababa-specific constraints (more lenient)
         constraints = self._create_addis_ababa_constraints(
@@ -91,7 +95,7 @@ class ClassicDFSController:
             constraint_messages = []
             
             for constraint in constraints:
-                valid, message = constraint.validate(path, self.domain_adapter.graph_adapter.graph)
+                valid, message = constraint.validate(path, self.domain_adapter.graph_adapter)
                 if not valid:
                     is_valid = False
                     constraint_messages.append(message)
@@ -110,7 +114,7 @@ class ClassicDFSController:
                 "goal_location": goal_location,
                 "start_node": start_node,
                 "goal_node": goal_node,
-                "all_found_paths": self.classic_dfs.get_all_found_paths(),
+                "all_found_paths": all_found_paths,
                 "visited_nodes": visited_nodes,  # Add visited nodes here
                 "constraints_applied": ["No constraints applied (too restrictive)"],
                 "constraint_warning": "Original constraints were too restrictive, showing unconstrained paths"
@@ -125,23 +129,16 @@ class ClassicDFSController:
             "goal_location": goal_location,
             "start_node": start_node,
             "goal_node": goal_node,
-            "all_found_paths": self.classic_dfs.get_all_found_paths(),
+            "all_found_paths": all_found_paths,
             "visited_nodes": visited_nodes,  # Add visited nodes here
             "constraints_applied": self._get_constraint_descriptions(constraints)
         }
         
-        # Add human-readable node names
-        results["path_names"] = []
-        results["path_costs"] = []
-        for path in results["paths"]:
-            path_names = [self.domain_adapter.get_node_name(node) for node in path]
-            results["path_names"].append(path_names)
-            
-            # Calculate path cost
-            cost = self.domain_adapter.path_calculator.calculate_path_cost(
-                path, self.domain_adapter.graph_adapter.graph
-            )
-            results["path_costs"].append(cost)
+        # Add human-readable street segments
+        results.update(self.domain_adapter.summarize_paths(results["paths"]))
+        results["path_costs"] = self.domain_adapter.path_calculator.calculate_path_costs(
+            results["paths"], self.domain_adapter.graph_adapter
+        )
         
         return results
     
@@ -260,18 +257,12 @@ class ClassicDFSController:
         
         # Generate path data if not present
         if not path_names:
-            path_names = []
-            for path in paths:
-                names = [self.domain_adapter.get_node_name(node) for node in path]
-                path_names.append(names)
+            path_names = self.domain_adapter.summarize_paths(paths)["path_names"]
         
         if not path_costs:
-            path_costs = []
-            for path in paths:
-                cost = self.domain_adapter.path_calculator.calculate_path_cost(
-                    path, self.domain_adapter.graph_adapter.graph
-                )
-                path_costs.append(cost)
+            path_costs = self.domain_adapter.path_calculator.calculate_path_costs(
+                paths, self.domain_adapter.graph_adapter
+            )
         
         # Find best path
         if path_costs:
@@ -291,8 +282,9 @@ class ClassicDFSController:
                 cost_percent = (cost_diff / path_costs[0]) * 100
                 print(f"ALT {i}: {cost:.0f}m ({cost_percent:+.0f}%), {len(path)-1} steps")
             
-            # Show start and end points only
-            print(f"   {names[0]} -> {names[-1]}")
+            # Streets along the path (endpoints are in the Route line above)
+            streets = " -> ".join(names[:4]) + (" -> ..." if len(names) > 4 else "")
+            print(f"   via {streets}")
         
         # Recommendations
         print(f"\nRECOMMENDATION:")
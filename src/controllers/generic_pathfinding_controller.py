@@ -3,9 +3,12 @@ Generic pathfinding controller.
 Works with any domain through adapters and generic components.
 """
 
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
 
+from config.settings import DEFAULT_DEPARTURE_TIME, DISPATCH_VEHICLE_COUNT
 from core.addis_ababa_adapter import AddisAbabaAdapter
+from core.speed_profiles import seconds_after_midnight
 from services.generic_pathfinding_service import GenericPathfindingService
 from services.visualization_service import VisualizationService
 
@@ -32,6 +35,8 @@ class GenericPathfindingController:
         max_nodes: Optional[int] = None,
         max_distance: Optional[float] = None,
         max_time: Optional[float] = None,
+        departure_time: Optional[Union[float, datetime]] = None,
+        weight_profile: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Find optimal paths between two locations.
@@ -39,11 +44,15 @@ class GenericPathfindingController:
         Args:
             start_location: Start location name
             goal_location: Goal location name
-            algorithm: Algorithm to use ("bfs", "dfs", "astar")
+            algorithm: Algorithm to use ("bfs", "dfs", "astar", "td_astar", "astar_turns")
             max_paths: Maximum number of paths to find
             max_nodes: Maximum nodes to process
             max_distance: Maximum path distance (meters)
             max_time: Maximum travel time (seconds)
+            departure_time: Departure time for hourly speed profiles
+                (seconds after midnight or datetime)
+            weight_profile: Edge weight profile ("distance", "travel_time", "truck"
+                or a registered custom profile)
             
         Returns:
             Dictionary with path results
@@ -60,17 +69,34 @@ class GenericPathfindingController:
             }
         
         # Create pathfinding service with specified algorithm
-        pathfinding_service = self.domain_adapter.create_pathfinding_service(algorithm)
+        try:
+            pathfinding_service = self.domain_adapter.create_pathfinding_service(
+                algorithm, departure_time, weight_profile
+            )
+        except KeyError as e:
+            return {
+                "success": False,
+                "message": str(e.args[0]),
+                "paths": []
+            }
         
         # Create domain-specific constraints
         constraints = self.domain_adapter.create_addis_constraints(
             max_nodes=max_nodes,
             max_distance=max_distance,
             max_time=max_time,
+            departure_time=departure_time,
         )
         
-        # Find paths
-        results = pathfinding_service.find_paths(start_node, goal_node, constraints, max_paths)
+        # Find paths; repeated queries with the same snapped endpoints come from the route cache or store
+        departure = seconds_after_midnight(departure_time) if departure_time is not None else None
+        cache_key = (
+            algorithm.lower(), self.domain_adapter.weights_key(weight_profile),
+            max_nodes, max_distance, max_time, departure
+        )
+        results = pathfinding_service.find_paths(
+            start_node, goal_node, constraints, max_paths, cache_key=cache_key
+        )
         
         # Add domain-specific information
         if results["success"]:
@@ -79,11 +105,293 @@ class GenericPathfindingController:
             results["start_node"] = start_node
             results["goal_node"] = goal_node
             
-            # Add human-readable node names
-            results["path_names"] = []
-            for path in results["paths"]:
-                path_names = [self.domain_adapter.get_node_name(node) for node in path]
-                results["path_names"].append(path_names)
+            # Add human-readable street segments
+            results.update(self.domain_adapter.summarize_paths(results["paths"]))
+        
+        return results
+    
+    def find_path_between_points(
+        self,
+        start_location: Union[str, Tuple[float, float]],
+        goal_location: Union[str, Tuple[float, float]],
+        algorithm: str = "astar",
+        weight_profile: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Find the optimal route between two points snapped onto their nearest edges.
+        
+        Unlike find_optimal_paths, which moves both points to their nearest
+        nodes first, the route enters and leaves the network part-way along
+        an edge, and its cost includes those partial edges.
+        
+        Args:
+            start_location: Start location name or (lat, lon) pair
+            goal_location: Goal location name or (lat, lon) pair
+            algorithm: "astar", or "dijkstra" for an uninformed search
+            weight_profile: Edge weight profile ("distance", "travel_time", "truck"
+                or a registered custom profile)
+            
+        Returns:
+            Dictionary with path results in the find_optimal_paths shape, plus
+            "cost" and the start and goal edge snaps
+        """
+        try:
+            start_snap = self.domain_adapter.get_nearest_edge(start_location)
+            goal_snap = self.domain_adapter.get_nearest_edge(goal_location)
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Could not find location: {e}",
+                "paths": []
+            }
+        
+        try:
+            # Algorithms without an edge-to-edge search fall back to Dijkstra
+            pathfinding_service = self.domain_adapter.create_pathfinding_service(
+                "astar" if algorithm.lower() == "astar" else "bfs", weight_profile=weight_profile
+            )
+        except KeyError as e:
+            return {
+                "success": False,
+                "message": str(e.args[0]),
+                "paths": []
+            }
+        
+        results = pathfinding_service.find_path_between_edges(start_snap, goal_snap)
+        
+        if results["success"]:
+            results["start_location"] = start_location
+            results["goal_location"] = goal_location
+            results["start_node"] = results["primary_path"][0]
+            results["goal_node"] = results["primary_path"][-1]
+            results.update(self.domain_adapter.summarize_paths(results["paths"]))
+        
+        return results
+    
+    def optimize_multi_stop(
+        self,
+        locations: Sequence[Union[str, Tuple[float, float]]],
+        return_to_start: bool = True,
+        demands: Optional[Sequence[float]] = None,
+        capacity: Optional[float] = None,
+        time_windows: Optional[Sequence[Optional[Tuple[float, float]]]] = None,
+        service_times: Optional[Sequence[float]] = None,
+        departure_time: Optional[Union[float, datetime]] = None,
+        weight_profile: Optional[str] = None,
+        time_budget: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Plan one route that visits many stops in a good order.
+        
+        Args:
+            locations: Location names or (lat, lon) pairs; the first is the start
+            return_to_start: End the route back at the start
+            demands: Load per location (aligned with locations, start included)
+            capacity: Vehicle capacity; the route reloads at the start when exceeded
+            time_windows: (earliest, latest) arrival per location in seconds
+                after midnight, or None for no window
+            service_times: Seconds spent at each location
+            departure_time: Departure from the start (seconds after midnight or datetime)
+            weight_profile: Edge weight profile to optimize ("distance", "travel_time", ...)
+            time_budget: Seconds of local search
+            
+        Returns:
+            Dictionary with path results in the find_optimal_paths shape,
+            plus the stop order, legs, trips and arrival times
+        """
+        try:
+            nodes = [self.domain_adapter.get_nearest_node(location) for location in locations]
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Could not find location: {e}",
+                "paths": []
+            }
+        
+        try:
+            service = self.domain_adapter.create_route_optimization_service(weight_profile, time_budget)
+        except KeyError as e:
+            return {
+                "success": False,
+                "message": str(e.args[0]),
+                "paths": []
+            }
+        
+        # Time windows need seconds
+        seconds_per_cost = self.domain_adapter.seconds_per_cost(weight_profile)
+        start_time = seconds_after_midnight(departure_time) if departure_time is not None else DEFAULT_DEPARTURE_TIME
+        
+        results = service.optimize(
+            nodes,
+            return_to_start=return_to_start,
+            demands=demands,
+            capacity=capacity,
+            time_windows=time_windows,
+            service_times=service_times,
+            start_time=start_time,
+            seconds_per_cost=seconds_per_cost,
+        )
+        
+        if results["success"]:
+            ordered = [locations[i] for i in results["stop_order"]]
+            results["stop_locations"] = ordered
+            results["start_location"] = ordered[0]
+            results["goal_location"] = ordered[-1]
+            results["start_node"] = nodes[0]
+            results["goal_node"] = results["primary_path"][-1]
+            results.update(self.domain_adapter.summarize_paths([results["primary_path"]]))
+        
+        return results
+    
+    def find_nearest_facility(
+        self,
+        location: Union[str, Tuple[float, float]],
+        category: str = "hospital",
+        weight_profile: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Find the nearest facility of a category by road.
+        
+        The lookup reads the precomputed network Voronoi partition, so no
+        search runs per query; the route is read from the stored tree.
+        
+        Args:
+            location: Location name or (lat, lon) pair
+            category: Facility category ("hospital", "fire_station", ...)
+            weight_profile: Edge weight profile deciding "nearest"
+                ("distance", "travel_time", ...); defaults to edge lengths
+            
+        Returns:
+            Dictionary with path results in the find_optimal_paths shape,
+            plus the facility name, node and cost
+        """
+        try:
+            start_node = self.domain_adapter.get_nearest_node(location)
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Could not find location: {e}",
+                "paths": []
+            }
+        
+        try:
+            index = self.domain_adapter.get_facility_index(category, weight_profile)
+            graph = (self.domain_adapter.get_weighted_graph(weight_profile) if weight_profile
+                     else self.domain_adapter.graph_adapter)
+        except KeyError as e:
+            return {
+                "success": False,
+                "message": str(e.args[0]),
+                "paths": []
+            }
+        
+        nearest = index.nearest_facility(start_node)
+        if nearest is None:
+            return {
+                "success": False,
+                "message": f"No {category} is reachable from {location}",
+                "paths": []
+            }
+        
+        facility, cost = nearest
+        route = index.route(start_node)
+        facility_name = index.facility_name(facility)
+        
+        results = {
+            "success": True,
+            "paths": [route],
+            "primary_path": route,
+            "all_paths": [route],
+            "visited_nodes": set(),
+            "statistics": self.domain_adapter.path_calculator.get_path_statistics([route], graph),
+            "algorithm": type(index).__name__,
+            "facility_category": category,
+            "facility_name": facility_name,
+            "facility_node": index.facility_node(facility),
+            "facility_cost": cost,
+            "start_location": location,
+            "goal_location": facility_name,
+            "start_node": start_node,
+            "goal_node": route[-1],
+        }
+        results.update(self.domain_adapter.summarize_paths([route]))
+        return results
+    
+    def dispatch_nearest_vehicles(
+        self,
+        incident_location: Union[str, Tuple[float, float]],
+        count: Optional[int] = None,
+        weight_profile: Optional[str] = "travel_time",
+        max_time: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Rank the vehicles that can reach an incident fastest.
+        
+        Vehicle positions come from the domain adapter's vehicle index
+        (see update_vehicle_positions).
+        
+        Args:
+            incident_location: Location name or (lat, lon) pair of the incident
+            count: Number of vehicles to return (defaults to DISPATCH_VEHICLE_COUNT)
+            weight_profile: Edge weight profile to rank by; "travel_time" by default
+            max_time: Ignore ranked vehicles whose travel time to the incident
+                is more than this many seconds
+            
+        Returns:
+            Dictionary with path results in the find_optimal_paths shape
+            (one route per vehicle, from the vehicle to the incident), plus
+            "vehicles" with the id, node, ETA in seconds and route of each
+            vehicle, fastest first
+        """
+        try:
+            incident_node = self.domain_adapter.get_nearest_node(incident_location)
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Could not find location: {e}",
+                "paths": []
+            }
+        
+        try:
+            service = self.domain_adapter.create_dispatch_service(weight_profile)
+        except KeyError as e:
+            return {
+                "success": False,
+                "message": str(e.args[0]),
+                "paths": []
+            }
+        
+        results = service.nearest_vehicles(
+            incident_node, count if count is not None else DISPATCH_VEHICLE_COUNT
+        )
+        
+        if results["success"]:
+            # ETAs are travel times along each route, whatever the profile ranked by
+            etas = self.domain_adapter.travel_times([vehicle["route"] for vehicle in results["vehicles"]])
+            for vehicle, eta in zip(results["vehicles"], etas.tolist()):
+                vehicle["eta_seconds"] = eta
+            if max_time is not None:
+                vehicles = [vehicle for vehicle in results["vehicles"] if vehicle["eta_seconds"] <= max_time]
+                if not vehicles:
+                    return {
+                        "success": False,
+                        "message": f"No vehicle can reach the incident within {max_time:.0f} s",
+                        "paths": []
+                    }
+                if len(vehicles) < len(results["vehicles"]):
+                    routes = [vehicle["route"] for vehicle in vehicles]
+                    results.update(
+                        vehicles=vehicles, paths=routes, primary_path=routes[0], all_paths=routes,
+                        statistics=self.domain_adapter.path_calculator.get_path_statistics(
+                            routes, service.graph
+                        )
+                    )
+            for rank, vehicle in enumerate(results["vehicles"], 1):
+                vehicle["rank"] = rank
+            results["goal_location"] = incident_location
+            results["goal_node"] = incident_node
+            results["start_node"] = results["primary_path"][0]
+            results.update(self.domain_adapter.summarize_paths(results["paths"]))
         
         return results
     
@@ -155,11 +463,14 @@ class GenericPathfindingController:
             alt_steps = len(paths[i]) - 1
             details.append(f"  Alternative {i}: {alt_steps} steps")
         
-        # Start and end points
-        if path_names and path_names[0]:
-            start_name = path_names[0][0]
-            end_name = path_names[0][-1]
+        # Start and end points (path_names lists street segments, not endpoints)
+        start_name = path_results.get("start_location")
+        end_name = path_results.get("goal_location")
+        if start_name and end_name:
             details.append(f"Route: {start_name} to {end_name}")
+        if path_names and path_names[0]:
+            streets = " -> ".join(path_names[0][:4]) + (" -> ..." if len(path_names[0]) > 4 else "")
+            details.append(f"  Via: {streets}")
         
         return details
     
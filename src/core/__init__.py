@@ -10,8 +10,15 @@ from .graph_interface import (
     MessageHandlerInterface, PathfindingAlgorithmInterface
 )
 from .graph_model import GraphModel
+from .compact_graph import CompactGraph
+from .speed_profiles import SpeedProfileTable
+from .edge_based_graph import EdgeBasedGraph
+from .hub_labels import HubLabelIndex
+from .facility_index import FacilityIndex
 from .location_model import LocationModel
+from .vehicle_index import VehicleIndex
 from .networkx_graph_adapter import NetworkXGraphAdapter
+from .compact_graph_adapter import CompactGraphAdapter
 from .addis_ababa_adapter import AddisAbabaAdapter
 
 __all__ = [
@@ -20,8 +27,9 @@ __all__ = [
     "MessageHandlerInterface", "PathfindingAlgorithmInterface",
     
     # Models
-    "GraphModel", "LocationModel",
+    "GraphModel", "LocationModel", "CompactGraph", "SpeedProfileTable",
+    "EdgeBasedGraph", "HubLabelIndex", "FacilityIndex", "VehicleIndex",
     
     # Adapters
-    "NetworkXGraphAdapter", "AddisAbabaAdapter",
+    "NetworkXGraphAdapter", "CompactGraphAdapter", "AddisAbabaAdapter",
 ]
\ No newline at end of file
@@ -3,23 +3,50 @@ Addis Ababa specific adapter.
 Implements domain-specific functionality using generic components.
 """
 
+import numpy as np
 import osmnx as ox
-from typing import List, Dict, Any, Optional, Tuple, Union
+from datetime import datetime
+from functools import partial
+from typing import List, Dict, Any, Callable, Hashable, Optional, Sequence, Tuple, Union
 
 from core.graph_interface import MessageHandlerInterface
 from core.networkx_graph_adapter import NetworkXGraphAdapter
+from core.compact_graph import CompactGraph
 from core.graph_model import GraphModel
 from core.location_model import LocationModel
+from core.facility_index import FacilityIndex
+from core.vehicle_index import VehicleIndex
+from core.spatial_index import EdgeSnap
+from core.route_summary import RouteSegment, RouteSummaryBuilder
 from shared.constraints.node_limit_constraint import NodeLimitConstraint
 from shared.constraints.distance_constraint import DistanceConstraint
 from shared.constraints.same_location_constraint import SameLocationConstraint
 from shared.constraints.time_constraint import TimeConstraint
-from config.settings import AVERAGE_SPEED_KMH
+from config.settings import (
+    AVERAGE_SPEED_KMH, COMPACT_GRAPH_DIR, FREE_FLOW_SPEED_KMH, TRUCK_CLASS_PENALTIES,
+    MULTI_STOP_TIME_BUDGET, FACILITY_CATEGORIES,
+    ROUTE_CACHE_MAX_ENTRIES, ROUTE_CACHE_MAX_BYTES, ROUTE_STORE_FILE, ROUTE_STORE_MAX_BYTES,
+    ORIGIN_TREE_CACHE_SIZE, ORIGIN_TREE_CACHE_MAX_BYTES, ORIGIN_TREE_MIN_QUERIES,
+    ORIGIN_TREE_WARM_LOCATIONS, ROUTE_TABLE_DIR, ROUTE_TABLE_ALGORITHMS, ROUTE_TABLE_MAX_PATHS
+)
 from shared.calculators.generic_path_calculator import GenericPathCalculator
 from algorithms.bfs import BFSAlgorithm
 from algorithms.dfs_classic import ClassicDFSAlgorithm as DFSAlgorithm
 from algorithms.astar_improved import AStarAlgorithm
+from algorithms.time_dependent_astar import TimeDependentAStarAlgorithm
+from algorithms.turn_aware_astar import TurnAwareAStarAlgorithm
+from algorithms.tour_optimizer import TourOptimizer
+from core.speed_profiles import seconds_after_midnight
+from core.weight_profiles import WeightProfile, WeightProfileRegistry
 from services.generic_pathfinding_service import GenericPathfindingService
+from services.route_optimization_service import RouteOptimizationService
+from services.dispatch_service import DispatchService
+from services.place_index_service import PlaceIndexService
+from services.local_geocoder import LocalGeocoder
+from services.route_cache import RouteCache
+from services.route_store import RouteStore
+from services.origin_tree_cache import OriginTreeCache
+from services.route_table import RouteTable, locations_fingerprint
 
 
 class AddisAbabaMessageHandler(MessageHandlerInterface):
@@ -42,56 +69,440 @@ class AddisAbabaAdapter:
         """Initialize Addis Ababa adapter with generic components."""
         # Domain-specific models
         self.graph_model = GraphModel()
-        self.location_model = LocationModel(self.graph_model.graph)
+        # Downloaded once from OSM when no cache exists; only per-query Nominatim lookups are opt-in
+        self.place_index = PlaceIndexService()
+        self.geocoder = LocalGeocoder(self.place_index)
+        place_lats, place_lons = self.place_index.coordinates()
+        self.reverse_index = self.graph_model.reverse_geocode_index(
+            self.place_index.get_all_names(), place_lats, place_lons
+        )
+        self.location_model = LocationModel(
+            self.graph_model.graph, self.graph_model.spatial_index, self.graph_model.edge_index,
+            self.geocoder, self.reverse_index
+        )
+        self.route_summary = RouteSummaryBuilder(self.graph_model.compact, self.reverse_index)
         
         # Generic adapters
-        self.graph_adapter = NetworkXGraphAdapter(self.graph_model.graph)
-        self.path_calculator = GenericPathCalculator()
+        self.graph_adapter = NetworkXGraphAdapter(self.graph_model.graph, self.graph_model.compact)
+        # Path times are summed from the travel_time profile's arc weights
+        self.path_calculator = GenericPathCalculator(arc_times=self._arc_travel_times)
         self.message_handler = AddisAbabaMessageHandler()
         
         # Initialize algorithms
         self.bfs_algorithm = BFSAlgorithm(self.message_handler)
         self.dfs_algorithm = DFSAlgorithm(self.message_handler)
-        self.astar_algorithm = AStarAlgorithm(self._euclidean_heuristic, self.message_handler)
+        # A* uses the metric heuristic on the compact graph's projected coordinates
+        self.astar_algorithm = AStarAlgorithm(self.message_handler)
+        self.td_astar_algorithm = TimeDependentAStarAlgorithm(
+            self.graph_model.speed_profiles, self.message_handler
+        )
+        self._turn_astar_algorithm: Optional[TurnAwareAStarAlgorithm] = None
+        
+        # Weight profiles, precomputed per arc on first use
+        self.weight_profiles = WeightProfileRegistry(self.graph_model.compact, COMPACT_GRAPH_DIR / "weights")
+        self.weight_profiles.register(WeightProfile.distance())
+        self.weight_profiles.register(WeightProfile.travel_time(FREE_FLOW_SPEED_KMH))
+        self.weight_profiles.register(WeightProfile.truck(FREE_FLOW_SPEED_KMH, TRUCK_CLASS_PENALTIES))
+        
+        # Live vehicle positions for dispatch queries
+        self.vehicle_index = VehicleIndex(self.graph_model.compact)
+        
+        # Results of repeated queries, shared by every pathfinding service
+        self.route_cache = RouteCache(ROUTE_CACHE_MAX_ENTRIES, ROUTE_CACHE_MAX_BYTES)
+        self.route_store = RouteStore(ROUTE_STORE_FILE, ROUTE_STORE_MAX_BYTES)
+        
+        # Shortest path trees of the busiest origins; the known locations start out hot
+        self.origin_trees = OriginTreeCache(
+            ORIGIN_TREE_CACHE_SIZE, ORIGIN_TREE_CACHE_MAX_BYTES, ORIGIN_TREE_MIN_QUERIES
+        )
+        if ORIGIN_TREE_WARM_LOCATIONS:
+            origins = [self.location_model.get_nearest_node(point)
+                       for point in self.location_model.locations.values()]
+            self.origin_trees.warm(self.graph_model.compact, None, self.weights_key(), origins)
+        
+        # Routes between the known locations, if build_route_table.py has been run for this graph
+        self.route_table = RouteTable.load(
+            ROUTE_TABLE_DIR, self.graph_model.compact, locations_fingerprint(self.location_model.locations)
+        )
+    
+    @property
+    def turn_astar_algorithm(self) -> TurnAwareAStarAlgorithm:
+        """Turn-aware A*, created on first use so turn costs are only built when needed."""
+        if self._turn_astar_algorithm is None:
+            self._turn_astar_algorithm = TurnAwareAStarAlgorithm(
+                self.graph_model.edge_based_graph, self.message_handler
+            )
+        return self._turn_astar_algorithm
+    
+    def register_weight_profile(self, profile: WeightProfile) -> None:
+        """
+        Register a custom weight profile (replaces one with the same name).
+        
+        Args:
+            profile: Weight profile
+        """
+        self.weight_profiles.register(profile)
+        # Cached routes may have been found with the replaced weights
+        self.route_cache.invalidate()
+    
+    def weights_key(self, weight_profile: Optional[str] = None) -> str:
+        """
+        Identify the arc weights of a profile in cache keys.
+        
+        Uses the profile's fingerprint rather than its name, so results
+        stored by a process with different weights under the same name
+        are never reused.
+        
+        Raises:
+            KeyError: If the profile is not registered
+        """
+        return self.weight_profiles.get(weight_profile).fingerprint if weight_profile else "length"
+    
+    def list_weight_profiles(self) -> List[str]:
+        """Get the names of the available weight profiles."""
+        return self.weight_profiles.names()
     
-    def create_pathfinding_service(self, algorithm_name: str = "bfs") -> GenericPathfindingService:
+    def get_weighted_graph(self, weight_profile: str) -> NetworkXGraphAdapter:
+        """
+        Get a graph view that routes by a weight profile.
+        
+        Args:
+            weight_profile: Profile name
+            
+        Returns:
+            Graph adapter sharing the loaded graph
+            
+        Raises:
+            KeyError: If the profile is not registered
+        """
+        return self.graph_adapter.with_weights(
+            weight_profile, self.weight_profiles.weight_list(weight_profile),
+            self.weight_profiles.get(weight_profile).unit
+        )
+    
+    def seconds_per_cost(self, weight_profile: Optional[str] = None) -> float:
+        """
+        Travel seconds per unit of a profile's cost, from the profile's unit.
+        
+        Profiles in seconds count as they are; edge lengths and profiles in
+        meters are converted at AVERAGE_SPEED_KMH.
+        
+        Args:
+            weight_profile: Profile name (None for edge lengths)
+            
+        Raises:
+            KeyError: If the profile is not registered
+        """
+        unit = self.weight_profiles.get(weight_profile).unit if weight_profile else "meters"
+        return 1.0 if unit == "seconds" else 3.6 / AVERAGE_SPEED_KMH
+    
+    def travel_times(self, paths: Sequence[Sequence[int]]) -> np.ndarray:
+        """
+        Free-flow travel time in seconds along each path.
+        
+        Times come from the travel_time profile's arc weights, whichever
+        profile chose the paths, so penalized costs (e.g. truck) are never
+        reported as times.
+        
+        Args:
+            paths: Node id paths
+            
+        Returns:
+            Seconds per path
+        """
+        return self.path_calculator.evaluate_paths(paths, self.graph_adapter).times
+    
+    def _arc_travel_times(self, compact: CompactGraph) -> Optional[np.ndarray]:
+        """Free-flow seconds per arc of the city graph (None for other graphs, e.g. subgraphs)."""
+        if compact is not self.graph_model.compact:
+            return None
+        return self.weight_profiles.weights("travel_time")
+    
+    def create_pathfinding_service(self, algorithm_name: str = "bfs",
+                                   departure_time: Optional[Union[float, datetime]] = None,
+                                   weight_profile: Optional[str] = None
+                                   ) -> GenericPathfindingService:
         """
         Create a pathfinding service with the specified algorithm.
         
         Args:
-            algorithm_name: Algorithm to use ("bfs", "dfs", "astar")
+            algorithm_name: Algorithm to use ("bfs", "dfs", "astar", "td_astar", "astar_turns")
+            departure_time: Departure time for "td_astar" (seconds after midnight or datetime)
+            weight_profile: Edge weight profile (e.g. "distance", "travel_time", "truck");
+                defaults to edge lengths
             
         Returns:
             Configured pathfinding service
+            
+        Raises:
+            KeyError: If the weight profile is not registered
         """
         algorithms = {
             "bfs": self.bfs_algorithm,
             "dfs": self.dfs_algorithm,
-            "astar": self.astar_algorithm
+            "astar": self.astar_algorithm,
+            "td_astar": self.td_astar_algorithm
         }
         
+        if algorithm_name.lower() == "astar_turns":
+            algorithms["astar_turns"] = self.turn_astar_algorithm
+        
         algorithm = algorithms.get(algorithm_name.lower(), self.bfs_algorithm)
+        if algorithm is self.td_astar_algorithm and departure_time is not None:
+            algorithm = TimeDependentAStarAlgorithm(
+                self.graph_model.speed_profiles, self.message_handler,
+                departure_time=seconds_after_midnight(departure_time)
+            )
+        
+        graph = self.get_weighted_graph(weight_profile) if weight_profile else self.graph_adapter
+        
+        # The route table holds unweighted results of the default algorithms
+        table_algorithm = algorithm_name.lower() if algorithm in (
+            self.bfs_algorithm, self.dfs_algorithm, self.astar_algorithm
+        ) and not weight_profile else ""
         
         return GenericPathfindingService(
-            graph=self.graph_adapter,
+            graph=graph,
             algorithm=algorithm,
             path_calculator=self.path_calculator,
+            message_handler=self.message_handler,
+            route_cache=self.route_cache,
+            route_store=self.route_store,
+            # Trees hold exact shortest paths, which only A* also returns
+            origin_trees=self.origin_trees if algorithm is self.astar_algorithm else None,
+            weights_key=self.weights_key(weight_profile),
+            route_table=self.route_table if table_algorithm else None,
+            table_algorithm=table_algorithm
+        )
+    
+    def build_route_table(self, algorithms: Sequence[str] = ROUTE_TABLE_ALGORITHMS,
+                          max_paths: int = ROUTE_TABLE_MAX_PATHS,
+                          progress: Optional[Callable[[str, int, int], None]] = None) -> RouteTable:
+        """
+        Precompute routes between every pair of known locations and save them.
+        
+        Each algorithm runs unconstrained, as the services and controllers
+        do before applying constraints, so a stored route answers every
+        query whose constraints it satisfies.
+        
+        Args:
+            algorithms: Algorithm names ("bfs", "dfs", "astar")
+            max_paths: Routes stored per pair and algorithm
+            progress: Optional callback(algorithm, start index, goal index)
+            
+        Returns:
+            The new route table (also used by services created afterwards)
+        """
+        names = list(self.location_model.locations)
+        nodes = [self.location_model.get_nearest_node(self.location_model.locations[name]) for name in names]
+        
+        def search(algorithm, start: int, goal: int, count: int) -> List[List[int]]:
+            return algorithm.find_path(start, goal, self.graph_adapter, [], count)
+        
+        searches = {name: partial(search, self.create_pathfinding_service(name).algorithm) for name in algorithms}
+        
+        table = RouteTable.build(
+            self.graph_model.compact, names, nodes, searches, max_paths,
+            locations_fingerprint(self.location_model.locations), progress
+        )
+        table.save(ROUTE_TABLE_DIR)
+        self.route_table = table
+        return table
+    
+    def get_precomputed_paths(self, algorithm: str, start_node: int, goal_node: int,
+                              max_paths: int) -> Optional[List[List[int]]]:
+        """
+        Look up unconstrained routes between two known locations.
+        
+        Args:
+            algorithm: Algorithm name ("bfs", "dfs", "astar")
+            start_node: Start node id
+            goal_node: Goal node id
+            max_paths: Routes wanted
+            
+        Returns:
+            Stored routes, or None if the pair was not precomputed (search instead)
+        """
+        if self.route_table is None:
+            return None
+        return self.route_table.paths(algorithm, start_node, goal_node, max_paths)
+    
+    def create_route_optimization_service(self, weight_profile: Optional[str] = None,
+                                          time_budget: Optional[float] = None
+                                          ) -> RouteOptimizationService:
+        """
+        Create a multi-stop route optimization service.
+        
+        Args:
+            weight_profile: Edge weight profile to optimize; defaults to edge lengths
+            time_budget: Seconds of local search (defaults to MULTI_STOP_TIME_BUDGET)
+            
+        Returns:
+            Configured route optimization service
+            
+        Raises:
+            KeyError: If the weight profile is not registered
+        """
+        graph = self.get_weighted_graph(weight_profile) if weight_profile else self.graph_adapter
+        optimizer = TourOptimizer(time_budget if time_budget is not None else MULTI_STOP_TIME_BUDGET)
+        
+        return RouteOptimizationService(
+            graph=graph,
+            path_calculator=self.path_calculator,
+            message_handler=self.message_handler,
+            optimizer=optimizer,
+            route_store=self.route_store,
+            weights_key=self.weights_key(weight_profile),
+            origin_trees=self.origin_trees
+        )
+    
+    def create_dispatch_service(self, weight_profile: Optional[str] = None) -> DispatchService:
+        """
+        Create a nearest-vehicle dispatch service over the live vehicle index.
+        
+        Args:
+            weight_profile: Edge weight profile to rank by; defaults to edge lengths
+            
+        Returns:
+            Configured dispatch service
+            
+        Raises:
+            KeyError: If the weight profile is not registered
+        """
+        graph = self.get_weighted_graph(weight_profile) if weight_profile else self.graph_adapter
+        
+        return DispatchService(
+            graph=graph,
+            vehicle_index=self.vehicle_index,
+            path_calculator=self.path_calculator,
             message_handler=self.message_handler
         )
     
+    def update_vehicle_positions(self, positions: Dict[Hashable, Tuple[float, float]]) -> None:
+        """
+        Snap vehicle positions to the road network and update the vehicle index.
+        
+        Positions are snapped in one vectorized call and applied as one
+        batch, so a feed can push a whole fleet per call.
+        
+        Args:
+            positions: Vehicle id -> (lat, lon)
+        """
+        if not positions:
+            return
+        vehicle_ids = list(positions)
+        coordinates = np.array([positions[vehicle_id] for vehicle_id in vehicle_ids], dtype=np.float64)
+        nodes, _ = self.snap_many(coordinates[:, 0], coordinates[:, 1])
+        self.vehicle_index.update_many(zip(vehicle_ids, nodes.tolist()))
+    
+    def remove_vehicle(self, vehicle_id: Hashable) -> bool:
+        """Remove a vehicle from dispatch; returns True if it was indexed."""
+        return self.vehicle_index.remove(vehicle_id)
+    
+    def list_facility_categories(self) -> List[str]:
+        """Get the names of the configured facility categories."""
+        return list(FACILITY_CATEGORIES)
+    
+    def get_facility_index(self, category: str, weight_profile: Optional[str] = None) -> FacilityIndex:
+        """
+        Get the nearest-facility partition of a category.
+        
+        Facilities are loaded from OSM through the category's tags and
+        snapped to their nearest nodes, then the graph model loads or builds
+        the partition for that category and weight profile.
+        
+        Args:
+            category: Key of FACILITY_CATEGORIES (e.g. "hospital", "fire_station")
+            weight_profile: Edge weight profile; defaults to edge lengths
+            
+        Returns:
+            Facility index
+            
+        Raises:
+            KeyError: If the category or weight profile is unknown, or the
+                category has no facilities (or could not be downloaded)
+        """
+        if category not in FACILITY_CATEGORIES:
+            raise KeyError(f"Unknown facility category '{category}'")
+        
+        try:
+            facilities = self.graph_model.facilities(category, FACILITY_CATEGORIES[category])
+        except Exception as e:
+            raise KeyError(f"Could not load {category} facilities from OpenStreetMap: {e}") from e
+        if not facilities:
+            raise KeyError(f"No {category} facilities found in OpenStreetMap")
+        names = list(facilities)
+        nodes = [self.location_model.get_nearest_node(facilities[name]) for name in names]
+        if weight_profile:
+            # The fingerprint keeps a re-registered profile from reusing a stale partition
+            weights_name = f"{weight_profile}-{self.weight_profiles.get(weight_profile).fingerprint}"
+            return self.graph_model.facility_index(
+                category, nodes, names, self.weight_profiles.weight_list(weight_profile), weights_name
+            )
+        return self.graph_model.facility_index(category, nodes, names)
+    
     def get_nearest_node(self, location: Union[str, Tuple[float, float]]) -> int:
         """Get nearest node to a location."""
         return self.location_model.get_nearest_node(location)
     
+    def get_nearest_edge(self, location: Union[str, Tuple[float, float]]) -> EdgeSnap:
+        """Project a location onto its nearest edge."""
+        return self.location_model.get_nearest_edge(location)
+    
+    def reverse_geocode(self, lat: float, lon: float) -> Optional[str]:
+        """Name the place or street at a coordinate (None if nothing nearby is named)."""
+        return self.location_model.reverse_geocode(lat, lon)
+    
+    def snap_many(self, lats, lons) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Snap many coordinates to nodes in one call.
+        
+        Args:
+            lats: Latitudes (NumPy array or sequence)
+            lons: Longitudes (NumPy array or sequence)
+            
+        Returns:
+            Tuple of (node ids, snap distances in meters)
+        """
+        return self.location_model.snap_many(lats, lons)
+    
     def get_node_name(self, node_id: int) -> str:
         """Get human-readable name for a node."""
         return self.location_model.get_node_name(node_id)
     
+    def get_route_summary(self, path: List[int]) -> List[RouteSegment]:
+        """Compress a path into street segments with their distances."""
+        return self.route_summary.summarize(path)
+    
+    def summarize_paths(self, paths: List[List[int]]) -> Dict[str, List[List[Any]]]:
+        """
+        Describe paths by their street segments rather than node by node.
+        
+        Args:
+            paths: Node id paths
+            
+        Returns:
+            Dictionary with "path_names" (segment labels per path; the
+            node's name for single-node paths) and "route_summaries"
+            (segment dictionaries with name, highway, distance and the
+            path positions where each segment starts and ends)
+        """
+        path_names, route_summaries = [], []
+        for path in paths:
+            segments = self.route_summary.summarize(path)
+            route_summaries.append([segment.to_dict() for segment in segments])
+            path_names.append(
+                [segment.label for segment in segments]
+                or [self.get_node_name(node) for node in path[:1]]
+            )
+        return {"path_names": path_names, "route_summaries": route_summaries}
+    
     def create_addis_constraints(
         self,
         max_nodes: Optional[int] = None,
         max_distance: Optional[float] = None,
         max_time: Optional[float] = None,
+        departure_time: Optional[Union[float, datetime]] = None,
     ) -> List:
         """
         Create Addis Ababa specific constraints.
@@ -99,6 +510,8 @@ class AddisAbabaAdapter:
         Args:
             max_nodes: Maximum nodes to process
             max_distance: Maximum path distance in meters
+            max_time: Maximum travel time in seconds
+            departure_time: Departure time; makes the time limit use hourly speed profiles
             
         Returns:
             List of constraints
@@ -114,21 +527,17 @@ class AddisAbabaAdapter:
         if max_time:
             # Convert average speed from km/h to m/s
             speed_m_per_s = (AVERAGE_SPEED_KMH * 1000.0) / 3600.0
-            constraints.append(TimeConstraint(max_time, self.path_calculator, speed_m_per_s))
+            if departure_time is not None:
+                constraints.append(TimeConstraint(
+                    max_time, self.path_calculator, speed_m_per_s,
+                    speed_profiles=self.graph_model.speed_profiles,
+                    departure_time=seconds_after_midnight(departure_time)
+                ))
+            else:
+                constraints.append(TimeConstraint(max_time, self.path_calculator, speed_m_per_s))
         
         return constraints
     
-    def _euclidean_heuristic(self, node: int, goal: int, graph) -> float:
-        """Euclidean distance heuristic for A*."""
-        node_data = graph.get_node_data(node)
-        goal_data = graph.get_node_data(goal)
-        
-        lat1, lon1 = node_data['y'], node_data['x']
-        lat2, lon2 = goal_data['y'], goal_data['x']
-        
-        # Simple Euclidean distance approximation
-        return ((lat2 - lat1) ** 2 + (lon2 - lon1) ** 2) ** 0.5 * 111000  # Convert to meters
-    
     def list_available_locations(self) -> List[str]:
         """Get list of available Addis Ababa locations."""
         return self.location_model.list_available_locations()
@@ -136,3 +545,13 @@ class AddisAbabaAdapter:
     def location_exists(self, location_name: str) -> bool:
         """Check if a location exists in Addis Ababa."""
         return self.location_model.location_exists(location_name)
+    
+    def close(self) -> None:
+        """Release background resources: the A* worker processes for parallel alternatives."""
+        self.astar_algorithm.close()
+    
+    def __enter__(self) -> 'AddisAbabaAdapter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
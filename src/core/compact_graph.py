@@ -0,0 +1,364 @@
+"""
+Compact array representation of the road network.
+Single responsibility: Dense node ids and CSR adjacency arrays for fast searches.
+"""
+
+import ast
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from shared.utils.array_store import save_arrays, load_arrays
+from shared.utils.geo import utm_project
+
+# Bump when the stored arrays change so stale caches are rebuilt
+FORMAT_VERSION = 2
+
+# OSM highway classes known to the profiles; "_link" roads share their parent class
+HIGHWAY_CLASSES = (
+    "motorway", "trunk", "primary", "secondary", "tertiary",
+    "unclassified", "residential", "living_street", "service", "other",
+)
+_HIGHWAY_CODES = {name: code for code, name in enumerate(HIGHWAY_CLASSES)}
+OTHER_HIGHWAY_CODE = _HIGHWAY_CODES["other"]
+
+_ARRAY_NAMES = ("node_ids", "lat", "lon", "x", "y", "indptr", "indices", "length", "highway")
+
+
+def first_tag_value(value: Any) -> Optional[str]:
+    """
+    First value of a possibly multi-valued OSM tag.
+
+    Simplified OSMnx edges carry a list where merged ways disagree.
+
+    Args:
+        value: Tag as stored on the edge (string, list or list repr)
+
+    Returns:
+        First value as a string, or None if the tag is missing or empty
+    """
+    if isinstance(value, str) and value.startswith("["):
+        # GraphML stores multi-valued tags as their Python repr
+        try:
+            value = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            pass
+    if isinstance(value, (list, tuple)):
+        value = value[0] if value else None
+    if value is None or (isinstance(value, float) and value != value):
+        # Missing tags read back from GraphML or pandas as NaN
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def highway_class_code(value: Any) -> int:
+    """
+    Map an OSM highway tag to its compact class code.
+
+    Args:
+        value: Highway tag as stored on the edge (string, list or list repr)
+
+    Returns:
+        Index into HIGHWAY_CLASSES
+    """
+    name = first_tag_value(value)
+    if not name:
+        return OTHER_HIGHWAY_CODE
+
+    if name.endswith("_link"):
+        name = name[:-len("_link")]
+    return _HIGHWAY_CODES.get(name, OTHER_HIGHWAY_CODE)
+
+
+class CompactGraph:
+    """Read-only CSR view of a road network with dense node ids."""
+
+    def __init__(self, node_ids: np.ndarray, lat: np.ndarray, lon: np.ndarray,
+                 x: np.ndarray, y: np.ndarray, indptr: np.ndarray, indices: np.ndarray,
+                 length: np.ndarray, highway: np.ndarray, version: str = ""):
+        """
+        Initialize from prebuilt arrays.
+
+        Args:
+            node_ids: Sorted original node ids, position = dense id
+            lat: Node latitudes
+            lon: Node longitudes
+            x: Node UTM 37N eastings in meters
+            y: Node UTM 37N northings in meters
+            indptr: CSR row offsets (arcs of node i are indptr[i]:indptr[i+1])
+            indices: Dense id of each arc's head node
+            length: Arc lengths in meters
+            highway: Arc highway class codes (see HIGHWAY_CLASSES)
+            version: Version of the graph the arrays were built from
+        """
+        self.node_ids = node_ids
+        self.lat = lat
+        self.lon = lon
+        self.x = x
+        self.y = y
+        self.indptr = indptr
+        self.indices = indices
+        self.length = length
+        self.highway = highway
+        self.version = version
+
+        self._index: Optional[Dict[int, int]] = None
+        self._node_id_list: Optional[List[int]] = None
+        self._neighbor_lists: Optional[List[List[int]]] = None
+        self._arc_offsets: Optional[List[int]] = None
+        self._arc_lengths: Optional[List[float]] = None
+        self._xy_lists: Optional[Tuple[List[float], List[float]]] = None
+        self._arc_keys: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_networkx(cls, graph, version: str = "") -> "CompactGraph":
+        """
+        Build the arrays from a NetworkX graph with OSMnx attributes.
+
+        Parallel edges collapse to the shortest one and self-loops are dropped.
+
+        Args:
+            graph: NetworkX (multi)graph with node 'x'/'y' and edge 'length'
+            version: Version of the source graph
+
+        Returns:
+            Compact graph
+        """
+        node_ids = np.array(sorted(graph.nodes), dtype=np.int64)
+        index = {int(node): i for i, node in enumerate(node_ids)}
+        is_multigraph = graph.is_multigraph()
+
+        lat = np.empty(len(node_ids), dtype=np.float64)
+        lon = np.empty(len(node_ids), dtype=np.float64)
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        indices, lengths, highways = [], [], []
+
+        for i, node in enumerate(node_ids.tolist()):
+            data = graph.nodes[node]
+            lat[i] = data.get('y', np.nan)
+            lon[i] = data.get('x', np.nan)
+
+            neighbors = []
+            for neighbor, edge_data in graph.adj[node].items():
+                if neighbor == node:
+                    continue
+                if is_multigraph:
+                    edge_data = min(edge_data.values(),
+                                    key=lambda d: float(d.get('length', 1.0)))
+                neighbors.append((index[neighbor], edge_data))
+
+            neighbors.sort(key=lambda item: item[0])
+            for neighbor_index, edge_data in neighbors:
+                indices.append(neighbor_index)
+                lengths.append(float(edge_data.get('length', 1.0)))
+                highways.append(highway_class_code(edge_data.get('highway')))
+            indptr[i + 1] = len(indices)
+
+        x, y = utm_project(lat, lon)
+        return cls(
+            node_ids=node_ids,
+            lat=lat,
+            lon=lon,
+            x=x,
+            y=y,
+            indptr=indptr,
+            indices=np.array(indices, dtype=np.int32),
+            length=np.array(lengths, dtype=np.float64),
+            highway=np.array(highways, dtype=np.uint8),
+            version=version,
+        )
+
+    def save(self, directory: Path) -> None:
+        """Save the arrays to a cache directory."""
+        meta = {"format_version": FORMAT_VERSION, "graph_version": self.version}
+        save_arrays(directory, meta, **{name: getattr(self, name) for name in _ARRAY_NAMES})
+
+    @classmethod
+    def load(cls, directory: Path, version: Optional[str] = None,
+             mmap: bool = False) -> Optional["CompactGraph"]:
+        """
+        Load arrays saved with save().
+
+        Args:
+            directory: Cache directory
+            version: Expected graph version (None accepts any)
+            mmap: Memory-map the arrays read-only
+
+        Returns:
+            Compact graph, or None if the cache is missing or stale
+        """
+        loaded = load_arrays(directory, _ARRAY_NAMES, mmap=mmap)
+        if loaded is None:
+            return None
+
+        meta, arrays = loaded
+        if meta.get("format_version") != FORMAT_VERSION:
+            return None
+        if version is not None and meta.get("graph_version") != version:
+            return None
+
+        return cls(version=meta.get("graph_version", ""), **arrays)
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.node_ids)
+
+    @property
+    def num_arcs(self) -> int:
+        """Number of directed arcs (each undirected edge counts twice)."""
+        return len(self.indices)
+
+    def index_of(self, node: int) -> int:
+        """
+        Get the dense id of an original node id.
+
+        Raises:
+            KeyError: If the node is not in the graph
+        """
+        if self._index is None:
+            self._index = {node_id: i for i, node_id in enumerate(self.node_id_list())}
+        return self._index[node]
+
+    def has_node(self, node: int) -> bool:
+        """Check if an original node id is in the graph."""
+        try:
+            self.index_of(node)
+            return True
+        except KeyError:
+            return False
+
+    def indices_of(self, nodes: Sequence[int]) -> np.ndarray:
+        """
+        Vectorized dense id lookup for many original node ids.
+
+        Raises:
+            KeyError: If any node is not in the graph
+        """
+        nodes = np.asarray(nodes, dtype=np.int64)
+        positions = np.searchsorted(self.node_ids, nodes)
+        positions = np.minimum(positions, len(self.node_ids) - 1)
+        if len(nodes) and not np.array_equal(self.node_ids[positions], nodes):
+            raise KeyError("Unknown node id in lookup")
+        return positions
+
+    def node_id_list(self) -> List[int]:
+        """Original node ids as a Python list (position = dense id), cached."""
+        if self._node_id_list is None:
+            self._node_id_list = self.node_ids.tolist()
+        return self._node_id_list
+
+    def to_node_ids(self, indices: Iterable[int]) -> List[int]:
+        """Convert dense ids back to original node ids."""
+        node_ids = self.node_id_list()
+        return [node_ids[i] for i in indices]
+
+    def neighbor_lists(self) -> List[List[int]]:
+        """
+        Per-node neighbor dense ids as Python lists.
+
+        Scalar indexing into NumPy arrays is slow inside Python loops, so
+        searches iterate over these lists instead. Built once and cached.
+        """
+        if self._neighbor_lists is None:
+            flat = self.indices.tolist()
+            offsets = self.arc_offsets()
+            self._neighbor_lists = [flat[offsets[i]:offsets[i + 1]] for i in range(self.num_nodes)]
+        return self._neighbor_lists
+
+    def arc_offsets(self) -> List[int]:
+        """CSR row offsets as a Python list (arcs of i: offsets[i]..offsets[i+1])."""
+        if self._arc_offsets is None:
+            self._arc_offsets = self.indptr.tolist()
+        return self._arc_offsets
+
+    def arc_lengths(self) -> List[float]:
+        """Arc lengths as a Python list, cached like neighbor_lists()."""
+        if self._arc_lengths is None:
+            self._arc_lengths = self.length.tolist()
+        return self._arc_lengths
+
+    def xy_lists(self) -> Tuple[List[float], List[float]]:
+        """Projected node coordinates as Python lists, cached like neighbor_lists()."""
+        if self._xy_lists is None:
+            self._xy_lists = (self.x.tolist(), self.y.tolist())
+        return self._xy_lists
+
+    def arc_between(self, u_index: int, v_index: int) -> int:
+        """
+        Get the arc id from one dense node to another.
+
+        Returns:
+            Arc id, or -1 if the nodes are not adjacent
+        """
+        start = self.arc_offsets()[u_index]
+        neighbors = self.neighbor_lists()[u_index]
+        for offset, neighbor in enumerate(neighbors):
+            if neighbor == v_index:
+                return start + offset
+        return -1
+
+    def arcs_along(self, path_indices: Sequence[int]) -> np.ndarray:
+        """
+        Vectorized arc id lookup for every hop of a path of dense ids.
+
+        Arcs are grouped by tail and sorted by head, so tail * num_nodes + head
+        is sorted over all arcs and one binary search finds every hop.
+
+        Returns:
+            Arc id per hop (len(path) - 1 entries), -1 where nodes are not adjacent
+        """
+        path = np.asarray(path_indices, dtype=np.int64)
+        if len(path) < 2 or self.num_arcs == 0:
+            return np.full(max(len(path) - 1, 0), -1, dtype=np.int64)
+        if self._arc_keys is None:
+            self._arc_keys = self.arc_tails().astype(np.int64) * self.num_nodes + self.indices
+        keys = path[:-1] * self.num_nodes + path[1:]
+        arcs = np.minimum(np.searchsorted(self._arc_keys, keys), self.num_arcs - 1)
+        return np.where(self._arc_keys[arcs] == keys, arcs, -1)
+
+    def subgraph(self, nodes: Iterable[int]) -> "CompactGraph":
+        """
+        Build the subgraph induced by a set of original node ids.
+
+        Raises:
+            KeyError: If any node is not in the graph
+        """
+        keep = np.unique(self.indices_of(list(nodes)))
+        remap = np.full(self.num_nodes, -1, dtype=np.int64)
+        remap[keep] = np.arange(len(keep))
+
+        tails = self.arc_tails()
+        arcs = (remap[tails] >= 0) & (remap[self.indices] >= 0)
+        # Remapping preserves order, so arcs stay grouped by tail and sorted by head
+        counts = np.bincount(remap[tails[arcs]], minlength=len(keep))
+        indptr = np.zeros(len(keep) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        return CompactGraph(
+            node_ids=self.node_ids[keep],
+            lat=self.lat[keep],
+            lon=self.lon[keep],
+            x=self.x[keep],
+            y=self.y[keep],
+            indptr=indptr,
+            indices=remap[self.indices[arcs]].astype(np.int32),
+            length=self.length[arcs],
+            highway=self.highway[arcs],
+            version=self.version,
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the arrays; cached Python lists are rebuilt on demand."""
+        state = {name: getattr(self, name) for name in _ARRAY_NAMES}
+        state["version"] = self.version
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    def arc_tails(self) -> np.ndarray:
+        """Dense id of the source node of every arc."""
+        return np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.indptr))
@@ -0,0 +1,97 @@
+"""
+Compact graph adapter.
+Adapts a CompactGraph to the generic GraphInterface without NetworkX.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .graph_interface import GraphInterface
+from .compact_graph import CompactGraph, HIGHWAY_CLASSES
+
+
+class CompactGraphAdapter(GraphInterface):
+    """
+    GraphInterface over the compact arrays alone.
+
+    Used where the NetworkX graph is not available, such as worker
+    processes that map the cached arrays instead of loading the GraphML.
+    Parallel edges were collapsed when the arrays were built, so edge data
+    has a single entry per node pair.
+    """
+
+    def __init__(self, compact_graph: CompactGraph, arc_weights=None,
+                 weight_profile: Optional[str] = None, weight_unit: str = "meters"):
+        """
+        Initialize with a compact graph.
+
+        Args:
+            compact_graph: Compact graph
+            arc_weights: Optional per-arc weight list aligned with compact_graph
+            weight_profile: Name of the profile arc_weights come from
+            weight_unit: Unit of arc_weights ("meters" or "seconds")
+        """
+        self.compact_graph = compact_graph
+        self.arc_weights = arc_weights
+        self.weight_profile = weight_profile
+        self.weight_unit = weight_unit
+
+    def get_neighbors(self, node: int) -> List[int]:
+        """Get neighbors of a node."""
+        compact = self.compact_graph
+        return compact.to_node_ids(compact.neighbor_lists()[compact.index_of(node)])
+
+    def node_exists(self, node: int) -> bool:
+        """Check if a node exists."""
+        return self.compact_graph.has_node(node)
+
+    def edge_exists(self, u: int, v: int) -> bool:
+        """Check if an edge exists."""
+        return self._arc(u, v) >= 0
+
+    def get_node_data(self, node: int) -> Dict[str, Any]:
+        """Get data for a node (OSMnx keys: 'y' latitude, 'x' longitude)."""
+        compact = self.compact_graph
+        index = compact.index_of(node)
+        return {'y': float(compact.lat[index]), 'x': float(compact.lon[index])}
+
+    def get_edge_data(self, u: int, v: int) -> Optional[Dict[str, Any]]:
+        """Get edge data keyed like a MultiGraph ({key: data})."""
+        arc = self._arc(u, v)
+        if arc < 0:
+            return None
+        compact = self.compact_graph
+        return {0: {'length': float(compact.length[arc]),
+                    'highway': HIGHWAY_CLASSES[int(compact.highway[arc])]}}
+
+    def get_compact_graph(self) -> CompactGraph:
+        """Get the compact graph."""
+        return self.compact_graph
+
+    def get_arc_weights(self):
+        """Get the per-arc weights of the applied profile, if any."""
+        return self.arc_weights
+
+    def get_weight_unit(self) -> str:
+        """Get the unit of the applied profile's weights."""
+        return self.weight_unit
+
+    def get_edge_weight(self, u: int, v: int) -> float:
+        """Get the edge cost from the applied weight profile, or the edge length."""
+        arc = self._arc(u, v)
+        if arc < 0:
+            return 1.0
+        if self.arc_weights is not None:
+            return self.arc_weights[arc]
+        return self.compact_graph.arc_lengths()[arc]
+
+    def get_subgraph(self, nodes: List[int]) -> 'CompactGraphAdapter':
+        """Get subgraph with specified nodes."""
+        return CompactGraphAdapter(self.compact_graph.subgraph(nodes))
+
+    def _arc(self, u: int, v: int) -> int:
+        """Arc id from u to v, or -1 if either node is missing or they are not adjacent."""
+        compact = self.compact_graph
+        try:
+            return compact.arc_between(compact.index_of(u), compact.index_of(v))
+        except KeyError:
+            return -1
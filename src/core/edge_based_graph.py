@@ -0,0 +1,282 @@
+"""
+Edge-based (line graph) expansion of the road network.
+Single responsibility: Turn costs and turn restrictions between consecutive arcs.
+"""
+
+import ast
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from core.compact_graph import CompactGraph, HIGHWAY_CLASSES
+from core.turn_restrictions import TurnRestriction
+
+# Turns within this many degrees of straight ahead are "straight"
+STRAIGHT_TURN_MAX_DEG = 30.0
+# Turns sharper than this are treated as U-turns
+U_TURN_MIN_DEG = 160.0
+
+
+def parse_way_ids(value: Any) -> Set[int]:
+    """
+    Parse the OSM way ids stored on an edge.
+
+    Simplified edges can merge several ways, in which case 'osmid' is a list
+    (or its Python repr after a GraphML round trip).
+
+    Args:
+        value: The edge's 'osmid' attribute
+
+    Returns:
+        Set of way ids
+    """
+    if isinstance(value, str):
+        try:
+            value = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return set()
+    if isinstance(value, (list, tuple, set)):
+        return {int(v) for v in value}
+    if value is None:
+        return set()
+    return {int(value)}
+
+
+class EdgeBasedGraph:
+    """
+    Turn transitions of a compact graph.
+
+    A transition is a pair of arcs (u->v, v->w) meeting at v. The transitions
+    leaving in-arc a are the out-arcs of its head in CSR order, so they are
+    stored as one flat array indexed by turn_offsets[a] + position, which is
+    the position of the out-arc among the head's neighbors. Banned turns get
+    an infinite cost. Everything is computed on first use.
+
+    Nodes where every transition is free are "non-branching": a search can
+    keep a single label per node there instead of one per incoming arc.
+    Penalties can be limited to intersections of given road classes, so
+    only those and intersections with restrictions branch; elsewhere every
+    turn, U-turns included, is free.
+    """
+
+    def __init__(self, compact: CompactGraph, turn_penalties: Dict[str, float],
+                 major_road_classes: Sequence[str] = (),
+                 major_road_left_turn_penalty: float = 0.0,
+                 banned_turns: Optional[Iterable[Tuple[int, int]]] = None,
+                 penalized_road_classes: Optional[Sequence[str]] = None):
+        """
+        Initialize the expansion.
+
+        Args:
+            compact: Compact graph to expand
+            turn_penalties: Cost per turn type ("straight", "right", "left", "u_turn")
+            major_road_classes: Highway classes whose intersections make left turns dearer
+            major_road_left_turn_penalty: Extra cost of a left turn at such an intersection
+            banned_turns: (in_arc, out_arc) pairs that may not be taken
+            penalized_road_classes: Highway classes whose intersections get turn
+                penalties (None penalizes turns at every intersection)
+        """
+        self.compact = compact
+        self.turn_penalties = {name: float(value) for name, value in turn_penalties.items()}
+        self.penalized_road_classes = None if penalized_road_classes is None else tuple(penalized_road_classes)
+        self.major_road_classes = tuple(major_road_classes)
+        self.major_road_left_turn_penalty = float(major_road_left_turn_penalty)
+
+        num_arcs = compact.num_arcs
+        keys = [in_arc * num_arcs + out_arc for in_arc, out_arc in (banned_turns or ())]
+        # Sorted int64 keys in_arc * num_arcs + out_arc
+        self.banned_keys = np.unique(np.array(keys, dtype=np.int64))
+
+        self._turn_costs: Optional[List[float]] = None
+        self._turn_offsets: Optional[List[int]] = None
+        self._branching: Optional[List[bool]] = None
+
+    @classmethod
+    def from_restrictions(cls, compact: CompactGraph, graph,
+                          restrictions: Sequence[TurnRestriction],
+                          turn_penalties: Dict[str, float],
+                          major_road_classes: Sequence[str] = (),
+                          major_road_left_turn_penalty: float = 0.0,
+                          penalized_road_classes: Optional[Sequence[str]] = None) -> "EdgeBasedGraph":
+        """
+        Build the expansion with OSM turn restrictions applied.
+
+        Restrictions name ways, so the edges around each via node are looked
+        up in the NetworkX graph to find which arcs belong to which way.
+
+        Args:
+            compact: Compact graph to expand
+            graph: NetworkX graph the compact graph was built from ('osmid' on edges)
+            restrictions: Turn restrictions to apply
+            turn_penalties: Cost per turn type
+            major_road_classes: Highway classes whose intersections make left turns dearer
+            major_road_left_turn_penalty: Extra cost of a left turn at such an intersection
+            penalized_road_classes: Highway classes whose intersections get turn
+                penalties (None penalizes turns at every intersection)
+
+        Returns:
+            Edge-based graph
+        """
+        banned_turns = []
+        for restriction in restrictions:
+            banned_turns.extend(_restriction_to_banned_turns(compact, graph, restriction))
+
+        return cls(compact, turn_penalties, major_road_classes,
+                   major_road_left_turn_penalty, banned_turns, penalized_road_classes)
+
+    @property
+    def num_restricted_turns(self) -> int:
+        """Number of banned arc-to-arc transitions."""
+        return len(self.banned_keys)
+
+    def turn_cost_lists(self) -> Tuple[List[float], List[int]]:
+        """
+        Flat transition costs and per-arc offsets as Python lists.
+
+        Returns:
+            (turn_costs, turn_offsets) where the cost of turning from in_arc
+            onto the out-arc at position p of its head is
+            turn_costs[turn_offsets[in_arc] + p] (inf if banned)
+        """
+        if self._turn_costs is None:
+            self._build_transitions()
+        return self._turn_costs, self._turn_offsets
+
+    def branching_nodes(self) -> List[bool]:
+        """Per dense node, whether any transition through it has a cost or is banned."""
+        if self._branching is None:
+            self._build_transitions()
+        return self._branching
+
+    def turn_cost(self, in_arc: int, out_arc: int) -> float:
+        """
+        Cost of a single transition.
+
+        Returns:
+            Turn cost, or inf if the turn is banned
+
+        Raises:
+            ValueError: If the arcs do not meet
+        """
+        compact = self.compact
+        head = int(compact.indices[in_arc])
+        if not compact.indptr[head] <= out_arc < compact.indptr[head + 1]:
+            raise ValueError(f"Arc {out_arc} does not leave the head of arc {in_arc}")
+        turn_costs, turn_offsets = self.turn_cost_lists()
+        return turn_costs[turn_offsets[in_arc] + out_arc - int(compact.indptr[head])]
+
+    def _build_transitions(self) -> None:
+        """Compute every transition cost at once with array operations."""
+        compact = self.compact
+        indptr = compact.indptr
+        heads = compact.indices.astype(np.int64)
+        tails = compact.arc_tails().astype(np.int64)
+        num_arcs = compact.num_arcs
+
+        # Transitions leaving each in-arc = out-degree of its head
+        out_degree = np.diff(indptr)
+        per_arc = out_degree[heads]
+        turn_offsets = np.zeros(num_arcs + 1, dtype=np.int64)
+        np.cumsum(per_arc, out=turn_offsets[1:])
+
+        in_arc = np.repeat(np.arange(num_arcs, dtype=np.int64), per_arc)
+        position = np.arange(len(in_arc), dtype=np.int64) - turn_offsets[in_arc]
+        via = heads[in_arc]
+        out_arc = indptr[via] + position
+
+        # Signed turn angle, bearings measured clockwise from north so right is positive
+        bearings = self._arc_bearings(tails, heads)
+        angle = bearings[out_arc] - bearings[in_arc]
+        angle = (angle + math.pi) % (2.0 * math.pi) - math.pi
+        magnitude = np.degrees(np.abs(angle))
+
+        penalties = self.turn_penalties
+        costs = np.where(angle > 0, penalties.get("right", 0.0), penalties.get("left", 0.0))
+        costs = np.where(magnitude <= STRAIGHT_TURN_MAX_DEG, penalties.get("straight", 0.0), costs)
+        is_u_turn = (magnitude >= U_TURN_MIN_DEG) | (heads[out_arc] == tails[in_arc])
+        costs = np.where(is_u_turn, penalties.get("u_turn", 0.0), costs)
+        if self.penalized_road_classes is not None:
+            costs = np.where(self._intersections_of(self.penalized_road_classes)[via], costs, 0.0)
+
+        if self.major_road_left_turn_penalty and self.major_road_classes:
+            is_left = (angle < 0) & (magnitude > STRAIGHT_TURN_MAX_DEG) & ~is_u_turn
+            costs = costs + np.where(is_left & self._intersections_of(self.major_road_classes)[via],
+                                     self.major_road_left_turn_penalty, 0.0)
+
+        if len(self.banned_keys):
+            costs[np.isin(in_arc * num_arcs + out_arc, self.banned_keys)] = math.inf
+
+        branching = np.zeros(compact.num_nodes, dtype=bool)
+        branching[via[costs != 0]] = True
+
+        self._turn_costs = costs.tolist()
+        self._turn_offsets = turn_offsets.tolist()
+        self._branching = branching.tolist()
+
+    def _arc_bearings(self, tails: np.ndarray, heads: np.ndarray) -> np.ndarray:
+        """Initial bearing of every arc in radians (straight line from tail to head)."""
+        lat = np.radians(self.compact.lat)
+        lon = np.radians(self.compact.lon)
+        # Equirectangular approximation, accurate for the short arcs of a city network
+        dx = (lon[heads] - lon[tails]) * np.cos(lat[tails])
+        dy = lat[heads] - lat[tails]
+        return np.arctan2(dx, dy)
+
+    def _intersections_of(self, road_classes: Sequence[str]) -> np.ndarray:
+        """Per dense node, whether an arc of one of the road classes ends there."""
+        codes = [HIGHWAY_CLASSES.index(name) for name in road_classes if name in HIGHWAY_CLASSES]
+        matches = np.isin(self.compact.highway, codes)
+        nodes = np.zeros(self.compact.num_nodes, dtype=bool)
+        nodes[self.compact.indices[matches]] = True
+        return nodes
+
+
+def _restriction_to_banned_turns(compact: CompactGraph, graph,
+                                 restriction: TurnRestriction) -> List[Tuple[int, int]]:
+    """Translate one way-based restriction into banned (in_arc, out_arc) pairs."""
+    if not compact.has_node(restriction.via_node):
+        return []
+
+    via = compact.index_of(restriction.via_node)
+    neighbors = compact.neighbor_lists()[via]
+    start = compact.arc_offsets()[via]
+
+    from_arcs, to_arcs = [], []
+    for position, neighbor in enumerate(neighbors):
+        edge_data = graph.get_edge_data(restriction.via_node, int(compact.node_ids[neighbor]))
+        if not edge_data:
+            continue
+        if graph.is_multigraph():
+            way_ids = set()
+            for data in edge_data.values():
+                way_ids |= parse_way_ids(data.get('osmid'))
+        else:
+            way_ids = parse_way_ids(edge_data.get('osmid'))
+
+        if restriction.from_way in way_ids:
+            from_arcs.append((compact.arc_between(neighbor, via), neighbor))
+        if restriction.to_way in way_ids:
+            to_arcs.append((start + position, neighbor))
+
+    def turn_matches(tail: int, head: int) -> bool:
+        # A way running through the via node is both "from" and "to" there;
+        # a U-turn restriction on it means the reversal, any other turn
+        # restriction means a different edge of the way
+        if restriction.from_way == restriction.to_way and restriction.restriction.endswith("u_turn"):
+            return head == tail
+        return head != tail
+
+    banned = []
+    if restriction.is_mandatory:
+        for in_arc, tail in from_arcs:
+            allowed_here = {out_arc for out_arc, head in to_arcs if turn_matches(tail, head)}
+            for position in range(len(neighbors)):
+                if start + position not in allowed_here:
+                    banned.append((in_arc, start + position))
+    else:
+        for in_arc, tail in from_arcs:
+            for out_arc, head in to_arcs:
+                if turn_matches(tail, head):
+                    banned.append((in_arc, out_arc))
+    return banned
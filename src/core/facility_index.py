@@ -0,0 +1,211 @@
+"""
+Network Voronoi partition of the graph by nearest facility.
+Single responsibility: Precompute, store and query each node's nearest facility by road.
+"""
+
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from shared.utils.array_store import save_arrays, load_arrays
+from core.compact_graph import CompactGraph
+
+# Bump when the stored arrays change so stale indexes are rebuilt
+FORMAT_VERSION = 1
+
+_ARRAY_NAMES = ("facilities", "nearest", "distance", "parent")
+
+
+class FacilityIndex:
+    """
+    Nearest facility of every node, from one multi-source Dijkstra.
+
+    All facilities of a category are seeded at distance 0 at once, so the
+    search grows one shortest path forest whose trees are the network
+    Voronoi cells. Per dense node the index stores the facility of its
+    cell, the distance to it and its parent in the forest (the next node
+    towards the facility), so a lookup is O(1) and the route is a walk
+    along parent pointers.
+    """
+
+    def __init__(self, compact: CompactGraph, facilities: np.ndarray, nearest: np.ndarray,
+                 distance: np.ndarray, parent: np.ndarray, names: Sequence[str] = (),
+                 category: str = "", weights_name: str = "length"):
+        """
+        Initialize from partition arrays.
+
+        Args:
+            compact: Compact graph the partition was built for
+            facilities: Original node id of each facility
+            nearest: Facility position per dense node (-1 if unreachable)
+            distance: Distance to that facility per dense node (inf if unreachable)
+            parent: Next dense node towards the facility (-1 at facilities)
+            names: Facility names, aligned with facilities
+            category: Facility category (e.g. "hospital")
+            weights_name: Name of the weights the partition was built from
+        """
+        self.compact = compact
+        self.facilities = facilities
+        self.nearest = nearest
+        self.distance = distance
+        self.parent = parent
+        self.names = list(names)
+        self.category = category
+        self.weights_name = weights_name
+
+    @classmethod
+    def build(cls, compact: CompactGraph, facility_nodes: Sequence[int], names: Sequence[str] = (),
+              category: str = "", weights: Optional[Sequence[float]] = None,
+              weights_name: str = "length") -> "FacilityIndex":
+        """
+        Partition the graph by running one Dijkstra from all facilities.
+
+        Args:
+            compact: Compact graph
+            facility_nodes: Original node id of each facility (snapped)
+            names: Facility names, aligned with facility_nodes
+            category: Facility category recorded with the index
+            weights: Per-arc weights (defaults to arc lengths)
+            weights_name: Name recorded with the index
+
+        Returns:
+            Facility index
+
+        Raises:
+            KeyError: If a facility node is not in the graph
+        """
+        from algorithms.dijkstra import shortest_path_tree
+
+        # Facilities snapped to the same node share it; the first one owns the cell
+        source_facility = {}
+        for position, node in enumerate(facility_nodes):
+            source_facility.setdefault(compact.index_of(node), position)
+
+        distances, parents, _ = shortest_path_tree(
+            compact, {source: 0.0 for source in source_facility}, weights
+        )
+
+        nearest = np.full(compact.num_nodes, -1, dtype=np.int32)
+        distance = np.full(compact.num_nodes, np.inf, dtype=np.float32)
+        parent = np.full(compact.num_nodes, -1, dtype=np.int32)
+        # Nodes are settled after their parents, so each inherits its parent's facility
+        for node, node_distance in distances.items():
+            tree_parent = parents[node]
+            if tree_parent is None:
+                nearest[node] = source_facility[node]
+            else:
+                nearest[node] = nearest[tree_parent]
+                parent[node] = tree_parent
+            distance[node] = node_distance
+
+        facilities = np.asarray(facility_nodes, dtype=np.int64)
+        return cls(compact, facilities, nearest, distance, parent, names, category, weights_name)
+
+    def save(self, directory: Path) -> None:
+        """Save the partition arrays to a cache directory."""
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "graph_version": self.compact.version,
+            "category": self.category,
+            "weights": self.weights_name,
+            "names": self.names,
+        }
+        save_arrays(directory, meta, **{name: getattr(self, name) for name in _ARRAY_NAMES})
+
+    @classmethod
+    def load(cls, directory: Path, compact: CompactGraph, facility_nodes: Sequence[int],
+             weights_name: str = "length", mmap: bool = True) -> Optional["FacilityIndex"]:
+        """
+        Load a partition saved with save(), memory-mapped by default.
+
+        Args:
+            directory: Cache directory
+            compact: Compact graph the partition must match
+            facility_nodes: Expected facility node ids (a changed list is stale)
+            weights_name: Expected weights name
+            mmap: Memory-map the arrays read-only
+
+        Returns:
+            Facility index, or None if the cache is missing or stale
+        """
+        loaded = load_arrays(directory, _ARRAY_NAMES, mmap=mmap)
+        if loaded is None:
+            return None
+
+        meta, arrays = loaded
+        if (meta.get("format_version") != FORMAT_VERSION
+                or meta.get("graph_version") != compact.version
+                or meta.get("weights") != weights_name
+                or len(arrays["nearest"]) != compact.num_nodes
+                or arrays["facilities"].tolist() != list(facility_nodes)):
+            return None
+
+        return cls(compact, names=meta.get("names", ()), category=meta.get("category", ""),
+                   weights_name=weights_name, **arrays)
+
+    @property
+    def num_facilities(self) -> int:
+        """Number of facilities in the partition."""
+        return len(self.facilities)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the partition arrays in bytes."""
+        return sum(getattr(self, name).nbytes for name in _ARRAY_NAMES)
+
+    def nearest_facility(self, node_id: int) -> Optional[Tuple[int, float]]:
+        """
+        Nearest facility of a node.
+
+        Args:
+            node_id: Original node id
+
+        Returns:
+            (facility position, distance), or None if no facility is reachable
+
+        Raises:
+            KeyError: If the node is not in the graph
+        """
+        index = self.compact.index_of(node_id)
+        facility = int(self.nearest[index])
+        if facility < 0:
+            return None
+        return facility, float(self.distance[index])
+
+    def facility_node(self, facility: int) -> int:
+        """Original node id of a facility position."""
+        return int(self.facilities[facility])
+
+    def facility_name(self, facility: int) -> str:
+        """Name of a facility position (its node id if unnamed)."""
+        if facility < len(self.names):
+            return self.names[facility]
+        return f"Facility {self.facility_node(facility)}"
+
+    def route(self, node_id: int) -> Optional[List[int]]:
+        """
+        Shortest path from a node to its nearest facility.
+
+        Args:
+            node_id: Original node id
+
+        Returns:
+            Original node ids from node_id to the facility, or None if no
+            facility is reachable
+        """
+        index = self.compact.index_of(node_id)
+        if self.nearest[index] < 0:
+            return None
+
+        parent = self.parent
+        path = [index]
+        while parent[index] >= 0:
+            index = int(parent[index])
+            path.append(index)
+        return self.compact.to_node_ids(path)
+
+    def cell_sizes(self) -> List[int]:
+        """Number of nodes in each facility's Voronoi cell."""
+        reached = self.nearest[self.nearest >= 0]
+        return np.bincount(reached, minlength=self.num_facilities).tolist()
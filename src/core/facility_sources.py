@@ -0,0 +1,92 @@
+"""
+OSM facility loading.
+Single responsibility: Named facility points from OpenStreetMap tags, downloaded once and cached as JSON.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import osmnx as ox
+
+FORMAT_VERSION = 1
+# Attribution required by the ODbL for data derived from OpenStreetMap
+OSM_SOURCE = "OpenStreetMap contributors, ODbL 1.0 (https://www.openstreetmap.org/copyright)"
+
+
+def load_facilities(path: Path, city: str, tags: Dict[str, Any]) -> Dict[str, Tuple[float, float]]:
+    """
+    Load the facilities matching OSM tags, downloading them on first use.
+
+    The cache file records the city, the tags, the source and the download
+    date; a cache for other tags or another city is downloaded again.
+    Features without a name are listed by their tag value and OSM id, and
+    a repeated name gets the OSM id appended, so no mapped facility is
+    dropped. Each feature is located by a representative point (a point
+    inside the building or site polygon).
+
+    Args:
+        path: JSON cache file of the category
+        city: Place whose facilities are loaded
+        tags: OSM tags selecting the category, e.g. {"amenity": "hospital"}
+
+    Returns:
+        Facility name -> (lat, lon)
+
+    Raises:
+        Exception: If there is no usable cache and the download fails
+    """
+    path = Path(path)
+    cached = _load_cache(path, city, tags)
+    if cached is not None:
+        return cached
+
+    # osmnx >= 2 uses features_from_place instead of geometries_from_place
+    gdf = ox.features_from_place(city, tags)
+    points = gdf.geometry.representative_point()
+    names = gdf["name"] if "name" in gdf.columns else [None] * len(gdf)
+    label = "/".join(str(value) for value in tags.values())
+
+    facilities: Dict[str, Tuple[float, float]] = {}
+    for (element, osm_id), name, point in zip(gdf.index, names, points):
+        name = str(name).strip() if isinstance(name, str) else ""
+        if not name:
+            name = f"{label} ({element} {osm_id})"
+        elif name in facilities:
+            name = f"{name} ({element} {osm_id})"
+        facilities[name] = (float(point.y), float(point.x))
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump({
+                "format_version": FORMAT_VERSION,
+                "source": OSM_SOURCE,
+                "retrieved": time.strftime("%Y-%m-%d"),
+                "city": city,
+                "tags": tags,
+                "facilities": [
+                    {"name": name, "lat": lat, "lon": lon} for name, (lat, lon) in facilities.items()
+                ],
+            }, f, ensure_ascii=False, indent=1)
+    except OSError:
+        # If caching fails, we still return the facilities
+        pass
+    return facilities
+
+
+def _load_cache(path: Path, city: str, tags: Dict[str, Any]) -> Optional[Dict[str, Tuple[float, float]]]:
+    """Facilities from the cache file, or None if it is missing, unreadable or for other tags."""
+    if not path.exists():
+        return None
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if (data.get("format_version") != FORMAT_VERSION or data.get("city") != city
+                or data.get("tags") != tags):
+            return None
+        return {str(entry["name"]): (float(entry["lat"]), float(entry["lon"]))
+                for entry in data["facilities"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
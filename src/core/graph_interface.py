@@ -40,6 +40,33 @@ class GraphInterface(ABC):
     def get_subgraph(self, nodes: List[int]) -> 'GraphInterface':
         """Get subgraph with specified nodes."""
         pass
+    
+    def get_compact_graph(self) -> Optional[Any]:
+        """Get the compact array view of the graph, if the implementation has one."""
+        return None
+    
+    def get_edge_weight(self, u: int, v: int) -> float:
+        """
+        Get the routing cost of the edge between two nodes.
+        
+        Defaults to the edge length (the shortest one for parallel edges),
+        or unit cost when the edge has no length.
+        """
+        edge_data = self.get_edge_data(u, v)
+        if not edge_data:
+            return 1.0
+        if 'length' not in edge_data and all(isinstance(d, dict) for d in edge_data.values()):
+            # Multigraph: {key: data} for each parallel edge
+            return min(float(d.get('length', 1.0)) for d in edge_data.values())
+        return float(edge_data.get('length', 1.0))
+    
+    def get_arc_weights(self) -> Optional[Any]:
+        """Get the per-arc weights aligned with the compact graph, if a profile is applied."""
+        return None
+    
+    def get_weight_unit(self) -> str:
+        """Get the unit of the routing costs: "meters" (edge lengths) unless a profile says otherwise."""
+        return "meters"
 
 
 class ConstraintInterface(ABC):
@@ -3,15 +3,30 @@ Graph model for managing the road network data.
 Single responsibility: Graph data management and basic operations.
 """
 
+import hashlib
+import numpy as np
 import osmnx as ox
 import networkx as nx
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence, Tuple
 
 from config.settings import (
-    CACHE_DIR, GRAPH_CACHE_FILE, DEFAULT_CITY, 
-    NETWORK_TYPE, SIMPLIFY_GRAPH
+    CACHE_DIR, GRAPH_CACHE_FILE, COMPACT_GRAPH_DIR, DEFAULT_CITY, 
+    NETWORK_TYPE, SIMPLIFY_GRAPH, FREE_FLOW_SPEED_KMH,
+    HOURLY_SPEED_FACTORS, ARTERIAL_HIGHWAY_CLASSES, TURN_RESTRICTIONS_FILE,
+    TURN_PENALTIES, TURN_PENALTY_ROAD_CLASSES, MAJOR_ROAD_CLASSES, MAJOR_ROAD_LEFT_TURN_PENALTY,
+    SPATIAL_INDEX_CELL_METERS,
+    REVERSE_GEOCODE_PLACE_RADIUS, FACILITY_CACHE_DIR
 )
+from core.compact_graph import CompactGraph
+from core.speed_profiles import SpeedProfileTable
+from core.edge_based_graph import EdgeBasedGraph
+from core.hub_labels import HubLabelIndex
+from core.facility_index import FacilityIndex
+from core.facility_sources import load_facilities
+from core.reverse_geocode_index import ReverseGeocodeIndex
+from core.spatial_index import SpatialGridIndex, EdgeSpatialIndex
+from core.turn_restrictions import load_turn_restrictions
 
 
 class GraphModel:
@@ -20,6 +35,16 @@ class GraphModel:
     def __init__(self):
         """Initialize the graph model with cached or fresh data."""
         self._graph: Optional[nx.Graph] = None
+        self._version: str = ""
+        self._compact: Optional[CompactGraph] = None
+        self._speed_profiles: Optional[SpeedProfileTable] = None
+        self._spatial_index: Optional[SpatialGridIndex] = None
+        self._edge_index: Optional[EdgeSpatialIndex] = None
+        self._edge_based_graph: Optional[EdgeBasedGraph] = None
+        self._hub_labels: Optional[HubLabelIndex] = None
+        self._facility_indexes: Dict[Tuple[str, str], FacilityIndex] = {}
+        self._facilities: Dict[str, Dict[str, Tuple[float, float]]] = {}
+        self._reverse_geocode_index: Optional[ReverseGeocodeIndex] = None
         self._load_graph()
     
     def _load_graph(self) -> None:
@@ -41,12 +66,226 @@ class GraphModel:
         
         # Convert to undirected for comprehensive path finding
         self._graph = self._graph.to_undirected()
+        
+        # Array views are cached next to the GraphML file
+        self._version = self._compute_version()
+        self._compact = self._load_compact_graph()
+        self._speed_profiles = self._load_speed_profiles()
+        self._spatial_index = self._load_spatial_index()
+        self._edge_index = self._load_edge_index()
+    
+    def _compute_version(self) -> str:
+        """Fingerprint the cached GraphML file so derived caches can detect changes."""
+        digest = hashlib.sha1()
+        with GRAPH_CACHE_FILE.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()[:16]
+    
+    def _load_compact_graph(self) -> CompactGraph:
+        """Load the compact array graph from cache or build it from the graph."""
+        compact = CompactGraph.load(COMPACT_GRAPH_DIR, version=self._version)
+        if compact is None:
+            compact = CompactGraph.from_networkx(self._graph, version=self._version)
+            try:
+                compact.save(COMPACT_GRAPH_DIR)
+            except OSError:
+                # Caching is an optimization, keep the in-memory arrays
+                pass
+        return compact
+    
+    def _load_speed_profiles(self) -> SpeedProfileTable:
+        """Load the hourly speed profiles stored alongside the compact graph."""
+        profile_dir = COMPACT_GRAPH_DIR / "speed_profiles"
+        fingerprint = SpeedProfileTable.settings_fingerprint(
+            FREE_FLOW_SPEED_KMH, HOURLY_SPEED_FACTORS, ARTERIAL_HIGHWAY_CLASSES
+        )
+        profiles = SpeedProfileTable.load(profile_dir, self._compact, fingerprint)
+        if profiles is None:
+            profiles = SpeedProfileTable.from_speeds(
+                self._compact, FREE_FLOW_SPEED_KMH, HOURLY_SPEED_FACTORS, ARTERIAL_HIGHWAY_CLASSES
+            )
+            try:
+                profiles.save(profile_dir)
+            except OSError:
+                pass
+        return profiles
+    
+    def _load_spatial_index(self) -> SpatialGridIndex:
+        """Load the nearest-node grid index stored alongside the compact graph."""
+        index_dir = COMPACT_GRAPH_DIR / "spatial_index"
+        index = SpatialGridIndex.load(index_dir, self._compact, SPATIAL_INDEX_CELL_METERS)
+        if index is None:
+            index = SpatialGridIndex.build(self._compact, SPATIAL_INDEX_CELL_METERS)
+            try:
+                index.save(index_dir)
+            except OSError:
+                pass
+        return index
+    
+    def _load_edge_index(self) -> EdgeSpatialIndex:
+        """Load the nearest-edge grid index stored alongside the compact graph."""
+        index_dir = COMPACT_GRAPH_DIR / "edge_index"
+        index = EdgeSpatialIndex.load(index_dir, self._compact, SPATIAL_INDEX_CELL_METERS)
+        if index is None:
+            index = EdgeSpatialIndex.build(self._compact, SPATIAL_INDEX_CELL_METERS)
+            try:
+                index.save(index_dir)
+            except OSError:
+                pass
+        return index
     
     @property
     def graph(self) -> nx.Graph:
         """Get the road network graph."""
         return self._graph
     
+    @property
+    def version(self) -> str:
+        """Get the version fingerprint of the loaded graph."""
+        return self._version
+    
+    @property
+    def compact(self) -> CompactGraph:
+        """Get the compact array view of the graph."""
+        return self._compact
+    
+    @property
+    def speed_profiles(self) -> SpeedProfileTable:
+        """Get the hourly travel time profiles of the graph."""
+        return self._speed_profiles
+    
+    @property
+    def spatial_index(self) -> SpatialGridIndex:
+        """Get the grid index for snapping coordinates to nodes."""
+        return self._spatial_index
+    
+    @property
+    def edge_index(self) -> EdgeSpatialIndex:
+        """Get the grid index for snapping coordinates onto edges."""
+        return self._edge_index
+    
+    @property
+    def edge_based_graph(self) -> EdgeBasedGraph:
+        """Get the turn-cost expansion of the graph (built on first access)."""
+        if self._edge_based_graph is None:
+            self._edge_based_graph = EdgeBasedGraph.from_restrictions(
+                self._compact,
+                self._graph,
+                load_turn_restrictions(TURN_RESTRICTIONS_FILE),
+                TURN_PENALTIES,
+                MAJOR_ROAD_CLASSES,
+                MAJOR_ROAD_LEFT_TURN_PENALTY,
+                TURN_PENALTY_ROAD_CLASSES
+            )
+        return self._edge_based_graph
+    
+    @property
+    def hub_labels(self) -> HubLabelIndex:
+        """Get the hub label distance oracle (memory-mapped; built and cached on first access)."""
+        if self._hub_labels is None:
+            label_dir = COMPACT_GRAPH_DIR / "hub_labels"
+            labels = HubLabelIndex.load(label_dir, self._compact)
+            if labels is None:
+                print("Building hub labels (one-time, this may take several minutes)...")
+                labels = HubLabelIndex.build(self._compact)
+                try:
+                    labels.save(label_dir)
+                    # Reopen memory-mapped so the label arrays live in the page cache
+                    labels = HubLabelIndex.load(label_dir, self._compact) or labels
+                except OSError:
+                    pass
+            self._hub_labels = labels
+        return self._hub_labels
+    
+    def facilities(self, category: str, tags: Dict[str, str]) -> Dict[str, Tuple[float, float]]:
+        """
+        Get the facilities of a category from OSM (downloaded once, then cached).
+        
+        Args:
+            category: Facility category, used as the cache file name
+            tags: OSM tags selecting the category
+            
+        Returns:
+            Facility name -> (lat, lon)
+        """
+        if category not in self._facilities:
+            self._facilities[category] = load_facilities(
+                FACILITY_CACHE_DIR / f"{category}.json", DEFAULT_CITY, tags
+            )
+        return self._facilities[category]
+    
+    def facility_index(self, category: str, facility_nodes: Sequence[int],
+                       names: Sequence[str] = (), weights: Optional[Sequence[float]] = None,
+                       weights_name: str = "length") -> FacilityIndex:
+        """
+        Get the nearest-facility partition of a category (memory-mapped; built and cached on first access).
+        
+        Args:
+            category: Facility category, used as the cache directory name
+            facility_nodes: Snapped node id of each facility
+            names: Facility names, aligned with facility_nodes
+            weights: Per-arc weights (defaults to arc lengths)
+            weights_name: Name of the weights, part of the cache key
+            
+        Returns:
+            Facility index
+        """
+        key = (category, weights_name)
+        index = self._facility_indexes.get(key)
+        if index is None or index.facilities.tolist() != list(facility_nodes):
+            index_dir = COMPACT_GRAPH_DIR / "facilities" / category / weights_name
+            index = FacilityIndex.load(index_dir, self._compact, facility_nodes, weights_name)
+            if index is None:
+                index = FacilityIndex.build(
+                    self._compact, facility_nodes, names, category, weights, weights_name
+                )
+                try:
+                    index.save(index_dir)
+                    index = FacilityIndex.load(
+                        index_dir, self._compact, facility_nodes, weights_name
+                    ) or index
+                except OSError:
+                    pass
+            self._facility_indexes[key] = index
+        return index
+    
+    def reverse_geocode_index(self, place_names: Sequence[str] = (), place_lats: Sequence[float] = (),
+                              place_lons: Sequence[float] = ()) -> ReverseGeocodeIndex:
+        """
+        Get the node and street labels for a set of named places (memory-mapped; built and cached on first access).
+        
+        Args:
+            place_names: Names of places that may label their nearest node
+            place_lats: Latitudes aligned with place_names (NaN if unknown)
+            place_lons: Longitudes aligned with place_names (NaN if unknown)
+            
+        Returns:
+            Reverse geocoding index
+        """
+        digest = hashlib.sha1(repr(REVERSE_GEOCODE_PLACE_RADIUS).encode("utf-8"))
+        digest.update("\n".join(place_names).encode("utf-8"))
+        digest.update(np.asarray(place_lats, dtype=np.float64).tobytes())
+        digest.update(np.asarray(place_lons, dtype=np.float64).tobytes())
+        fingerprint = digest.hexdigest()[:16]
+        
+        index = self._reverse_geocode_index
+        if index is None or index.places_fingerprint != fingerprint:
+            index_dir = COMPACT_GRAPH_DIR / "reverse_geocode"
+            index = ReverseGeocodeIndex.load(index_dir, self._compact, fingerprint)
+            if index is None:
+                index = ReverseGeocodeIndex.build(
+                    self._compact, self._graph, self._spatial_index, place_names, place_lats,
+                    place_lons, REVERSE_GEOCODE_PLACE_RADIUS, fingerprint
+                )
+                try:
+                    index.save(index_dir)
+                    index = ReverseGeocodeIndex.load(index_dir, self._compact, fingerprint) or index
+                except OSError:
+                    pass
+            self._reverse_geocode_index = index
+        return index
+    
     def get_node_data(self, node_id: int) -> Dict[str, Any]:
         """Get data for a specific node."""
         return self._graph.nodes[node_id]
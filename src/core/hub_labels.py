@@ -0,0 +1,367 @@
+"""
+Hub labeling distance oracle.
+Single responsibility: Build, store and query hub labels derived from a contraction order.
+"""
+
+import heapq
+import math
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from shared.utils.array_store import save_arrays, load_arrays
+from core.compact_graph import CompactGraph
+
+# Bump when the stored arrays change so stale indexes are rebuilt
+FORMAT_VERSION = 1
+
+_ARRAY_NAMES = ("offsets", "hubs", "dists", "order")
+
+# Witness searches give up after settling this many nodes; a missed witness
+# only adds a redundant shortcut, never a wrong distance
+WITNESS_SETTLE_LIMIT = 500
+
+
+def _witness_distances(adjacency: List[Dict[int, float]], source: int, excluded: int,
+                       targets: Dict[int, float], limit: float) -> Dict[int, float]:
+    """Bounded Dijkstra from source avoiding one node, for shortcut witness checks."""
+    distances: Dict[int, float] = {}
+    tentative = {source: 0.0}
+    open_list = [(0.0, source)]
+    remaining = len(targets)
+
+    while open_list and len(distances) < WITNESS_SETTLE_LIMIT:
+        distance, node = heapq.heappop(open_list)
+        if node in distances:
+            continue
+        if distance > limit:
+            break
+        distances[node] = distance
+        if node in targets:
+            remaining -= 1
+            if not remaining:
+                break
+        for neighbor, weight in adjacency[node].items():
+            candidate = distance + weight
+            if neighbor != excluded and candidate < tentative.get(neighbor, math.inf):
+                tentative[neighbor] = candidate
+                heapq.heappush(open_list, (candidate, neighbor))
+
+    return distances
+
+
+def _required_shortcuts(adjacency: List[Dict[int, float]], node: int) -> List[Tuple[int, int, float]]:
+    """Shortcuts (u, w, weight) needed to contract node without changing any distance."""
+    neighbors = list(adjacency[node].items())
+    shortcuts = []
+    for i, (u, weight_u) in enumerate(neighbors[:-1]):
+        targets = {w: weight_u + weight_w for w, weight_w in neighbors[i + 1:]}
+        witnesses = _witness_distances(adjacency, u, node, targets, max(targets.values()))
+        for w, via in targets.items():
+            if witnesses.get(w, math.inf) > via:
+                shortcuts.append((u, w, via))
+    return shortcuts
+
+
+def contract(compact: CompactGraph, weights: Optional[Sequence[float]] = None
+             ) -> Tuple[List[int], List[List[Tuple[int, float]]]]:
+    """
+    Compute a contraction order and the upward graph it induces.
+
+    Nodes are contracted greedily by edge difference (shortcuts added minus
+    edges removed) plus the number of already contracted neighbors, with
+    lazy priority updates. Contracting a node adds shortcuts between its
+    remaining neighbors where no witness path is found.
+
+    Args:
+        compact: Compact graph
+        weights: Per-arc weights (defaults to arc lengths)
+
+    Returns:
+        (order, upward): dense ids in contraction order (least important
+        first), and per node its (higher-ranked neighbor, weight) edges
+        including shortcuts
+    """
+    if weights is None:
+        weights = compact.arc_lengths()
+    neighbor_lists = compact.neighbor_lists()
+    arc_offsets = compact.arc_offsets()
+    num_nodes = compact.num_nodes
+
+    adjacency: List[Dict[int, float]] = []
+    for node in range(num_nodes):
+        edges: Dict[int, float] = {}
+        offset = arc_offsets[node]
+        for position, neighbor in enumerate(neighbor_lists[node]):
+            weight = weights[offset + position]
+            if weight < edges.get(neighbor, math.inf):
+                edges[neighbor] = weight
+        adjacency.append(edges)
+
+    contracted_neighbors = [0] * num_nodes
+    depth = [0] * num_nodes
+
+    def simulate(node: int) -> Tuple[int, List[Tuple[int, int, float]]]:
+        shortcuts = _required_shortcuts(adjacency, node)
+        # Edge difference keeps the graph sparse; the other terms spread
+        # contractions evenly so the hierarchy stays shallow
+        score = len(shortcuts) - len(adjacency[node]) + contracted_neighbors[node] + depth[node]
+        return score, shortcuts
+
+    queue = [(simulate(node)[0], node) for node in range(num_nodes)]
+    heapq.heapify(queue)
+    # A node's score only changes when one of its neighbors is contracted
+    stale = [False] * num_nodes
+    order: List[int] = []
+    upward: List[List[Tuple[int, float]]] = [[] for _ in range(num_nodes)]
+
+    while queue:
+        score, node = heapq.heappop(queue)
+        if stale[node]:
+            # Lazy update: re-queue if the node became more expensive than the next candidate
+            stale[node] = False
+            score, shortcuts = simulate(node)
+            if queue and score > queue[0][0]:
+                heapq.heappush(queue, (score, node))
+                continue
+        else:
+            shortcuts = _required_shortcuts(adjacency, node)
+
+        for u, w, weight in shortcuts:
+            if weight < adjacency[u].get(w, math.inf):
+                adjacency[u][w] = weight
+                adjacency[w][u] = weight
+
+        upward[node] = list(adjacency[node].items())
+        for neighbor in adjacency[node]:
+            del adjacency[neighbor][node]
+            contracted_neighbors[neighbor] += 1
+            stale[neighbor] = True
+            depth[neighbor] = max(depth[neighbor], depth[node] + 1)
+        adjacency[node] = {}
+        order.append(node)
+
+    return order, upward
+
+
+class HubLabelIndex:
+    """
+    Distance oracle answering shortest-path distances by merging two labels.
+
+    Every node stores (hub, distance) pairs for the nodes above it in the
+    contraction hierarchy. The highest-ranked node on any shortest path is
+    a hub of both endpoints, so the distance is the minimum of
+    d(s, h) + d(h, t) over their common hubs. Labels are kept in CSR form:
+    hubs (ranks, ascending) and float32 distances of node i are
+    offsets[i]:offsets[i+1].
+    """
+
+    def __init__(self, compact: CompactGraph, offsets: np.ndarray, hubs: np.ndarray,
+                 dists: np.ndarray, order: np.ndarray, weights_name: str = "length",
+                 weights: Optional[Sequence[float]] = None):
+        """
+        Initialize from label arrays.
+
+        Args:
+            compact: Compact graph the labels were built for
+            offsets: CSR offsets into hubs/dists, one row per dense node
+            hubs: Hub ranks of each label, ascending within a row
+            dists: Distance to each hub
+            order: Dense id of each rank (contraction order)
+            weights_name: Name of the weights the labels were built from
+            weights: Per-arc weights for path retrieval (defaults to arc lengths)
+        """
+        self.compact = compact
+        self.offsets = offsets
+        self.hubs = hubs
+        self.dists = dists
+        self.order = order
+        self.weights_name = weights_name
+        self.weights = weights
+        self._offset_list: Optional[List[int]] = None
+
+    @classmethod
+    def build(cls, compact: CompactGraph, weights: Optional[Sequence[float]] = None,
+              weights_name: str = "length") -> "HubLabelIndex":
+        """
+        Build labels from a contraction of the graph.
+
+        Labels are filled from the most important node down: a node's label
+        is its own rank plus the labels of its upward neighbors shifted by
+        the edge weight. Entries whose distance is beaten by a path through
+        another common hub are pruned, since they can never be a minimum.
+
+        Args:
+            compact: Compact graph
+            weights: Per-arc weights (defaults to arc lengths)
+            weights_name: Name recorded with the labels
+
+        Returns:
+            Hub label index
+        """
+        order, upward = contract(compact, weights)
+        rank = [0] * compact.num_nodes
+        for position, node in enumerate(order):
+            rank[node] = position
+
+        labels: List[Dict[int, float]] = [{} for _ in range(compact.num_nodes)]
+        for node in reversed(order):
+            label = {rank[node]: 0.0}
+            for neighbor, weight in upward[node]:
+                for hub, distance in labels[neighbor].items():
+                    candidate = weight + distance
+                    if candidate < label.get(hub, math.inf):
+                        label[hub] = candidate
+
+            for hub, distance in list(label.items()):
+                if hub == rank[node]:
+                    continue
+                for other, other_distance in labels[order[hub]].items():
+                    if other != hub and other in label and label[other] + other_distance < distance:
+                        del label[hub]
+                        break
+            labels[node] = label
+
+        sizes = np.fromiter((len(label) for label in labels), dtype=np.int64, count=len(labels))
+        offsets = np.zeros(len(labels) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+        hubs = np.empty(offsets[-1], dtype=np.int32)
+        dists = np.empty(offsets[-1], dtype=np.float32)
+        for node, label in enumerate(labels):
+            row = sorted(label.items())
+            start = offsets[node]
+            hubs[start:start + len(row)] = [hub for hub, _ in row]
+            dists[start:start + len(row)] = [distance for _, distance in row]
+
+        return cls(compact, offsets, hubs, dists, np.array(order, dtype=np.int32), weights_name, weights)
+
+    def save(self, directory: Path) -> None:
+        """Save the label arrays to a cache directory."""
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "graph_version": self.compact.version,
+            "weights": self.weights_name,
+        }
+        save_arrays(directory, meta, **{name: getattr(self, name) for name in _ARRAY_NAMES})
+
+    @classmethod
+    def load(cls, directory: Path, compact: CompactGraph, weights_name: str = "length",
+             weights: Optional[Sequence[float]] = None, mmap: bool = True) -> Optional["HubLabelIndex"]:
+        """
+        Load labels saved with save(), memory-mapped by default.
+
+        Args:
+            directory: Cache directory
+            compact: Compact graph the labels must match
+            weights_name: Expected weights name
+            weights: Per-arc weights for path retrieval
+            mmap: Memory-map the arrays read-only
+
+        Returns:
+            Hub label index, or None if the cache is missing or stale
+        """
+        loaded = load_arrays(directory, _ARRAY_NAMES, mmap=mmap)
+        if loaded is None:
+            return None
+
+        meta, arrays = loaded
+        if (meta.get("format_version") != FORMAT_VERSION
+                or meta.get("graph_version") != compact.version
+                or meta.get("weights") != weights_name
+                or len(arrays["offsets"]) != compact.num_nodes + 1):
+            return None
+
+        return cls(compact, weights_name=weights_name, weights=weights, **arrays)
+
+    @property
+    def num_entries(self) -> int:
+        """Total number of label entries."""
+        return len(self.hubs)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the label arrays in bytes."""
+        return sum(getattr(self, name).nbytes for name in _ARRAY_NAMES)
+
+    def distance(self, source: int, target: int) -> float:
+        """
+        Shortest-path distance between two original node ids.
+
+        Returns:
+            Distance, or inf if target is unreachable
+
+        Raises:
+            KeyError: If either node is not in the graph
+        """
+        compact = self.compact
+        return self.distance_index(compact.index_of(source), compact.index_of(target))
+
+    def distance_index(self, source: int, target: int) -> float:
+        """Shortest-path distance between two dense node ids (label merge)."""
+        if source == target:
+            return 0.0
+
+        offsets = self._offsets()
+        source_hubs = self.hubs[offsets[source]:offsets[source + 1]]
+        target_start, target_end = offsets[target], offsets[target + 1]
+        target_hubs = self.hubs[target_start:target_end]
+
+        positions = np.searchsorted(target_hubs, source_hubs)
+        np.minimum(positions, len(target_hubs) - 1, out=positions)
+        common = target_hubs[positions] == source_hubs
+        if not common.any():
+            return math.inf
+
+        source_dists = self.dists[offsets[source]:offsets[source + 1]]
+        target_dists = self.dists[target_start:target_end]
+        return float((source_dists[common] + target_dists[positions[common]]).min())
+
+    def path(self, source: int, target: int) -> Optional[List[int]]:
+        """
+        Retrieve a shortest path on demand.
+
+        Walks from source, each time moving to the neighbor that minimizes
+        edge weight plus remaining label distance, so only the labels are
+        needed and no paths are stored.
+
+        Args:
+            source: Original source node id
+            target: Original target node id
+
+        Returns:
+            Original node ids from source to target, or None if unreachable
+        """
+        compact = self.compact
+        current, goal = compact.index_of(source), compact.index_of(target)
+        if math.isinf(self.distance_index(current, goal)):
+            return None
+
+        weights = self.weights if self.weights is not None else compact.arc_lengths()
+        neighbor_lists = compact.neighbor_lists()
+        arc_offsets = compact.arc_offsets()
+        path = [current]
+        on_path = {current}
+
+        while current != goal:
+            offset = arc_offsets[current]
+            best, best_cost = -1, math.inf
+            for position, neighbor in enumerate(neighbor_lists[current]):
+                if neighbor in on_path:
+                    continue
+                cost = weights[offset + position] + self.distance_index(neighbor, goal)
+                if cost < best_cost:
+                    best, best_cost = neighbor, cost
+            if best < 0:
+                return None
+            path.append(best)
+            on_path.add(best)
+            current = best
+
+        return compact.to_node_ids(path)
+
+    def _offsets(self) -> List[int]:
+        """Label offsets as a Python list (cheaper to index than a mapped array)."""
+        if self._offset_list is None:
+            self._offset_list = self.offsets.tolist()
+        return self._offset_list
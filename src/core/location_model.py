@@ -3,18 +3,40 @@ Location model for handling location lookup and geocoding.
 Single responsibility: Location data management and node lookup.
 """
 
+import numpy as np
 import osmnx as ox
 from typing import Union, Tuple, Optional
 
-from config.settings import LOCATIONS
+from config.settings import ALLOW_NETWORK_GEOCODING, LOCATIONS, SNAP_CHUNK_SIZE
+from core.spatial_index import SpatialGridIndex, EdgeSpatialIndex, EdgeSnap
+from core.reverse_geocode_index import ReverseGeocodeIndex, PLACE_LABEL
 
 
 class LocationModel:
     """Manages location data and provides node lookup functionality."""
     
-    def __init__(self, graph):
-        """Initialize with the road network graph."""
+    def __init__(self, graph, spatial_index: Optional[SpatialGridIndex] = None,
+                 edge_index: Optional[EdgeSpatialIndex] = None, geocoder=None,
+                 reverse_index: Optional[ReverseGeocodeIndex] = None):
+        """
+        Initialize with the road network graph.
+        
+        Args:
+            graph: Road network graph
+            spatial_index: Grid index over the graph's nodes; without it
+                every lookup falls back to OSMnx's nearest_nodes
+            edge_index: Grid index over the graph's edges, needed for
+                get_nearest_edge
+            geocoder: Offline geocoder with geocode(name) -> (lat, lon) or
+                None, consulted for names missing from LOCATIONS
+            reverse_index: Precomputed node and street labels, used by
+                get_node_name and reverse_geocode
+        """
         self.graph = graph
+        self.spatial_index = spatial_index
+        self.edge_index = edge_index
+        self.geocoder = geocoder
+        self.reverse_index = reverse_index
         self.locations = LOCATIONS
     
     def get_nearest_node(self, location: Union[str, Tuple[float, float]]) -> int:
@@ -34,9 +56,96 @@ class LocationModel:
             point = self._resolve_location_name(location)
         else:
             point = location
-            
+        
+        if self.spatial_index is not None:
+            node = self.spatial_index.nearest_node(point[0], point[1])
+            if node is not None:
+                return node
         return ox.distance.nearest_nodes(self.graph, point[1], point[0])
     
+    def get_nearest_edge(self, location: Union[str, Tuple[float, float]]) -> EdgeSnap:
+        """
+        Project a location onto its nearest edge.
+        
+        Args:
+            location: Location name (str) or coordinates (lat, lon)
+            
+        Returns:
+            Edge snap with the edge's end nodes and the projected point
+            
+        Raises:
+            ValueError: If location cannot be found or no edge index is available
+        """
+        if isinstance(location, str):
+            point = self._resolve_location_name(location)
+        else:
+            point = location
+        
+        snap = self.edge_index.nearest(point[0], point[1]) if self.edge_index is not None else None
+        if snap is None:
+            raise ValueError(f"No edge found near {location}")
+        return snap
+    
+    def reverse_geocode(self, lat: float, lon: float) -> Optional[str]:
+        """
+        Name the place or street at a coordinate.
+        
+        A named place labelling the nearest node wins; otherwise the
+        street of the nearest edge, then the nearest node's street label.
+        
+        Args:
+            lat: Latitude
+            lon: Longitude
+            
+        Returns:
+            Place or street name, or None if nothing nearby is named
+        """
+        if self.reverse_index is None or self.spatial_index is None:
+            return None
+        
+        index = self.reverse_index
+        nearest = self.spatial_index.nearest(lat, lon)
+        node = nearest[0] if nearest is not None else None
+        if node is not None and index.node_kind[node] == PLACE_LABEL:
+            return index.label(node)
+        
+        if self.edge_index is not None:
+            snap = self.edge_index.nearest(lat, lon)
+            street = index.street(snap.arc) if snap is not None else None
+            if street is not None:
+                return street
+        
+        return index.label(node) if node is not None else None
+    
+    def snap_many(self, lats, lons, chunk_size: int = SNAP_CHUNK_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Snap many coordinates to their nearest nodes in one call.
+        
+        Args:
+            lats: Latitudes (NumPy array or sequence)
+            lons: Longitudes (NumPy array or sequence), aligned with lats
+            chunk_size: Points per vectorized chunk, bounding peak memory
+            
+        Returns:
+            Tuple of (node ids as int64, snap distances in meters); -1 and
+            inf for rows whose coordinate is NaN or infinite
+            
+        Raises:
+            ValueError: If lats and lons differ in length
+        """
+        lats = np.asarray(lats, dtype=np.float64).ravel()
+        lons = np.asarray(lons, dtype=np.float64).ravel()
+        if len(lats) != len(lons):
+            raise ValueError("lats and lons must have the same length")
+        
+        if self.spatial_index is None:
+            nodes, distances = ox.distance.nearest_nodes(self.graph, lons, lats, return_dist=True)
+            return np.asarray(nodes, dtype=np.int64), np.asarray(distances, dtype=np.float64)
+        
+        nearest, distances = self.spatial_index.nearest_many(lats, lons, chunk_size)
+        node_ids = self.spatial_index.compact.node_ids
+        return np.where(nearest >= 0, node_ids[np.maximum(nearest, 0)], -1), distances
+    
     def _resolve_location_name(self, location_name: str) -> Tuple[float, float]:
         """
         Resolve location name to coordinates.
@@ -63,7 +172,15 @@ class LocationModel:
             if normalized_input in stored_name.lower() or stored_name.lower() in normalized_input:
                 return coordinates
         
-        # Try to geocode the location name
+        # Look the name up in the local place index
+        if self.geocoder is not None:
+            coordinates = self.geocoder.geocode(location_name)
+            if coordinates is not None:
+                return coordinates
+        
+        # Nominatim blocks for seconds and needs a connection, so it is opt-in
+        if not ALLOW_NETWORK_GEOCODING:
+            raise ValueError(f"Location '{location_name}' not found")
         try:
             return ox.geocode(f"{location_name}, Addis Ababa, Ethiopia")
         except Exception:
@@ -73,19 +190,31 @@ class LocationModel:
         """
         Get human-readable name for a node.
         
+        Names are tried in a fixed order, first hit wins:
+        
+        1. The reverse index label: the named place snapped to the node,
+           else its most important street (only with a reverse_index)
+        2. The node's own OSM tags: its name, else its amenity
+        3. A generic "Highway Node <id>" or "Node <id>"
+        
         Args:
             node_id: ID of the node
             
         Returns:
             Human-readable node name
         """
-        node_data = self.graph.nodes[node_id]
+        if self.reverse_index is not None:
+            label = self.reverse_index.node_label_of(node_id)
+            if label is not None:
+                return label
         
+        node_data = self.graph.nodes[node_id]
         if 'name' in node_data:
             return node_data['name']
-        elif 'amenity' in node_data:
+        if 'amenity' in node_data:
             return f"{node_data['amenity']} (ID: {node_id})"
-        elif 'highway' in node_data:
+        
+        if 'highway' in node_data:
             return f"Highway Node {node_id}"
         return f"Node {node_id}"
     
@@ -11,9 +11,38 @@ from .graph_interface import GraphInterface
 class NetworkXGraphAdapter(GraphInterface):
     """Adapter for NetworkX graphs to implement GraphInterface."""
     
-    def __init__(self, networkx_graph):
-        """Initialize with a NetworkX graph."""
+    def __init__(self, networkx_graph, compact_graph=None, arc_weights=None,
+                 weight_profile: Optional[str] = None, weight_unit: str = "meters"):
+        """
+        Initialize with a NetworkX graph.
+        
+        Args:
+            networkx_graph: NetworkX graph
+            compact_graph: Optional compact array view of the same graph
+            arc_weights: Optional per-arc weight list aligned with compact_graph
+            weight_profile: Name of the profile arc_weights come from
+            weight_unit: Unit of arc_weights ("meters" or "seconds")
+        """
         self.graph = networkx_graph
+        self.compact_graph = compact_graph
+        self.arc_weights = arc_weights
+        self.weight_profile = weight_profile
+        self.weight_unit = weight_unit
+    
+    def with_weights(self, weight_profile: str, arc_weights,
+                     weight_unit: str = "meters") -> 'NetworkXGraphAdapter':
+        """
+        Get a view of the same graph that routes by another weight profile.
+        
+        Args:
+            weight_profile: Profile name
+            arc_weights: Per-arc weight list aligned with the compact graph
+            weight_unit: Unit of arc_weights ("meters" or "seconds")
+            
+        Returns:
+            Adapter sharing this adapter's graphs
+        """
+        return NetworkXGraphAdapter(self.graph, self.compact_graph, arc_weights, weight_profile, weight_unit)
     
     def get_neighbors(self, node: int) -> List[int]:
         """Get neighbors of a node."""
@@ -39,6 +68,30 @@ class NetworkXGraphAdapter(GraphInterface):
         except:
             return None
     
+    def get_compact_graph(self):
+        """Get the compact array view of the graph, if one was provided."""
+        return self.compact_graph
+    
+    def get_arc_weights(self):
+        """Get the per-arc weights of the applied profile, if any."""
+        return self.arc_weights
+    
+    def get_weight_unit(self) -> str:
+        """Get the unit of the applied profile's weights."""
+        return self.weight_unit
+    
+    def get_edge_weight(self, u: int, v: int) -> float:
+        """Get the edge cost from the applied weight profile, or the edge length."""
+        if self.arc_weights is not None:
+            compact = self.compact_graph
+            try:
+                arc = compact.arc_between(compact.index_of(u), compact.index_of(v))
+            except KeyError:
+                arc = -1
+            if arc >= 0:
+                return self.arc_weights[arc]
+        return super().get_edge_weight(u, v)
+    
     def get_subgraph(self, nodes: List[int]) -> 'NetworkXGraphAdapter':
         """Get subgraph with specified nodes."""
         subgraph = self.graph.subgraph(nodes)
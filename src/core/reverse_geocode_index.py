@@ -0,0 +1,195 @@
+"""
+Reverse geocoding of graph nodes and edges.
+Single responsibility: Precompute, store and query a readable label per node and a street name per arc.
+"""
+
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from shared.utils.array_store import decode_strings, encode_strings, load_arrays, save_arrays
+from core.compact_graph import CompactGraph, first_tag_value
+from core.spatial_index import SpatialGridIndex
+
+# Bump when the stored arrays change so stale indexes are rebuilt
+FORMAT_VERSION = 1
+
+# Label kinds per node
+NO_LABEL = 0
+PLACE_LABEL = 1
+STREET_LABEL = 2
+
+_ARRAY_NAMES = ("label_offsets", "label_bytes", "node_label", "node_kind", "arc_street")
+
+
+class ReverseGeocodeIndex:
+    """
+    Readable name of every node and street name of every arc.
+
+    A node is labelled with the named place snapped to it, if one lies
+    within a radius, otherwise with the name of its most important named
+    street (lowest highway class code, then alphabetical). Labels live in
+    one string table; per node the index stores a label id and kind, per
+    arc a street name id, so every lookup is an array read.
+    """
+
+    def __init__(self, compact: CompactGraph, labels: List[str], node_label: np.ndarray,
+                 node_kind: np.ndarray, arc_street: np.ndarray, places_fingerprint: str = ""):
+        """
+        Initialize from label arrays.
+
+        Args:
+            compact: Compact graph the labels were built for
+            labels: String table of place and street names
+            node_label: Label id per dense node (-1 if unlabelled)
+            node_kind: NO_LABEL, PLACE_LABEL or STREET_LABEL per dense node
+            arc_street: Street name id per arc (-1 for unnamed edges)
+            places_fingerprint: Fingerprint of the places the labels were built from
+        """
+        self.compact = compact
+        self.labels = labels
+        self.node_label = node_label
+        self.node_kind = node_kind
+        self.arc_street = arc_street
+        self.places_fingerprint = places_fingerprint
+
+    @classmethod
+    def build(cls, compact: CompactGraph, graph, spatial_index: SpatialGridIndex,
+              place_names: Sequence[str] = (), place_lats: Sequence[float] = (),
+              place_lons: Sequence[float] = (), place_radius: float = 60.0,
+              places_fingerprint: str = "") -> "ReverseGeocodeIndex":
+        """
+        Label every node from named places and edge names.
+
+        Args:
+            compact: Compact graph
+            graph: NetworkX graph the compact graph was built from (edge 'name')
+            spatial_index: Grid index for snapping places to nodes
+            place_names: Names of places (e.g. from the place index)
+            place_lats: Latitudes aligned with place_names (NaN if unknown)
+            place_lons: Longitudes aligned with place_names (NaN if unknown)
+            place_radius: Maximum distance in meters between a place and its node
+            places_fingerprint: Fingerprint of the places, recorded with the index
+
+        Returns:
+            Reverse geocoding index
+        """
+        labels: List[str] = []
+        label_ids = {}
+
+        def label_id(name: str) -> int:
+            if name not in label_ids:
+                label_ids[name] = len(labels)
+                labels.append(name)
+            return label_ids[name]
+
+        # Street name of every arc, in CSR order
+        node_ids = compact.node_id_list()
+        arc_offsets = compact.arc_offsets()
+        is_multigraph = graph.is_multigraph()
+        arc_street = np.full(compact.num_arcs, -1, dtype=np.int32)
+        for tail, neighbors in enumerate(compact.neighbor_lists()):
+            adjacency = graph.adj[node_ids[tail]]
+            offset = arc_offsets[tail]
+            for position, head in enumerate(neighbors):
+                edge_data = adjacency[node_ids[head]]
+                if is_multigraph:
+                    # Same choice as the compact graph: the shortest parallel edge
+                    edge_data = min(edge_data.values(), key=lambda d: float(d.get('length', 1.0)))
+                name = first_tag_value(edge_data.get('name'))
+                if name:
+                    arc_street[offset + position] = label_id(name)
+
+        # Most important named street per node: min over (highway code, name)
+        node_label = np.full(compact.num_nodes, -1, dtype=np.int32)
+        node_kind = np.zeros(compact.num_nodes, dtype=np.uint8)
+        named = np.flatnonzero(arc_street >= 0)
+        if len(named):
+            # Alphabetical rank of every street name breaks highway class ties
+            by_rank = np.array(sorted(range(len(labels)), key=labels.__getitem__), dtype=np.int64)
+            rank = np.empty_like(by_rank)
+            rank[by_rank] = np.arange(len(by_rank))
+            keys = (compact.highway[named].astype(np.int64) << 32) | rank[arc_street[named]]
+            unset = np.iinfo(np.int64).max
+            best = np.full(compact.num_nodes, unset, dtype=np.int64)
+            np.minimum.at(best, compact.arc_tails()[named], keys)
+            has_street = best != unset
+            node_label[has_street] = by_rank[best[has_street] & 0xFFFFFFFF]
+            node_kind[has_street] = STREET_LABEL
+
+        # Named places override streets at the node they snap to; closest place wins
+        lats = np.asarray(place_lats, dtype=np.float64)
+        lons = np.asarray(place_lons, dtype=np.float64)
+        located = np.flatnonzero(np.isfinite(lats) & np.isfinite(lons))
+        if len(located):
+            nearest, distances = spatial_index.nearest_many(lats[located], lons[located])
+            close = np.flatnonzero((nearest >= 0) & (distances <= place_radius))
+            for position in close[np.argsort(-distances[close], kind="stable")].tolist():
+                node = int(nearest[position])
+                node_label[node] = label_id(str(place_names[located[position]]))
+                node_kind[node] = PLACE_LABEL
+
+        return cls(compact, labels, node_label, node_kind, arc_street, places_fingerprint)
+
+    def save(self, directory: Path) -> None:
+        """Save the label arrays to a cache directory."""
+        offsets, blob = encode_strings(self.labels)
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "graph_version": self.compact.version,
+            "places_fingerprint": self.places_fingerprint,
+        }
+        save_arrays(directory, meta, label_offsets=offsets, label_bytes=blob,
+                    node_label=self.node_label, node_kind=self.node_kind, arc_street=self.arc_street)
+
+    @classmethod
+    def load(cls, directory: Path, compact: CompactGraph,
+             places_fingerprint: str = "") -> Optional["ReverseGeocodeIndex"]:
+        """
+        Load labels saved with save().
+
+        Args:
+            directory: Cache directory
+            compact: Compact graph the labels must match
+            places_fingerprint: Fingerprint of the current places
+
+        Returns:
+            Reverse geocoding index, or None if the cache is missing or stale
+        """
+        loaded = load_arrays(directory, _ARRAY_NAMES, mmap=True)
+        if loaded is None:
+            return None
+
+        meta, arrays = loaded
+        if (meta.get("format_version") != FORMAT_VERSION
+                or meta.get("graph_version") != compact.version
+                or meta.get("places_fingerprint") != places_fingerprint
+                or len(arrays["node_label"]) != compact.num_nodes
+                or len(arrays["arc_street"]) != compact.num_arcs):
+            return None
+
+        labels = decode_strings(arrays["label_offsets"], arrays["label_bytes"])
+        return cls(compact, labels, arrays["node_label"], arrays["node_kind"], arrays["arc_street"],
+                   places_fingerprint)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the per-node and per-arc arrays in bytes."""
+        return self.node_label.nbytes + self.node_kind.nbytes + self.arc_street.nbytes
+
+    def label(self, node_index: int) -> Optional[str]:
+        """Label of a dense node, or None if it has none."""
+        label_id = int(self.node_label[node_index])
+        return self.labels[label_id] if label_id >= 0 else None
+
+    def node_label_of(self, node_id: int) -> Optional[str]:
+        """Label of an original node id, or None if it has none or is unknown."""
+        if not self.compact.has_node(node_id):
+            return None
+        return self.label(self.compact.index_of(node_id))
+
+    def street(self, arc: int) -> Optional[str]:
+        """Street name of an arc, or None for unnamed edges."""
+        street_id = int(self.arc_street[arc])
+        return self.labels[street_id] if street_id >= 0 else None
@@ -0,0 +1,116 @@
+"""
+Route summaries: a path as a short list of street segments.
+Single responsibility: Run-length compress the edges of node paths by street name and highway class.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.compact_graph import CompactGraph, HIGHWAY_CLASSES, OTHER_HIGHWAY_CODE
+from core.reverse_geocode_index import ReverseGeocodeIndex
+
+
+@dataclass(frozen=True)
+class RouteSegment:
+    """
+    Consecutive edges of a path on the same street and highway class.
+
+    Attributes:
+        name: Street name, or None for unnamed edges
+        highway: Highway class (see HIGHWAY_CLASSES)
+        distance: Length of the segment in meters
+        start: Position in the path of the segment's first node
+        end: Position in the path of the segment's last node
+    """
+    name: Optional[str]
+    highway: str
+    distance: float
+    start: int
+    end: int
+
+    @property
+    def label(self) -> str:
+        """Street name, or a description of the road for unnamed edges."""
+        return self.name if self.name is not None else f"Unnamed {self.highway} road"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Segment as a plain dictionary, for result payloads."""
+        return {
+            "name": self.label,
+            "highway": self.highway,
+            "distance": self.distance,
+            "start": self.start,
+            "end": self.end,
+        }
+
+
+class RouteSummaryBuilder:
+    """
+    Builds route summaries from the compact graph's arc arrays.
+
+    All arcs of a path are found with one vectorized lookup; street names
+    come from the reverse geocoding index and highway classes from the
+    compact graph, so only one string per segment is ever produced.
+    """
+
+    def __init__(self, compact: CompactGraph, reverse_index: Optional[ReverseGeocodeIndex] = None):
+        """
+        Initialize the builder.
+
+        Args:
+            compact: Compact graph the paths run on
+            reverse_index: Street name per arc; without it every edge is unnamed
+        """
+        self.compact = compact
+        self.reverse_index = reverse_index
+
+    def summarize(self, path: Sequence[int]) -> List[RouteSegment]:
+        """
+        Compress a path into street segments.
+
+        Args:
+            path: Original node ids of the path
+
+        Returns:
+            Segments in path order (empty for paths with fewer than two
+            nodes or with nodes missing from the graph)
+        """
+        if len(path) < 2:
+            return []
+        try:
+            arcs = self.compact.arcs_along(self.compact.indices_of(path))
+        except KeyError:
+            return []
+
+        # Hops between non-adjacent nodes count as unnamed, zero-length edges
+        known = arcs >= 0
+        safe = np.maximum(arcs, 0)
+        lengths = np.where(known, self.compact.length[safe], 0.0)
+        highways = np.where(known, self.compact.highway[safe], OTHER_HIGHWAY_CODE)
+        if self.reverse_index is not None:
+            streets = np.where(known, self.reverse_index.arc_street[safe], -1)
+        else:
+            streets = np.full(len(arcs), -1)
+
+        # A segment starts wherever the street or the highway class changes
+        changes = np.flatnonzero((streets[1:] != streets[:-1]) | (highways[1:] != highways[:-1])) + 1
+        starts = np.concatenate(([0], changes))
+        ends = np.append(changes, len(arcs))
+        distances = np.add.reduceat(lengths, starts)
+
+        labels = self.reverse_index.labels if self.reverse_index is not None else []
+        return [
+            RouteSegment(
+                name=labels[street] if street >= 0 else None,
+                highway=HIGHWAY_CLASSES[highway],
+                distance=distance,
+                start=start,
+                end=end,
+            )
+            for street, highway, distance, start, end in zip(
+                streets[starts].tolist(), highways[starts].tolist(),
+                distances.tolist(), starts.tolist(), ends.tolist()
+            )
+        ]
@@ -0,0 +1,128 @@
+"""
+Reusable per-thread search state.
+Single responsibility: Preallocated, epoch-stamped label arrays indexed by dense node id.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+from shared.utils.priority_queues import PriorityQueue, create_priority_queue
+
+_thread_local = threading.local()
+
+
+class SearchWorkspace:
+    """
+    Label arrays shared by consecutive searches on one thread.
+
+    A label (cost, parent) is only valid when its stamp equals the current
+    epoch, so starting a new search is a single increment instead of
+    clearing or reallocating dictionaries sized to the explored region.
+    Searches read and write the lists directly in their inner loops.
+    """
+
+    def __init__(self, num_nodes: int):
+        """
+        Preallocate arrays for a graph.
+
+        Args:
+            num_nodes: Number of dense node ids
+        """
+        self.num_nodes = num_nodes
+        self.epoch = 0
+        self.in_use = False
+
+        # Node has a cost/parent label in this epoch when stamp[node] == epoch
+        self.stamp: List[int] = [0] * num_nodes
+        # Node was settled (closed) in this epoch when closed[node] == epoch
+        self.closed: List[int] = [0] * num_nodes
+        self.cost: List[float] = [0.0] * num_nodes
+        self.parent: List[int] = [-1] * num_nodes
+
+        # Nodes labelled in this epoch, in labelling order: touched[:touched_count]
+        self.touched: List[int] = [0] * num_nodes
+        self.touched_count = 0
+
+        self._queues: Dict[str, PriorityQueue] = {}
+
+    def begin(self) -> int:
+        """
+        Start a new search, invalidating every label in O(1).
+
+        Returns:
+            The new epoch
+        """
+        self.epoch += 1
+        self.touched_count = 0
+        return self.epoch
+
+    def priority_queue(self, kind: str) -> PriorityQueue:
+        """
+        Get this workspace's empty priority queue of a kind, creating it once.
+
+        Args:
+            kind: Queue name (see shared.utils.priority_queues.PRIORITY_QUEUES)
+
+        Returns:
+            Empty priority queue sized to the graph
+        """
+        queue = self._queues.get(kind)
+        if queue is None:
+            queue = create_priority_queue(kind, self.num_nodes)
+            self._queues[kind] = queue
+        else:
+            queue.clear()
+        return queue
+
+    def visited(self) -> List[int]:
+        """Dense ids labelled in the current epoch."""
+        return self.touched[:self.touched_count]
+
+    def path_to(self, node: int) -> List[int]:
+        """
+        Follow parent labels back from a node.
+
+        Args:
+            node: Dense id labelled in the current epoch
+
+        Returns:
+            Dense ids from the search root to node
+        """
+        parent = self.parent
+        path = []
+        while node >= 0:
+            path.append(node)
+            node = parent[node]
+        path.reverse()
+        return path
+
+
+@contextmanager
+def borrow_workspace(num_nodes: int) -> Iterator[SearchWorkspace]:
+    """
+    Borrow the calling thread's workspace for one search.
+
+    The workspace is created on first use and kept for the thread's
+    lifetime. If it is already borrowed (a suspended generator, or a
+    nested search) a temporary workspace is handed out instead.
+
+    Args:
+        num_nodes: Number of dense node ids of the graph to search
+
+    Yields:
+        Workspace with a fresh epoch
+    """
+    workspace = getattr(_thread_local, "workspace", None)
+    if workspace is None or (workspace.num_nodes != num_nodes and not workspace.in_use):
+        workspace = SearchWorkspace(num_nodes)
+        _thread_local.workspace = workspace
+    elif workspace.in_use or workspace.num_nodes != num_nodes:
+        workspace = SearchWorkspace(num_nodes)
+
+    workspace.in_use = True
+    try:
+        workspace.begin()
+        yield workspace
+    finally:
+        workspace.in_use = False
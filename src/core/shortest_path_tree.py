@@ -0,0 +1,102 @@
+"""
+Single-source shortest path trees stored as arrays.
+Single responsibility: Hold one origin's distances and predecessors and read routes from them.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from core.compact_graph import CompactGraph
+
+
+class ShortestPathTree:
+    """
+    Distances and tree parents from one origin to every reachable node.
+
+    Twelve bytes per node (float64 distance, int32 parent), so a tree of
+    the whole city fits in a few megabytes, and any route from the origin
+    is read by following parents: O(path length), no search.
+    """
+
+    def __init__(self, compact: CompactGraph, origin: int, distance: np.ndarray, parent: np.ndarray):
+        """
+        Initialize from tree arrays.
+
+        Args:
+            compact: Compact graph the tree was grown on
+            origin: Original node id of the origin
+            distance: Cost from the origin per dense node (inf if unreachable)
+            parent: Dense parent per dense node (-1 for the origin and unreachable nodes)
+        """
+        self.compact = compact
+        self.origin = origin
+        self.distance = distance
+        self.parent = parent
+        self.version = compact.version
+
+    @classmethod
+    def build(cls, compact: CompactGraph, origin: int,
+              weights: Optional[Sequence[float]] = None) -> "ShortestPathTree":
+        """
+        Grow the full tree with one Dijkstra search.
+
+        Args:
+            compact: Compact graph
+            origin: Original node id of the origin
+            weights: Per-arc weights (defaults to arc lengths)
+
+        Returns:
+            Shortest path tree
+
+        Raises:
+            KeyError: If the origin is not in the graph
+        """
+        from algorithms.dijkstra import shortest_path_tree
+
+        distances, parents, _ = shortest_path_tree(compact, {compact.index_of(origin): 0.0}, weights)
+
+        distance = np.full(compact.num_nodes, np.inf, dtype=np.float64)
+        parent = np.full(compact.num_nodes, -1, dtype=np.int32)
+        settled = np.fromiter(distances.keys(), dtype=np.int64, count=len(distances))
+        distance[settled] = np.fromiter(distances.values(), dtype=np.float64, count=len(distances))
+        parent[settled] = np.fromiter(
+            (-1 if tree_parent is None else tree_parent for tree_parent in parents.values()),
+            dtype=np.int32, count=len(parents)
+        )
+        return cls(compact, origin, distance, parent)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the tree arrays in bytes."""
+        return self.distance.nbytes + self.parent.nbytes
+
+    def distance_to(self, node_id: int) -> float:
+        """Cost from the origin to a node (inf if unreachable)."""
+        return float(self.distance[self.compact.index_of(node_id)])
+
+    def distances_to(self, node_ids: Sequence[int]) -> np.ndarray:
+        """Costs from the origin to many nodes, e.g. one distance-matrix row."""
+        return self.distance[self.compact.indices_of(node_ids)]
+
+    def path_to(self, node_id: int) -> Optional[List[int]]:
+        """
+        Shortest path from the origin to a node.
+
+        Args:
+            node_id: Original node id
+
+        Returns:
+            Original node ids from the origin to node_id, or None if unreachable
+        """
+        index = self.compact.index_of(node_id)
+        if not np.isfinite(self.distance[index]):
+            return None
+
+        parent = self.parent
+        path = [index]
+        while parent[index] >= 0:
+            index = int(parent[index])
+            path.append(index)
+        path.reverse()
+        return self.compact.to_node_ids(path)
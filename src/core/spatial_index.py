@@ -0,0 +1,574 @@
+"""
+Uniform grid spatial indexes over node coordinates and edge segments.
+Single responsibility: Build, store and query bucket grids for nearest-node and nearest-edge snapping.
+"""
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from shared.utils.array_store import save_arrays, load_arrays
+from shared.utils.geo import utm_project, utm_project_point
+from core.compact_graph import CompactGraph
+
+# Bump when the stored arrays change so stale indexes are rebuilt
+FORMAT_VERSION = 1
+
+_ARRAY_NAMES = ("cell_offsets", "cell_nodes")
+_EDGE_ARRAY_NAMES = ("cell_offsets", "cell_arcs")
+
+# Batch queries gather candidates from each point's 3 x 3 block of cells
+_BLOCK = np.array([(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)], dtype=np.int64)
+
+
+def _grid_extent(compact: CompactGraph, cell_size: float) -> Tuple[Tuple[float, float], int, int]:
+    """Origin, columns and rows of a grid covering every node with coordinates."""
+    valid = np.isfinite(compact.x) & np.isfinite(compact.y)
+    if not valid.any():
+        return (0.0, 0.0), 1, 1
+    origin = (float(compact.x[valid].min()), float(compact.y[valid].min()))
+    columns = int((compact.x[valid].max() - origin[0]) // cell_size) + 1
+    rows = int((compact.y[valid].max() - origin[1]) // cell_size) + 1
+    return origin, columns, rows
+
+
+def _first_ring(row: int, column: int, rows: int, columns: int) -> int:
+    """First ring around a cell that reaches the grid (closer rings hold no cells)."""
+    return max(0, -column, column - columns + 1, -row, row - rows + 1)
+
+
+def _ring_cells(row: int, column: int, ring: int, rows: int, columns: int) -> List[range]:
+    """Cell numbers on the square ring at Chebyshev distance ring, clipped to the grid."""
+    first_row, last_row = row - ring, row + ring
+    first_column, last_column = column - ring, column + ring
+    cells = []
+    low, high = max(first_column, 0), min(last_column, columns - 1)
+    for ring_row in {first_row, last_row}:
+        if 0 <= ring_row < rows and low <= high:
+            cells.append(range(ring_row * columns + low, ring_row * columns + high + 1))
+    low, high = max(first_row + 1, 0), min(last_row - 1, rows - 1)
+    for ring_column in {first_column, last_column}:
+        if 0 <= ring_column < columns and low <= high:
+            cells.append(range(low * columns + ring_column, high * columns + ring_column + 1, columns))
+    return cells
+
+
+class _CellGrid:
+    """Geometry shared by the grid indexes: square cells numbered row by row from the south-west."""
+
+    origin: Tuple[float, float]
+    cell_size: float
+    columns: int
+    rows: int
+
+    @staticmethod
+    def _project(lat: float, lon: float) -> Tuple[float, float]:
+        """UTM position of a coordinate; NaN for a NaN or infinite coordinate, which matches nothing."""
+        if not (math.isfinite(lat) and math.isfinite(lon)):
+            return math.nan, math.nan
+        return utm_project_point(lat, lon)
+
+    def _cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """(row, column) of the cell containing a projected point (may lie off the grid)."""
+        return (math.floor((y - self.origin[1]) / self.cell_size),
+                math.floor((x - self.origin[0]) / self.cell_size))
+
+    def _unscanned_margin(self, x: float, y: float, row: int, column: int, ring: int) -> Optional[float]:
+        """
+        Distance from a point to the nearest grid cell outside the rings scanned so far.
+
+        Returns:
+            Margin in meters, or None once the scanned square covers the grid
+        """
+        origin_x, origin_y = self.origin
+        size = self.cell_size
+        first_row, last_row = row - ring, row + ring
+        first_column, last_column = column - ring, column + ring
+        margin = math.inf
+        if first_column > 0:
+            margin = x - (origin_x + first_column * size)
+        if last_column < self.columns - 1:
+            margin = min(margin, origin_x + (last_column + 1) * size - x)
+        if first_row > 0:
+            margin = min(margin, y - (origin_y + first_row * size))
+        if last_row < self.rows - 1:
+            margin = min(margin, origin_y + (last_row + 1) * size - y)
+        return None if margin == math.inf else margin
+
+
+class SpatialGridIndex(_CellGrid):
+    """
+    Nodes bucketed into square cells of the projected (UTM) plane.
+
+    Cells are stored in CSR form: the dense ids of cell c are
+    cell_nodes[cell_offsets[c]:cell_offsets[c + 1]], with cells numbered
+    row by row from the south-west corner. A query scans rings of cells
+    around the point's cell and stops once the best distance found is
+    shorter than the distance to any cell not yet scanned, so it touches
+    a handful of nodes in a city-sized grid.
+    """
+
+    def __init__(self, compact: CompactGraph, cell_offsets: np.ndarray, cell_nodes: np.ndarray,
+                 origin: Tuple[float, float], cell_size: float, columns: int, rows: int):
+        """
+        Initialize from grid arrays.
+
+        Args:
+            compact: Compact graph whose node coordinates are indexed
+            cell_offsets: CSR offsets into cell_nodes, one row per cell
+            cell_nodes: Dense node ids grouped by cell
+            origin: (x, y) of the grid's south-west corner in UTM meters
+            cell_size: Cell edge length in meters
+            columns: Number of cells west to east
+            rows: Number of cells south to north
+        """
+        self.compact = compact
+        self.cell_offsets = cell_offsets
+        self.cell_nodes = cell_nodes
+        self.origin = origin
+        self.cell_size = cell_size
+        self.columns = columns
+        self.rows = rows
+
+        # Python copies for fast scalar access in the ring scan
+        self._offsets: List[int] = cell_offsets.tolist()
+        self._nodes: List[int] = cell_nodes.tolist()
+        self._xs, self._ys = compact.xy_lists()
+
+    @classmethod
+    def build(cls, compact: CompactGraph, cell_size: float = 150.0) -> "SpatialGridIndex":
+        """
+        Bucket every node with coordinates into grid cells.
+
+        Args:
+            compact: Compact graph
+            cell_size: Cell edge length in meters
+
+        Returns:
+            Spatial grid index
+        """
+        valid = np.flatnonzero(np.isfinite(compact.x) & np.isfinite(compact.y))
+        origin, columns, rows = _grid_extent(compact, cell_size)
+
+        column = ((compact.x[valid] - origin[0]) // cell_size).astype(np.int64)
+        row = ((compact.y[valid] - origin[1]) // cell_size).astype(np.int64)
+        cells = row * columns + column
+
+        order = np.argsort(cells, kind="stable")
+        cell_nodes = valid[order].astype(np.int32)
+        cell_offsets = np.zeros(columns * rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells, minlength=columns * rows), out=cell_offsets[1:])
+
+        return cls(compact, cell_offsets, cell_nodes, origin, cell_size, columns, rows)
+
+    def save(self, directory: Path) -> None:
+        """Save the grid arrays to a cache directory."""
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "graph_version": self.compact.version,
+            "origin": list(self.origin),
+            "cell_size": self.cell_size,
+            "columns": self.columns,
+            "rows": self.rows,
+        }
+        save_arrays(directory, meta, **{name: getattr(self, name) for name in _ARRAY_NAMES})
+
+    @classmethod
+    def load(cls, directory: Path, compact: CompactGraph,
+             cell_size: float = 150.0) -> Optional["SpatialGridIndex"]:
+        """
+        Load a grid saved with save().
+
+        Args:
+            directory: Cache directory
+            compact: Compact graph the grid must match
+            cell_size: Expected cell edge length in meters
+
+        Returns:
+            Spatial grid index, or None if the cache is missing or stale
+        """
+        loaded = load_arrays(directory, _ARRAY_NAMES)
+        if loaded is None:
+            return None
+
+        meta, arrays = loaded
+        if (meta.get("format_version") != FORMAT_VERSION
+                or meta.get("graph_version") != compact.version
+                or meta.get("cell_size") != cell_size
+                or len(arrays["cell_offsets"]) != meta.get("columns", 0) * meta.get("rows", 0) + 1):
+            return None
+
+        return cls(compact, arrays["cell_offsets"], arrays["cell_nodes"], tuple(meta["origin"]),
+                   cell_size, meta["columns"], meta["rows"])
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the grid arrays in bytes."""
+        return sum(getattr(self, name).nbytes for name in _ARRAY_NAMES)
+
+    def nearest_node(self, lat: float, lon: float) -> Optional[int]:
+        """Original id of the node nearest to a coordinate, or None if it is not finite or no node has coordinates."""
+        x, y = self._project(lat, lon)
+        nearest = self.nearest_xy(x, y)
+        return None if nearest is None else self.compact.node_id_list()[nearest[0]]
+
+    def nearest(self, lat: float, lon: float) -> Optional[Tuple[int, float]]:
+        """
+        Node nearest to a coordinate.
+
+        Args:
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+
+        Returns:
+            (dense node id, distance in meters), or None if the coordinate is
+            not finite or no node has coordinates
+        """
+        x, y = self._project(lat, lon)
+        return self.nearest_xy(x, y)
+
+    def nearest_xy(self, x: float, y: float) -> Optional[Tuple[int, float]]:
+        """Node nearest to a projected point, as (dense node id, distance in meters); None if it is not finite."""
+        if not (math.isfinite(x) and math.isfinite(y)):
+            return None
+        offsets, nodes, xs, ys = self._offsets, self._nodes, self._xs, self._ys
+        columns, rows = self.columns, self.rows
+        row, column = self._cell_of(x, y)
+
+        best, best_d2 = -1, math.inf
+        ring = _first_ring(row, column, rows, columns)
+        while True:
+            for cell_range in _ring_cells(row, column, ring, rows, columns):
+                for cell in cell_range:
+                    for position in range(offsets[cell], offsets[cell + 1]):
+                        node = nodes[position]
+                        dx, dy = xs[node] - x, ys[node] - y
+                        d2 = dx * dx + dy * dy
+                        if d2 < best_d2:
+                            best, best_d2 = node, d2
+
+            margin = self._unscanned_margin(x, y, row, column, ring)
+            if margin is None or (best >= 0 and best_d2 <= margin * margin):
+                break
+            ring += 1
+
+        if best < 0:
+            return None
+        return best, math.sqrt(best_d2)
+
+    def nearest_many(self, lats, lons, chunk_size: int = 50000) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized nearest-node lookup for many coordinates.
+
+        Points are processed in chunks of chunk_size so the candidate arrays
+        stay bounded. Each point is matched against the nodes in its 3 x 3
+        block of cells, which is exact whenever the match is closer than
+        the block's edge; the few points where it is not (sparse areas,
+        points off the grid) fall back to the ring scan.
+
+        Args:
+            lats: Latitudes in degrees (array-like)
+            lons: Longitudes in degrees (array-like)
+            chunk_size: Points per vectorized chunk
+
+        Returns:
+            Tuple of (dense node ids, distances in meters); -1 and inf
+            where a coordinate is NaN or infinite, or no node has coordinates
+        """
+        lats = np.asarray(lats, dtype=np.float64).ravel()
+        lons = np.asarray(lons, dtype=np.float64).ravel()
+        nearest = np.full(len(lats), -1, dtype=np.int64)
+        distances = np.full(len(lats), np.inf)
+        # Bad rows are skipped rather than failing the whole batch
+        usable = np.flatnonzero(np.isfinite(lats) & np.isfinite(lons))
+
+        for start in range(0, len(usable), chunk_size):
+            rows = usable[start:start + chunk_size]
+            x, y = utm_project(lats[rows], lons[rows])
+            nearest[rows], distances[rows] = self._nearest_chunk(x, y)
+
+        return nearest, distances
+
+    def _nearest_chunk(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Block-candidate matching for one chunk of projected points."""
+        count = len(x)
+        size = self.cell_size
+        origin_x, origin_y = self.origin
+        column = np.floor((x - origin_x) / size).astype(np.int64)
+        row = np.floor((y - origin_y) / size).astype(np.int64)
+
+        block_rows = row[:, None] + _BLOCK[:, 0]
+        block_columns = column[:, None] + _BLOCK[:, 1]
+        inside = ((block_rows >= 0) & (block_rows < self.rows)
+                  & (block_columns >= 0) & (block_columns < self.columns))
+        cells = np.where(inside, block_rows * self.columns + block_columns, 0)
+        starts = self.cell_offsets[cells]
+        sizes = np.where(inside, self.cell_offsets[cells + 1] - starts, 0).ravel()
+
+        # Flatten every (point, candidate node) pair of the chunk
+        total = int(sizes.sum())
+        owner = np.repeat(np.arange(count * 9) // 9, sizes)
+        first = np.cumsum(sizes) - sizes
+        positions = np.repeat(starts.ravel() - first, sizes) + np.arange(total)
+        candidates = self.cell_nodes[positions].astype(np.int64)
+        d2 = (self.compact.x[candidates] - x[owner]) ** 2 + (self.compact.y[candidates] - y[owner]) ** 2
+
+        # Pairs are grouped by point, so per-point minima are segment reductions
+        nearest = np.full(count, -1, dtype=np.int64)
+        best_d2 = np.full(count, np.inf)
+        point_sizes = sizes.reshape(count, 9).sum(axis=1)
+        found = point_sizes > 0
+        if total:
+            best_d2[found] = np.minimum.reduceat(d2, (np.cumsum(point_sizes) - point_sizes)[found])
+            hits = np.flatnonzero(d2 == best_d2[owner])
+            hits = hits[np.r_[True, owner[hits][1:] != owner[hits][:-1]]]
+            nearest[owner[hits]] = candidates[hits]
+
+        # The block covers at least the margin from the point to its edge
+        margin = np.minimum.reduce([
+            x - (origin_x + (column - 1) * size), origin_x + (column + 2) * size - x,
+            y - (origin_y + (row - 1) * size), origin_y + (row + 2) * size - y,
+        ])
+        distances = np.sqrt(best_d2)
+        for point in np.flatnonzero((nearest < 0) | (distances > margin)).tolist():
+            match = self.nearest_xy(float(x[point]), float(y[point]))
+            if match is not None:
+                nearest[point], distances[point] = match
+
+        return nearest, distances
+
+
+@dataclass(frozen=True)
+class EdgeSnap:
+    """
+    A point projected onto its nearest edge.
+
+    Edges are taken as the straight chord between their end nodes (the
+    compact graph keeps no curve geometry), and fraction is the position
+    of the projection along the chord from tail to head.
+    """
+    arc: int
+    tail: int
+    head: int
+    fraction: float
+    distance: float
+    x: float
+    y: float
+
+    def endpoint_costs(self, weights: Sequence[float]) -> Dict[int, float]:
+        """
+        Partial-edge costs between the snapped point and the edge's end nodes.
+
+        Both directions of an edge carry the same length and highway class,
+        so the arc's weight prices the way to the tail and to the head. As
+        search sources these are the initial costs; as targets they are the
+        offsets added on arrival.
+
+        Args:
+            weights: Per-arc weights
+
+        Returns:
+            Dense end node -> cost
+        """
+        weight = weights[self.arc]
+        return {self.tail: self.fraction * weight, self.head: (1.0 - self.fraction) * weight}
+
+    def direct_cost(self, other: "EdgeSnap", weights: Sequence[float]) -> float:
+        """Cost of driving along the edge to another snap on the same arc (inf otherwise)."""
+        if self.arc != other.arc:
+            return math.inf
+        return abs(self.fraction - other.fraction) * weights[self.arc]
+
+
+class EdgeSpatialIndex(_CellGrid):
+    """
+    Edge segments bucketed into the cells their bounding boxes overlap.
+
+    Each undirected edge is stored once, as its arc from the lower to the
+    higher dense id. The closest point of a segment lies inside its
+    bounding box, so the ring scan of SpatialGridIndex stays exact: once
+    the best distance is below the margin to the unscanned cells, no other
+    segment can be closer.
+    """
+
+    def __init__(self, compact: CompactGraph, cell_offsets: np.ndarray, cell_arcs: np.ndarray,
+                 origin: Tuple[float, float], cell_size: float, columns: int, rows: int):
+        """
+        Initialize from grid arrays.
+
+        Args:
+            compact: Compact graph whose edges are indexed
+            cell_offsets: CSR offsets into cell_arcs, one row per cell
+            cell_arcs: Arc ids grouped by cell
+            origin: (x, y) of the grid's south-west corner in UTM meters
+            cell_size: Cell edge length in meters
+            columns: Number of cells west to east
+            rows: Number of cells south to north
+        """
+        self.compact = compact
+        self.cell_offsets = cell_offsets
+        self.cell_arcs = cell_arcs
+        self.origin = origin
+        self.cell_size = cell_size
+        self.columns = columns
+        self.rows = rows
+
+        self._offsets: List[int] = cell_offsets.tolist()
+        self._arcs: List[int] = cell_arcs.tolist()
+        self._tails: List[int] = compact.arc_tails().tolist()
+        self._heads: List[int] = compact.indices.tolist()
+        self._xs, self._ys = compact.xy_lists()
+
+    @classmethod
+    def build(cls, compact: CompactGraph, cell_size: float = 150.0) -> "EdgeSpatialIndex":
+        """
+        Bucket every edge with located end nodes into the cells of its bounding box.
+
+        Args:
+            compact: Compact graph
+            cell_size: Cell edge length in meters
+
+        Returns:
+            Edge spatial index
+        """
+        origin, columns, rows = _grid_extent(compact, cell_size)
+        tails, heads = compact.arc_tails(), compact.indices
+        located = np.isfinite(compact.x) & np.isfinite(compact.y)
+        arcs = np.flatnonzero((tails < heads) & located[tails] & located[heads])
+        tails, heads = tails[arcs], heads[arcs]
+
+        def cell_range(low: np.ndarray, high: np.ndarray, start: float, limit: int):
+            first = np.clip((low - start) // cell_size, 0, limit - 1).astype(np.int64)
+            last = np.clip((high - start) // cell_size, 0, limit - 1).astype(np.int64)
+            return first, last
+
+        first_column, last_column = cell_range(np.minimum(compact.x[tails], compact.x[heads]),
+                                               np.maximum(compact.x[tails], compact.x[heads]),
+                                               origin[0], columns)
+        first_row, last_row = cell_range(np.minimum(compact.y[tails], compact.y[heads]),
+                                         np.maximum(compact.y[tails], compact.y[heads]),
+                                         origin[1], rows)
+
+        # One (arc, cell) pair per cell of each bounding box
+        widths = last_column - first_column + 1
+        counts = widths * (last_row - first_row + 1)
+        owner = np.repeat(np.arange(len(arcs)), counts)
+        local = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        cells = ((first_row[owner] + local // widths[owner]) * columns
+                 + first_column[owner] + local % widths[owner])
+
+        order = np.argsort(cells, kind="stable")
+        cell_arcs = arcs[owner[order]].astype(np.int64)
+        cell_offsets = np.zeros(columns * rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells, minlength=columns * rows), out=cell_offsets[1:])
+
+        return cls(compact, cell_offsets, cell_arcs, origin, cell_size, columns, rows)
+
+    def save(self, directory: Path) -> None:
+        """Save the grid arrays to a cache directory."""
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "graph_version": self.compact.version,
+            "origin": list(self.origin),
+            "cell_size": self.cell_size,
+            "columns": self.columns,
+            "rows": self.rows,
+        }
+        save_arrays(directory, meta, **{name: getattr(self, name) for name in _EDGE_ARRAY_NAMES})
+
+    @classmethod
+    def load(cls, directory: Path, compact: CompactGraph,
+             cell_size: float = 150.0) -> Optional["EdgeSpatialIndex"]:
+        """
+        Load a grid saved with save().
+
+        Args:
+            directory: Cache directory
+            compact: Compact graph the grid must match
+            cell_size: Expected cell edge length in meters
+
+        Returns:
+            Edge spatial index, or None if the cache is missing or stale
+        """
+        loaded = load_arrays(directory, _EDGE_ARRAY_NAMES)
+        if loaded is None:
+            return None
+
+        meta, arrays = loaded
+        if (meta.get("format_version") != FORMAT_VERSION
+                or meta.get("graph_version") != compact.version
+                or meta.get("cell_size") != cell_size
+                or len(arrays["cell_offsets"]) != meta.get("columns", 0) * meta.get("rows", 0) + 1):
+            return None
+
+        return cls(compact, arrays["cell_offsets"], arrays["cell_arcs"], tuple(meta["origin"]),
+                   cell_size, meta["columns"], meta["rows"])
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the grid arrays in bytes."""
+        return sum(getattr(self, name).nbytes for name in _EDGE_ARRAY_NAMES)
+
+    def nearest(self, lat: float, lon: float) -> Optional[EdgeSnap]:
+        """
+        Edge nearest to a coordinate, with the point projected onto it.
+
+        Args:
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+
+        Returns:
+            Edge snap, or None if the coordinate is not finite or the graph
+            has no located edges
+        """
+        x, y = self._project(lat, lon)
+        return self.nearest_xy(x, y)
+
+    def nearest_xy(self, x: float, y: float) -> Optional[EdgeSnap]:
+        """Edge nearest to a projected point (None if it is not finite)."""
+        if not (math.isfinite(x) and math.isfinite(y)):
+            return None
+        offsets, arcs, tails, heads = self._offsets, self._arcs, self._tails, self._heads
+        xs, ys = self._xs, self._ys
+        columns, rows = self.columns, self.rows
+        row, column = self._cell_of(x, y)
+
+        best, best_d2, best_fraction = -1, math.inf, 0.0
+        ring = _first_ring(row, column, rows, columns)
+        while True:
+            for cell_range in _ring_cells(row, column, ring, rows, columns):
+                for cell in cell_range:
+                    for position in range(offsets[cell], offsets[cell + 1]):
+                        arc = arcs[position]
+                        tail_x, tail_y = xs[tails[arc]], ys[tails[arc]]
+                        dx, dy = xs[heads[arc]] - tail_x, ys[heads[arc]] - tail_y
+                        squared_length = dx * dx + dy * dy
+                        fraction = 0.0
+                        if squared_length > 0:
+                            fraction = ((x - tail_x) * dx + (y - tail_y) * dy) / squared_length
+                            fraction = 0.0 if fraction < 0.0 else 1.0 if fraction > 1.0 else fraction
+                        px, py = tail_x + fraction * dx - x, tail_y + fraction * dy - y
+                        d2 = px * px + py * py
+                        if d2 < best_d2:
+                            best, best_d2, best_fraction = arc, d2, fraction
+
+            margin = self._unscanned_margin(x, y, row, column, ring)
+            if margin is None or (best >= 0 and best_d2 <= margin * margin):
+                break
+            ring += 1
+
+        if best < 0:
+            return None
+        tail, head = tails[best], heads[best]
+        return EdgeSnap(
+            arc=best,
+            tail=tail,
+            head=head,
+            fraction=best_fraction,
+            distance=math.sqrt(best_d2),
+            x=xs[tail] + best_fraction * (xs[head] - xs[tail]),
+            y=ys[tail] + best_fraction * (ys[head] - ys[tail]),
+        )
@@ -0,0 +1,236 @@
+"""
+Time-dependent travel time profiles for the road network.
+Single responsibility: Per-edge piecewise-linear travel times by highway class and hour.
+"""
+
+import hashlib
+import json
+import math
+from datetime import datetime, time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from core.compact_graph import CompactGraph, HIGHWAY_CLASSES
+from shared.utils.array_store import save_arrays, load_arrays
+
+SECONDS_PER_HOUR = 3600.0
+SECONDS_PER_DAY = 24 * SECONDS_PER_HOUR
+
+
+def seconds_after_midnight(value: Union[float, int, datetime, time]) -> float:
+    """
+    Normalize a departure time to seconds after midnight.
+
+    Args:
+        value: Seconds after midnight, a datetime or a time of day
+
+    Returns:
+        Seconds after midnight
+    """
+    if isinstance(value, datetime):
+        value = value.time()
+    if isinstance(value, time):
+        return value.hour * SECONDS_PER_HOUR + value.minute * 60.0 + value.second + value.microsecond / 1e6
+    return float(value)
+
+
+class SpeedProfileTable:
+    """
+    Hourly travel-time profiles keyed by highway class.
+
+    Every class stores its pace (seconds per meter) at the 24 hourly
+    breakpoints plus a wrap-around copy of midnight, and pace is linearly
+    interpolated in between. An arc's travel time is its length times the
+    pace of its class, so the per-arc cost is just the length and class
+    code already held by the compact graph; the table itself is a tiny
+    float32 matrix of shape (classes, 25).
+    """
+
+    def __init__(self, compact: CompactGraph, pace: np.ndarray, fingerprint: str = ""):
+        """
+        Initialize with a pace matrix.
+
+        Args:
+            compact: Compact graph the profiles apply to
+            pace: float32 array of shape (len(HIGHWAY_CLASSES), 25), seconds per meter
+            fingerprint: Hash of the speed settings the table was built from
+        """
+        self.compact = compact
+        self.pace = pace
+        self.fingerprint = fingerprint
+
+        # Python copies for fast scalar access inside search loops
+        self._pace_rows: List[List[float]] = pace.astype(np.float64).tolist()
+        self._arc_lengths: List[float] = compact.arc_lengths()
+        self._arc_classes: List[int] = compact.highway.tolist()
+        self._min_pace = float(pace.min())
+
+        # Arcs up to this length are FIFO without waiting: a profile can only
+        # let a later departure overtake an earlier one when its travel time
+        # drops faster than the clock advances
+        self._fifo_safe_length: List[float] = []
+        for row in self._pace_rows:
+            steepest_drop = max(row[k] - row[k + 1] for k in range(24)) / SECONDS_PER_HOUR
+            self._fifo_safe_length.append(1.0 / steepest_drop if steepest_drop > 0 else math.inf)
+
+    @classmethod
+    def from_speeds(cls, compact: CompactGraph, free_flow_kmh: Dict[str, float],
+                    hourly_factors: Dict[str, Sequence[float]],
+                    arterial_classes: Sequence[str]) -> "SpeedProfileTable":
+        """
+        Build the table from free-flow speeds and hourly speed factors.
+
+        Args:
+            compact: Compact graph the profiles apply to
+            free_flow_kmh: Free-flow speed per highway class
+            hourly_factors: 24 speed factors for "arterial" and "local" roads
+            arterial_classes: Highway classes that follow the arterial factors
+
+        Returns:
+            Speed profile table
+        """
+        pace = np.empty((len(HIGHWAY_CLASSES), 25), dtype=np.float32)
+        for code, highway in enumerate(HIGHWAY_CLASSES):
+            speed_m_per_s = free_flow_kmh.get(highway, free_flow_kmh["other"]) * 1000.0 / 3600.0
+            factors = hourly_factors["arterial" if highway in arterial_classes else "local"]
+            for hour in range(25):
+                pace[code, hour] = 1.0 / (speed_m_per_s * factors[hour % 24])
+
+        fingerprint = cls.settings_fingerprint(free_flow_kmh, hourly_factors, arterial_classes)
+        return cls(compact, pace, fingerprint)
+
+    @staticmethod
+    def settings_fingerprint(free_flow_kmh: Dict[str, float],
+                             hourly_factors: Dict[str, Sequence[float]],
+                             arterial_classes: Sequence[str]) -> str:
+        """Hash of the speed settings, used to detect stale cached tables."""
+        payload = json.dumps(
+            [free_flow_kmh, {k: list(v) for k, v in hourly_factors.items()}, list(arterial_classes)],
+            sort_keys=True
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    def save(self, directory: Path) -> None:
+        """Save the pace matrix next to the compact graph arrays."""
+        meta = {"graph_version": self.compact.version, "fingerprint": self.fingerprint}
+        save_arrays(directory, meta, pace=self.pace)
+
+    @classmethod
+    def load(cls, directory: Path, compact: CompactGraph,
+             fingerprint: Optional[str] = None) -> Optional["SpeedProfileTable"]:
+        """
+        Load a table saved with save().
+
+        Args:
+            directory: Cache directory
+            compact: Compact graph the profiles apply to
+            fingerprint: Expected settings fingerprint (None accepts any)
+
+        Returns:
+            Speed profile table, or None if the cache is missing or stale
+        """
+        loaded = load_arrays(directory, ("pace",))
+        if loaded is None:
+            return None
+
+        meta, arrays = loaded
+        if meta.get("graph_version") != compact.version:
+            return None
+        if fingerprint is not None and meta.get("fingerprint") != fingerprint:
+            return None
+        if arrays["pace"].shape != (len(HIGHWAY_CLASSES), 25):
+            return None
+
+        return cls(compact, arrays["pace"], meta.get("fingerprint", ""))
+
+    @property
+    def max_speed_m_per_s(self) -> float:
+        """Fastest speed reached by any class at any hour."""
+        return 1.0 / self._min_pace
+
+    def travel_time(self, arc: int, departure_time: float) -> float:
+        """
+        Travel time of an arc when entering it at the given time.
+
+        Args:
+            arc: Arc id in the compact graph
+            departure_time: Seconds after midnight (values beyond a day wrap)
+
+        Returns:
+            Travel time in seconds
+        """
+        return self._arc_lengths[arc] * self._pace_at(self._pace_rows[self._arc_classes[arc]], departure_time)
+
+    def arrival_time(self, arc: int, departure_time: float) -> float:
+        """
+        FIFO-consistent arrival time at the end of an arc.
+
+        Arrival is the lower envelope of departing now or waiting for a
+        later hourly breakpoint, which makes it non-decreasing in the departure
+        time even for very long arcs on steep profiles.
+
+        Args:
+            arc: Arc id in the compact graph
+            departure_time: Seconds after midnight
+
+        Returns:
+            Arrival time in seconds after midnight
+        """
+        length = self._arc_lengths[arc]
+        highway = self._arc_classes[arc]
+        row = self._pace_rows[highway]
+        arrival = departure_time + length * self._pace_at(row, departure_time)
+
+        if length > self._fifo_safe_length[highway]:
+            # Piecewise-linear, so the envelope minimum sits on an hourly breakpoint
+            next_hour = (math.floor(departure_time / SECONDS_PER_HOUR) + 1) * SECONDS_PER_HOUR
+            while next_hour < arrival:
+                arrival = min(arrival, next_hour + length * self._pace_at(row, next_hour))
+                next_hour += SECONDS_PER_HOUR
+
+        return arrival
+
+    def path_arrival_times(self, path_indices: Sequence[int], departure_time: float) -> List[float]:
+        """
+        Arrival time at every node of a path given in dense ids.
+
+        Args:
+            path_indices: Dense node ids of the path
+            departure_time: Departure time at the first node
+
+        Returns:
+            Arrival times, one per node (the first equals departure_time)
+        """
+        times = [departure_time]
+        for u, v in zip(path_indices, path_indices[1:]):
+            arc = self.compact.arc_between(u, v)
+            if arc < 0:
+                raise ValueError(f"No edge between dense nodes {u} and {v}")
+            times.append(self.arrival_time(arc, times[-1]))
+        return times
+
+    def path_travel_time(self, path: Sequence[int], departure_time: float) -> float:
+        """
+        Travel time of a path given in original node ids.
+
+        Args:
+            path: Original node ids of the path
+            departure_time: Departure time in seconds after midnight
+
+        Returns:
+            Travel time in seconds
+        """
+        if len(path) < 2:
+            return 0.0
+        path_indices = [self.compact.index_of(node) for node in path]
+        return self.path_arrival_times(path_indices, departure_time)[-1] - departure_time
+
+    @staticmethod
+    def _pace_at(row: List[float], time_s: float) -> float:
+        """Linearly interpolate a class pace at a time of day."""
+        hour = (time_s % SECONDS_PER_DAY) / SECONDS_PER_HOUR
+        k = int(hour)
+        return row[k] + (row[k + 1] - row[k]) * (hour - k)
+
@@ -0,0 +1,105 @@
+"""
+OSM turn restriction loading.
+Single responsibility: Parsing turn restriction relations into a simple form.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Restriction values defined by the OSM "restriction" relation
+PROHIBITORY_RESTRICTIONS = ("no_left_turn", "no_right_turn", "no_straight_on", "no_u_turn", "no_entry", "no_exit")
+MANDATORY_RESTRICTIONS = ("only_left_turn", "only_right_turn", "only_straight_on", "only_u_turn")
+
+
+@dataclass(frozen=True)
+class TurnRestriction:
+    """A single from-way / via-node / to-way turn restriction."""
+
+    restriction: str
+    from_way: int
+    via_node: int
+    to_way: int
+
+    @property
+    def is_mandatory(self) -> bool:
+        """True for "only_*" restrictions, which ban every other turn."""
+        return self.restriction.startswith("only_")
+
+
+def load_turn_restrictions(path: Path) -> List[TurnRestriction]:
+    """
+    Load turn restrictions from a JSON file.
+
+    Two layouts are accepted: a plain list of objects with "restriction",
+    "from_way", "via_node" and "to_way", or an Overpass API response whose
+    "elements" contain type=restriction relations.
+
+    Args:
+        path: JSON file (a missing file means no restrictions)
+
+    Returns:
+        List of restrictions with a node as the via member
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+
+    if isinstance(data, dict):
+        return _parse_overpass_relations(data.get("elements", []))
+
+    restrictions = []
+    for entry in data:
+        restriction = _parse_restriction_value(entry.get("restriction"))
+        if restriction is None:
+            continue
+        try:
+            restrictions.append(TurnRestriction(
+                restriction,
+                int(entry["from_way"]),
+                int(entry["via_node"]),
+                int(entry["to_way"])
+            ))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return restrictions
+
+
+def _parse_overpass_relations(elements: List[Dict[str, Any]]) -> List[TurnRestriction]:
+    """Convert Overpass restriction relations to TurnRestriction objects."""
+    restrictions = []
+    for element in elements:
+        if element.get("type") != "relation":
+            continue
+        tags = element.get("tags", {})
+        restriction = _parse_restriction_value(tags.get("restriction"))
+        if restriction is None:
+            continue
+
+        roles = {}
+        for member in element.get("members", []):
+            roles.setdefault((member.get("role"), member.get("type")), member.get("ref"))
+
+        from_way = roles.get(("from", "way"))
+        via_node = roles.get(("via", "node"))
+        to_way = roles.get(("to", "way"))
+        # Via-way restrictions span several intersections and are not supported
+        if from_way is None or via_node is None or to_way is None:
+            continue
+
+        restrictions.append(TurnRestriction(restriction, int(from_way), int(via_node), int(to_way)))
+    return restrictions
+
+
+def _parse_restriction_value(value: Optional[str]) -> Optional[str]:
+    """Return the restriction value if it is one we understand."""
+    if value in PROHIBITORY_RESTRICTIONS or value in MANDATORY_RESTRICTIONS:
+        return value
+    return None
@@ -0,0 +1,120 @@
+"""
+Live vehicle positions on the road network.
+Single responsibility: Map vehicles to snapped nodes and nodes back to the vehicles on them.
+"""
+
+import threading
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from core.compact_graph import CompactGraph
+
+
+class VehicleIndex:
+    """
+    Two-way index between vehicles and the dense nodes they are snapped to.
+
+    A position update is two dictionary operations, so feeds can push
+    thousands of updates per second. Updates take a lock; searches read
+    one node at a time without it and get a consistent snapshot of the
+    vehicles on that node. A vehicle that moves during a search may be
+    seen at its old and its new node, so callers de-duplicate by id.
+    """
+
+    def __init__(self, compact: CompactGraph):
+        """
+        Initialize an empty index.
+
+        Args:
+            compact: Compact graph whose dense node ids the index uses
+        """
+        self.compact = compact
+        self._node_of: Dict[Hashable, int] = {}
+        self._at_node: Dict[int, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+
+    def update(self, vehicle_id: Hashable, node_id: int) -> None:
+        """
+        Place a vehicle on a node, moving it if it is already indexed.
+
+        Args:
+            vehicle_id: Vehicle identifier
+            node_id: Original node id the vehicle is snapped to
+
+        Raises:
+            KeyError: If the node is not in the graph
+        """
+        self.update_many([(vehicle_id, node_id)])
+
+    def update_many(self, positions: Iterable[Tuple[Hashable, int]]) -> None:
+        """
+        Apply a batch of (vehicle id, original node id) updates under one lock.
+
+        Raises:
+            KeyError: If a node is not in the graph
+        """
+        index_of = self.compact.index_of
+        dense = [(vehicle_id, index_of(node_id)) for vehicle_id, node_id in positions]
+        with self._lock:
+            for vehicle_id, node in dense:
+                self._move(vehicle_id, node)
+
+    def remove(self, vehicle_id: Hashable) -> bool:
+        """
+        Remove a vehicle (e.g. when it goes off duty).
+
+        Returns:
+            True if the vehicle was indexed
+        """
+        with self._lock:
+            node = self._node_of.pop(vehicle_id, None)
+            if node is None:
+                return False
+            self._detach(vehicle_id, node)
+            return True
+
+    def clear(self) -> None:
+        """Remove all vehicles."""
+        with self._lock:
+            self._node_of.clear()
+            self._at_node.clear()
+
+    def node_of(self, vehicle_id: Hashable) -> Optional[int]:
+        """Original node id of a vehicle, or None if it is not indexed."""
+        node = self._node_of.get(vehicle_id)
+        return None if node is None else self.compact.node_id_list()[node]
+
+    def vehicles_at(self, node: int) -> Tuple[Hashable, ...]:
+        """Vehicles on a dense node (empty if none)."""
+        vehicles = self._at_node.get(node)
+        return tuple(vehicles) if vehicles else ()
+
+    def vehicle_ids(self) -> List[Hashable]:
+        """All indexed vehicles."""
+        return list(self._node_of)
+
+    def __len__(self) -> int:
+        return len(self._node_of)
+
+    def __contains__(self, vehicle_id: Hashable) -> bool:
+        return vehicle_id in self._node_of
+
+    def _move(self, vehicle_id: Hashable, node: int) -> None:
+        """Re-home a vehicle; the caller holds the lock."""
+        previous = self._node_of.get(vehicle_id)
+        if previous == node:
+            return
+        if previous is not None:
+            self._detach(vehicle_id, previous)
+        self._node_of[vehicle_id] = node
+        vehicles = self._at_node.get(node)
+        if vehicles is None:
+            self._at_node[node] = {vehicle_id}
+        else:
+            vehicles.add(vehicle_id)
+
+    def _detach(self, vehicle_id: Hashable, node: int) -> None:
+        """Drop a vehicle from a node's set; the caller holds the lock."""
+        vehicles = self._at_node[node]
+        vehicles.discard(vehicle_id)
+        if not vehicles:
+            del self._at_node[node]
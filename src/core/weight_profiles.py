@@ -0,0 +1,193 @@
+"""
+Edge weight profiles for routing.
+Single responsibility: Per-arc cost arrays for distance, travel time and custom profiles.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from core.compact_graph import CompactGraph, HIGHWAY_CLASSES
+from shared.utils.array_store import save_arrays, load_arrays
+
+
+class WeightProfile:
+    """
+    A routing cost model expressed as a cost per meter for each highway class.
+
+    Subclasses can override compute() for costs that are not a per-class
+    rate; they should also override fingerprint so cached arrays are rebuilt
+    when the model changes.
+    """
+
+    def __init__(self, name: str, cost_per_meter: Dict[str, float],
+                 default_cost_per_meter: float = 1.0, description: str = "",
+                 unit: str = "meters"):
+        """
+        Initialize a profile.
+
+        Args:
+            name: Profile name used to select it per query
+            cost_per_meter: Cost per meter for each highway class
+                (float("inf") forbids the class)
+            default_cost_per_meter: Cost per meter for classes not listed
+            description: Human readable description
+            unit: Unit of the costs, "meters" or "seconds" (penalized profiles
+                keep the unit of the costs they scale)
+        """
+        self.name = name
+        self.cost_per_meter = dict(cost_per_meter)
+        self.default_cost_per_meter = default_cost_per_meter
+        self.description = description
+        self.unit = unit
+
+    @classmethod
+    def distance(cls) -> "WeightProfile":
+        """Shortest distance in meters."""
+        return cls("distance", {}, 1.0, "Shortest distance (meters)")
+
+    @classmethod
+    def travel_time(cls, free_flow_kmh: Dict[str, float]) -> "WeightProfile":
+        """Fastest free-flow travel time in seconds."""
+        return cls("travel_time", _seconds_per_meter(free_flow_kmh),
+                   _seconds_per_meter(free_flow_kmh)["other"],
+                   "Free-flow travel time (seconds)", unit="seconds")
+
+    @classmethod
+    def truck(cls, free_flow_kmh: Dict[str, float],
+              class_penalties: Dict[str, float]) -> "WeightProfile":
+        """
+        Free-flow travel time with penalty factors on streets trucks should avoid.
+
+        Args:
+            free_flow_kmh: Free-flow speed per highway class
+            class_penalties: Travel time multiplier per avoided highway class
+        """
+        pace = _seconds_per_meter(free_flow_kmh)
+        for highway, factor in class_penalties.items():
+            pace[highway] = pace.get(highway, pace["other"]) * factor
+        return cls("truck", pace, pace["other"], "Truck travel time avoiding residential streets",
+                   unit="seconds")
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the cost model and its unit, used to detect stale cached arrays."""
+        payload = json.dumps([self.name, self.unit, self._class_costs().tolist()])
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    def compute(self, compact: CompactGraph) -> np.ndarray:
+        """
+        Compute the cost of every arc of a compact graph.
+
+        Args:
+            compact: Compact graph
+
+        Returns:
+            Contiguous float64 array with one cost per arc
+        """
+        return np.ascontiguousarray(compact.length * self._class_costs()[compact.highway])
+
+    def _class_costs(self) -> np.ndarray:
+        """Cost per meter indexed by highway class code."""
+        return np.array([self.cost_per_meter.get(highway, self.default_cost_per_meter)
+                         for highway in HIGHWAY_CLASSES], dtype=np.float64)
+
+
+class WeightProfileRegistry:
+    """
+    Named weight profiles with their per-arc arrays.
+
+    Arrays are computed once per profile and kept in memory and on disk,
+    so selecting a profile for a query is a dictionary lookup.
+    """
+
+    def __init__(self, compact: CompactGraph, cache_dir: Optional[Path] = None):
+        """
+        Initialize an empty registry.
+
+        Args:
+            compact: Compact graph the arrays are computed for
+            cache_dir: Directory for cached arrays (None disables disk caching)
+        """
+        self.compact = compact
+        self.cache_dir = cache_dir
+        self._profiles: Dict[str, WeightProfile] = {}
+        self._weights: Dict[str, np.ndarray] = {}
+        self._weight_lists: Dict[str, List[float]] = {}
+
+    def register(self, profile: WeightProfile) -> None:
+        """Add or replace a profile."""
+        self._profiles[profile.name] = profile
+        self._weights.pop(profile.name, None)
+        self._weight_lists.pop(profile.name, None)
+
+    def get(self, name: str) -> WeightProfile:
+        """
+        Get a profile by name.
+
+        Raises:
+            KeyError: If no profile has that name
+        """
+        if name not in self._profiles:
+            raise KeyError(f"Unknown weight profile: {name}")
+        return self._profiles[name]
+
+    def names(self) -> List[str]:
+        """Names of the registered profiles."""
+        return list(self._profiles)
+
+    def weights(self, name: str) -> np.ndarray:
+        """
+        Get the per-arc weight array of a profile.
+
+        Raises:
+            KeyError: If no profile has that name
+        """
+        if name not in self._weights:
+            self._weights[name] = self._load_or_compute(self.get(name))
+        return self._weights[name]
+
+    def weight_list(self, name: str) -> List[float]:
+        """
+        Get the per-arc weights of a profile as a Python list.
+
+        Search loops index these one arc at a time, which is much faster on
+        a list than on a NumPy array. Built once per profile.
+
+        Raises:
+            KeyError: If no profile has that name
+        """
+        if name not in self._weight_lists:
+            self._weight_lists[name] = self.weights(name).tolist()
+        return self._weight_lists[name]
+
+    def _load_or_compute(self, profile: WeightProfile) -> np.ndarray:
+        """Load the profile's array from disk, or compute and save it."""
+        directory = self.cache_dir / profile.name if self.cache_dir else None
+
+        if directory is not None:
+            loaded = load_arrays(directory, ("weights",))
+            if loaded is not None:
+                meta, arrays = loaded
+                if (meta.get("graph_version") == self.compact.version
+                        and meta.get("fingerprint") == profile.fingerprint
+                        and len(arrays["weights"]) == self.compact.num_arcs):
+                    return arrays["weights"]
+
+        weights = profile.compute(self.compact)
+        if directory is not None:
+            meta = {"graph_version": self.compact.version, "fingerprint": profile.fingerprint}
+            try:
+                save_arrays(directory, meta, weights=weights)
+            except OSError:
+                # Caching is an optimization, keep the in-memory array
+                pass
+        return weights
+
+
+def _seconds_per_meter(free_flow_kmh: Dict[str, float]) -> Dict[str, float]:
+    """Convert speeds in km/h to pace in seconds per meter."""
+    return {highway: 3.6 / speed for highway, speed in free_flow_kmh.items()}
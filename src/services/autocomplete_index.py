@@ -0,0 +1,173 @@
+"""
+Sorted-array autocomplete over place names.
+Single responsibility: Ranked prefix, word-prefix and substring completion of place names.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from shared.utils.text import normalize_name, word_starts
+
+# Sorts after every character a key can contain
+_KEY_END = chr(0x10FFFF)
+
+
+class AutocompleteIndex:
+    """
+    Completes typed prefixes to place names in sub-millisecond time.
+
+    Every word of every normalized name contributes one entry: the rest of
+    the name from that word on ("bole medhane alem" gives "bole medhane
+    alem", "medhane alem" and "alem"). Sorting the entries once turns any
+    prefix or word-prefix query into one contiguous range found by binary
+    search. Each entry carries a precomputed rank, so the top k of a range
+    are picked with a partial sort instead of scoring every name.
+
+    Ranking: names starting with the query before names with a later word
+    starting with it, then lower priority value, then shorter names, then
+    alphabetical order.
+
+    Substring matches (contains()) search one newline-joined string of all
+    keys with str.find, so the scan runs in C rather than per name.
+    """
+
+    def __init__(self, names: Sequence[str], priorities: Optional[Sequence[int]] = None):
+        """
+        Build the index.
+
+        Args:
+            names: Place names to complete to (duplicates are ignored)
+            priorities: Optional small non-negative integer per name; lower
+                values rank first among otherwise equal matches (e.g. 0 for
+                curated locations, 1 for OSM names)
+        """
+        self._names: List[str] = []
+        self._exact: Dict[str, int] = {}
+        name_keys = []
+        name_ranks = []
+        entry_keys = []
+        entry_names = []
+        entry_ranks = []
+        seen = set()
+
+        ordered = sorted(
+            (normalize_name(name), 0 if priorities is None else int(priorities[position]), name)
+            for position, name in enumerate(names)
+        )
+        for key, priority, name in ordered:
+            if not key or name in seen:
+                continue
+            seen.add(name)
+            name_id = len(self._names)
+            self._names.append(name)
+            self._exact.setdefault(key, name_id)
+            # Rank bits: word-prefix flag | priority | length | alphabetical position
+            base = (min(priority, 0x7F) << 48) | (min(len(key), 0xFFFF) << 32) | name_id
+            name_keys.append(key)
+            name_ranks.append(base)
+            for start in word_starts(key):
+                entry_keys.append(key[start:])
+                entry_names.append(name_id)
+                entry_ranks.append(base if start == 0 else base | (1 << 55))
+
+        order = sorted(range(len(entry_keys)), key=entry_keys.__getitem__)
+        self._keys: List[str] = [entry_keys[i] for i in order]
+        self._entry_names = np.array([entry_names[i] for i in order], dtype=np.int64)
+        self._entry_ranks = np.array([entry_ranks[i] for i in order], dtype=np.int64)
+
+        # Keys in name id order, one per line; _key_starts[i] is where name i begins
+        self._key_blob = "\n".join(name_keys)
+        self._key_starts: List[int] = []
+        offset = 0
+        for key in name_keys:
+            self._key_starts.append(offset)
+            offset += len(key) + 1
+        self._name_ranks = np.array(name_ranks, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def lookup(self, name: str) -> Optional[str]:
+        """
+        Indexed name equal to a query after normalization.
+
+        Args:
+            name: Name as typed
+
+        Returns:
+            The indexed spelling, or None if there is no exact match
+        """
+        name_id = self._exact.get(normalize_name(name))
+        return self._names[name_id] if name_id is not None else None
+
+    def complete(self, query: str, limit: int = 10) -> List[str]:
+        """
+        Top-ranked names that start with the query or have a word that does.
+
+        The query may span words ("bole med" completes "Bole Medhane Alem",
+        "medhane al" does too).
+
+        Args:
+            query: Text typed so far
+            limit: Maximum number of names
+
+        Returns:
+            Up to limit names, best first
+        """
+        key = normalize_name(query)
+        if not key or limit < 1:
+            return []
+        low = bisect_left(self._keys, key)
+        high = bisect_left(self._keys, key + _KEY_END, low)
+        if low == high:
+            return []
+
+        # A name can own several entries of the range, so take a few spares
+        ranks = self._entry_ranks[low:high]
+        take = min(len(ranks), 4 * limit)
+        while True:
+            if take < len(ranks):
+                picked = np.argpartition(ranks, take - 1)[:take]
+            else:
+                picked = np.arange(len(ranks))
+            picked = picked[np.argsort(ranks[picked], kind="stable")]
+            name_ids = list(dict.fromkeys(self._entry_names[low + picked].tolist()))
+            if len(name_ids) >= limit or take == len(ranks):
+                return [self._names[name_id] for name_id in name_ids[:limit]]
+            take = min(len(ranks), take * 4)
+
+    def contains(self, query: str, limit: int = 10) -> List[str]:
+        """
+        Top-ranked names containing the query anywhere, e.g. inside a word.
+
+        Args:
+            query: Text typed so far
+            limit: Maximum number of names
+
+        Returns:
+            Up to limit names, best first (lower priority, then shorter names)
+        """
+        key = normalize_name(query)
+        if not key or limit < 1:
+            return []
+
+        blob, find, starts = self._key_blob, self._key_blob.find, self._key_starts
+        name_ids = []
+        position = find(key)
+        while position >= 0:
+            name_id = bisect_right(starts, position) - 1
+            name_ids.append(name_id)
+            # Continue after this name's line, one hit per name is enough
+            next_start = starts[name_id + 1] if name_id + 1 < len(starts) else len(blob)
+            position = find(key, next_start)
+        if not name_ids:
+            return []
+
+        ids = np.array(name_ids, dtype=np.int64)
+        ranks = self._name_ranks[ids]
+        if len(ids) > limit:
+            picked = np.argpartition(ranks, limit - 1)[:limit]
+            ids, ranks = ids[picked], ranks[picked]
+        return [self._names[name_id] for name_id in ids[np.argsort(ranks, kind="stable")].tolist()]
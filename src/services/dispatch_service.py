@@ -0,0 +1,121 @@
+"""
+Nearest-available-vehicle dispatch.
+Single responsibility: Rank indexed vehicles by network cost to an incident with one bounded search.
+"""
+
+import math
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from core.graph_interface import GraphInterface, MessageHandlerInterface, PathCalculatorInterface
+from core.vehicle_index import VehicleIndex
+from algorithms.dijkstra import shortest_path_tree
+
+
+class DispatchService:
+    """Finds the k vehicles that reach a node fastest, in the result shape of GenericPathfindingService."""
+
+    def __init__(self, graph: GraphInterface, vehicle_index: VehicleIndex,
+                 path_calculator: PathCalculatorInterface,
+                 message_handler: MessageHandlerInterface = None):
+        """
+        Initialize with generic components.
+
+        Args:
+            graph: Graph implementation with a compact view (and optional weight profile)
+            vehicle_index: Live vehicle positions on the same compact graph
+            path_calculator: Calculator for path costs and statistics
+            message_handler: Optional message handler
+        """
+        self.graph = graph
+        self.vehicle_index = vehicle_index
+        self.path_calculator = path_calculator
+        self.message_handler = message_handler
+
+    def nearest_vehicles(self, incident: int, k: int = 3,
+                         max_cost: float = math.inf) -> Dict[str, Any]:
+        """
+        Rank the k vehicles with the lowest network cost to an incident.
+
+        The search grows outward from the incident (the compact graph holds
+        both directions of every edge, so its tree gives costs *to* the
+        incident) and stops as soon as k vehicles are settled, so only the
+        neighborhood of the incident is explored.
+
+        Args:
+            incident: Node id of the incident
+            k: Number of vehicles to return
+            max_cost: Ignore vehicles farther than this
+
+        Returns:
+            Dictionary with path results and metadata, plus "vehicles":
+            (vehicle id, node, cost, route) per vehicle, closest first
+        """
+        compact = self.graph.get_compact_graph()
+        if compact is None:
+            return self._failure("Dispatch needs a compact graph")
+        if not compact.has_node(incident):
+            return self._failure(f"Incident node {incident} not found")
+        if k < 1:
+            return self._failure("At least one vehicle must be requested")
+
+        vehicles_at = self.vehicle_index.vehicles_at
+        found: List[Tuple[Hashable, int, float]] = []
+        seen = set()
+
+        def collect(node: int, distance: float) -> bool:
+            for vehicle_id in vehicles_at(node):
+                if vehicle_id not in seen:
+                    seen.add(vehicle_id)
+                    found.append((vehicle_id, node, distance))
+            return len(found) >= k
+
+        _, parents, _ = shortest_path_tree(
+            compact, {compact.index_of(incident): 0.0}, self.graph.get_arc_weights(),
+            max_distance=max_cost, stop_when=collect
+        )
+        if not found:
+            limit = "" if math.isinf(max_cost) else f" within cost {max_cost:.0f}"
+            return self._failure(f"No vehicle can reach the incident{limit}")
+
+        vehicles = []
+        for vehicle_id, node, cost in found[:k]:
+            vehicles.append({
+                "vehicle_id": vehicle_id,
+                "node": compact.node_id_list()[node],
+                "cost": cost,
+                "route": self._route_to_root(compact, parents, node),
+            })
+        routes = [vehicle["route"] for vehicle in vehicles]
+
+        stats = self.path_calculator.get_path_statistics(routes, self.graph)
+        if self.message_handler:
+            self.message_handler.handle_success(
+                f"Found {len(vehicles)} vehicle(s) for the incident, closest at cost {vehicles[0]['cost']:.0f}"
+            )
+
+        return {
+            "success": True,
+            "paths": routes,
+            "primary_path": routes[0],
+            "all_paths": routes,
+            "visited_nodes": set(compact.to_node_ids(parents)),
+            "statistics": stats,
+            "algorithm": "Dijkstra",
+            "vehicles": vehicles,
+        }
+
+    @staticmethod
+    def _route_to_root(compact, parents: Dict[int, Optional[int]], node: int) -> List[int]:
+        """Node path from a settled node up to the tree root (the incident)."""
+        path = []
+        current: Optional[int] = node
+        while current is not None:
+            path.append(current)
+            current = parents[current]
+        return compact.to_node_ids(path)
+
+    def _failure(self, message: str) -> Dict[str, Any]:
+        """Failure result in the shared result shape."""
+        if self.message_handler:
+            self.message_handler.handle_error(message)
+        return {"success": False, "message": message, "paths": []}
@@ -3,19 +3,28 @@ Pure generic pathfinding service.
 Completely domain-agnostic and reusable for any graph type and algorithm.
 """
 
-from typing import List, Optional, Iterator, Dict, Any
+from typing import List, Optional, Iterator, Dict, Any, Hashable
 
 from core.graph_interface import (
     GraphInterface, PathfindingAlgorithmInterface, ConstraintInterface,
     MessageHandlerInterface, PathCalculatorInterface
 )
+from core.spatial_index import EdgeSnap
+from algorithms.dijkstra import shortest_path_between_edges
+from services.route_cache import RouteCache
+from services.route_store import RouteStore
+from services.origin_tree_cache import OriginTreeCache
+from services.route_table import RouteTable
 
 
 class GenericPathfindingService:
     """Pure generic pathfinding service for any graph type and algorithm."""
     
     def __init__(self, graph: GraphInterface, algorithm: PathfindingAlgorithmInterface,
-                 path_calculator: PathCalculatorInterface, message_handler: MessageHandlerInterface = None):
+                 path_calculator: PathCalculatorInterface, message_handler: MessageHandlerInterface = None,
+                 route_cache: Optional[RouteCache] = None, route_store: Optional[RouteStore] = None,
+                 origin_trees: Optional[OriginTreeCache] = None, weights_key: str = "",
+                 route_table: Optional[RouteTable] = None, table_algorithm: str = ""):
         """
         Initialize with generic components.
         
@@ -24,15 +33,30 @@ class GenericPathfindingService:
             algorithm: Pathfinding algorithm (BFS, DFS, A*, etc.)
             path_calculator: Calculator for path costs and statistics
             message_handler: Optional message handler
+            route_cache: Optional cache of results, shared between services
+            route_store: Optional persistent store of results, shared between processes
+            origin_trees: Optional cache of shortest path trees of hot origins;
+                only pass it with algorithms that return exact shortest paths
+            weights_key: Identifies the graph's arc weights in the tree cache
+            route_table: Optional precomputed results between known locations,
+                built with this service's algorithm and weights
+            table_algorithm: Name of the algorithm's results in the route table
         """
         self.graph = graph
         self.algorithm = algorithm
         self.path_calculator = path_calculator
         self.message_handler = message_handler
+        self.route_cache = route_cache
+        self.route_store = route_store
+        self.origin_trees = origin_trees
+        self.weights_key = weights_key
+        self.route_table = route_table
+        self.table_algorithm = table_algorithm
     
     def find_paths(self, start: int, goal: int, 
                    constraints: Optional[List[ConstraintInterface]] = None,
-                   max_paths: Optional[int] = None) -> Dict[str, Any]:
+                   max_paths: Optional[int] = None,
+                   cache_key: Optional[Hashable] = None) -> Dict[str, Any]:
         """
         Find paths using the configured algorithm.
         
@@ -41,10 +65,42 @@ class GenericPathfindingService:
             goal: Goal node
             constraints: List of constraints to validate against
             max_paths: Maximum number of paths to find
+            cache_key: Description of everything besides start, goal and
+                max_paths that shapes the result (algorithm, weights,
+                constraint limits); successful results are cached under
+                it in the service's route cache and route store
             
         Returns:
             Dictionary with path results and metadata
         """
+        if cache_key is None or (self.route_cache is None and self.route_store is None):
+            return self._find_paths(start, goal, constraints, max_paths)
+        
+        # Routes are only valid on the graph snapshot they were found on
+        compact = self.graph.get_compact_graph()
+        version = compact.version if compact is not None else ""
+        key = (cache_key, start, goal, max_paths)
+        if self.route_cache is not None:
+            results = self.route_cache.get(key, version)
+            if results is not None:
+                return results
+        
+        # Results stored by an earlier run or another worker
+        results = self.route_store.get_route(key, version) if self.route_store is not None else None
+        if results is None:
+            results = self._find_paths(start, goal, constraints, max_paths)
+            if not results["success"]:
+                return results
+            if self.route_store is not None:
+                self.route_store.put_route(key, results, version)
+        
+        if self.route_cache is not None:
+            self.route_cache.put(key, results, version)
+        return results
+    
+    def _find_paths(self, start: int, goal: int, constraints: Optional[List[ConstraintInterface]],
+                    max_paths: Optional[int]) -> Dict[str, Any]:
+        """Run the search, validation and statistics of find_paths without the cache."""
         # Validate basic requirements
         if not self.graph.node_exists(start):
             error_msg = f"Start node {start} not found"
@@ -58,8 +114,21 @@ class GenericPathfindingService:
                 self.message_handler.handle_error(error_msg)
             return {"success": False, "message": error_msg, "paths": []}
         
-        # Find paths using algorithm
-        paths = self.algorithm.find_path(start, goal, self.graph, constraints, max_paths)
+        # A single best route from a hot origin is read from its cached tree
+        visited_nodes = set()
+        paths = self._path_from_tree(start, goal, constraints) if max_paths == 1 else None
+        
+        # Routes between known locations come from the precomputed table
+        if paths is None:
+            paths = self._paths_from_table(start, goal, constraints, max_paths)
+        
+        if paths is None:
+            # Find paths using algorithm
+            paths = self.algorithm.find_path(start, goal, self.graph, constraints, max_paths)
+            
+            # Get visited nodes for visualization (if algorithm supports it)
+            if paths and hasattr(self.algorithm, 'get_visited_nodes'):
+                visited_nodes = self.algorithm.get_visited_nodes()
         
         if not paths:
             no_path_msg = "No paths found between the specified nodes"
@@ -67,11 +136,6 @@ class GenericPathfindingService:
                 self.message_handler.handle_info(no_path_msg)
             return {"success": False, "message": no_path_msg, "paths": []}
         
-        # Get visited nodes for visualization (if algorithm supports it)
-        visited_nodes = set()
-        if hasattr(self.algorithm, 'get_visited_nodes'):
-            visited_nodes = self.algorithm.get_visited_nodes()
-        
         # Calculate statistics
         stats = self.path_calculator.get_path_statistics(paths, self.graph)
         
@@ -88,6 +152,104 @@ class GenericPathfindingService:
             "algorithm": type(self.algorithm).__name__
         }
     
+    def _path_from_tree(self, start: int, goal: int,
+                        constraints: Optional[List[ConstraintInterface]]) -> Optional[List[List[int]]]:
+        """
+        Read the shortest path from the start's cached tree.
+        
+        Returns:
+            [path], or None if the start has no tree yet, the goal is
+            unreachable or the path breaks a constraint (the caller searches)
+        """
+        compact = self.graph.get_compact_graph()
+        if self.origin_trees is None or compact is None:
+            return None
+        tree = self.origin_trees.lookup(compact, self.graph.get_arc_weights(), self.weights_key, start)
+        path = tree.path_to(goal) if tree is not None else None
+        if path is None:
+            return None
+        for constraint in constraints or []:
+            if not constraint.validate(path, self.graph)[0]:
+                return None
+        return [path]
+    
+    def _paths_from_table(self, start: int, goal: int, constraints: Optional[List[ConstraintInterface]],
+                          max_paths: Optional[int]) -> Optional[List[List[int]]]:
+        """
+        Read the precomputed result between two known locations.
+        
+        Returns:
+            Stored paths, or None if the pair is not in the table or a stored
+            path breaks a constraint (the caller searches)
+        """
+        if self.route_table is None or max_paths is None:
+            return None
+        paths = self.route_table.paths(self.table_algorithm, start, goal, max_paths)
+        if paths is None:
+            return None
+        for path in paths:
+            for constraint in constraints or []:
+                if not constraint.validate(path, self.graph)[0]:
+                    return None
+        return paths
+    
+    def find_path_between_edges(self, start_snap: EdgeSnap, goal_snap: EdgeSnap) -> Dict[str, Any]:
+        """
+        Find the optimal route between two points snapped onto edges.
+        
+        Uses the algorithm's own edge-to-edge search if it has one (A*),
+        otherwise Dijkstra with the same partial-edge sources and targets.
+        
+        Args:
+            start_snap: Snapped start point
+            goal_snap: Snapped goal point
+            
+        Returns:
+            Dictionary with path results and metadata, plus "cost" (including
+            the partial edges at both ends) and the two snaps
+        """
+        compact = self.graph.get_compact_graph()
+        if compact is None:
+            error_msg = "Edge snapping needs a compact graph"
+            if self.message_handler:
+                self.message_handler.handle_error(error_msg)
+            return {"success": False, "message": error_msg, "paths": []}
+        
+        visited_nodes = set()
+        if hasattr(self.algorithm, 'find_path_between_edges'):
+            result = self.algorithm.find_path_between_edges(start_snap, goal_snap, self.graph)
+            algorithm_name = type(self.algorithm).__name__
+            if hasattr(self.algorithm, 'get_visited_nodes'):
+                visited_nodes = self.algorithm.get_visited_nodes()
+        else:
+            result = shortest_path_between_edges(compact, start_snap, goal_snap, self.graph.get_arc_weights())
+            algorithm_name = "Dijkstra"
+        
+        if result is None:
+            no_path_msg = "No paths found between the specified points"
+            if self.message_handler:
+                self.message_handler.handle_info(no_path_msg)
+            return {"success": False, "message": no_path_msg, "paths": []}
+        
+        cost, path = result
+        stats = self.path_calculator.get_path_statistics([path], self.graph)
+        
+        if self.message_handler:
+            self.message_handler.handle_success(f"Found a path between the points using {algorithm_name}")
+        
+        return {
+            "success": True,
+            "paths": [path],
+            "primary_path": path,
+            "all_paths": [path],
+            "visited_nodes": visited_nodes or set(path),
+            "statistics": stats,
+            "algorithm": algorithm_name,
+            "cost": cost,
+            "start_snap": start_snap,
+            "goal_snap": goal_snap,
+        }
+    
     def find_paths_streaming(self, start: int, goal: int,
                            constraints: Optional[List[ConstraintInterface]] = None,
                            max_paths: Optional[int] = None) -> Iterator[Dict[str, Any]]:
@@ -0,0 +1,124 @@
+"""
+Offline geocoding from the local place index.
+Single responsibility: Resolve place names to coordinates through exact, prefix and fuzzy tiers.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from difflib import get_close_matches
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import GEOCODER_FUZZY_CANDIDATES, GEOCODER_FUZZY_CUTOFF
+from services.place_index_service import PlaceIndexService
+from services.trigram_index import TrigramIndex
+from shared.utils.text import normalize_name
+
+
+@dataclass(frozen=True)
+class GeocodeMatch:
+    """A place name resolved from the index, with the tier that matched it."""
+    name: str
+    lat: float
+    lon: float
+    tier: str
+
+
+class LocalGeocoder:
+    """
+    Resolves names against the place index without network calls.
+
+    Tiers are tried in order and the first hit wins:
+    exact (after normalization), prefix (the shortest indexed name
+    starting with the query) and fuzzy (difflib similarity above a cutoff).
+    The fuzzy tier only scores the keys sharing the most trigrams with the
+    query, taken from a trigram index, instead of every key.
+    Only places with coordinates take part.
+    """
+
+    # Share of query trigrams a key needs to be a fuzzy candidate; loose, so
+    # the top candidates rather than this share decide what difflib sees
+    _CANDIDATE_TRIGRAM_SHARE = 0.3
+
+    def __init__(self, place_index: PlaceIndexService, fuzzy_cutoff: float = GEOCODER_FUZZY_CUTOFF,
+                 fuzzy_candidates: int = GEOCODER_FUZZY_CANDIDATES):
+        """
+        Build the lookup tables for a place index.
+
+        Args:
+            place_index: Place index holding names and coordinates
+            fuzzy_cutoff: Minimum similarity (0-1) of a fuzzy match
+            fuzzy_candidates: Keys scored with difflib per fuzzy lookup
+        """
+        self.place_index = place_index
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.fuzzy_candidates = fuzzy_candidates
+        self._trigrams: Optional[TrigramIndex] = None
+
+        keyed = []
+        for position in range(len(place_index)):
+            if place_index.coordinates_at(position) is not None:
+                keyed.append((normalize_name(place_index.name_at(position)), position))
+        keyed.sort()
+
+        self._keys: List[str] = [key for key, _ in keyed]
+        self._positions: List[int] = [position for _, position in keyed]
+        self._exact: Dict[str, int] = {}
+        for key, position in keyed:
+            self._exact.setdefault(key, position)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def lookup(self, name: str) -> Optional[GeocodeMatch]:
+        """
+        Resolve a name to its best-matching place.
+
+        Args:
+            name: Place name as typed
+
+        Returns:
+            Matched place, or None if no tier matches
+        """
+        query = normalize_name(name)
+        if not query or not self._keys:
+            return None
+
+        position = self._exact.get(query)
+        if position is not None:
+            return self._match(position, "exact")
+
+        # Keys starting with the query form one run of the sorted list
+        start = bisect_left(self._keys, query)
+        end = start
+        while end < len(self._keys) and self._keys[end].startswith(query):
+            end += 1
+        if end > start:
+            best = min(range(start, end), key=lambda i: len(self._keys[i]))
+            return self._match(self._positions[best], "prefix")
+
+        if self._trigrams is None:
+            self._trigrams = TrigramIndex(self._keys)
+        candidates = [key for key, _ in self._trigrams.search(
+            query, self.fuzzy_candidates, cutoff=self._CANDIDATE_TRIGRAM_SHARE
+        )]
+        close = get_close_matches(query, candidates, n=1, cutoff=self.fuzzy_cutoff)
+        if close:
+            return self._match(self._exact[close[0]], "fuzzy")
+        return None
+
+    def geocode(self, name: str) -> Optional[Tuple[float, float]]:
+        """
+        Resolve a name to (lat, lon).
+
+        Args:
+            name: Place name as typed
+
+        Returns:
+            Coordinates of the best match, or None if no tier matches
+        """
+        match = self.lookup(name)
+        return (match.lat, match.lon) if match is not None else None
+
+    def _match(self, position: int, tier: str) -> GeocodeMatch:
+        lat, lon = self.place_index.coordinates_at(position)
+        return GeocodeMatch(self.place_index.name_at(position), lat, lon, tier)
@@ -0,0 +1,183 @@
+"""
+Cache of full shortest path trees for frequently queried origins.
+Single responsibility: Pick hot origins by query frequency and keep their trees within a memory bound.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Iterable, Optional, Sequence, Set, Tuple
+
+from core.compact_graph import CompactGraph
+from core.shortest_path_tree import ShortestPathTree
+
+# Query counts are halved once this many origins per cached tree are tracked,
+# so the counter stays small and favors recent demand
+_TRACKED_PER_TREE = 64
+
+
+class OriginTreeCache:
+    """
+    Shortest path trees of the top origins by query frequency.
+
+    Every lookup counts a query for its (weights, origin) key. Once an
+    origin has min_queries queries and ranks among the max_origins most
+    queried ones, its full tree is built on a background thread; later
+    queries from it read their route from the tree. Trees are evicted
+    least queried first when the count or byte bound is exceeded.
+
+    Trees remember the graph version they were grown on. A lookup on a
+    newer graph drops the stale tree and, if the origin is still hot,
+    rebuilds it in the background, so trees follow graph updates without
+    blocking queries.
+    """
+
+    def __init__(self, max_origins: int = 16, max_bytes: int = 64 * 1024 * 1024,
+                 min_queries: int = 2, background: bool = True):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_origins: Maximum number of trees kept
+            max_bytes: Maximum size of all trees in bytes
+            min_queries: Queries from an origin before its tree is built
+            background: Build trees on a worker thread (False builds them
+                inside the lookup that makes an origin hot)
+        """
+        self.max_origins = max_origins
+        self.max_bytes = max_bytes
+        self.min_queries = min_queries
+        self._trees: Dict[Hashable, ShortestPathTree] = {}
+        self._counts: Dict[Hashable, int] = {}
+        self._pending: Set[Hashable] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1) if background else None
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of all cached trees in bytes."""
+        return sum(tree.nbytes for tree in self._trees.values())
+
+    def lookup(self, compact: CompactGraph, weights: Optional[Sequence[float]],
+               weights_key: str, origin: int, count: bool = True) -> Optional[ShortestPathTree]:
+        """
+        Count a query from an origin and return its tree if one is ready.
+
+        Args:
+            compact: Compact graph the query runs on
+            weights: Per-arc weights of the query (defaults to arc lengths)
+            weights_key: Identifies the weights (e.g. a profile fingerprint)
+            origin: Original node id the query starts from
+            count: Whether the query counts towards the origin's hotness;
+                uncounted lookups only reuse a tree that is already built
+
+        Returns:
+            Tree grown from the origin on this graph, or None (the caller searches)
+        """
+        key = (weights_key, origin)
+        with self._lock:
+            if count:
+                self._count(key)
+            tree = self._trees.get(key)
+            if tree is not None and tree.version != compact.version:
+                del self._trees[key]
+                tree = None
+            if tree is not None:
+                self.hits += 1
+                return tree
+            self.misses += 1
+            build = count and self._is_hot(key) and key not in self._pending
+            if build:
+                self._pending.add(key)
+
+        if build:
+            self._schedule(compact, weights, key)
+            # Synchronous builds are ready for this query already
+            with self._lock:
+                tree = self._trees.get(key)
+        return tree
+
+    def warm(self, compact: CompactGraph, weights: Optional[Sequence[float]],
+             weights_key: str, origins: Iterable[int]) -> None:
+        """
+        Build trees for origins known to be hot (airport, depots, landmarks).
+
+        The origins are counted as min_queries queries each, so they are
+        kept until busier origins push them out.
+        """
+        scheduled = []
+        with self._lock:
+            for origin in origins:
+                key = (weights_key, origin)
+                self._counts[key] = max(self._counts.get(key, 0), self.min_queries)
+                if key not in self._trees and key not in self._pending and self._is_hot(key):
+                    self._pending.add(key)
+                    scheduled.append(key)
+        for key in scheduled:
+            self._schedule(compact, weights, key)
+
+    def clear(self) -> None:
+        """Drop all trees and query counts."""
+        with self._lock:
+            self._trees.clear()
+            self._counts.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit and miss counters, trees built and memory used."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "trees": len(self._trees),
+                "bytes": sum(tree.nbytes for tree in self._trees.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "builds": self.builds,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "pending": len(self._pending),
+            }
+
+    def _count(self, key: Hashable) -> None:
+        """Count a query, aging all counts when too many origins are tracked (lock held)."""
+        self._counts[key] = self._counts.get(key, 0) + 1
+        if len(self._counts) > _TRACKED_PER_TREE * max(self.max_origins, 1):
+            self._counts = {tracked: count // 2 for tracked, count in self._counts.items()
+                            if count // 2 > 0 or tracked in self._trees}
+
+    def _is_hot(self, key: Hashable) -> bool:
+        """Whether an origin qualifies for a tree: enough queries and a top rank (lock held)."""
+        count = self._counts.get(key, 0)
+        if count < self.min_queries or self.max_origins < 1:
+            return False
+        busier = sum(1 for other in self._counts.values() if other > count)
+        return busier < self.max_origins
+
+    def _schedule(self, compact: CompactGraph, weights: Optional[Sequence[float]],
+                  key: Tuple[str, int]) -> None:
+        if self._executor is not None:
+            self._executor.submit(self._build, compact, weights, key)
+        else:
+            self._build(compact, weights, key)
+
+    def _build(self, compact: CompactGraph, weights: Optional[Sequence[float]],
+               key: Tuple[str, int]) -> None:
+        try:
+            tree = ShortestPathTree.build(compact, key[1], weights)
+        except KeyError:
+            tree = None
+
+        with self._lock:
+            self._pending.discard(key)
+            if tree is None or tree.nbytes > self.max_bytes:
+                return
+            self._trees[key] = tree
+            self.builds += 1
+            # Evict the least queried trees until both bounds hold
+            total = sum(cached.nbytes for cached in self._trees.values())
+            while len(self._trees) > self.max_origins or total > self.max_bytes:
+                coldest = min(self._trees, key=lambda cached: self._counts.get(cached, 0))
+                total -= self._trees.pop(coldest).nbytes
@@ -2,31 +2,53 @@
 Service for building and querying a place-name index for Addis Ababa.
 
 Uses OpenStreetMap data via OSMnx to fetch essentially all named places
-within the configured city boundary and caches them locally for fast
-autocomplete / lookup.
+within the configured city boundary and caches them locally, with one
+coordinate per name, for fast autocomplete / lookup and offline geocoding.
 """
 
 from __future__ import annotations
 
 import json
-from difflib import get_close_matches
+import math
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
+import numpy as np
 import osmnx as ox
 
-from config.settings import CACHE_DIR, DEFAULT_CITY
+from config.settings import CACHE_DIR, DEFAULT_CITY, PLACE_INDEX_DIR
+from services.autocomplete_index import AutocompleteIndex
+from services.trigram_index import TrigramIndex
+from shared.utils.array_store import decode_strings, encode_strings, load_arrays, save_arrays
+
+FORMAT_VERSION = 1
+_ARRAY_NAMES = ("name_offsets", "name_bytes", "lat", "lon")
 
 
 class PlaceIndexService:
-    """Manages an index of named places in Addis Ababa for suggestions."""
+    """Manages an index of named places in Addis Ababa for suggestions and geocoding."""
 
-    def __init__(self, city: str = DEFAULT_CITY) -> None:
+    def __init__(self, city: str = DEFAULT_CITY, build_if_missing: bool = True) -> None:
+        """
+        Load the place index from its cache, downloading it if needed.
+
+        Args:
+            city: Place whose named features are indexed
+            build_if_missing: Download the index from OSM when no cache
+                exists (falling back to the legacy names-only JSON cache if
+                the download fails); when False, a missing cache leaves the
+                index empty or names-only
+        """
         self.city = city
+        self.index_dir = Path(PLACE_INDEX_DIR)
         self.cache_file = Path(CACHE_DIR) / "addis_place_index.json"
         self._names: list[str] = []
+        self._lats = np.empty(0, dtype=np.float64)
+        self._lons = np.empty(0, dtype=np.float64)
+        self._autocomplete: Optional[AutocompleteIndex] = None
+        self._trigrams: Optional[TrigramIndex] = None
         self._ensure_cache_dir()
-        self._load_or_build_index()
+        self._load_or_build_index(build_if_missing)
 
     # ------------------------------------------------------------------ #
     # Public API
@@ -35,26 +57,66 @@ class PlaceIndexService:
         """Return all indexed place names."""
         return list(self._names)
 
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def name_at(self, position: int) -> str:
+        """Return the place name at a position of the (sorted) index."""
+        return self._names[position]
+
+    def coordinates_at(self, position: int) -> Optional[Tuple[float, float]]:
+        """
+        Return the (lat, lon) of the place at a position of the index.
+
+        Places loaded from the legacy names-only cache have no coordinates
+        and return None.
+        """
+        lat, lon = float(self._lats[position]), float(self._lons[position])
+        if math.isnan(lat) or math.isnan(lon):
+            return None
+        return lat, lon
+
+    def coordinates(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the latitude and longitude arrays, aligned with the names (NaN if unknown)."""
+        return self._lats, self._lons
+
+    def complete(self, query: str, limit: int = 10) -> List[str]:
+        """
+        Return up to `limit` names starting with the query, or with a word
+        starting with it, best first (see AutocompleteIndex).
+        """
+        if self._autocomplete is None:
+            self._autocomplete = AutocompleteIndex(self._names)
+        return self._autocomplete.complete(query, limit)
+
     def search(self, query: str, limit: int = 10) -> List[str]:
         """
         Return up to `limit` matching place names for the given query.
 
-        - First uses simple "contains" matching (case-insensitive).
-        - If nothing is found, falls back to fuzzy matching.
+        - First names starting with the query, or with a word starting with it.
+        - Then names containing the query anywhere (case-insensitive).
+        - Then fuzzy matches from the trigram index, where spelling variants
+          of romanized names (Piassa / Piazza / Piaza) count as equal.
         """
-        q = query.strip().lower()
-        if not q:
+        if not query.strip():
             return []
 
-        # Simple substring search
-        contains_matches = [name for name in self._names if q in name.lower()]
-
-        if contains_matches:
-            return contains_matches[:limit]
-
-        # Fuzzy fallback
-        fuzzy = get_close_matches(q, self._names, n=limit, cutoff=0.6)
-        return fuzzy
+        matches = self.complete(query, limit)
+        if len(matches) < limit:
+            for name in self._autocomplete.contains(query, limit):
+                if name not in matches:
+                    matches.append(name)
+                    if len(matches) >= limit:
+                        break
+        if len(matches) < limit:
+            if self._trigrams is None:
+                self._trigrams = TrigramIndex(self._names)
+            for name, _ in self._trigrams.search(query, limit, cutoff=0.6):
+                if name not in matches:
+                    matches.append(name)
+                    if len(matches) >= limit:
+                        break
+        return matches
 
     # ------------------------------------------------------------------ #
     # Internal helpers
@@ -62,27 +124,63 @@ class PlaceIndexService:
     def _ensure_cache_dir(self) -> None:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-    def _load_or_build_index(self) -> None:
-        if self.cache_file.exists():
+    def _load_or_build_index(self, build_if_missing: bool) -> None:
+        if self._load_index():
+            return
+
+        if build_if_missing:
             try:
-                with self.cache_file.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                # Ensure it's a list of strings
-                self._names = [str(name) for name in data]
-                if self._names:
-                    return
+                self._build_index()
+                return
             except Exception:
-                # Fall back to rebuild if cache is corrupted
-                pass
+                # Offline: names without coordinates beat no names at all
+                if not self._load_legacy_names():
+                    raise
+            return
 
-        self._build_index()
+        self._load_legacy_names()
+
+    def _load_legacy_names(self) -> bool:
+        """Load names cached by older versions, without coordinates; returns False if there are none."""
+        if not self.cache_file.exists():
+            return False
+        try:
+            with self.cache_file.open("r", encoding="utf-8") as f:
+                self._set_places([str(name) for name in json.load(f)], None, None)
+        except Exception:
+            return False
+        return bool(self._names)
+
+    def _load_index(self) -> bool:
+        """Load the columnar cache; returns False if it is missing or stale."""
+        loaded = load_arrays(self.index_dir, _ARRAY_NAMES, mmap=True)
+        if loaded is None:
+            return False
+
+        meta, arrays = loaded
+        offsets = arrays["name_offsets"]
+        if (meta.get("format_version") != FORMAT_VERSION
+                or meta.get("city") != self.city
+                or len(offsets) != len(arrays["lat"]) + 1):
+            return False
+
+        names = decode_strings(offsets, arrays["name_bytes"])
+        self._names, self._lats, self._lons = names, arrays["lat"], arrays["lon"]
+        return bool(names)
+
+    def _set_places(self, names: list[str], lats: Optional[list[float]],
+                    lons: Optional[list[float]]) -> None:
+        self._names = names
+        self._lats = np.full(len(names), np.nan) if lats is None else np.asarray(lats, dtype=np.float64)
+        self._lons = np.full(len(names), np.nan) if lons is None else np.asarray(lons, dtype=np.float64)
 
     def _build_index(self) -> None:
         """
         Download and index named geometries for Addis Ababa from OSM.
 
         This is done once (or when the cache is missing/corrupt) and then
-        stored as a simple JSON array of names.
+        stored as columns: the names as one UTF-8 blob with offsets, and
+        a representative point per name as latitude and longitude arrays.
         """
         # Broad tag set to capture as many named features as possible
         tags = {
@@ -96,23 +194,31 @@ class PlaceIndexService:
         # osmnx >= 2 uses features_from_place instead of geometries_from_place
         gdf = ox.features_from_place(self.city, tags)
 
+        # One point per name, taken from the first feature carrying it;
+        # representative points always lie inside their polygon
+        places: dict[str, tuple[float, float]] = {}
         if "name" in gdf.columns:
-            unique_names = {
-                str(name).strip()
-                for name in gdf["name"].dropna().unique()
-                if str(name).strip()
-            }
-        else:
-            unique_names = set()
+            named = gdf[gdf["name"].notna()]
+            points = named.geometry.representative_point()
+            for name, point in zip(named["name"], points):
+                name = str(name).strip()
+                if name and name not in places:
+                    places[name] = (point.y, point.x)
 
         # Store sorted for nicer UX
-        self._names = sorted(unique_names)
+        names = sorted(places)
+        self._set_places(names, [places[name][0] for name in names], [places[name][1] for name in names])
 
+        offsets, blob = encode_strings(names)
         try:
-            with self.cache_file.open("w", encoding="utf-8") as f:
-                json.dump(self._names, f, ensure_ascii=False, indent=2)
+            save_arrays(
+                self.index_dir,
+                {"format_version": FORMAT_VERSION, "city": self.city, "count": len(names)},
+                name_offsets=offsets,
+                name_bytes=blob,
+                lat=self._lats,
+                lon=self._lons,
+            )
         except Exception:
-            # If caching fails, we still keep _names in memory
+            # If caching fails, we still keep the places in memory
             pass
-
-
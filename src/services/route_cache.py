@@ -0,0 +1,154 @@
+"""
+In-memory cache of computed routes.
+Single responsibility: Bounded, thread-safe LRU storage of path results keyed by query.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Bytes charged per element of a flat container (list slot plus a boxed int or float)
+_ELEMENT_BYTES = 8 + 32
+
+
+def estimate_result_bytes(value: Any) -> int:
+    """
+    Approximate memory held by a path result.
+
+    Nested containers are walked; containers of scalars (paths, visited
+    node sets) are charged per element instead of measuring every item,
+    so the estimate stays cheap for results with many visited nodes.
+
+    Args:
+        value: Result dictionary or any value inside it
+
+    Returns:
+        Estimated size in bytes
+    """
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_result_bytes(key) + estimate_result_bytes(item) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        first = next(iter(value), None)
+        if isinstance(first, (dict, list, tuple, set, frozenset)):
+            return sys.getsizeof(value) + sum(estimate_result_bytes(item) for item in value)
+        return sys.getsizeof(value) + len(value) * _ELEMENT_BYTES
+    return sys.getsizeof(value)
+
+
+class RouteCache:
+    """
+    Least-recently-used cache of path results, bounded by entries and bytes.
+
+    Every entry is tagged with the graph version it was computed on; a
+    lookup with a different version drops the whole cache, since a new
+    graph snapshot invalidates every stored route. All operations take
+    one lock, so searches running on several threads can share a cache.
+    Results are stored and returned as shallow copies: callers may add
+    keys to what they get back, but must not modify the paths in place.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results (0 disables caching)
+            max_bytes: Maximum estimated size of all cached results
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._version: Optional[str] = None
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated size of all cached results in bytes."""
+        return self._bytes
+
+    def get(self, key: Hashable, version: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Look up a result and mark it as recently used.
+
+        Args:
+            key: Query key
+            version: Version of the graph the caller searches on
+
+        Returns:
+            Copy of the cached result, or None on a miss
+        """
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[0])
+
+    def put(self, key: Hashable, result: Dict[str, Any], version: str = "") -> bool:
+        """
+        Store a result, evicting least recently used ones to stay in bounds.
+
+        Args:
+            key: Query key
+            result: Path result dictionary
+            version: Version of the graph the result was computed on
+
+        Returns:
+            True if the result was stored (False if it alone exceeds the byte bound)
+        """
+        size = estimate_result_bytes(result)
+        if self.max_entries < 1 or size > self.max_bytes:
+            return False
+
+        with self._lock:
+            self._check_version(version)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (dict(result), size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+        return True
+
+    def invalidate(self) -> None:
+        """Drop all cached results (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit and miss counters, occupancy and hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "version": self._version,
+            }
+
+    def _check_version(self, version: str) -> None:
+        """Drop every entry when the graph version changes (lock held)."""
+        if version != self._version:
+            self._entries.clear()
+            self._bytes = 0
+            self._version = version
@@ -0,0 +1,194 @@
+"""
+Multi-stop route optimization service.
+Single responsibility: Network distance matrices, visit order optimization and route stitching.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core.graph_interface import GraphInterface, MessageHandlerInterface, PathCalculatorInterface
+from algorithms.dijkstra import shortest_path_tree
+from algorithms.tour_optimizer import TourOptimizer, TourProblem
+from core.shortest_path_tree import ShortestPathTree
+from services.route_store import RouteStore
+from services.origin_tree_cache import OriginTreeCache
+
+
+class RouteOptimizationService:
+    """Plans a route visiting many stops, in the result shape of GenericPathfindingService."""
+
+    def __init__(self, graph: GraphInterface, path_calculator: PathCalculatorInterface,
+                 message_handler: MessageHandlerInterface = None,
+                 optimizer: Optional[TourOptimizer] = None,
+                 route_store: Optional[RouteStore] = None, weights_key: str = "",
+                 origin_trees: Optional[OriginTreeCache] = None):
+        """
+        Initialize with generic components.
+
+        Args:
+            graph: Graph implementation with a compact view (and optional weight profile)
+            path_calculator: Calculator for path costs and statistics
+            message_handler: Optional message handler
+            optimizer: Visit order optimizer (defaults to TourOptimizer())
+            route_store: Optional persistent store for distance-matrix rows
+            weights_key: Identifies the graph's arc weights in stored row keys
+            origin_trees: Optional cache of shortest path trees of hot origins (depots)
+        """
+        self.graph = graph
+        self.path_calculator = path_calculator
+        self.message_handler = message_handler
+        self.optimizer = optimizer or TourOptimizer()
+        self.route_store = route_store
+        self.weights_key = weights_key
+        self.origin_trees = origin_trees
+
+    def optimize(self, stops: Sequence[int], return_to_start: bool = True,
+                 demands: Optional[Sequence[float]] = None, capacity: Optional[float] = None,
+                 time_windows: Optional[Sequence[Optional[Tuple[float, float]]]] = None,
+                 service_times: Optional[Sequence[float]] = None, start_time: float = 0.0,
+                 seconds_per_cost: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Find a short route that starts at stops[0] and visits all other stops.
+
+        Args:
+            stops: Node ids; the first is the start (depot)
+            return_to_start: End the route back at the start
+            demands: Load picked up or delivered at each stop (aligned with stops)
+            capacity: Vehicle capacity; the route reloads at the start when exceeded
+            time_windows: (earliest, latest) arrival in seconds per stop, or None
+            service_times: Seconds spent at each stop
+            start_time: Departure time in seconds
+            seconds_per_cost: Travel seconds per unit of edge cost for time
+                windows (None when the edge costs already are seconds)
+
+        Returns:
+            Dictionary with path results and metadata, plus the stop order,
+            per-leg paths, trips and arrival times
+        """
+        compact = self.graph.get_compact_graph()
+        if compact is None:
+            return self._failure("Multi-stop optimization needs a compact graph")
+        if len(stops) < 2:
+            return self._failure("At least two stops are needed")
+        missing = [stop for stop in stops if not compact.has_node(stop)]
+        if missing:
+            return self._failure(f"Stop node {missing[0]} not found")
+
+        costs, trees = self._distance_matrix(compact, stops)
+        unreachable = [i for i, row in enumerate(costs) if any(math.isinf(value) for value in row)]
+        if unreachable:
+            return self._failure(f"Stop {unreachable[0]} cannot be reached from every other stop")
+
+        travel_times = None
+        if seconds_per_cost is not None:
+            travel_times = [[value * seconds_per_cost for value in row] for row in costs]
+        problem = TourProblem(
+            costs=costs,
+            travel_times=travel_times,
+            return_to_start=return_to_start,
+            demands=demands,
+            capacity=capacity,
+            time_windows=time_windows,
+            service_times=service_times,
+            start_time=start_time,
+        )
+        try:
+            solution = self.optimizer.solve(problem)
+        except ValueError as e:
+            return self._failure(str(e))
+
+        # Visit sequence in matrix indices, including reload returns to the start
+        sequence = [0]
+        for trip_number, trip in enumerate(solution.trips):
+            if trip_number:
+                sequence.append(0)
+            sequence.extend(trip)
+        if return_to_start:
+            sequence.append(0)
+
+        legs = [self._leg_path(compact, trees[a], stops[a], stops[b])
+                for a, b in zip(sequence, sequence[1:])]
+        route = [stops[0]]
+        for leg in legs:
+            route.extend(leg[1:])
+
+        stats = self.path_calculator.get_path_statistics([route], self.graph)
+        if self.message_handler:
+            self.message_handler.handle_success(
+                f"Planned a route through {len(stops)} stops in {len(solution.trips)} trip(s)"
+            )
+
+        return {
+            "success": True,
+            "paths": [route],
+            "primary_path": route,
+            "all_paths": [route],
+            "visited_nodes": set(),
+            "statistics": stats,
+            "algorithm": type(self.optimizer).__name__,
+            "stop_order": sequence,
+            "legs": legs,
+            "trips": solution.trips,
+            "total_cost": solution.cost,
+            "arrival_times": solution.arrival_times,
+            "lateness": solution.lateness,
+            "feasible": solution.feasible,
+        }
+
+    def _distance_matrix(self, compact, stops: Sequence[int]
+                         ) -> Tuple[List[List[float]], List[Any]]:
+        """
+        One-to-many searches from every stop; returns costs and shortest path trees.
+
+        Rows of hot origins are read from their cached ShortestPathTree.
+        Only the depot (stop 0) counts towards hotness; delivery stops
+        rarely repeat and would push real hot origins out of the cache,
+        so they only reuse trees that are already built. Rows found in
+        the route store skip their search and have no tree (None); legs
+        from those stops are searched on their own.
+        """
+        weights = self.graph.get_arc_weights()
+        targets = [compact.index_of(stop) for stop in stops]
+        costs, trees = [], []
+        for index, (stop, source) in enumerate(zip(stops, targets)):
+            tree = (self.origin_trees.lookup(compact, weights, self.weights_key, stop, count=index == 0)
+                    if self.origin_trees is not None else None)
+            if tree is not None:
+                costs.append(tree.distances_to(stops).tolist())
+                trees.append(tree)
+                continue
+            key = (self.weights_key, stop, tuple(stops))
+            row = self.route_store.get_matrix_row(key, compact.version) if self.route_store else None
+            if row is not None:
+                costs.append(row.tolist())
+                trees.append(None)
+                continue
+            distances, parents, _ = shortest_path_tree(compact, {source: 0.0}, weights, targets=targets)
+            costs.append([distances.get(target, math.inf) for target in targets])
+            trees.append(parents)
+            if self.route_store is not None:
+                self.route_store.put_matrix_row(key, costs[-1], compact.version)
+        return costs, trees
+
+    def _leg_path(self, compact, parents: Any, source: int, target: int) -> List[int]:
+        """Node path from source to target read from source's shortest path tree."""
+        if isinstance(parents, ShortestPathTree):
+            return parents.path_to(target)
+        if parents is None:
+            _, parents, _ = shortest_path_tree(
+                compact, {compact.index_of(source): 0.0}, self.graph.get_arc_weights(),
+                stop_at=compact.index_of(target)
+            )
+        node = compact.index_of(target)
+        path = []
+        while node is not None:
+            path.append(node)
+            node = parents[node]
+        path.reverse()
+        return compact.to_node_ids(path)
+
+    def _failure(self, message: str) -> Dict[str, Any]:
+        """Failure result in the shared result shape."""
+        if self.message_handler:
+            self.message_handler.handle_error(message)
+        return {"success": False, "message": message, "paths": []}
@@ -0,0 +1,312 @@
+"""
+Persistent store of computed routes and distance-matrix rows.
+Single responsibility: Share search results across restarts and worker processes through SQLite.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+# Bump when the payload encoding changes so old entries are ignored
+FORMAT_VERSION = 1
+
+# Compaction trims the store to this share of its byte limit, so it does not rerun on every put
+_COMPACT_TARGET = 0.8
+
+# Access times of hits are written in batches of this many, not one UPDATE per read
+_TOUCH_BATCH = 64
+
+# Puts between re-reading the stored size, which other processes change too
+_SIZE_SYNC_PUTS = 64
+
+# Entries of another graph version are deleted once none of them was used for this many seconds
+_STALE_VERSION_AGE = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    version TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+"""
+
+
+def encode_paths(paths: Sequence[Sequence[int]]) -> bytes:
+    """
+    Pack node paths into a compressed binary blob.
+
+    Layout before compression: path count (uint32), path lengths (uint32
+    each), then all node ids (int64). OSM ids along a path share their
+    high bytes, so zlib shrinks the ids severalfold.
+
+    Args:
+        paths: Node id paths
+
+    Returns:
+        Compressed bytes
+    """
+    lengths = np.array([len(path) for path in paths], dtype=np.uint32)
+    nodes = np.fromiter((node for path in paths for node in path), dtype=np.int64, count=int(lengths.sum()))
+    header = np.array([len(lengths)], dtype=np.uint32)
+    return zlib.compress(header.tobytes() + lengths.tobytes() + nodes.tobytes(), 1)
+
+
+def decode_paths(blob: bytes) -> List[List[int]]:
+    """Unpack paths packed by encode_paths."""
+    raw = zlib.decompress(blob)
+    count = int(np.frombuffer(raw, dtype=np.uint32, count=1)[0])
+    lengths = np.frombuffer(raw, dtype=np.uint32, count=count, offset=4)
+    nodes = np.frombuffer(raw, dtype=np.int64, offset=4 * (count + 1)).tolist()
+    offsets = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64))).tolist()
+    return [nodes[offsets[i]:offsets[i + 1]] for i in range(count)]
+
+
+class RouteStore:
+    """
+    SQLite-backed key-value store for routes and distance-matrix rows.
+
+    The database runs in WAL mode, so several processes can read while
+    one writes. Every entry carries the graph version it was computed on
+    and lookups only match entries of the caller's version. When the
+    stored payloads exceed the byte limit, a background thread deletes
+    entries of graph versions no process has used for an hour (workers
+    may run on different graph versions for a while) and then the least
+    recently used ones. The stored size is tracked per process and
+    re-read from the database every few puts, so writes of other
+    processes count towards the limit. Reads do not write: access times
+    of hits are collected in memory and written in batches by later puts
+    and by compaction. Storage errors are swallowed: a failing store
+    behaves like an empty one and never breaks routing.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Open (or create) a store.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Limit on the total size of stored payloads
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._compacting = threading.Lock()
+        self._touch_lock = threading.Lock()
+        self._touched: Dict[str, float] = {}
+        self._size_lock = threading.Lock()
+        self._puts_since_sync = 0
+        self._version = ""
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = self._connection()
+            connection.executescript(_SCHEMA)
+            self._bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        except (OSError, sqlite3.Error):
+            self._bytes = 0
+
+    def get_route(self, key: Hashable, version: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Look up a path result.
+
+        Args:
+            key: Query key (tuple of strings and numbers)
+            version: Version of the graph the caller searches on
+
+        Returns:
+            Result with paths, statistics and algorithm (visited nodes are
+            not stored and come back empty), or None on a miss
+        """
+        payload = self._get("route", key, version)
+        if payload is None:
+            return None
+        meta_size = int.from_bytes(payload[:4], "little")
+        meta = json.loads(payload[4:4 + meta_size].decode("utf-8"))
+        paths = decode_paths(payload[4 + meta_size:])
+        return {
+            "success": True,
+            "paths": paths,
+            "primary_path": paths[0],
+            "all_paths": paths,
+            "visited_nodes": set(),
+            "statistics": meta["statistics"],
+            "algorithm": meta["algorithm"],
+        }
+
+    def put_route(self, key: Hashable, result: Dict[str, Any], version: str = "") -> None:
+        """
+        Store a successful path result.
+
+        Args:
+            key: Query key (tuple of strings and numbers)
+            result: Path result dictionary
+            version: Version of the graph the result was computed on
+        """
+        meta = json.dumps({"statistics": result["statistics"], "algorithm": result["algorithm"]},
+                          default=float).encode("utf-8")
+        payload = len(meta).to_bytes(4, "little") + meta + encode_paths(result["paths"])
+        self._put("route", key, payload, version)
+
+    def get_matrix_row(self, key: Hashable, version: str = "") -> Optional[np.ndarray]:
+        """
+        Look up a row of network costs from one source to many targets.
+
+        Returns:
+            float64 costs aligned with the targets of the key, or None on a miss
+        """
+        payload = self._get("row", key, version)
+        return np.frombuffer(payload, dtype=np.float64) if payload is not None else None
+
+    def put_matrix_row(self, key: Hashable, costs: Sequence[float], version: str = "") -> None:
+        """Store a row of network costs (inf for unreachable targets)."""
+        self._put("row", key, np.asarray(costs, dtype=np.float64).tobytes(), version)
+
+    def compact(self) -> int:
+        """
+        Delete entries of stale graph versions, then least recently used
+        ones until the store is below its target size.
+
+        A version other than this process's is stale once none of its
+        entries was stored or read for _STALE_VERSION_AGE seconds, so
+        workers that have not reloaded the graph yet, or already run on
+        a newer one, keep their entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        try:
+            connection = self._connection()
+            self._flush_touches(connection)
+            deleted = connection.execute(
+                "DELETE FROM entries WHERE version != ? AND version IN "
+                "(SELECT version FROM entries GROUP BY version HAVING MAX(last_used) < ?)",
+                (self._version, time.time() - _STALE_VERSION_AGE),
+            ).rowcount
+            total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            target = self.max_bytes * _COMPACT_TARGET
+            rows = connection.execute("SELECT key, size FROM entries ORDER BY last_used").fetchall()
+            stale = []
+            for key, size in rows:
+                if total <= target:
+                    break
+                stale.append((key,))
+                total -= size
+            connection.executemany("DELETE FROM entries WHERE key = ?", stale)
+            with self._size_lock:
+                self._bytes = total
+                self._puts_since_sync = 0
+            return deleted + len(stale)
+        except sqlite3.Error:
+            return 0
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        try:
+            self._connection().execute("DELETE FROM entries")
+            with self._size_lock:
+                self._bytes = 0
+            with self._touch_lock:
+                self._touched.clear()
+        except sqlite3.Error:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit and miss counters of this process and the stored size."""
+        lookups = self.hits + self.misses
+        return {
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection of the calling thread (SQLite connections are not shared between threads)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _key_text(kind: str, key: Hashable) -> str:
+        """Stable text key; repr of tuples of strings and numbers is the same in every process."""
+        digest = hashlib.sha1(repr((FORMAT_VERSION, key)).encode("utf-8")).hexdigest()
+        return f"{kind}:{digest}"
+
+    def _get(self, kind: str, key: Hashable, version: str) -> Optional[bytes]:
+        self._version = version
+        key_text = self._key_text(kind, key)
+        try:
+            connection = self._connection()
+            row = connection.execute("SELECT payload FROM entries WHERE key = ? AND version = ?",
+                                     (key_text, version)).fetchone()
+        except sqlite3.Error:
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self._touch_lock:
+            self._touched[key_text] = time.time()
+        return bytes(row[0])
+
+    def _put(self, kind: str, key: Hashable, payload: bytes, version: str) -> None:
+        self._version = version
+        if len(payload) > self.max_bytes:
+            return
+        key_text = self._key_text(kind, key)
+        try:
+            connection = self._connection()
+            # A replaced entry's payload no longer counts towards the size
+            replaced = connection.execute("SELECT size FROM entries WHERE key = ?", (key_text,)).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, kind, version, payload, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key_text, kind, version, payload, len(payload), time.time()),
+            )
+            if len(self._touched) >= _TOUCH_BATCH:
+                self._flush_touches(connection)
+
+            with self._size_lock:
+                self._bytes += len(payload) - (replaced[0] if replaced is not None else 0)
+                self._puts_since_sync += 1
+                if self._puts_since_sync >= _SIZE_SYNC_PUTS:
+                    self._bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+                    self._puts_since_sync = 0
+                over_limit = self._bytes > self.max_bytes
+        except sqlite3.Error:
+            return
+
+        if over_limit and self._compacting.acquire(blocking=False):
+            threading.Thread(target=self._compact_in_background, daemon=True).start()
+
+    def _flush_touches(self, connection: sqlite3.Connection) -> None:
+        """Write the access times collected since the last flush in one statement."""
+        with self._touch_lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            connection.executemany("UPDATE entries SET last_used = MAX(last_used, ?) WHERE key = ?",
+                                   [(used, key_text) for key_text, used in touched.items()])
+
+    def _compact_in_background(self) -> None:
+        try:
+            self.compact()
+        finally:
+            self._compacting.release()
@@ -0,0 +1,191 @@
+"""
+Precomputed routes between the known locations.
+Single responsibility: Build, store and look up every pairwise result of the configured algorithms.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.compact_graph import CompactGraph
+from shared.utils.array_store import load_arrays, save_arrays
+
+# Bump when the stored arrays change so stale tables are rebuilt
+FORMAT_VERSION = 1
+
+_ARRAY_NAMES = ("location_nodes", "entry_offsets", "path_offsets", "path_nodes")
+
+# Finds up to max_paths paths from one node to another
+PathSearch = Callable[[int, int, int], List[List[int]]]
+
+
+def locations_fingerprint(locations: Mapping[str, Tuple[float, float]]) -> str:
+    """Hash of location names and coordinates, used to detect stale tables."""
+    payload = json.dumps(sorted((name, list(point)) for name, point in locations.items()))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class RouteTable:
+    """
+    Results of every algorithm between every ordered pair of locations.
+
+    Entry (algorithm a, start s, goal g) has id (a * L + s) * L + g for L
+    locations; entry_offsets maps it to a range of paths and path_offsets
+    maps each path to its nodes in one flat node array, so a lookup is
+    two dictionary reads and a few slices of memory-mapped arrays.
+    """
+
+    def __init__(self, compact: CompactGraph, algorithms: Sequence[str], names: Sequence[str],
+                 location_nodes: np.ndarray, max_paths: int, entry_offsets: np.ndarray,
+                 path_offsets: np.ndarray, path_nodes: np.ndarray, fingerprint: str = ""):
+        """
+        Initialize from table arrays.
+
+        Args:
+            compact: Compact graph the routes were found on
+            algorithms: Algorithm names, in entry order
+            names: Location names, aligned with location_nodes
+            location_nodes: Snapped node id of each location
+            max_paths: Paths requested per search when the table was built
+            entry_offsets: Path range per entry (len = entries + 1)
+            path_offsets: Node range per path (len = paths + 1)
+            path_nodes: Node ids of all paths, concatenated
+            fingerprint: Fingerprint of the locations the table was built for
+        """
+        self.compact = compact
+        self.algorithms = list(algorithms)
+        self.names = list(names)
+        self.location_nodes = location_nodes
+        self.max_paths = max_paths
+        self.entry_offsets = entry_offsets
+        self.path_offsets = path_offsets
+        self.path_nodes = path_nodes
+        self.fingerprint = fingerprint
+        self._algorithm_index = {name: position for position, name in enumerate(self.algorithms)}
+        self._location_index: Dict[int, int] = {}
+        for position, node in enumerate(location_nodes.tolist()):
+            self._location_index.setdefault(node, position)
+
+    @classmethod
+    def build(cls, compact: CompactGraph, names: Sequence[str], location_nodes: Sequence[int],
+              searches: Mapping[str, PathSearch], max_paths: int = 5, fingerprint: str = "",
+              progress: Optional[Callable[[str, int, int], None]] = None) -> "RouteTable":
+        """
+        Run every search between every ordered pair of locations.
+
+        Args:
+            compact: Compact graph the searches run on
+            names: Location names
+            location_nodes: Snapped node id of each location
+            searches: Algorithm name -> search(start, goal, max_paths)
+            max_paths: Paths requested per search
+            fingerprint: Fingerprint of the locations, recorded with the table
+            progress: Optional callback(algorithm, start index, goal index)
+
+        Returns:
+            Route table
+        """
+        entry_offsets = [0]
+        path_offsets = [0]
+        path_nodes: List[int] = []
+        for algorithm, search in searches.items():
+            for start_index, start in enumerate(location_nodes):
+                for goal_index, goal in enumerate(location_nodes):
+                    if progress is not None:
+                        progress(algorithm, start_index, goal_index)
+                    paths = search(start, goal, max_paths) if start != goal else []
+                    for path in paths[:max_paths]:
+                        path_nodes.extend(path)
+                        path_offsets.append(len(path_nodes))
+                    entry_offsets.append(len(path_offsets) - 1)
+
+        return cls(
+            compact, list(searches), names, np.asarray(location_nodes, dtype=np.int64), max_paths,
+            np.asarray(entry_offsets, dtype=np.int64), np.asarray(path_offsets, dtype=np.int64),
+            np.asarray(path_nodes, dtype=np.int64), fingerprint
+        )
+
+    def save(self, directory: Path) -> None:
+        """Save the table arrays to a cache directory."""
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "graph_version": self.compact.version,
+            "fingerprint": self.fingerprint,
+            "algorithms": self.algorithms,
+            "names": self.names,
+            "max_paths": self.max_paths,
+        }
+        save_arrays(directory, meta, location_nodes=self.location_nodes, entry_offsets=self.entry_offsets,
+                    path_offsets=self.path_offsets, path_nodes=self.path_nodes)
+
+    @classmethod
+    def load(cls, directory: Path, compact: CompactGraph, fingerprint: str = "") -> Optional["RouteTable"]:
+        """
+        Load a table saved with save().
+
+        Args:
+            directory: Cache directory
+            compact: Compact graph the routes must match
+            fingerprint: Fingerprint of the current locations
+
+        Returns:
+            Route table, or None if the artifact is missing or stale
+        """
+        loaded = load_arrays(directory, _ARRAY_NAMES, mmap=True)
+        if loaded is None:
+            return None
+
+        meta, arrays = loaded
+        count = len(arrays["location_nodes"])
+        if (meta.get("format_version") != FORMAT_VERSION
+                or meta.get("graph_version") != compact.version
+                or meta.get("fingerprint") != fingerprint
+                or len(arrays["entry_offsets"]) != len(meta.get("algorithms", [])) * count * count + 1):
+            return None
+
+        return cls(compact, meta["algorithms"], meta["names"], arrays["location_nodes"], meta["max_paths"],
+                   arrays["entry_offsets"], arrays["path_offsets"], arrays["path_nodes"], fingerprint)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the table arrays in bytes."""
+        return self.entry_offsets.nbytes + self.path_offsets.nbytes + self.path_nodes.nbytes
+
+    def has_algorithm(self, algorithm: str) -> bool:
+        """Whether the table holds results of an algorithm."""
+        return algorithm in self._algorithm_index
+
+    def paths(self, algorithm: str, start: int, goal: int, max_paths: int) -> Optional[List[List[int]]]:
+        """
+        Stored result of an algorithm between two location nodes.
+
+        Args:
+            algorithm: Algorithm name
+            start: Start node id
+            goal: Goal node id
+            max_paths: Paths the caller asks for
+
+        Returns:
+            Stored paths (empty if the search found none), or None if the
+            pair is not in the table or max_paths differs from the count the
+            table was built with
+        """
+        # Alternatives depend on the requested count (A* tries one heuristic
+        # weight per alternative), so only the count the table was built with is served
+        if max_paths != self.max_paths:
+            return None
+
+        algorithm_index = self._algorithm_index.get(algorithm)
+        start_index = self._location_index.get(start)
+        goal_index = self._location_index.get(goal)
+        if algorithm_index is None or start_index is None or goal_index is None or start == goal:
+            return None
+
+        count = len(self.location_nodes)
+        entry = (algorithm_index * count + start_index) * count + goal_index
+        first, last = int(self.entry_offsets[entry]), int(self.entry_offsets[entry + 1])
+        offsets = self.path_offsets[first:last + 1].tolist()
+        return [self.path_nodes[offsets[i]:offsets[i + 1]].tolist() for i in range(len(offsets) - 1)]
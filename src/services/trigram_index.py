@@ -0,0 +1,111 @@
+"""
+Trigram inverted index over place names.
+Single responsibility: Fuzzy place-name search with candidate generation and bounded scoring.
+"""
+
+import math
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+import numpy as np
+
+from shared.utils.text import fold_transliteration, normalize_name
+
+
+def name_trigrams(name: str) -> FrozenSet[str]:
+    """
+    Trigrams of a name's folded key, with word boundaries marked.
+
+    Every word is padded ("  piasa ") so that word starts and ends form
+    trigrams of their own and short words still have some.
+
+    Args:
+        name: Place name or query as typed
+
+    Returns:
+        Set of trigrams (empty if the name has no letters or digits)
+    """
+    grams = set()
+    for word in fold_transliteration(normalize_name(name)).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class TrigramIndex:
+    """
+    Inverted index from trigrams to the names containing them.
+
+    A name matches a query when it contains at least a cutoff share of
+    the query's trigrams (so "piaza" finds "Piassa Mall", and any
+    spelling that folds to the same form scores 1.0). Candidates only
+    come from the postings of the query's rarest trigrams: a name that
+    misses all of them cannot reach the cutoff. Only those candidates are
+    scored, so latency follows the rare postings, not the number of names.
+    """
+
+    def __init__(self, names: Sequence[str]):
+        """
+        Build the index.
+
+        Args:
+            names: Place names (duplicates are ignored)
+        """
+        self._names: List[str] = list(dict.fromkeys(names))
+        grams_per_name = [name_trigrams(name) for name in self._names]
+        self._gram_counts = np.array([len(grams) for grams in grams_per_name], dtype=np.int64)
+
+        # Postings are sorted by name id, ready for binary search
+        postings: Dict[str, List[int]] = {}
+        for name_id, grams in enumerate(grams_per_name):
+            for gram in grams:
+                postings.setdefault(gram, []).append(name_id)
+        self._postings: Dict[str, np.ndarray] = {
+            gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def search(self, query: str, limit: int = 10, cutoff: float = 0.6) -> List[Tuple[str, float]]:
+        """
+        Names sharing the most trigrams with a query.
+
+        Args:
+            query: Text as typed (any spelling variant)
+            limit: Maximum number of names
+            cutoff: Minimum share (0-1) of the query's trigrams a name must contain
+
+        Returns:
+            Up to limit (name, score) pairs, best first. The score is the
+            share of query trigrams found; ties go to the name closest in
+            size to the query (higher Jaccard similarity).
+        """
+        query_grams = name_trigrams(query)
+        if not query_grams or limit < 1:
+            return []
+
+        known = sorted((len(self._postings[gram]), gram) for gram in query_grams if gram in self._postings)
+        needed = max(1, math.ceil(cutoff * len(query_grams)))
+        if len(known) < needed:
+            return []
+
+        # A name with `needed` query trigrams has one among any
+        # len(known) - needed + 1 of them, so the rarest ones suffice
+        rare = [self._postings[gram] for _, gram in known[:len(known) - needed + 1]]
+        candidates = np.unique(np.concatenate(rare)) if len(rare) > 1 else rare[0]
+
+        # Count each candidate's query trigrams by binary search in every posting
+        shared = np.zeros(len(candidates), dtype=np.int64)
+        for _, gram in known:
+            posting = self._postings[gram]
+            positions = np.searchsorted(posting, candidates)
+            shared += posting[np.minimum(positions, len(posting) - 1)] == candidates
+
+        size = len(query_grams)
+        keep = shared >= needed
+        candidates, shared = candidates[keep], shared[keep]
+        jaccard = shared / (size + self._gram_counts[candidates] - shared)
+        # Best coverage first, then best Jaccard, then name order
+        order = np.lexsort((candidates, -jaccard, -shared))[:limit]
+        return [(self._names[name_id], count / size)
+                for name_id, count in zip(candidates[order].tolist(), shared[order].tolist())]
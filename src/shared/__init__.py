@@ -13,6 +13,7 @@ from .constraints.same_location_constraint import SameLocationConstraint
 # Calculators
 from .calculators.generic_path_calculator import GenericPathCalculator
 from .calculators.path_calculator import PathCalculator
+from .calculators.path_cost_engine import PathCostEngine, PathCosts
 
 # Utils
 from .utils.constraint_validator import ConstraintValidator
@@ -22,7 +23,7 @@ __all__ = [
     "NodeLimitConstraint", "DistanceConstraint", "SameLocationConstraint",
     
     # Calculators
-    "GenericPathCalculator", "PathCalculator",
+    "GenericPathCalculator", "PathCalculator", "PathCostEngine", "PathCosts",
     
     # Utils
     "ConstraintValidator",
@@ -3,14 +3,37 @@ Pure generic path calculator implementation.
 Completely domain-agnostic and reusable for any graph type.
 """
 
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+import numpy as np
 
 from core.graph_interface import GraphInterface, PathCalculatorInterface
+from shared.calculators.path_cost_engine import PathCostEngine, PathCosts
+
+if TYPE_CHECKING:
+    from core.compact_graph import CompactGraph
+
+# Cost engines kept at once (one per compact graph)
+_MAX_ENGINES = 8
+
+# Gives the per-arc travel times in seconds of a compact graph, or None if it has none
+ArcTimeSource = Callable[["CompactGraph"], Optional[np.ndarray]]
 
 
 class GenericPathCalculator(PathCalculatorInterface):
     """Generic path calculator implementation."""
     
+    def __init__(self, arc_times: Optional[ArcTimeSource] = None):
+        """
+        Initialize with no cost engines; one is built per compact graph on first use.
+        
+        Args:
+            arc_times: Optional source of per-arc travel times; paths on graphs
+                it has times for get times summed along their arcs
+        """
+        self.arc_times = arc_times
+        self._engines: Dict[int, PathCostEngine] = {}
+    
     def calculate_path_cost(self, path: List[int], graph: GraphInterface) -> float:
         """
         Calculate total cost of a path.
@@ -22,11 +45,19 @@ class GenericPathCalculator(PathCalculatorInterface):
         Returns:
             Total cost of the path
         """
+        engine = self._engine_for(graph)
+        if engine is not None:
+            return engine.path_cost(path)
+        
         total_cost = 0.0
         
         for i in range(len(path) - 1):
             try:
                 edge_data = graph.get_edge_data(path[i], path[i+1])
+                if (edge_data and 'length' not in edge_data
+                        and all(isinstance(d, dict) for d in edge_data.values())):
+                    # MultiGraph data is keyed by parallel edge; the shortest one counts
+                    edge_data = min(edge_data.values(), key=lambda d: float(d.get('length', 1.0)))
                 if edge_data and 'length' in edge_data:
                     total_cost += edge_data['length']
                 else:
@@ -37,6 +68,20 @@ class GenericPathCalculator(PathCalculatorInterface):
                 
         return total_cost
     
+    def calculate_path_time(self, path: List[int], graph: GraphInterface) -> Optional[float]:
+        """
+        Calculate the travel time of a path from per-arc travel times.
+        
+        Args:
+            path: List of node IDs
+            graph: Graph implementation
+            
+        Returns:
+            Travel time in seconds, or None if the graph has no arc times
+        """
+        engine = self._engine_for(graph)
+        return engine.path_time(path) if engine is not None else None
+    
     def paths_are_similar(self, path1: List[int], path2: List[int], threshold: float = 0.8) -> bool:
         """
         Check if two paths are essentially the same based on node overlap.
@@ -68,18 +113,64 @@ class GenericPathCalculator(PathCalculatorInterface):
         Returns:
             Dictionary with path statistics
         """
-        if not paths:
-            return {"count": 0, "avg_cost": 0, "avg_steps": 0}
+        return self.evaluate_paths(paths, graph).statistics()
+    
+    def calculate_path_costs(self, paths: List[List[int]], graph: GraphInterface) -> List[float]:
+        """
+        Calculate the total cost of many paths at once.
+        
+        Args:
+            paths: List of paths
+            graph: Graph implementation
+            
+        Returns:
+            Cost per path, in order
+        """
+        return self.evaluate_paths(paths, graph).costs.tolist()
+    
+    def evaluate_paths(self, paths: List[List[int]], graph: GraphInterface,
+                       average_speed_m_per_s: Optional[float] = None) -> PathCosts:
+        """
+        Get costs, steps and optionally travel times of many paths in one call.
         
-        costs = [self.calculate_path_cost(path, graph) for path in paths]
-        steps = [len(path) - 1 for path in paths]  # steps = nodes - 1
+        Graphs with a compact view are costed in one vectorized pass;
+        others fall back to calculate_path_cost per path. Times are summed
+        from per-arc travel times when the graph has them.
+        
+        Args:
+            paths: List of paths
+            graph: Graph implementation
+            average_speed_m_per_s: Flat travel speed for times of graphs
+                without arc times (None skips times)
+            
+        Returns:
+            Per-path costs, steps and times; statistics() summarizes them
+        """
+        engine = self._engine_for(graph)
+        if engine is not None:
+            return engine.evaluate(paths, average_speed_m_per_s)
+        
+        costs = np.array([self.calculate_path_cost(path, graph) for path in paths], dtype=np.float64)
+        steps = np.array([len(path) - 1 for path in paths], dtype=np.int64)  # steps = nodes - 1
+        times = None
+        if average_speed_m_per_s is not None and average_speed_m_per_s > 0:
+            times = costs / average_speed_m_per_s
+        return PathCosts(costs, steps, times)
+    
+    def _engine_for(self, graph: GraphInterface) -> Optional[PathCostEngine]:
+        """Get the cost engine of a graph's compact view, building it on first use."""
+        get_compact_graph = getattr(graph, "get_compact_graph", None)
+        compact = get_compact_graph() if get_compact_graph is not None else None
+        if compact is None:
+            return None
         
-        return {
-            "count": len(paths),
-            "avg_cost": sum(costs) / len(costs),
-            "avg_steps": sum(steps) / len(steps),
-            "min_cost": min(costs),
-            "max_cost": max(costs),
-            "min_steps": min(steps),
-            "max_steps": max(steps)
-        }
+        arc_times = self.arc_times(compact) if self.arc_times is not None else None
+        key = id(compact)
+        engine = self._engines.get(key)
+        if engine is None or engine.compact is not compact or engine.arc_times is not arc_times:
+            if len(self._engines) >= _MAX_ENGINES:
+                # Engines of replaced graphs or throwaway subgraphs
+                self._engines.clear()
+            engine = PathCostEngine.for_graph(graph, arc_times)
+            self._engines[key] = engine
+        return engine
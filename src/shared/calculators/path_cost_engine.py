@@ -0,0 +1,190 @@
+"""
+Batch path costing on the compact graph.
+Single responsibility: Turn many node paths into arc ids at once and sum per-arc costs with NumPy.
+"""
+
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    # core imports shared at load time, so the compact graph is only imported for annotations
+    from core.compact_graph import CompactGraph
+
+# Cost of a hop whose edge carries no length, or of two nodes that are not adjacent
+FALLBACK_HOP_COST = 1.0
+
+
+@dataclass(frozen=True)
+class PathCosts:
+    """Cost, hop count and optional travel time of every path in a batch."""
+
+    costs: np.ndarray
+    steps: np.ndarray
+    times: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.costs)
+
+    def statistics(self) -> Dict[str, Any]:
+        """Summary in the format of PathCalculatorInterface.get_path_statistics."""
+        if len(self.costs) == 0:
+            return {"count": 0, "avg_cost": 0, "avg_steps": 0}
+
+        return {
+            "count": len(self.costs),
+            "avg_cost": float(self.costs.mean()),
+            "avg_steps": float(self.steps.mean()),
+            "min_cost": float(self.costs.min()),
+            "max_cost": float(self.costs.max()),
+            "min_steps": int(self.steps.min()),
+            "max_steps": int(self.steps.max()),
+        }
+
+
+class PathCostEngine:
+    """
+    Costs paths by summing per-arc cost and travel time arrays.
+
+    All paths of a batch are concatenated into one node array, mapped to
+    dense ids with one binary search and to arc ids with one more (see
+    CompactGraph.arcs_along), so costing a batch is a handful of NumPy
+    calls instead of an edge lookup per hop. Hops between nodes that are
+    not adjacent, or not in the graph, cost FALLBACK_HOP_COST like in
+    GenericPathCalculator (and take no time).
+    """
+
+    def __init__(self, compact: "CompactGraph", arc_costs: np.ndarray,
+                 arc_times: Optional[np.ndarray] = None):
+        """
+        Initialize with per-arc costs.
+
+        Args:
+            compact: Compact graph the paths run on
+            arc_costs: Cost of each arc, aligned with the compact graph's arcs
+            arc_times: Optional travel time of each arc in seconds
+        """
+        self.compact = compact
+        self.arc_costs = np.asarray(arc_costs, dtype=np.float64)
+        self.arc_times = np.asanyarray(arc_times, dtype=np.float64) if arc_times is not None else None
+
+    @classmethod
+    def for_graph(cls, graph: Any, arc_times: Optional[np.ndarray] = None) -> Optional["PathCostEngine"]:
+        """
+        Build an engine that costs paths on a graph by edge length.
+
+        Lengths come from the compact view, which keeps the shortest of
+        parallel edges, so multigraphs (whose edge data is keyed by
+        parallel edge) are costed in meters like simple graphs.
+
+        Args:
+            graph: Graph implementation, ideally backed by a compact graph
+            arc_times: Optional travel time of each arc in seconds
+
+        Returns:
+            Engine, or None if the graph has no compact view
+        """
+        get_compact_graph = getattr(graph, "get_compact_graph", None)
+        compact = get_compact_graph() if get_compact_graph is not None else None
+        if compact is None:
+            return None
+        return cls(compact, compact.length, arc_times)
+
+    def hop_arcs(self, paths: Sequence[Sequence[int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Arc id of every hop of every path.
+
+        Args:
+            paths: Original node id paths
+
+        Returns:
+            (arcs, offsets): arc id per position of the concatenated paths
+            (-1 where the next node is not adjacent or the path ends there)
+            and the start of each path in that array (len = paths + 1)
+        """
+        lengths = np.fromiter((len(path) for path in paths), dtype=np.int64, count=len(paths))
+        offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        nodes = np.fromiter(chain.from_iterable(paths), dtype=np.int64, count=int(offsets[-1]))
+
+        arcs = np.full(len(nodes), -1, dtype=np.int64)
+        arcs[:-1] = self._arcs_between(nodes)
+        # Hops across path boundaries have no arc
+        arcs[offsets[1:][lengths > 0] - 1] = -1
+        return arcs, offsets
+
+    def path_cost(self, path: Sequence[int]) -> float:
+        """
+        Cost of a single path.
+
+        Skips the batch bookkeeping of evaluate(), which dominates for one
+        path; used when constraints validate paths one at a time.
+        """
+        if len(path) < 2:
+            return 0.0
+        arcs = self._arcs_between(np.fromiter(path, dtype=np.int64, count=len(path)))
+        on_arc = arcs >= 0
+        return float(self.arc_costs[arcs[on_arc]].sum()) + FALLBACK_HOP_COST * (len(arcs) - int(on_arc.sum()))
+
+    def path_time(self, path: Sequence[int]) -> Optional[float]:
+        """Travel time of a single path in seconds, or None without arc times."""
+        if self.arc_times is None:
+            return None
+        if len(path) < 2:
+            return 0.0
+        arcs = self._arcs_between(np.fromiter(path, dtype=np.int64, count=len(path)))
+        return float(self.arc_times[arcs[arcs >= 0]].sum())
+
+    def evaluate(self, paths: Sequence[Sequence[int]],
+                 average_speed_m_per_s: Optional[float] = None) -> PathCosts:
+        """
+        Cost, hop count and travel time of many paths in one call.
+
+        Args:
+            paths: Original node id paths
+            average_speed_m_per_s: Flat travel speed for times when the
+                engine has no arc times (None skips times)
+
+        Returns:
+            Per-path costs, steps and, with arc times or a positive speed,
+            times in seconds
+        """
+        arcs, offsets = self.hop_arcs(paths)
+        on_arc = arcs >= 0
+        costs = self._sum_per_path(arcs, on_arc, offsets, self.arc_costs, FALLBACK_HOP_COST)
+        steps = offsets[1:] - offsets[:-1] - 1
+
+        times = None
+        if self.arc_times is not None:
+            times = self._sum_per_path(arcs, on_arc, offsets, self.arc_times, 0.0)
+        elif average_speed_m_per_s is not None and average_speed_m_per_s > 0:
+            times = costs / average_speed_m_per_s
+        return PathCosts(costs, steps, times)
+
+    @staticmethod
+    def _sum_per_path(arcs: np.ndarray, on_arc: np.ndarray, offsets: np.ndarray,
+                      arc_values: np.ndarray, fallback: float) -> np.ndarray:
+        """Sum of an arc array along every path, with fallback for hops without an arc."""
+        hop_values = np.full(len(arcs), fallback, dtype=np.float64)
+        hop_values[on_arc] = arc_values[arcs[on_arc]]
+        # A path's last position is not a hop
+        hop_values[offsets[1:][offsets[1:] > offsets[:-1]] - 1] = 0.0
+
+        cumulative = np.zeros(len(hop_values) + 1, dtype=np.float64)
+        np.cumsum(hop_values, out=cumulative[1:])
+        return cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+
+    def _arcs_between(self, nodes: np.ndarray) -> np.ndarray:
+        """Arc id between each pair of consecutive original node ids (-1 if there is none)."""
+        compact = self.compact
+        if len(nodes) < 2 or compact.num_nodes == 0:
+            return np.full(max(len(nodes) - 1, 0), -1, dtype=np.int64)
+
+        dense = np.minimum(np.searchsorted(compact.node_ids, nodes), compact.num_nodes - 1)
+        known = compact.node_ids[dense] == nodes
+        arcs = compact.arcs_along(dense)
+        # Hops touching nodes outside the graph have no arc
+        arcs[~(known[:-1] & known[1:])] = -1
+        return arcs
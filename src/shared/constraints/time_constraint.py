@@ -3,7 +3,7 @@ Time constraint implementation.
 Generic constraint that can work with any graph and path calculator.
 """
 
-from typing import List
+from typing import List, Optional
 
 from core.graph_interface import GraphInterface, ConstraintInterface, PathCalculatorInterface
 
@@ -16,6 +16,8 @@ class TimeConstraint(ConstraintInterface):
         max_time_seconds: float,
         path_calculator: PathCalculatorInterface,
         average_speed_m_per_s: float,
+        speed_profiles=None,
+        departure_time: Optional[float] = None,
     ):
         """
         Initialize with maximum allowed time and speed model.
@@ -23,11 +25,16 @@ class TimeConstraint(ConstraintInterface):
         Args:
             max_time_seconds: Maximum allowed travel time (in seconds)
             path_calculator: Calculator to compute path distance (in meters)
-            average_speed_m_per_s: Assumed average travel speed in m/s
+            average_speed_m_per_s: Assumed average travel speed in m/s, used when
+                the path calculator has no per-arc travel times
+            speed_profiles: Optional SpeedProfileTable for time-dependent estimates
+            departure_time: Departure time (seconds after midnight) used with speed_profiles
         """
         self.max_time_seconds = max_time_seconds
         self.path_calculator = path_calculator
         self.average_speed_m_per_s = average_speed_m_per_s
+        self.speed_profiles = speed_profiles
+        self.departure_time = departure_time
 
     def validate(self, path: List[int], graph: GraphInterface) -> tuple[bool, str]:
         """
@@ -36,14 +43,11 @@ class TimeConstraint(ConstraintInterface):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if self.average_speed_m_per_s <= 0:
+        estimated_time_s = self._estimate_time(path, graph)
+        if estimated_time_s is None:
             # Degenerate speed, treat as no time constraint
             return True, ""
 
-        distance_m = self.path_calculator.calculate_path_cost(path, graph)
-        # Convert distance and speed to time
-        estimated_time_s = distance_m / self.average_speed_m_per_s
-
         if estimated_time_s > self.max_time_seconds:
             # Present message in minutes for easier interpretation
             est_min = estimated_time_s / 60.0
@@ -55,4 +59,30 @@ class TimeConstraint(ConstraintInterface):
 
         return True, ""
 
+    def _estimate_time(self, path: List[int], graph: GraphInterface) -> Optional[float]:
+        """
+        Estimate the travel time of a path in seconds.
+
+        Uses the hourly speed profiles when a departure time is known, then
+        the path calculator's per-arc travel times if it has them, and the
+        flat average speed otherwise.
+        """
+        if self.speed_profiles is not None and self.departure_time is not None:
+            try:
+                return self.speed_profiles.path_travel_time(path, self.departure_time)
+            except (KeyError, ValueError):
+                # Path is not on the profiled graph, use the flat estimate
+                pass
+
+        calculate_path_time = getattr(self.path_calculator, "calculate_path_time", None)
+        if calculate_path_time is not None:
+            travel_time = calculate_path_time(path, graph)
+            if travel_time is not None:
+                return travel_time
+
+        if self.average_speed_m_per_s <= 0:
+            return None
 
+        distance_m = self.path_calculator.calculate_path_cost(path, graph)
+        # Convert distance and speed to time
+        return distance_m / self.average_speed_m_per_s
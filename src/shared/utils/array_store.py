@@ -0,0 +1,102 @@
+"""
+On-disk storage for precomputed NumPy arrays.
+Single responsibility: Saving and loading directories of .npy files with metadata.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+META_FILE = "meta.json"
+
+
+def save_arrays(directory: Path, meta: Dict[str, Any], **arrays: np.ndarray) -> None:
+    """
+    Save arrays as individual .npy files next to a metadata file.
+    
+    The metadata file is written last, so a directory without it is
+    treated as incomplete and rebuilt on the next load.
+    
+    Args:
+        directory: Target directory (created if missing)
+        meta: JSON-serializable metadata (versions, fingerprints, ...)
+        **arrays: Arrays to store, keyed by file name
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    
+    meta_path = directory / META_FILE
+    if meta_path.exists():
+        meta_path.unlink()
+    
+    for name, array in arrays.items():
+        np.save(directory / f"{name}.npy", np.ascontiguousarray(array))
+    
+    with meta_path.open("w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+
+def read_meta(directory: Path) -> Optional[Dict[str, Any]]:
+    """Read the metadata of an array directory, or None if it is missing."""
+    meta_path = Path(directory) / META_FILE
+    if not meta_path.exists():
+        return None
+    try:
+        with meta_path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def load_arrays(directory: Path, names: Iterable[str],
+                mmap: bool = False) -> Optional[Tuple[Dict[str, Any], Dict[str, np.ndarray]]]:
+    """
+    Load arrays previously stored with save_arrays.
+    
+    Args:
+        directory: Source directory
+        names: Array names to load
+        mmap: Memory-map the arrays read-only instead of reading them
+        
+    Returns:
+        Tuple of (metadata, arrays), or None if anything is missing
+    """
+    directory = Path(directory)
+    meta = read_meta(directory)
+    if meta is None:
+        return None
+    
+    arrays = {}
+    try:
+        for name in names:
+            arrays[name] = np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None)
+    except (OSError, ValueError):
+        return None
+    
+    return meta, arrays
+
+
+def encode_strings(strings: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack strings into two arrays for save_arrays.
+    
+    Args:
+        strings: Strings to pack
+        
+    Returns:
+        Tuple of (offsets as int64, one UTF-8 blob as uint8); string i is
+        blob[offsets[i]:offsets[i + 1]]
+    """
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def decode_strings(offsets: np.ndarray, blob: np.ndarray) -> List[str]:
+    """Unpack strings packed with encode_strings."""
+    data = blob.tobytes()
+    bounds = offsets.tolist()
+    return [data[bounds[i]:bounds[i + 1]].decode("utf-8") for i in range(len(bounds) - 1)]
@@ -0,0 +1,125 @@
+"""
+Geographic helper functions.
+Single responsibility: Distance computations and projections of geographic coordinates.
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+# Mean Earth radius in meters (same value OSMnx uses for edge lengths)
+EARTH_RADIUS_M = 6371009.0
+
+# UTM zone covering Addis Ababa (EPSG:32637, central meridian 39°E)
+ADDIS_UTM_ZONE = 37
+
+# WGS84 ellipsoid and UTM constants
+_WGS84_A = 6378137.0
+_WGS84_F = 1.0 / 298.257223563
+_UTM_K0 = 0.9996
+_UTM_FALSE_EASTING = 500000.0
+_UTM_FALSE_NORTHING_SOUTH = 10000000.0
+
+# Krüger series terms of the WGS84 ellipsoid
+_KRUEGER_N = _WGS84_F / (2.0 - _WGS84_F)
+_KRUEGER_RADIUS = _WGS84_A / (1.0 + _KRUEGER_N) * (1.0 + _KRUEGER_N ** 2 / 4.0 + _KRUEGER_N ** 4 / 64.0)
+_KRUEGER_ALPHA = (
+    _KRUEGER_N / 2.0 - 2.0 * _KRUEGER_N ** 2 / 3.0 + 5.0 * _KRUEGER_N ** 3 / 16.0,
+    13.0 * _KRUEGER_N ** 2 / 48.0 - 3.0 * _KRUEGER_N ** 3 / 5.0,
+    61.0 * _KRUEGER_N ** 3 / 240.0,
+)
+_KRUEGER_ECCENTRICITY = 2.0 * math.sqrt(_KRUEGER_N) / (1.0 + _KRUEGER_N)
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great-circle distance between two points in meters.
+    
+    Args:
+        lat1: Latitude of the first point
+        lon1: Longitude of the first point
+        lat2: Latitude of the second point
+        lon2: Longitude of the second point
+        
+    Returns:
+        Distance in meters
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def utm_project(lat, lon, zone: int = ADDIS_UTM_ZONE,
+                northern: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Project WGS84 coordinates to UTM easting/northing in meters.
+    
+    Uses the Krüger series to third order, which is accurate to well under
+    a millimeter inside the zone.
+    
+    Args:
+        lat: Latitudes in degrees (scalar or array)
+        lon: Longitudes in degrees (scalar or array)
+        zone: UTM zone number
+        northern: Northern hemisphere (False adds the southern false northing)
+        
+    Returns:
+        Tuple of (easting, northing) float64 arrays
+    """
+    phi = np.radians(np.asarray(lat, dtype=np.float64))
+    d_lambda = np.radians(np.asarray(lon, dtype=np.float64)) - math.radians(zone * 6 - 183)
+    
+    sin_phi = np.sin(phi)
+    t = np.sinh(np.arctanh(sin_phi) - _KRUEGER_ECCENTRICITY * np.arctanh(_KRUEGER_ECCENTRICITY * sin_phi))
+    xi = np.arctan2(t, np.cos(d_lambda))
+    eta = np.arctanh(np.sin(d_lambda) / np.sqrt(1.0 + t ** 2))
+    
+    easting_sum = eta.copy()
+    northing_sum = xi.copy()
+    for j, alpha_j in enumerate(_KRUEGER_ALPHA, start=1):
+        easting_sum += alpha_j * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+        northing_sum += alpha_j * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+    
+    easting = _UTM_FALSE_EASTING + _UTM_K0 * _KRUEGER_RADIUS * easting_sum
+    northing = _UTM_K0 * _KRUEGER_RADIUS * northing_sum
+    if not northern:
+        northing = northing + _UTM_FALSE_NORTHING_SOUTH
+    return easting, northing
+
+
+def utm_project_point(lat: float, lon: float, zone: int = ADDIS_UTM_ZONE,
+                      northern: bool = True) -> Tuple[float, float]:
+    """
+    Project a single WGS84 coordinate to UTM easting/northing in meters.
+    
+    Same series as utm_project, in scalar math so per-query snapping does
+    not pay NumPy's per-call overhead.
+    
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+        zone: UTM zone number
+        northern: Northern hemisphere (False adds the southern false northing)
+        
+    Returns:
+        Tuple of (easting, northing)
+    """
+    sin_phi = math.sin(math.radians(lat))
+    d_lambda = math.radians(lon) - math.radians(zone * 6 - 183)
+    t = math.sinh(math.atanh(sin_phi) - _KRUEGER_ECCENTRICITY * math.atanh(_KRUEGER_ECCENTRICITY * sin_phi))
+    xi = math.atan2(t, math.cos(d_lambda))
+    eta = math.atanh(math.sin(d_lambda) / math.sqrt(1.0 + t * t))
+    
+    easting_sum, northing_sum = eta, xi
+    for j, alpha_j in enumerate(_KRUEGER_ALPHA, start=1):
+        easting_sum += alpha_j * math.cos(2 * j * xi) * math.sinh(2 * j * eta)
+        northing_sum += alpha_j * math.sin(2 * j * xi) * math.cosh(2 * j * eta)
+    
+    easting = _UTM_FALSE_EASTING + _UTM_K0 * _KRUEGER_RADIUS * easting_sum
+    northing = _UTM_K0 * _KRUEGER_RADIUS * northing_sum
+    if not northern:
+        northing += _UTM_FALSE_NORTHING_SOUTH
+    return easting, northing
@@ -0,0 +1,251 @@
+"""
+Priority queues for Dijkstra-family searches over dense node ids.
+Single responsibility: Interchangeable min-queues (binary heap, indexed heap, radix heap).
+"""
+
+import heapq
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple, Type
+
+# Radix heap keys are integers: costs are stored in 1/100 units (centimeters
+# for length weights, centiseconds for travel-time weights)
+RADIX_KEYS_PER_UNIT = 100
+
+
+class PriorityQueue(ABC):
+    """
+    Min-queue of dense node ids keyed by cost.
+
+    push() either inserts a node or lowers its priority. Queues that cannot
+    lower a priority in place keep the old entry, so a node can be popped
+    more than once; searches skip nodes that are already settled.
+    """
+
+    @abstractmethod
+    def push(self, item: int, priority: float) -> None:
+        """Insert an item, or lower its priority if it is already queued."""
+
+    @abstractmethod
+    def pop(self) -> Tuple[float, int]:
+        """
+        Remove the item with the lowest priority.
+
+        Returns:
+            Tuple of (priority, item)
+
+        Raises:
+            IndexError: If the queue is empty
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all items, keeping allocated storage for reuse."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of queued entries (including stale duplicates)."""
+
+
+class HeapqQueue(PriorityQueue):
+    """Binary heap on heapq; decrease-key pushes a duplicate entry."""
+
+    def __init__(self, capacity: int = 0):
+        self._heap: List[Tuple[float, int]] = []
+
+    def push(self, item: int, priority: float) -> None:
+        heapq.heappush(self._heap, (priority, item))
+
+    def pop(self) -> Tuple[float, int]:
+        return heapq.heappop(self._heap)
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class IndexedBinaryHeap(PriorityQueue):
+    """
+    Binary heap with a position index for true decrease-key.
+
+    Every item is queued at most once, so the heap never grows beyond the
+    number of labelled nodes. The position index is sized to the graph
+    once; clear() only resets the entries still queued.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize for items 0..capacity-1.
+
+        Args:
+            capacity: Number of dense node ids
+        """
+        self._items: List[int] = []
+        self._priorities: List[float] = []
+        self._position: List[int] = [-1] * capacity
+
+    def push(self, item: int, priority: float) -> None:
+        position = self._position[item]
+        if position < 0:
+            position = len(self._items)
+            self._items.append(item)
+            self._priorities.append(priority)
+        elif priority < self._priorities[position]:
+            self._priorities[position] = priority
+        else:
+            return
+        self._sift_up(position, item, priority)
+
+    def pop(self) -> Tuple[float, int]:
+        items, priorities, position = self._items, self._priorities, self._position
+        if not items:
+            raise IndexError("pop from empty priority queue")
+
+        top_item, top_priority = items[0], priorities[0]
+        position[top_item] = -1
+        last_item, last_priority = items.pop(), priorities.pop()
+        if items:
+            self._sift_down(0, last_item, last_priority)
+        return top_priority, top_item
+
+    def clear(self) -> None:
+        position = self._position
+        for item in self._items:
+            position[item] = -1
+        self._items.clear()
+        self._priorities.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _sift_up(self, index: int, item: int, priority: float) -> None:
+        """Move an entry towards the root until its parent is not larger."""
+        items, priorities, position = self._items, self._priorities, self._position
+        while index > 0:
+            parent = (index - 1) >> 1
+            if priorities[parent] <= priority:
+                break
+            items[index] = items[parent]
+            priorities[index] = priorities[parent]
+            position[items[index]] = index
+            index = parent
+        items[index] = item
+        priorities[index] = priority
+        position[item] = index
+
+    def _sift_down(self, index: int, item: int, priority: float) -> None:
+        """Place an entry at index and move it down until its children are not smaller."""
+        items, priorities, position = self._items, self._priorities, self._position
+        size = len(items)
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priorities[child] >= priority:
+                break
+            items[index] = items[child]
+            priorities[index] = priorities[child]
+            position[items[index]] = index
+            index = child
+        items[index] = item
+        priorities[index] = priority
+        position[item] = index
+
+
+class RadixHeap(PriorityQueue):
+    """
+    Radix heap for monotone integer keys.
+
+    Priorities are floored to integer keys of 1/RADIX_KEYS_PER_UNIT. Bucket
+    i holds keys whose highest bit differing from the last popped key is
+    bit i - 1, so each entry moves to a lower bucket at most once per bit
+    and pushes are O(1). This requires monotone pops, as in Dijkstra and in
+    A* with a consistent heuristic; a key below the last popped key is
+    clamped to it. Ordering is exact only to the key resolution, and
+    decrease-key pushes a duplicate entry.
+    """
+
+    _NUM_BUCKETS = 65
+
+    def __init__(self, capacity: int = 0, keys_per_unit: int = RADIX_KEYS_PER_UNIT):
+        """
+        Initialize an empty heap.
+
+        Args:
+            capacity: Unused, accepted for a uniform constructor
+            keys_per_unit: Integer keys per unit of priority
+        """
+        self.keys_per_unit = keys_per_unit
+        self._buckets: List[List[Tuple[int, int]]] = [[] for _ in range(self._NUM_BUCKETS)]
+        self._last = 0
+        self._size = 0
+
+    def push(self, item: int, priority: float) -> None:
+        key = int(priority * self.keys_per_unit)
+        last = self._last
+        if key < last:
+            key = last
+        self._buckets[(key ^ last).bit_length()].append((key, item))
+        self._size += 1
+
+    def pop(self) -> Tuple[float, int]:
+        if not self._size:
+            raise IndexError("pop from empty priority queue")
+
+        buckets = self._buckets
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            # Redistribute around the new minimum; every entry lands in a lower bucket
+            entries = buckets[index]
+            buckets[index] = []
+            last = min(entries)[0]
+            self._last = last
+            for entry in entries:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+        key, item = buckets[0].pop()
+        self._size -= 1
+        return key / self.keys_per_unit, item
+
+    def clear(self) -> None:
+        for bucket in self._buckets:
+            bucket.clear()
+        self._last = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+
+PRIORITY_QUEUES: Dict[str, Type[PriorityQueue]] = {
+    "heapq": HeapqQueue,
+    "indexed": IndexedBinaryHeap,
+    "radix": RadixHeap,
+}
+
+
+def create_priority_queue(kind: str, capacity: int) -> PriorityQueue:
+    """
+    Create a priority queue by name.
+
+    Args:
+        kind: One of PRIORITY_QUEUES ("heapq", "indexed", "radix")
+        capacity: Number of dense node ids the queue may hold
+
+    Returns:
+        Empty priority queue
+
+    Raises:
+        ValueError: If kind is unknown
+    """
+    try:
+        queue_class = PRIORITY_QUEUES[kind]
+    except KeyError:
+        raise ValueError(f"Unknown priority queue '{kind}', "
+                         f"expected one of {sorted(PRIORITY_QUEUES)}") from None
+    return queue_class(capacity)
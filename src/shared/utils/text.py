@@ -0,0 +1,76 @@
+"""
+Place-name normalization helpers.
+Single responsibility: Canonical search keys for place names and their word boundaries.
+"""
+
+import re
+import unicodedata
+from typing import List
+
+# Anything that is not a letter, digit or mark separates words
+_SEPARATORS = re.compile(r"[^\w]+|_+")
+
+# Spelling variants of romanized Amharic (and Italian-era) names, applied in order
+# after doubled letters are collapsed: Piassa / Piazza / Piaza all fold to "piasa"
+_DOUBLED = re.compile(r"([a-z])\1+")
+_TRANSLITERATIONS = (
+    (re.compile(r"ph"), "f"),
+    (re.compile(r"kh|ck|q"), "k"),
+    (re.compile(r"t?z|ts"), "s"),
+    (re.compile(r"ie"), "e"),
+    (re.compile(r"ou"), "u"),
+    (re.compile(r"ny"), "gn"),
+)
+
+
+def normalize_name(name: str) -> str:
+    """
+    Canonical search key of a place name.
+
+    Case-folds, strips Latin accents (so "Café" matches "cafe"), turns
+    punctuation into spaces ("Arat-Kilo" matches "arat kilo") and
+    collapses whitespace. Ethiopic and other scripts are kept as they are.
+
+    Args:
+        name: Place name as written
+
+    Returns:
+        Normalized key (empty if the name has no letters or digits)
+    """
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(_SEPARATORS.sub(" ", stripped).split())
+
+
+def word_starts(key: str) -> List[int]:
+    """
+    Offsets of the words of a normalized key.
+
+    Args:
+        key: Key returned by normalize_name
+
+    Returns:
+        Start offset of every word, beginning with 0 for a non-empty key
+    """
+    if not key:
+        return []
+    return [0] + [index + 1 for index, char in enumerate(key) if char == " "]
+
+
+def fold_transliteration(key: str) -> str:
+    """
+    Fold spelling variants of romanized names onto one form.
+
+    Meant for fuzzy matching keys only: the folding is lossy (z and s
+    become the same letter), so exact lookups keep using normalize_name.
+
+    Args:
+        key: Key returned by normalize_name
+
+    Returns:
+        Folded key
+    """
+    folded = _DOUBLED.sub(r"\1", key)
+    for pattern, replacement in _TRANSLITERATIONS:
+        folded = pattern.sub(replacement, folded)
+    return folded
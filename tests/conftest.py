@@ -0,0 +1,96 @@
+"""
+Shared fixtures for the test suite.
+Single responsibility: Put src on the import path and provide small synthetic road grids.
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+import networkx as nx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# core first: services and algorithms import each other through it
+import core  # noqa: E402,F401
+from core.compact_graph import CompactGraph  # noqa: E402
+
+HIGHWAYS = ("residential", "primary", "secondary", "tertiary")
+WORDS = ("Bole", "Piassa", "Merkato", "Arat", "Kilo", "Sidist", "Megenagna", "Kazanchis", "Medhane",
+         "Alem", "Saris", "Gerji", "Lideta", "Café", "Hotel", "Mall", "School", "Church", "Arat-Kilo")
+
+
+def road_grid(size: int = 12, seed: int = 1, multi: bool = False) -> nx.Graph:
+    """
+    Jittered square street grid around Addis Ababa with OSMnx-style attributes.
+
+    Nodes are about 110 m apart; edge lengths are the straight-line
+    distance stretched by up to 30 %, so shortest paths are not trivial.
+    With multi, the grid is a MultiGraph (like OSMnx graphs) and every
+    third edge gets a longer parallel edge.
+    """
+    rng = random.Random(seed)
+    graph = nx.MultiGraph() if multi else nx.Graph()
+    for row in range(size):
+        for column in range(size):
+            graph.add_node(1000 + row * size + column,
+                           y=9.0 + row * 0.001 + rng.uniform(-2e-4, 2e-4),
+                           x=38.75 + column * 0.001 + rng.uniform(-2e-4, 2e-4))
+    for row in range(size):
+        for column in range(size):
+            node = 1000 + row * size + column
+            for other_row, other_column in ((row, column + 1), (row + 1, column)):
+                if other_row < size and other_column < size:
+                    other = 1000 + other_row * size + other_column
+                    a, b = graph.nodes[node], graph.nodes[other]
+                    straight = math.hypot((a["y"] - b["y"]) * 110574, (a["x"] - b["x"]) * 109951)
+                    graph.add_edge(node, other, length=straight * rng.uniform(1.0, 1.3),
+                                   highway=rng.choice(HIGHWAYS), name=f"Street {row}")
+                    if multi and (node + other) % 3 == 0:
+                        graph.add_edge(node, other, length=straight * 1.5, highway="residential")
+    return graph
+
+
+class RecordingAlgorithm:
+    """Pathfinding algorithm that searches with NetworkX and records every call."""
+
+    def __init__(self, graph: nx.Graph):
+        self.graph = graph
+        self.calls = []
+
+    def find_path(self, start, goal, graph, constraints=None, max_paths=None):
+        self.calls.append((start, goal, max_paths))
+        return [nx.shortest_path(self.graph, start, goal)]
+
+
+@pytest.fixture
+def grid_graph() -> nx.Graph:
+    return road_grid()
+
+
+@pytest.fixture
+def multi_grid_graph() -> nx.MultiGraph:
+    return road_grid(multi=True)
+
+
+@pytest.fixture
+def compact(grid_graph) -> CompactGraph:
+    return CompactGraph.from_networkx(grid_graph, version="v1")
+
+
+@pytest.fixture
+def recording_algorithm(grid_graph) -> RecordingAlgorithm:
+    return RecordingAlgorithm(grid_graph)
+
+
+@pytest.fixture
+def place_names():
+    """A few thousand distinct names of one to three words, some with accents and dashes."""
+    rng = random.Random(5)
+    names = set()
+    while len(names) < 3000:
+        words = [rng.choice(WORDS) for _ in range(rng.randint(1, 3))]
+        names.add(" ".join(words) + (f" {rng.randint(1, 40)}" if rng.random() < 0.5 else ""))
+    return sorted(names)
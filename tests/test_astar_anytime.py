@@ -0,0 +1,64 @@
+"""Tests for the anytime repairing A* (ARA*) mode."""
+
+import networkx as nx
+import pytest
+
+from algorithms.astar_improved import AStarAlgorithm
+from conftest import road_grid
+from core.compact_graph import CompactGraph
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+
+START, GOAL = 1000, 1000 + 25 * 25 - 1
+
+
+def adapter_for(graph):
+    return NetworkXGraphAdapter(graph, compact_graph=CompactGraph.from_networkx(graph, version="v1"))
+
+
+@pytest.fixture(scope="module", params=[1, 2, 3])
+def large_grid(request):
+    return road_grid(size=25, seed=request.param)
+
+
+def anytime(graph, **options):
+    return list(AStarAlgorithm(parallel_workers=0).find_paths_anytime(START, GOAL, adapter_for(graph), **options))
+
+
+def test_solutions_improve_and_bounds_tighten(large_grid):
+    solutions = anytime(large_grid, initial_weight=3.0, weight_step=0.25)
+    optimum = nx.shortest_path_length(large_grid, START, GOAL, weight="length")
+
+    assert len(solutions) > 1
+    costs = [solution["cost"] for solution in solutions]
+    bounds = [solution["suboptimality_bound"] for solution in solutions]
+    assert costs == sorted(costs, reverse=True)
+    assert bounds == sorted(bounds, reverse=True)
+    for solution in solutions:
+        # The published bound holds against the true optimum
+        assert solution["cost"] <= solution["suboptimality_bound"] * optimum + 1e-6
+        assert solution["suboptimality_bound"] <= solution["heuristic_weight"]
+        assert nx.path_weight(large_grid, solution["path"], "length") == pytest.approx(solution["cost"])
+
+    assert solutions[-1]["is_optimal"] and solutions[-1]["cost"] == pytest.approx(optimum)
+
+
+def test_callback_sees_every_solution(large_grid):
+    published = []
+    solutions = anytime(large_grid, callback=published.append)
+    assert published == solutions
+
+
+def test_time_budget_stops_after_first_solution(large_grid):
+    solutions = anytime(large_grid, initial_weight=3.0, time_budget=0.0)
+    assert len(solutions) == 1 and solutions[0]["heuristic_weight"] == 3.0
+
+
+def test_unreachable_goal_yields_nothing(grid_graph):
+    grid_graph.add_node(9999, y=9.02, x=38.77)
+    search = AStarAlgorithm(parallel_workers=0).find_paths_anytime(1000, 9999, adapter_for(grid_graph))
+    assert list(search) == []
+
+
+def test_same_start_and_goal_is_optimal_immediately(grid_graph):
+    solutions = list(AStarAlgorithm(parallel_workers=0).find_paths_anytime(1000, 1000, adapter_for(grid_graph)))
+    assert [(s["path"], s["cost"], s["is_optimal"]) for s in solutions] == [([1000], 0.0, True)]
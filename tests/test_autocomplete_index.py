@@ -0,0 +1,74 @@
+"""Tests for the autocomplete index against a linear scan."""
+
+import pytest
+
+from services.autocomplete_index import AutocompleteIndex
+from shared.utils.text import normalize_name, word_starts
+
+QUERIES = ["b", "bole", "bole med", "Arat-K", "kilo", "cafe", "CAFÉ", "ala", "ssa", "12", "hotel 3", "x", ""]
+
+
+def ranked(names, priorities):
+    """Names with their keys, priorities and alphabetical position as the index orders them."""
+    entries = sorted((normalize_name(name), priority, name) for name, priority in zip(names, priorities))
+    return [(key, priority, position, name) for position, (key, priority, name) in enumerate(entries)]
+
+
+def linear_complete(names, priorities, query, limit):
+    query = normalize_name(query)
+    if not query:
+        return []
+    matches = []
+    for key, priority, position, name in ranked(names, priorities):
+        starts = [start for start in word_starts(key) if key[start:].startswith(query)]
+        if starts:
+            matches.append(((0 if starts[0] == 0 else 1, priority, len(key), position), name))
+    return [name for _, name in sorted(matches)[:limit]]
+
+
+def linear_contains(names, priorities, query, limit):
+    query = normalize_name(query)
+    if not query:
+        return []
+    matches = [((priority, len(key), position), name)
+               for key, priority, position, name in ranked(names, priorities) if query in key]
+    return [name for _, name in sorted(matches)[:limit]]
+
+
+@pytest.fixture
+def priorities(place_names):
+    return [position % 3 for position in range(len(place_names))]
+
+
+@pytest.mark.parametrize("limit", [1, 10, 100])
+def test_complete_matches_linear_scan(place_names, priorities, limit):
+    index = AutocompleteIndex(place_names, priorities)
+    for query in QUERIES:
+        assert index.complete(query, limit) == linear_complete(place_names, priorities, query, limit)
+
+
+@pytest.mark.parametrize("limit", [1, 10, 100])
+def test_contains_matches_linear_scan(place_names, priorities, limit):
+    index = AutocompleteIndex(place_names, priorities)
+    for query in QUERIES:
+        assert index.contains(query, limit) == linear_contains(place_names, priorities, query, limit)
+
+
+def test_lookup_normalizes(place_names):
+    index = AutocompleteIndex(place_names + ["Arat Kilo Café"])
+    assert index.lookup("arat-kilo cafe") == "Arat Kilo Café"
+    assert index.lookup("arat kilo caf") is None
+
+
+def test_duplicates_are_ignored():
+    index = AutocompleteIndex(["Bole", "Bole", "Bole Road"])
+    assert len(index) == 2
+    assert index.complete("bo") == ["Bole", "Bole Road"]
+
+
+def test_name_start_ranks_before_later_word_and_priority_breaks_ties():
+    index = AutocompleteIndex(["Old Bole", "Bole Medhane Alem", "Bole"], priorities=[0, 0, 1])
+
+    assert index.complete("bole") == ["Bole Medhane Alem", "Bole", "Old Bole"]
+    assert index.complete("medhane al") == ["Bole Medhane Alem"]
+    assert index.complete("med alem") == []
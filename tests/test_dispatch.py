@@ -0,0 +1,95 @@
+"""Tests for the live vehicle index and nearest-vehicle dispatch."""
+
+import random
+import threading
+
+import networkx as nx
+import pytest
+
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+from core.vehicle_index import VehicleIndex
+from services.dispatch_service import DispatchService
+from shared.calculators.generic_path_calculator import GenericPathCalculator
+
+
+@pytest.fixture
+def vehicles(compact):
+    index = VehicleIndex(compact)
+    rng = random.Random(3)
+    index.update_many((f"unit-{number}", rng.randrange(1000, 1144)) for number in range(15))
+    return index
+
+
+@pytest.fixture
+def dispatch(grid_graph, compact, vehicles):
+    return DispatchService(NetworkXGraphAdapter(grid_graph, compact_graph=compact), vehicles, GenericPathCalculator())
+
+
+def brute_force_ranking(grid_graph, vehicles, incident):
+    distances = nx.single_source_dijkstra_path_length(grid_graph, incident, weight="length")
+    return sorted((distances[vehicles.node_of(vehicle)], vehicle) for vehicle in vehicles.vehicle_ids())
+
+
+@pytest.mark.parametrize("incident", [1000, 1066, 1143])
+def test_ranking_matches_brute_force(grid_graph, vehicles, dispatch, incident):
+    result = dispatch.nearest_vehicles(incident, k=4)
+    expected = brute_force_ranking(grid_graph, vehicles, incident)[:4]
+
+    assert result["success"]
+    assert [vehicle["cost"] for vehicle in result["vehicles"]] == pytest.approx([cost for cost, _ in expected])
+    for vehicle in result["vehicles"]:
+        route = vehicle["route"]
+        assert route[0] == vehicle["node"] == vehicles.node_of(vehicle["vehicle_id"]) and route[-1] == incident
+        assert nx.path_weight(grid_graph, route, "length") == pytest.approx(vehicle["cost"])
+
+
+def test_search_stops_once_k_vehicles_are_found(compact, dispatch, vehicles):
+    vehicles.clear()
+    vehicles.update("near", 1001)
+    vehicles.update("far", 1143)
+
+    result = dispatch.nearest_vehicles(1000, k=1)
+    assert [vehicle["vehicle_id"] for vehicle in result["vehicles"]] == ["near"]
+    assert len(result["visited_nodes"]) < compact.num_nodes // 4
+
+
+def test_max_cost_and_empty_fleet(dispatch, vehicles):
+    vehicles.clear()
+    vehicles.update("far", 1143)
+    assert not dispatch.nearest_vehicles(1000, max_cost=500.0)["success"]
+    assert dispatch.nearest_vehicles(1000, max_cost=1e6)["success"]
+
+    vehicles.remove("far")
+    result = dispatch.nearest_vehicles(1000)
+    assert not result["success"] and result["paths"] == []
+
+
+def test_moves_and_shared_nodes(compact):
+    index = VehicleIndex(compact)
+    index.update_many([("a", 1000), ("b", 1000), ("a", 1005)])
+
+    assert index.vehicles_at(compact.index_of(1000)) == ("b",)
+    assert index.node_of("a") == 1005 and len(index) == 2
+    assert index.remove("a") and not index.remove("a")
+    assert index.vehicles_at(compact.index_of(1005)) == ()
+    with pytest.raises(KeyError):
+        index.update("c", 9999)
+
+
+def test_concurrent_updates_keep_both_maps_consistent(compact):
+    index = VehicleIndex(compact)
+
+    def feed(seed):
+        rng = random.Random(seed)
+        for _ in range(500):
+            index.update_many((f"unit-{rng.randrange(20)}", rng.randrange(1000, 1144)) for _ in range(5))
+
+    threads = [threading.Thread(target=feed, args=(seed,)) for seed in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for vehicle in index.vehicle_ids():
+        assert index.vehicles_at(compact.index_of(index.node_of(vehicle))).count(vehicle) == 1
+    assert sum(len(index.vehicles_at(node)) for node in range(compact.num_nodes)) == len(index)
@@ -0,0 +1,127 @@
+"""Tests for nearest-edge snapping and routing between snapped points."""
+
+import math
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from algorithms.astar_improved import AStarAlgorithm
+from algorithms.dijkstra import shortest_path_between_edges
+from core.location_model import LocationModel
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+from core.spatial_index import EdgeSpatialIndex
+from shared.utils.geo import utm_project_point
+
+
+def query_points(count=200, seed=11):
+    """Points over the grid and up to a few hundred meters beyond it."""
+    rng = random.Random(seed)
+    return [(9.0 + rng.uniform(-0.004, 0.015), 38.75 + rng.uniform(-0.004, 0.015)) for _ in range(count)]
+
+
+def brute_force_edge(compact, lat, lon):
+    x, y = utm_project_point(lat, lon)
+    tails, heads = compact.arc_tails(), compact.indices
+    tail_x, tail_y = compact.x[tails], compact.y[tails]
+    dx, dy = compact.x[heads] - tail_x, compact.y[heads] - tail_y
+    fraction = np.clip(((x - tail_x) * dx + (y - tail_y) * dy) / (dx * dx + dy * dy), 0.0, 1.0)
+    return float(np.hypot(tail_x + fraction * dx - x, tail_y + fraction * dy - y).min())
+
+
+def brute_force_route_cost(grid_graph, compact, source, target):
+    """Best of every end-node pair, plus driving along a shared edge."""
+    weights = compact.arc_lengths()
+    best = source.direct_cost(target, weights)
+    for tail, tail_cost in source.endpoint_costs(weights).items():
+        distances = nx.single_source_dijkstra_path_length(grid_graph, int(compact.node_ids[tail]), weight="length")
+        for head, head_cost in target.endpoint_costs(weights).items():
+            best = min(best, tail_cost + distances[int(compact.node_ids[head])] + head_cost)
+    return best
+
+
+@pytest.fixture
+def edge_index(compact):
+    return EdgeSpatialIndex.build(compact)
+
+
+@pytest.mark.parametrize("cell_size", [50.0, 150.0, 1000.0])
+def test_edge_snap_matches_brute_force(compact, cell_size):
+    index = EdgeSpatialIndex.build(compact, cell_size)
+    for lat, lon in query_points():
+        snap = index.nearest(lat, lon)
+        assert snap.distance == pytest.approx(brute_force_edge(compact, lat, lon), abs=1e-6)
+
+        x, y = utm_project_point(lat, lon)
+        assert math.hypot(snap.x - x, snap.y - y) == pytest.approx(snap.distance, abs=1e-6)
+        assert 0.0 <= snap.fraction <= 1.0
+        assert compact.indices[snap.arc] == snap.head
+
+
+def test_partial_edge_costs_split_the_edge(compact, edge_index):
+    weights = compact.arc_lengths()
+    for lat, lon in query_points(20):
+        snap = edge_index.nearest(lat, lon)
+        costs = snap.endpoint_costs(weights)
+        assert sum(costs.values()) == pytest.approx(weights[snap.arc])
+        assert costs[snap.tail] == pytest.approx(snap.fraction * weights[snap.arc])
+
+
+def test_saved_edge_index_answers_the_same(compact, edge_index, tmp_path):
+    edge_index.save(tmp_path)
+    loaded = EdgeSpatialIndex.load(tmp_path, compact)
+    for lat, lon in query_points(20):
+        assert loaded.nearest(lat, lon) == edge_index.nearest(lat, lon)
+
+
+def test_routes_between_snapped_points(grid_graph, compact, edge_index):
+    adapter = NetworkXGraphAdapter(grid_graph, compact_graph=compact)
+    astar = AStarAlgorithm(parallel_workers=0)
+    weights = compact.arc_lengths()
+    points = query_points(24, seed=5)
+
+    for (start_lat, start_lon), (goal_lat, goal_lon) in zip(points[::2], points[1::2]):
+        source = edge_index.nearest(start_lat, start_lon)
+        target = edge_index.nearest(goal_lat, goal_lon)
+        expected = brute_force_route_cost(grid_graph, compact, source, target)
+
+        cost, path = shortest_path_between_edges(compact, source, target)
+        assert cost == pytest.approx(expected)
+        # The path runs between end nodes of the two edges and prices out to the cost
+        first, last = compact.index_of(path[0]), compact.index_of(path[-1])
+        assert first in (source.tail, source.head) and last in (target.tail, target.head)
+        along = nx.path_weight(grid_graph, path, "length") if len(path) > 1 else 0.0
+        if source.arc != target.arc:
+            assert (source.endpoint_costs(weights)[first] + along
+                    + target.endpoint_costs(weights)[last]) == pytest.approx(cost)
+
+        astar_cost, _ = astar.find_path_between_edges(source, target, adapter)
+        assert astar_cost == pytest.approx(expected)
+
+
+def test_points_on_one_edge_drive_along_it(compact, edge_index):
+    weights = compact.arc_lengths()
+    arc = int(compact.indptr[compact.index_of(1066)])
+    tail, head = compact.index_of(1066), int(compact.indices[arc])
+
+    def along(fraction):
+        lat = float(compact.lat[tail] + (compact.lat[head] - compact.lat[tail]) * fraction)
+        lon = float(compact.lon[tail] + (compact.lon[head] - compact.lon[tail]) * fraction)
+        return edge_index.nearest(lat, lon)
+
+    near_tail, near_head = along(0.2), along(0.7)
+    assert {near_tail.tail, near_tail.head} == {near_head.tail, near_head.head} == {tail, head}
+
+    cost, path = shortest_path_between_edges(compact, near_head, near_tail)
+    assert cost == pytest.approx(0.5 * weights[arc], rel=1e-3)
+    # Driving from the point near the head towards the one near the tail
+    assert path == compact.to_node_ids([head, tail])
+
+
+def test_location_model_snaps_coordinates_to_edges(grid_graph, edge_index):
+    model = LocationModel(grid_graph, edge_index=edge_index)
+    lat, lon = query_points(1)[0]
+    assert model.get_nearest_edge((lat, lon)) == edge_index.nearest(lat, lon)
+    with pytest.raises(ValueError):
+        LocationModel(grid_graph).get_nearest_edge((lat, lon))
@@ -0,0 +1,112 @@
+"""Tests for the network Voronoi facility index and OSM facility loading."""
+
+import types
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from core import facility_sources
+from core.compact_graph import CompactGraph
+from core.facility_index import FacilityIndex
+from core.facility_sources import load_facilities
+
+FACILITIES = [1000, 1077, 1143, 1011]
+
+
+@pytest.fixture
+def index(compact):
+    return FacilityIndex.build(compact, FACILITIES, names=["A", "B", "C", "D"], category="hospital")
+
+
+def test_every_node_gets_its_nearest_facility(grid_graph, index):
+    by_facility = {facility: nx.single_source_dijkstra_path_length(grid_graph, facility, weight="length")
+                   for facility in FACILITIES}
+
+    for node in grid_graph.nodes:
+        position, distance = index.nearest_facility(node)
+        best = min(by_facility[facility][node] for facility in FACILITIES)
+        assert distance == pytest.approx(best, rel=1e-6)
+        assert by_facility[index.facility_node(position)][node] == pytest.approx(best, rel=1e-6)
+
+
+def test_routes_walk_to_the_cell_facility(grid_graph, index):
+    for node in (1050, 1100, 1011, 1131):
+        position, distance = index.nearest_facility(node)
+        route = index.route(node)
+        assert route[0] == node and route[-1] == index.facility_node(position)
+        assert nx.path_weight(grid_graph, route, "length") == pytest.approx(distance, rel=1e-6)
+
+
+def test_cells_partition_the_graph(compact, index):
+    sizes = index.cell_sizes()
+    assert len(sizes) == 4 and sum(sizes) == compact.num_nodes and min(sizes) > 0
+    assert index.facility_name(1) == "B"
+
+
+def test_unreachable_nodes_and_shared_facility_nodes(grid_graph):
+    grid_graph.add_node(9999, y=9.03, x=38.78)
+    compact = CompactGraph.from_networkx(grid_graph, version="v1")
+    # Two facilities snapped to the same node: the first owns the cell
+    index = FacilityIndex.build(compact, [1000, 1000])
+
+    assert index.nearest_facility(9999) is None and index.route(9999) is None
+    assert index.cell_sizes()[1] == 0
+    assert index.facility_name(1) == "Facility 1000"
+
+
+def test_saved_partition_is_memory_mapped_and_checked(compact, index, tmp_path):
+    index.save(tmp_path)
+    loaded = FacilityIndex.load(tmp_path, compact, FACILITIES)
+
+    assert isinstance(loaded.nearest, np.memmap)
+    np.testing.assert_array_equal(loaded.nearest, index.nearest)
+    assert loaded.names == index.names and loaded.category == "hospital"
+    assert FacilityIndex.load(tmp_path, compact, FACILITIES[:3]) is None
+    assert FacilityIndex.load(tmp_path, compact, FACILITIES, weights_name="travel_time") is None
+
+
+class FakePoints:
+    def __init__(self, coordinates):
+        self.coordinates = coordinates
+
+    def representative_point(self):
+        return [types.SimpleNamespace(y=lat, x=lon) for lat, lon in self.coordinates]
+
+
+class FakeFeatures:
+    """The parts of an OSMnx GeoDataFrame load_facilities reads."""
+
+    columns = ("name",)
+
+    def __init__(self, rows):
+        self.index = [(element, osm_id) for element, osm_id, _, _ in rows]
+        self._names = [name for _, _, name, _ in rows]
+        self.geometry = FakePoints([point for _, _, _, point in rows])
+
+    def __getitem__(self, column):
+        return self._names
+
+
+def test_facilities_are_named_downloaded_once_and_cached(tmp_path, monkeypatch):
+    downloads = []
+    rows = [("node", 1, "Black Lion", (9.02, 38.75)), ("way", 2, float("nan"), (9.01, 38.76)),
+            ("way", 3, "Black Lion", (9.03, 38.77))]
+
+    def features_from_place(city, tags):
+        downloads.append((city, tags))
+        return FakeFeatures(rows)
+
+    monkeypatch.setattr(facility_sources, "ox", types.SimpleNamespace(features_from_place=features_from_place))
+    path = tmp_path / "hospital.json"
+    tags = {"amenity": "hospital"}
+
+    facilities = load_facilities(path, "Addis Ababa", tags)
+    assert facilities == {"Black Lion": (9.02, 38.75), "hospital (way 2)": (9.01, 38.76),
+                          "Black Lion (way 3)": (9.03, 38.77)}
+    assert load_facilities(path, "Addis Ababa", tags) == facilities
+    assert len(downloads) == 1
+
+    # A cache for other tags is not reused
+    load_facilities(path, "Addis Ababa", {"amenity": "clinic"})
+    assert len(downloads) == 2
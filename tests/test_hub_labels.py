@@ -0,0 +1,67 @@
+"""Tests for the hub label distance oracle against Dijkstra."""
+
+import math
+
+import networkx as nx
+import pytest
+
+from core.compact_graph import CompactGraph
+from core.hub_labels import HubLabelIndex
+
+SOURCES = [1000, 1005, 1066, 1143]
+
+
+@pytest.fixture
+def labels(compact):
+    return HubLabelIndex.build(compact)
+
+
+def test_distances_match_dijkstra(grid_graph, labels):
+    for source in SOURCES:
+        expected = nx.single_source_dijkstra_path_length(grid_graph, source, weight="length")
+        for target in grid_graph.nodes:
+            # Labels store float32 distances
+            assert labels.distance(source, target) == pytest.approx(expected[target], rel=1e-5)
+
+
+def test_paths_are_shortest(grid_graph, labels):
+    for source in SOURCES:
+        for target in (1011, 1132, 1077):
+            path = labels.path(source, target)
+            assert path[0] == source and path[-1] == target
+            expected = nx.dijkstra_path_length(grid_graph, source, target, weight="length")
+            assert nx.path_weight(grid_graph, path, "length") == pytest.approx(expected, rel=1e-5)
+
+
+def test_custom_weights(grid_graph, compact):
+    weights = [length * (3.0 if highway == 1 else 1.0)
+               for length, highway in zip(compact.length.tolist(), compact.highway.tolist())]
+    labels = HubLabelIndex.build(compact, weights, weights_name="custom")
+    for (u, v), weight in zip(zip(compact.arc_tails().tolist(), compact.indices.tolist()), weights):
+        grid_graph[compact.node_ids[u]][compact.node_ids[v]]["custom"] = weight
+
+    expected = nx.single_source_dijkstra_path_length(grid_graph, 1000, weight="custom")
+    for target, distance in expected.items():
+        assert labels.distance(1000, target) == pytest.approx(distance, rel=1e-5)
+
+
+def test_disconnected_nodes_are_unreachable(grid_graph):
+    grid_graph.add_node(5000, x=38.8, y=9.1)
+    labels = HubLabelIndex.build(CompactGraph.from_networkx(grid_graph))
+
+    assert math.isinf(labels.distance(1000, 5000))
+    assert labels.path(1000, 5000) is None
+
+
+def test_save_and_load(compact, labels, tmp_path):
+    labels.save(tmp_path)
+    loaded = HubLabelIndex.load(tmp_path, compact)
+
+    assert loaded.distance(1000, 1143) == labels.distance(1000, 1143)
+
+
+def test_load_rejects_other_weights_or_graph(grid_graph, labels, tmp_path):
+    labels.save(tmp_path)
+
+    assert HubLabelIndex.load(tmp_path, labels.compact, weights_name="travel_time") is None
+    assert HubLabelIndex.load(tmp_path, CompactGraph.from_networkx(grid_graph, version="v2")) is None
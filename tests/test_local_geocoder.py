@@ -0,0 +1,73 @@
+"""Tests for the offline geocoder tiers."""
+
+from difflib import get_close_matches
+
+import pytest
+
+from services.local_geocoder import LocalGeocoder
+from shared.utils.text import normalize_name
+
+
+class Places:
+    """Place index with the interface LocalGeocoder reads: names and optional coordinates."""
+
+    def __init__(self, places):
+        self._places = sorted(places.items())
+
+    def __len__(self):
+        return len(self._places)
+
+    def name_at(self, position):
+        return self._places[position][0]
+
+    def coordinates_at(self, position):
+        return self._places[position][1]
+
+
+@pytest.fixture
+def named_places(place_names):
+    return Places({name: (9.0 + position * 1e-5, 38.7) for position, name in enumerate(place_names)})
+
+
+def test_exact_tier_ignores_case_accents_and_punctuation():
+    geocoder = LocalGeocoder(Places({"Café Arat-Kilo": (9.03, 38.76), "Bole": (9.0, 38.78)}))
+    match = geocoder.lookup("  cafe ARAT kilo ")
+
+    assert (match.name, match.tier) == ("Café Arat-Kilo", "exact")
+    assert geocoder.geocode("Café Arat-Kilo") == (9.03, 38.76)
+
+
+def test_prefix_tier_takes_the_shortest_completion():
+    geocoder = LocalGeocoder(Places({"Bole Road": (1.0, 1.0), "Bole Medhane Alem": (2.0, 2.0),
+                                     "Bolero Bar": (3.0, 3.0)}))
+    match = geocoder.lookup("bole r")
+
+    assert (match.name, match.tier) == ("Bole Road", "prefix")
+    assert geocoder.lookup("bol").name == "Bole Road"
+
+
+def test_places_without_coordinates_are_skipped():
+    geocoder = LocalGeocoder(Places({"Unmapped Square": None, "Mapped Square": (9.0, 38.7)}))
+
+    assert len(geocoder) == 1
+    assert geocoder.lookup("Unmapped Square").name == "Mapped Square"
+    assert LocalGeocoder(Places({})).lookup("anything") is None
+
+
+def test_fuzzy_tier_matches_spelling_variants():
+    geocoder = LocalGeocoder(Places({"Piassa Mall": (9.03, 38.75), "Bole Road": (9.0, 38.78)}))
+    match = geocoder.lookup("Piaza Mal")
+
+    assert (match.name, match.tier) == ("Piassa Mall", "fuzzy")
+    assert geocoder.lookup("Qqqq") is None
+
+
+def test_fuzzy_candidates_keep_difflib_result(named_places):
+    # Typos of indexed names: the trigram candidates must still contain the difflib winner
+    geocoder = LocalGeocoder(named_places)
+    keys = [normalize_name(named_places.name_at(position)) for position in range(len(named_places))]
+    for name in ("Merkatto Hotell 12", "Kazanchiss Mal", "Lidetta Church 7", "Gerjji Saris"):
+        query = normalize_name(name)
+        expected = get_close_matches(query, keys, n=1, cutoff=geocoder.fuzzy_cutoff)
+        match = geocoder.lookup(name)
+        assert (normalize_name(match.name) if match else None) == (expected[0] if expected else None)
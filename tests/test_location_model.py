@@ -0,0 +1,77 @@
+"""Tests for name resolution and node naming in the location model."""
+
+import numpy as np
+import pytest
+
+from core import location_model
+from core.location_model import LocationModel
+from core.reverse_geocode_index import NO_LABEL, PLACE_LABEL, STREET_LABEL, ReverseGeocodeIndex
+
+
+@pytest.fixture
+def tagged_graph(grid_graph):
+    graph = grid_graph.copy()
+    graph.nodes[1000]["name"] = "Tagged Square"
+    graph.nodes[1001]["amenity"] = "pharmacy"
+    graph.nodes[1002]["highway"] = "traffic_signals"
+    return graph
+
+
+@pytest.fixture
+def reverse_index(compact):
+    """Labels only node 1000 (as a place) and node 1001 (as a street)."""
+    node_label = np.full(compact.num_nodes, -1, dtype=np.int32)
+    node_kind = np.full(compact.num_nodes, NO_LABEL, dtype=np.uint8)
+    for node, label, kind in ((1000, 0, PLACE_LABEL), (1001, 1, STREET_LABEL)):
+        node_label[compact.index_of(node)] = label
+        node_kind[compact.index_of(node)] = kind
+    return ReverseGeocodeIndex(compact, ["Meskel Square", "Bole Road"], node_label, node_kind,
+                               np.full(compact.num_arcs, -1, dtype=np.int32))
+
+
+def test_reverse_index_label_comes_first(tagged_graph, reverse_index):
+    model = LocationModel(tagged_graph, reverse_index=reverse_index)
+
+    assert model.get_node_name(1000) == "Meskel Square"
+    assert model.get_node_name(1001) == "Bole Road"
+
+
+def test_node_tags_name_unlabelled_nodes(tagged_graph, reverse_index):
+    model = LocationModel(tagged_graph, reverse_index=reverse_index)
+    tagged_graph.nodes[1003]["name"] = "Corner Shop"
+
+    assert model.get_node_name(1003) == "Corner Shop"
+    assert model.get_node_name(1002) == "Highway Node 1002"
+    assert model.get_node_name(1004) == "Node 1004"
+
+
+def test_without_reverse_index_tags_and_fallback_apply(tagged_graph):
+    model = LocationModel(tagged_graph)
+
+    assert [model.get_node_name(node) for node in (1000, 1001, 1002, 1004)] == [
+        "Tagged Square", "pharmacy (ID: 1001)", "Highway Node 1002", "Node 1004"]
+
+
+class FixedGeocoder:
+    def __init__(self, places):
+        self.places = places
+        self.queries = []
+
+    def geocode(self, name):
+        self.queries.append(name)
+        return self.places.get(name)
+
+
+def test_names_resolve_from_locations_then_geocoder(grid_graph, monkeypatch):
+    monkeypatch.setattr(location_model, "ALLOW_NETWORK_GEOCODING", False)
+    geocoder = FixedGeocoder({"Sidist Kilo Campus": (9.005, 38.755)})
+    model = LocationModel(grid_graph, geocoder=geocoder)
+    model.locations = {"Meskel Square": (9.0, 38.75)}
+
+    assert model._resolve_location_name("meskel square") == (9.0, 38.75)
+    assert geocoder.queries == []
+    assert model._resolve_location_name("Sidist Kilo Campus") == (9.005, 38.755)
+
+    # Without the network opt-in an unknown name fails instead of calling Nominatim
+    with pytest.raises(ValueError, match="not found"):
+        model._resolve_location_name("Nowhere Street")
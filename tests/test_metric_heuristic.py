@@ -0,0 +1,78 @@
+"""Tests for the metric A* heuristic."""
+
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from algorithms.metric_heuristic import MetricHeuristic
+from core.compact_graph import CompactGraph
+from core.weight_profiles import WeightProfile
+
+SPEEDS = {"primary": 50.0, "secondary": 40.0, "tertiary": 30.0, "residential": 20.0, "other": 25.0}
+
+
+def assert_consistent(compact, weights, heuristic, goal_index):
+    """h(u) <= w(u, v) + h(v) on every arc, within float rounding."""
+    estimate = heuristic.for_goal_index(goal_index)
+    for tail, head, weight in zip(compact.arc_tails().tolist(), compact.indices.tolist(), weights):
+        assert estimate(tail) <= weight + estimate(head) + 1e-9
+
+
+@pytest.mark.parametrize("profile", [None, WeightProfile.travel_time(SPEEDS)], ids=["length", "time"])
+def test_heuristic_is_consistent_and_admissible(grid_graph, compact, profile):
+    weights = compact.length if profile is None else profile.compute(compact)
+    heuristic = MetricHeuristic(compact, weights)
+    goal = 1000 + 143
+    goal_index = compact.index_of(goal)
+
+    assert_consistent(compact, weights.tolist(), heuristic, goal_index)
+    for node in (1000, 1060):
+        exact = nx.shortest_path_length(
+            grid_graph, node, goal,
+            weight=lambda u, v, data: weights[compact.arc_between(compact.index_of(u), compact.index_of(v))])
+        assert heuristic.estimate(compact.index_of(node), goal_index) <= exact
+
+
+def test_length_scale_is_close_to_one(compact):
+    # Edge lengths are the straight line stretched by 0-30 %, measured off UTM
+    assert MetricHeuristic(compact).scale == pytest.approx(1.0, abs=0.01)
+
+
+def with_artifacts(grid_graph):
+    """Grid plus a duplicate of node 1000 joined by a 1 cm edge and a zero-length edge."""
+    graph = grid_graph.copy()
+    graph.add_node(5000, y=graph.nodes[1000]["y"] + 1e-8, x=graph.nodes[1000]["x"])
+    graph.add_edge(1000, 5000, length=0.01, highway="residential")
+    graph.add_edge(1001, 1013, length=0.0, highway="residential")
+    return CompactGraph.from_networkx(graph, version="artifacts")
+
+
+def test_mapping_artifacts_do_not_collapse_the_scale(grid_graph, compact):
+    clean = MetricHeuristic(compact).scale
+    assert MetricHeuristic(with_artifacts(grid_graph)).scale == pytest.approx(clean)
+
+
+def test_non_finite_weights_are_ignored(compact):
+    weights = compact.length.copy()
+    weights[0], weights[1], weights[2] = np.nan, np.inf, -1.0
+
+    scale = MetricHeuristic(compact, weights).scale
+    assert math.isfinite(scale) and scale == pytest.approx(MetricHeuristic(compact).scale, rel=0.05)
+
+
+def test_no_measurable_arc_gives_zero_scale(compact):
+    assert MetricHeuristic(compact, np.zeros(compact.num_arcs)).scale == 0.0
+
+
+def test_batch_estimates_match_single_ones(compact):
+    heuristic = MetricHeuristic(compact)
+    goal_index = compact.index_of(1077)
+    nodes = list(range(0, compact.num_nodes, 7))
+
+    expected = [heuristic.estimate(node, goal_index) for node in nodes]
+    np.testing.assert_allclose(heuristic.estimate_many(nodes, goal_index), expected)
+    neighbors = compact.neighbor_lists()[5]
+    assert heuristic.neighbor_estimates(5, goal_index) == pytest.approx(
+        [heuristic.estimate(node, goal_index) for node in neighbors])
@@ -0,0 +1,98 @@
+"""Tests for the hot-origin shortest path tree cache."""
+
+import networkx as nx
+import pytest
+
+from core.compact_graph import CompactGraph
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+from services.origin_tree_cache import OriginTreeCache
+from services.route_optimization_service import RouteOptimizationService
+from shared.calculators.generic_path_calculator import GenericPathCalculator
+
+
+def test_tree_is_built_after_min_queries(compact):
+    cache = OriginTreeCache(max_origins=2, min_queries=2, background=False)
+
+    assert cache.lookup(compact, None, "length", 1000) is None
+    tree = cache.lookup(compact, None, "length", 1000)
+    assert tree is not None
+    assert cache.lookup(compact, None, "length", 1000) is tree
+    assert cache.stats()["builds"] == 1
+
+
+def test_tree_matches_dijkstra(grid_graph, compact):
+    cache = OriginTreeCache(min_queries=1, background=False)
+    tree = cache.lookup(compact, None, "length", 1000)
+    expected = nx.single_source_dijkstra_path_length(grid_graph, 1000, weight="length")
+
+    for node, distance in expected.items():
+        assert tree.distance_to(node) == pytest.approx(distance)
+        path = tree.path_to(node)
+        assert path[0] == 1000 and path[-1] == node
+        assert nx.path_weight(grid_graph, path, "length") == pytest.approx(distance)
+
+
+def test_keeps_most_queried_origins(compact):
+    cache = OriginTreeCache(max_origins=2, min_queries=1, background=False)
+    for origin, queries in ((1000, 3), (1001, 2), (1002, 1)):
+        for _ in range(queries):
+            cache.lookup(compact, None, "length", origin)
+    cache.lookup(compact, None, "length", 1002)
+    cache.lookup(compact, None, "length", 1002)
+
+    assert len(cache) == 2
+    assert cache.lookup(compact, None, "length", 1000) is not None
+
+
+def test_weights_keys_are_separate(compact):
+    cache = OriginTreeCache(min_queries=1, background=False)
+    doubled = (compact.length * 2).tolist()
+    by_length = cache.lookup(compact, None, "length", 1000)
+    by_double = cache.lookup(compact, doubled, "double", 1000)
+
+    assert by_double.distance_to(1050) == pytest.approx(2 * by_length.distance_to(1050))
+
+
+def test_new_graph_version_rebuilds_tree(grid_graph, compact):
+    cache = OriginTreeCache(min_queries=1, background=False)
+    old = cache.lookup(compact, None, "length", 1000)
+
+    grid_graph[1000][1001]["length"] *= 10
+    updated = CompactGraph.from_networkx(grid_graph, version="v2")
+    new = cache.lookup(updated, None, "length", 1000)
+
+    assert new is not old and new.version == "v2"
+    expected = nx.single_source_dijkstra_path_length(grid_graph, 1000, weight="length")
+    assert new.distance_to(1001) == pytest.approx(expected[1001])
+
+
+def test_byte_bound_limits_trees(compact):
+    one_tree = OriginTreeCache(min_queries=1, background=False)
+    size = one_tree.lookup(compact, None, "length", 1000).nbytes
+
+    cache = OriginTreeCache(max_origins=8, max_bytes=2 * size, min_queries=1, background=False)
+    for origin in range(1000, 1006):
+        cache.lookup(compact, None, "length", origin)
+    assert len(cache) == 2 and cache.nbytes <= 2 * size
+
+
+def test_uncounted_lookups_only_reuse_built_trees(compact):
+    cache = OriginTreeCache(min_queries=1, background=False)
+
+    assert cache.lookup(compact, None, "length", 1000, count=False) is None
+    assert len(cache) == 0
+    built = cache.lookup(compact, None, "length", 1000)
+    assert cache.lookup(compact, None, "length", 1000, count=False) is built
+
+
+def test_multi_stop_plans_only_count_the_depot(grid_graph, compact):
+    cache = OriginTreeCache(max_origins=4, min_queries=2, background=False)
+    service = RouteOptimizationService(NetworkXGraphAdapter(grid_graph, compact_graph=compact),
+                                       GenericPathCalculator(), origin_trees=cache)
+    for first_stop in range(1010, 1050, 5):
+        result = service.optimize([1000, first_stop, first_stop + 30, first_stop + 61])
+        assert result["success"]
+
+    # The depot became hot; a delivery stop's next query is only its first counted one
+    assert len(cache) == 1 and cache.lookup(compact, None, "", 1000, count=False) is not None
+    assert cache.lookup(compact, None, "", 1010) is None
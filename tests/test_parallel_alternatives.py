@@ -0,0 +1,59 @@
+"""Tests for alternative routes searched in a process pool."""
+
+import pytest
+
+from algorithms.astar_improved import AStarAlgorithm
+from algorithms.parallel_alternatives import ParallelAlternativeSearch
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+
+WEIGHTS = [0.5, 1.5, 2.0, 0.8]
+PAIRS = [(1000, 1143), (1011, 1132), (1070, 1005)]
+
+
+@pytest.fixture
+def adapter(grid_graph, compact):
+    return NetworkXGraphAdapter(grid_graph, compact_graph=compact)
+
+
+def sequential_paths(adapter, start, goal):
+    algorithm = AStarAlgorithm(parallel_workers=0)
+    return [algorithm.find_weighted_path(start, goal, adapter, weight) for weight in WEIGHTS]
+
+
+def test_pool_results_match_sequential_searches_in_order(adapter, compact):
+    search = ParallelAlternativeSearch(compact, workers=2)
+    try:
+        for start, goal in PAIRS:
+            results = search.search(start, goal, WEIGHTS)
+            assert [path for path, _ in results] == sequential_paths(adapter, start, goal)
+            assert all(start in visited and goal in visited for _, visited in results)
+    finally:
+        search.close()
+
+
+def test_workers_map_cached_arrays(adapter, compact, tmp_path):
+    compact.save(tmp_path)
+    search = ParallelAlternativeSearch(compact, workers=2, cache_dir=tmp_path)
+    assert search._worker_graph_source() == (str(tmp_path), "v1", None)
+    try:
+        assert [path for path, _ in search.search(1000, 1143, WEIGHTS)] == sequential_paths(adapter, 1000, 1143)
+    finally:
+        search.close()
+
+
+def test_stale_cache_ships_the_graph(compact, tmp_path):
+    compact.save(tmp_path)
+    search = ParallelAlternativeSearch(compact, cache_dir=tmp_path)
+    compact.version = "v2"
+    assert search._worker_graph_source() == (None, "v2", compact)
+
+
+def test_parallel_find_path_equals_sequential(adapter):
+    with AStarAlgorithm(parallel_workers=2) as parallel:
+        sequential = AStarAlgorithm(parallel_workers=0)
+        for start, goal in PAIRS:
+            assert parallel.find_path(start, goal, adapter, max_paths=5) == \
+                sequential.find_path(start, goal, adapter, max_paths=5)
+        assert parallel._parallel_searches
+    # Leaving the context shuts the pools down
+    assert parallel._parallel_searches == {}
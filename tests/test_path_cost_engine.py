@@ -0,0 +1,112 @@
+"""Tests for batch path costing against the per-hop edge data loop."""
+
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from core.compact_graph import CompactGraph
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+from core.weight_profiles import WeightProfile
+from shared.calculators.generic_path_calculator import GenericPathCalculator
+from shared.constraints.distance_constraint import DistanceConstraint
+from shared.constraints.time_constraint import TimeConstraint
+
+FREE_FLOW_KMH = {"primary": 50.0, "secondary": 40.0, "tertiary": 35.0, "residential": 25.0, "other": 20.0}
+
+
+def per_hop_loop(path, graph, arc_weights=None):
+    """Costs the way the calculator did before the engine: one get_edge_data call per hop."""
+    total = 0.0
+    for u, v in zip(path, path[1:]):
+        edge_data = graph.get_edge_data(u, v)
+        if not edge_data:
+            total += 1.0 if arc_weights is None else 0.0
+            continue
+        # MultiGraph edge data is keyed by parallel edge; the shortest one is driven
+        data = min(edge_data.values(), key=lambda d: d["length"]) if "length" not in edge_data else edge_data
+        total += data["length"] if arc_weights is None else arc_weights(data)
+    return total
+
+
+def random_paths(graph, count=40, seed=2):
+    rng = random.Random(seed)
+    nodes = sorted(graph.nodes)
+    return [nx.shortest_path(graph, rng.choice(nodes), rng.choice(nodes)) for _ in range(count)]
+
+
+@pytest.fixture
+def multi_adapter(multi_grid_graph):
+    compact = CompactGraph.from_networkx(multi_grid_graph)
+    return NetworkXGraphAdapter(multi_grid_graph, compact)
+
+
+@pytest.fixture
+def times(multi_adapter):
+    return WeightProfile.travel_time(FREE_FLOW_KMH).compute(multi_adapter.get_compact_graph())
+
+
+def seconds(data):
+    kmh = FREE_FLOW_KMH.get(data["highway"], FREE_FLOW_KMH["other"])
+    return data["length"] * 3.6 / kmh
+
+
+def test_costs_are_meters_on_multigraph(multi_grid_graph, multi_adapter):
+    calculator = GenericPathCalculator()
+    paths = random_paths(multi_grid_graph)
+    expected = [per_hop_loop(path, multi_grid_graph) for path in paths]
+
+    assert calculator.calculate_path_costs(paths, multi_adapter) == pytest.approx(expected)
+    assert [calculator.calculate_path_cost(path, multi_adapter) for path in paths] == pytest.approx(expected)
+    assert calculator.calculate_path_cost([1000, 1001, 1002, 1014], multi_adapter) > 300.0
+
+
+def test_fallback_loop_matches_engine(multi_grid_graph, multi_adapter):
+    # Without a compact view the calculator walks the edge data itself
+    plain = NetworkXGraphAdapter(multi_grid_graph)
+    calculator = GenericPathCalculator()
+    for path in random_paths(multi_grid_graph, 10):
+        assert calculator.calculate_path_cost(path, plain) == pytest.approx(
+            calculator.calculate_path_cost(path, multi_adapter))
+
+
+def test_times_sum_arc_travel_times(multi_grid_graph, multi_adapter, times):
+    calculator = GenericPathCalculator(arc_times=lambda compact: times)
+    paths = random_paths(multi_grid_graph)
+    evaluated = calculator.evaluate_paths(paths, multi_adapter, average_speed_m_per_s=8.3)
+
+    # Parallel edges here are residential, so the shortest edge is also the one timed
+    assert evaluated.times.tolist() == pytest.approx([per_hop_loop(path, multi_grid_graph, seconds)
+                                                     for path in paths])
+    assert calculator.calculate_path_time(paths[0], multi_adapter) == pytest.approx(evaluated.times[0])
+    assert GenericPathCalculator().calculate_path_time(paths[0], multi_adapter) is None
+
+
+def test_statistics_and_steps(multi_grid_graph, multi_adapter):
+    paths = random_paths(multi_grid_graph, 5)
+    costs = [per_hop_loop(path, multi_grid_graph) for path in paths]
+    statistics = GenericPathCalculator().get_path_statistics(paths, multi_adapter)
+
+    assert statistics["avg_cost"] == pytest.approx(np.mean(costs))
+    assert statistics["min_cost"] == pytest.approx(min(costs))
+    assert statistics["max_steps"] == max(len(path) - 1 for path in paths)
+
+
+def test_non_adjacent_hops_cost_one_unit(multi_adapter):
+    calculator = GenericPathCalculator()
+    assert calculator.calculate_path_cost([1000, 1143], multi_adapter) == 1.0
+    assert calculator.calculate_path_costs([[1000], [], [1000, 99999]], multi_adapter) == [0.0, 0.0, 1.0]
+
+
+def test_constraints_compare_meters_and_seconds(multi_grid_graph, multi_adapter, times):
+    calculator = GenericPathCalculator(arc_times=lambda compact: times)
+    path = nx.shortest_path(multi_grid_graph, 1000, 1143)
+    meters = per_hop_loop(path, multi_grid_graph)
+    travel_time = per_hop_loop(path, multi_grid_graph, seconds)
+
+    assert DistanceConstraint(meters + 1, calculator).validate(path, multi_adapter)[0]
+    assert not DistanceConstraint(meters - 1, calculator).validate(path, multi_adapter)[0]
+    # The flat speed would allow the path; the arc travel times do not
+    assert not TimeConstraint(travel_time - 1, calculator, 1000.0).validate(path, multi_adapter)[0]
+    assert TimeConstraint(travel_time + 1, calculator, 0.001).validate(path, multi_adapter)[0]
@@ -0,0 +1,101 @@
+"""Tests for the interchangeable priority queues and the searches that use them."""
+
+import random
+
+import networkx as nx
+import pytest
+
+from algorithms.astar_improved import AStarAlgorithm
+from algorithms.dijkstra import shortest_path_tree
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+from shared.utils.priority_queues import (
+    PRIORITY_QUEUES, RADIX_KEYS_PER_UNIT, IndexedBinaryHeap, RadixHeap, create_priority_queue
+)
+
+KINDS = sorted(PRIORITY_QUEUES)
+
+
+def drain(queue):
+    popped = []
+    while len(queue):
+        popped.append(queue.pop())
+    return popped
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_monotone_workload_pops_in_order(kind):
+    """Dijkstra-like use: every push is at least the last popped priority."""
+    rng = random.Random(7)
+    queue = create_priority_queue(kind, 5000)
+    last, popped, item = 0.0, [], 0
+    for _ in range(2000):
+        for _ in range(rng.randint(0, 3)):
+            queue.push(item, last + rng.uniform(0.0, 500.0))
+            item += 1
+        if len(queue):
+            last, _ = queue.pop()
+            popped.append(last)
+    popped.extend(priority for priority, _ in drain(queue))
+
+    resolution = 1.0 / RADIX_KEYS_PER_UNIT if kind == "radix" else 0.0
+    assert all(b >= a - resolution for a, b in zip(popped, popped[1:]))
+    assert len(popped) == item
+
+
+def test_indexed_heap_lowers_priorities_in_place():
+    queue = IndexedBinaryHeap(4)
+    queue.push(1, 5.0)
+    queue.push(2, 3.0)
+    queue.push(1, 1.0)
+    queue.push(2, 9.0)  # not lower, ignored
+
+    assert len(queue) == 2
+    assert drain(queue) == [(1.0, 1), (3.0, 2)]
+
+
+def test_radix_heap_clamps_keys_below_the_last_pop():
+    queue = RadixHeap()
+    queue.push(1, 10.0)
+    assert queue.pop() == (10.0, 1)
+    queue.push(2, 4.0)
+    queue.push(3, 12.5)
+    assert drain(queue) == [(10.0, 2), (12.5, 3)]
+
+
+def test_cleared_queues_are_reusable():
+    for kind in KINDS:
+        queue = create_priority_queue(kind, 10)
+        queue.push(3, 2.0)
+        queue.clear()
+        assert len(queue) == 0
+        queue.push(3, 1.0)
+        assert queue.pop() == (1.0, 3)
+        with pytest.raises(IndexError):
+            queue.pop()
+
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError, match="fibonacci"):
+        create_priority_queue("fibonacci", 10)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_dijkstra_distances_with_every_queue(grid_graph, compact, kind):
+    distances, _, _ = shortest_path_tree(compact, {compact.index_of(1000): 0.0}, queue_kind=kind)
+    expected = nx.single_source_dijkstra_path_length(grid_graph, 1000, weight="length")
+
+    for node, distance in expected.items():
+        # Radix keys are floored to centimeters on every relaxation
+        assert distances[compact.index_of(node)] == pytest.approx(distance, abs=0.5 if kind == "radix" else 1e-9)
+
+
+def test_inflated_astar_does_not_use_the_radix_heap(grid_graph, compact):
+    adapter = NetworkXGraphAdapter(grid_graph, compact_graph=compact)
+    radix = AStarAlgorithm(priority_queue="radix", parallel_workers=0)
+    heap = AStarAlgorithm(priority_queue="heapq", parallel_workers=0)
+
+    assert radix._open_list_kind(monotone=False) == "heapq"
+    assert radix._open_list_kind(monotone=True) == "radix"
+    for weight in (0.5, 2.0):
+        assert (radix.find_weighted_path(1000, 1143, adapter, weight)
+                == heap.find_weighted_path(1000, 1143, adapter, weight))
@@ -0,0 +1,106 @@
+"""Tests for the reverse geocoding index and LocationModel.reverse_geocode."""
+
+import math
+
+import pytest
+
+from conftest import road_grid
+from core.compact_graph import CompactGraph, highway_class_code
+from core.location_model import LocationModel
+from core.reverse_geocode_index import NO_LABEL, PLACE_LABEL, STREET_LABEL, ReverseGeocodeIndex
+from core.spatial_index import EdgeSpatialIndex, SpatialGridIndex
+
+# Meters per degree, as used by road_grid for edge lengths
+METERS_PER_LAT = 110574
+
+
+def reference_street(graph, node):
+    """Most important named street at a node: lowest class code, then alphabetical."""
+    streets = [(highway_class_code(data["highway"]), data["name"])
+               for _, _, data in graph.edges(node, data=True) if data.get("name")]
+    return min(streets)[1] if streets else None
+
+
+def north_of(graph, node, meters):
+    return graph.nodes[node]["y"] + meters / METERS_PER_LAT, graph.nodes[node]["x"]
+
+
+def build(graph, places=()):
+    compact = CompactGraph.from_networkx(graph, version="v1")
+    names = [name for name, _ in places]
+    lats = [point[0] if point else math.nan for _, point in places]
+    lons = [point[1] if point else math.nan for _, point in places]
+    spatial = SpatialGridIndex.build(compact)
+    return ReverseGeocodeIndex.build(compact, graph, spatial, names, lats, lons, place_radius=60.0,
+                                     places_fingerprint="places-1")
+
+
+@pytest.mark.parametrize("multi", [False, True])
+def test_streets_label_nodes_by_class_then_name(multi):
+    graph = road_grid(multi=multi)
+    index = build(graph)
+
+    for node in graph.nodes:
+        assert index.node_label_of(node) == reference_street(graph, node)
+        assert index.node_kind[index.compact.index_of(node)] == STREET_LABEL
+
+
+def test_arc_streets_follow_the_edges(grid_graph):
+    index = build(grid_graph)
+    compact = index.compact
+    for tail, head in zip(compact.arc_tails().tolist(), compact.indices.tolist()):
+        u, v = int(compact.node_ids[tail]), int(compact.node_ids[head])
+        assert index.street(compact.arc_between(tail, head)) == grid_graph.edges[u, v]["name"]
+
+
+def test_unnamed_edges_leave_nodes_unlabelled(grid_graph):
+    for _, _, data in grid_graph.edges(1000, data=True):
+        del data["name"]
+    index = build(grid_graph)
+
+    assert index.node_label_of(1000) is None
+    assert index.node_kind[index.compact.index_of(1000)] == NO_LABEL
+    assert index.node_label_of(424242) is None
+
+
+def test_nearby_places_override_streets_and_the_closest_wins(grid_graph):
+    places = [
+        ("Far Cafe", north_of(grid_graph, 1066, 40.0)),
+        ("Meskel Square", north_of(grid_graph, 1066, 5.0)),
+        ("Out Of Reach", north_of(grid_graph, 1143, 500.0)),
+        ("Unlocated", None),
+    ]
+    index = build(grid_graph, places)
+
+    assert index.node_label_of(1066) == "Meskel Square"
+    assert index.node_kind[index.compact.index_of(1066)] == PLACE_LABEL
+    assert index.node_label_of(1143) == reference_street(grid_graph, 1143)
+    assert "Unlocated" not in index.labels
+
+
+def test_saved_index_is_checked_against_graph_and_places(grid_graph, tmp_path):
+    index = build(grid_graph, [("Meskel Square", north_of(grid_graph, 1066, 5.0))])
+    index.save(tmp_path)
+
+    loaded = ReverseGeocodeIndex.load(tmp_path, index.compact, "places-1")
+    assert loaded.labels == index.labels
+    assert [loaded.label(node) for node in range(index.compact.num_nodes)] == \
+        [index.label(node) for node in range(index.compact.num_nodes)]
+    assert ReverseGeocodeIndex.load(tmp_path, index.compact, "places-2") is None
+
+    index.compact.version = "v2"
+    assert ReverseGeocodeIndex.load(tmp_path, index.compact, "places-1") is None
+
+
+def test_reverse_geocode_prefers_places_then_edge_streets(grid_graph):
+    index = build(grid_graph, [("Meskel Square", north_of(grid_graph, 1066, 5.0))])
+    compact = index.compact
+    model = LocationModel(grid_graph, spatial_index=SpatialGridIndex.build(compact),
+                          edge_index=EdgeSpatialIndex.build(compact), reverse_index=index)
+
+    assert model.reverse_geocode(*north_of(grid_graph, 1066, 2.0)) == "Meskel Square"
+    # Midway along an edge, its own street names the point
+    a, b = grid_graph.nodes[1030], grid_graph.nodes[1031]
+    assert model.reverse_geocode((a["y"] + b["y"]) / 2, (a["x"] + b["x"]) / 2) == \
+        grid_graph.edges[1030, 1031]["name"]
+    assert LocationModel(grid_graph).reverse_geocode(9.0, 38.75) is None
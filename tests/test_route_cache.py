@@ -0,0 +1,100 @@
+"""Tests for the in-memory LRU route cache."""
+
+import threading
+
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+from services.generic_pathfinding_service import GenericPathfindingService
+from services.route_cache import RouteCache, estimate_result_bytes
+from shared.calculators.generic_path_calculator import GenericPathCalculator
+
+
+def result(path):
+    return {"success": True, "paths": [path], "statistics": {"count": 1}, "algorithm": "Test"}
+
+
+def test_get_returns_stored_result():
+    cache = RouteCache(max_entries=4)
+    cache.put(("a", "b"), result([1, 2, 3]), version="v1")
+
+    assert cache.get(("a", "b"), version="v1")["paths"] == [[1, 2, 3]]
+    assert cache.get(("a", "c"), version="v1") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_evicts_least_recently_used():
+    cache = RouteCache(max_entries=2)
+    cache.put("a", result([1]))
+    cache.put("b", result([2]))
+    cache.get("a")
+    cache.put("c", result([3]))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.evictions == 1
+
+
+def test_byte_accounting_matches_entries():
+    results = {key: result(list(range(key * 10))) for key in range(1, 6)}
+    cache = RouteCache(max_entries=10, max_bytes=10 ** 9)
+    for key, value in results.items():
+        cache.put(key, value)
+    cache.put(3, result([1, 2]))
+
+    expected = sum(estimate_result_bytes(value) for key, value in results.items() if key != 3)
+    assert cache.nbytes == expected + estimate_result_bytes(result([1, 2]))
+
+    limit = cache.nbytes // 2
+    bounded = RouteCache(max_entries=10, max_bytes=limit)
+    for key, value in results.items():
+        bounded.put(key, value)
+    assert bounded.nbytes <= limit
+    assert len(bounded) < len(results)
+
+
+def test_version_change_drops_entries():
+    cache = RouteCache()
+    cache.put("a", result([1, 2]), version="v1")
+
+    assert cache.get("a", version="v2") is None
+    assert len(cache) == 0
+    assert cache.get("a", version="v1") is None
+
+
+def test_returned_copy_does_not_alter_cache():
+    cache = RouteCache()
+    cache.put("a", result([1, 2]))
+    cache.get("a")["extra"] = True
+
+    assert "extra" not in cache.get("a")
+
+
+def test_service_answers_repeated_query_from_cache(grid_graph, compact, recording_algorithm):
+    service = GenericPathfindingService(
+        NetworkXGraphAdapter(grid_graph, compact_graph=compact), recording_algorithm, GenericPathCalculator(),
+        route_cache=RouteCache()
+    )
+    first = service.find_paths(1000, 1143, max_paths=1, cache_key=("bfs",))
+    second = service.find_paths(1000, 1143, max_paths=1, cache_key=("bfs",))
+    service.find_paths(1000, 1143, max_paths=1, cache_key=("dfs",))
+
+    assert second["paths"] == first["paths"]
+    assert recording_algorithm.calls == [(1000, 1143, 1), (1000, 1143, 1)]
+
+
+def test_concurrent_puts_keep_bounds():
+    cache = RouteCache(max_entries=50)
+
+    def fill(offset):
+        for key in range(200):
+            cache.put((offset, key), result([key]))
+            cache.get((offset, key - 1))
+
+    threads = [threading.Thread(target=fill, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == 50
+    # Every result here has the same estimated size
+    assert cache.nbytes == 50 * estimate_result_bytes(result([0]))
@@ -0,0 +1,140 @@
+"""Tests for the SQLite route store."""
+
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from services import route_store
+from services.route_store import RouteStore, decode_paths, encode_paths
+
+
+def result(paths):
+    return {"paths": paths, "statistics": {"count": len(paths)}, "algorithm": "Test"}
+
+
+def stored_bytes(path):
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+
+def age_version(path, version, seconds):
+    """Pretend no process has used the entries of a version for some time."""
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE entries SET last_used = last_used - ? WHERE version = ?", (seconds, version))
+
+
+def test_paths_round_trip():
+    paths = [[1, 2, 3], [10 ** 12, 5], [7]]
+    assert decode_paths(encode_paths(paths)) == paths
+
+
+def test_route_and_matrix_row_round_trip(tmp_path):
+    store = RouteStore(tmp_path / "routes.sqlite")
+    store.put_route(("a", "b"), result([[1, 2, 3], [1, 4, 3]]), version="v1")
+    store.put_matrix_row(("row", 1), [1.5, np.inf, 0.0], version="v1")
+
+    route = store.get_route(("a", "b"), version="v1")
+    assert route["paths"] == [[1, 2, 3], [1, 4, 3]]
+    assert route["statistics"] == {"count": 2}
+    np.testing.assert_array_equal(store.get_matrix_row(("row", 1), version="v1"), [1.5, np.inf, 0.0])
+
+
+def test_replace_keeps_byte_count_exact(tmp_path):
+    path = tmp_path / "routes.sqlite"
+    store = RouteStore(path)
+    for length in (50, 10, 80, 20, 30):
+        store.put_route("key", result([list(range(length))]), version="v1")
+    store.put_route("other", result([[1, 2]]), version="v1")
+
+    assert store.stats()["bytes"] == stored_bytes(path)
+    assert store.get_route("key", version="v1")["paths"] == [list(range(30))]
+
+
+def test_versions_are_isolated(tmp_path):
+    store = RouteStore(tmp_path / "routes.sqlite")
+    store.put_route("key", result([[1, 2]]), version="v1")
+
+    assert store.get_route("key", version="v2") is None
+    assert store.get_route("key", version="v1") is not None
+
+
+def test_compaction_drops_stale_versions_then_least_recently_used(tmp_path):
+    path = tmp_path / "routes.sqlite"
+    store = RouteStore(path, max_bytes=10 ** 9)
+    store.put_route("old", result([list(range(100))]), version="v1")
+    age_version(path, "v1", route_store._STALE_VERSION_AGE + 60)
+    for key in range(5):
+        # Distinct access times keep the LRU order unambiguous
+        time.sleep(0.01)
+        store.put_route(key, result([list(range(100))]), version="v2")
+    # Reading entry 0 makes it the most recently used one
+    store.get_route(0, version="v2")
+
+    size = stored_bytes(path) // 6
+    store.max_bytes = int(size * 3 / 0.8) + 1
+    deleted = store.compact()
+
+    assert deleted == 3
+    assert store.get_route("old", version="v1") is None
+    kept = [key for key in range(5) if store.get_route(key, version="v2") is not None]
+    assert kept == [0, 3, 4]
+    assert store.stats()["bytes"] == stored_bytes(path)
+
+
+def test_compaction_keeps_versions_other_workers_still_use(tmp_path):
+    path = tmp_path / "routes.sqlite"
+    lagging = RouteStore(path, max_bytes=10 ** 9)
+    updated = RouteStore(path, max_bytes=10 ** 9)
+    lagging.put_route("a", result([[1, 2]]), version="v1")
+    updated.put_route("c", result([[5, 6]]), version="v3")
+    updated.put_route("b", result([[3, 4]]), version="v2")
+    age_version(path, "v3", route_store._STALE_VERSION_AGE + 60)
+
+    # v1 is another worker's current graph and v2 is this worker's; only v3 is stale
+    assert updated.compact() == 1
+    assert lagging.get_route("a", version="v1") is not None
+    assert lagging.compact() == 0
+    assert updated.get_route("b", version="v2") is not None
+    assert updated.get_route("c", version="v3") is None
+
+
+def test_size_includes_writes_of_other_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(route_store, "_SIZE_SYNC_PUTS", 4)
+    path = tmp_path / "routes.sqlite"
+    first = RouteStore(path, max_bytes=10 ** 9)
+    second = RouteStore(path, max_bytes=10 ** 9)
+    for key in range(10):
+        first.put_route(key, result([list(range(50))]), version="v1")
+    for key in range(4):
+        second.put_route(("second", key), result([list(range(50))]), version="v1")
+
+    assert second.stats()["bytes"] == stored_bytes(path)
+
+
+def test_concurrent_puts_keep_size_exact(tmp_path):
+    path = tmp_path / "routes.sqlite"
+    store = RouteStore(path, max_bytes=10 ** 9)
+
+    def write(worker):
+        for key in range(40):
+            store.put_route((worker, key % 10), result([list(range(key + 1))]), version="v1")
+
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert store.stats()["bytes"] == stored_bytes(path)
+
+
+def test_clear_empties_store(tmp_path):
+    path = tmp_path / "routes.sqlite"
+    store = RouteStore(path)
+    store.put_route("key", result([[1, 2]]))
+    store.clear()
+
+    assert store.get_route("key") is None
+    assert stored_bytes(path) == 0 and store.stats()["bytes"] == 0
@@ -0,0 +1,72 @@
+"""Tests for run-length route summaries by street and highway class."""
+
+import networkx as nx
+import pytest
+
+from core.compact_graph import highway_class_code, HIGHWAY_CLASSES
+from core.reverse_geocode_index import ReverseGeocodeIndex
+from core.route_summary import RouteSegment, RouteSummaryBuilder
+from core.spatial_index import SpatialGridIndex
+
+
+@pytest.fixture
+def builder(grid_graph, compact):
+    reverse_index = ReverseGeocodeIndex.build(compact, grid_graph, SpatialGridIndex.build(compact))
+    return RouteSummaryBuilder(compact, reverse_index)
+
+
+def reference_summary(graph, path, named=True):
+    """Edge-by-edge run-length encoding of (street, highway class)."""
+    segments = []
+    for position, (u, v) in enumerate(zip(path, path[1:])):
+        data = graph.edges[u, v]
+        key = (data["name"] if named else None, HIGHWAY_CLASSES[highway_class_code(data["highway"])])
+        if segments and (segments[-1][0], segments[-1][1]) == key:
+            segments[-1][2] += data["length"]
+            segments[-1][4] = position + 1
+        else:
+            segments.append([key[0], key[1], data["length"], position, position + 1])
+    return [RouteSegment(*segment) for segment in segments]
+
+
+def assert_same_segments(actual, expected):
+    assert [(s.name, s.highway, s.start, s.end) for s in actual] == \
+        [(s.name, s.highway, s.start, s.end) for s in expected]
+    assert [s.distance for s in actual] == pytest.approx([s.distance for s in expected])
+
+
+@pytest.mark.parametrize("start, goal", [(1000, 1143), (1011, 1132), (1000, 1011), (1070, 1005)])
+def test_summaries_match_edge_by_edge_encoding(grid_graph, builder, start, goal):
+    path = nx.shortest_path(grid_graph, start, goal, weight="length")
+    segments = builder.summarize(path)
+
+    assert_same_segments(segments, reference_summary(grid_graph, path))
+    assert sum(s.distance for s in segments) == pytest.approx(nx.path_weight(grid_graph, path, "length"))
+    # Segments tile the path and consecutive ones always differ
+    assert segments[0].start == 0 and segments[-1].end == len(path) - 1
+    for before, after in zip(segments, segments[1:]):
+        assert before.end == after.start
+        assert (before.name, before.highway) != (after.name, after.highway)
+
+
+def test_without_reverse_index_only_highway_classes_split(grid_graph, compact):
+    path = list(range(1000, 1012))
+    segments = RouteSummaryBuilder(compact).summarize(path)
+
+    assert_same_segments(segments, reference_summary(grid_graph, path, named=False))
+    assert segments[0].to_dict()["name"] == f"Unnamed {segments[0].highway} road"
+
+
+def test_hops_between_unlinked_nodes_are_unnamed_and_free(grid_graph, builder):
+    # 1001 -> 1050 is not an edge
+    segments = builder.summarize([1000, 1001, 1050, 1051])
+
+    hop = [segment for segment in segments if segment.start == 1]
+    assert hop == [RouteSegment(None, "other", 0.0, 1, 2)]
+    assert sum(s.distance for s in segments) == pytest.approx(
+        grid_graph.edges[1000, 1001]["length"] + grid_graph.edges[1050, 1051]["length"])
+
+
+@pytest.mark.parametrize("path", [[], [1000], [1000, 424242]])
+def test_short_or_unknown_paths_have_no_segments(builder, path):
+    assert builder.summarize(path) == []
@@ -0,0 +1,80 @@
+"""Tests for the precomputed route table and how the service falls back from it."""
+
+import networkx as nx
+import pytest
+
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+from services.generic_pathfinding_service import GenericPathfindingService
+from services.route_table import RouteTable
+from shared.calculators.generic_path_calculator import GenericPathCalculator
+from shared.constraints.node_limit_constraint import NodeLimitConstraint
+
+LOCATIONS = [1000, 1011, 1077, 1143]
+
+
+def dijkstra_search(graph):
+    def search(start, goal, max_paths):
+        return [nx.dijkstra_path(graph, start, goal, weight="length")]
+    return search
+
+
+def build_table(grid_graph, compact, max_paths=1):
+    names = [f"Location {node}" for node in LOCATIONS]
+    return RouteTable.build(compact, names, LOCATIONS, {"dijkstra": dijkstra_search(grid_graph)}, max_paths)
+
+
+def test_lookup_matches_search(grid_graph, compact):
+    table = build_table(grid_graph, compact)
+
+    for start in LOCATIONS:
+        for goal in LOCATIONS:
+            if start != goal:
+                expected = nx.dijkstra_path(grid_graph, start, goal, weight="length")
+                assert table.paths("dijkstra", start, goal, 1) == [expected]
+    assert table.paths("dijkstra", 1000, 1000, 1) is None
+    assert table.paths("dijkstra", 1000, 1001, 1) is None
+    assert table.paths("bfs", 1000, 1011, 1) is None
+
+
+def test_other_max_paths_is_not_served(grid_graph, compact):
+    table = build_table(grid_graph, compact, max_paths=1)
+    assert table.paths("dijkstra", 1000, 1011, 3) is None
+
+
+def test_save_and_load(grid_graph, compact, tmp_path):
+    table = build_table(grid_graph, compact)
+    table.fingerprint = "f1"
+    table.save(tmp_path)
+
+    loaded = RouteTable.load(tmp_path, compact, fingerprint="f1")
+    assert loaded.paths("dijkstra", 1000, 1143, 1) == table.paths("dijkstra", 1000, 1143, 1)
+    assert RouteTable.load(tmp_path, compact, fingerprint="f2") is None
+
+
+@pytest.fixture
+def service(grid_graph, compact, recording_algorithm):
+    return GenericPathfindingService(
+        NetworkXGraphAdapter(grid_graph, compact_graph=compact), recording_algorithm, GenericPathCalculator(),
+        route_table=build_table(grid_graph, compact), table_algorithm="dijkstra"
+    )
+
+
+def test_service_reads_table(grid_graph, service, recording_algorithm):
+    result = service.find_paths(1000, 1143, max_paths=1)
+
+    assert result["success"] and recording_algorithm.calls == []
+    assert result["paths"] == [nx.dijkstra_path(grid_graph, 1000, 1143, weight="length")]
+
+
+def test_service_searches_when_stored_path_breaks_constraint(grid_graph, service, recording_algorithm):
+    stored = service.route_table.paths("dijkstra", 1000, 1143, 1)[0]
+    result = service.find_paths(1000, 1143, [NodeLimitConstraint(len(stored) - 1)], max_paths=1)
+
+    assert recording_algorithm.calls == [(1000, 1143, 1)]
+    assert result["paths"] == [nx.shortest_path(grid_graph, 1000, 1143)]
+
+
+def test_service_searches_for_other_max_paths(service, recording_algorithm):
+    service.find_paths(1000, 1143, max_paths=3)
+
+    assert recording_algorithm.calls == [(1000, 1143, 3)]
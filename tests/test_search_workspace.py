@@ -0,0 +1,98 @@
+"""Tests for the epoch-stamped search workspace and the searches that reuse it."""
+
+import threading
+
+import networkx as nx
+import pytest
+
+from algorithms.astar_improved import AStarAlgorithm
+from algorithms.bfs import BFSAlgorithm
+from algorithms.dfs_classic import ClassicDFSAlgorithm
+from core.networkx_graph_adapter import NetworkXGraphAdapter
+from core.search_workspace import SearchWorkspace, borrow_workspace
+
+PAIRS = [(1000, 1143), (1011, 1132), (1070, 1005), (1143, 1000), (1060, 1067)]
+
+
+@pytest.fixture
+def adapter(grid_graph, compact):
+    return NetworkXGraphAdapter(grid_graph, compact_graph=compact)
+
+
+def test_begin_invalidates_every_label():
+    workspace = SearchWorkspace(4)
+    epoch = workspace.begin()
+    for node, parent in ((0, -1), (1, 0), (2, 1)):
+        workspace.stamp[node] = epoch
+        workspace.parent[node] = parent
+        workspace.touched[workspace.touched_count] = node
+        workspace.touched_count += 1
+    assert workspace.visited() == [0, 1, 2] and workspace.path_to(2) == [0, 1, 2]
+
+    workspace.begin()
+    assert workspace.visited() == []
+    assert all(stamp != workspace.epoch for stamp in workspace.stamp)
+
+
+def test_borrowing_reuses_one_workspace_per_thread():
+    with borrow_workspace(10) as first:
+        first_epoch = first.epoch
+        # A nested search gets its own workspace
+        with borrow_workspace(10) as nested:
+            assert nested is not first
+    with borrow_workspace(10) as again:
+        assert again is first and again.epoch == first_epoch + 1
+
+    other = []
+
+    def borrow():
+        with borrow_workspace(10) as workspace:
+            other.append(workspace)
+
+    thread = threading.Thread(target=borrow)
+    thread.start()
+    thread.join()
+    assert other[0] is not first
+
+
+def test_queues_come_back_empty():
+    workspace = SearchWorkspace(8)
+    queue = workspace.priority_queue("heapq")
+    queue.push(3, 1.0)
+    assert workspace.priority_queue("heapq") is queue and not queue
+
+
+def test_consecutive_searches_do_not_leak_labels(grid_graph, adapter):
+    astar = AStarAlgorithm(parallel_workers=0)
+    bfs = BFSAlgorithm()
+    # Interleave algorithms and repeat pairs so stale labels would show up
+    for start, goal in PAIRS + PAIRS[::-1]:
+        path = astar.find_path(start, goal, adapter, max_paths=1)[0]
+        assert nx.path_weight(grid_graph, path, "length") == pytest.approx(
+            nx.shortest_path_length(grid_graph, start, goal, weight="length"))
+
+        hops = bfs.find_path(start, goal, adapter)[0]
+        assert len(hops) - 1 == nx.shortest_path_length(grid_graph, start, goal)
+
+        walk = ClassicDFSAlgorithm().find_path(start, goal, adapter, max_paths=1)[0]
+        assert walk[0] == start and walk[-1] == goal and nx.is_path(grid_graph, walk)
+
+
+def test_threads_search_with_separate_workspaces(grid_graph, adapter):
+    expected = {pair: nx.shortest_path_length(grid_graph, *pair, weight="length") for pair in PAIRS}
+    failures = []
+
+    def search():
+        astar = AStarAlgorithm(parallel_workers=0)
+        for _ in range(20):
+            for start, goal in PAIRS:
+                path = astar.find_path(start, goal, adapter, max_paths=1)[0]
+                if nx.path_weight(grid_graph, path, "length") != pytest.approx(expected[start, goal]):
+                    failures.append((start, goal))
+
+    threads = [threading.Thread(target=search) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert failures == []
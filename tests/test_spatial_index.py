@@ -0,0 +1,79 @@
+"""Tests for the grid spatial index against brute force."""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from core.compact_graph import CompactGraph
+from core.spatial_index import SpatialGridIndex
+from shared.utils.geo import utm_project_point
+
+
+def query_points(count=300, seed=7):
+    """Points over the grid and up to a few hundred meters beyond it."""
+    rng = random.Random(seed)
+    return [(9.0 + rng.uniform(-0.004, 0.015), 38.75 + rng.uniform(-0.004, 0.015)) for _ in range(count)]
+
+
+def brute_force_node(compact, lat, lon):
+    x, y = utm_project_point(lat, lon)
+    distances = np.hypot(compact.x - x, compact.y - y)
+    return float(distances.min())
+
+
+@pytest.mark.parametrize("cell_size", [50.0, 150.0, 1000.0])
+def test_nearest_node_matches_brute_force(compact, cell_size):
+    index = SpatialGridIndex.build(compact, cell_size)
+    for lat, lon in query_points():
+        node, distance = index.nearest(lat, lon)
+        assert distance == pytest.approx(brute_force_node(compact, lat, lon))
+        x, y = utm_project_point(lat, lon)
+        assert math.hypot(compact.x[node] - x, compact.y[node] - y) == pytest.approx(distance)
+
+
+def test_save_and_load(compact, tmp_path):
+    index = SpatialGridIndex.build(compact)
+    index.save(tmp_path)
+    loaded = SpatialGridIndex.load(tmp_path, compact)
+
+    lat, lon = query_points(1)[0]
+    assert loaded.nearest(lat, lon) == index.nearest(lat, lon)
+
+
+def test_nearest_node_returns_original_id(compact):
+    index = SpatialGridIndex.build(compact)
+    lat, lon = compact.lat[17], compact.lon[17]
+
+    assert index.nearest_node(lat, lon) == int(compact.node_ids[17])
+
+
+def test_load_rejects_other_cell_size_or_graph(grid_graph, compact, tmp_path):
+    SpatialGridIndex.build(compact).save(tmp_path)
+
+    assert SpatialGridIndex.load(tmp_path, compact, cell_size=300.0) is None
+    assert SpatialGridIndex.load(tmp_path, CompactGraph.from_networkx(grid_graph, version="v2")) is None
+
+
+def test_nearest_many_matches_single_lookups(compact):
+    index = SpatialGridIndex.build(compact)
+    points = query_points()
+    _, distances = index.nearest_many([lat for lat, _ in points], [lon for _, lon in points], chunk_size=64)
+
+    for (lat, lon), distance in zip(points, distances.tolist()):
+        assert distance == pytest.approx(index.nearest(lat, lon)[1])
+        assert distance == pytest.approx(brute_force_node(compact, lat, lon))
+
+
+def test_nearest_many_skips_non_finite_rows(compact):
+    index = SpatialGridIndex.build(compact)
+    lats = np.array([9.003, np.nan, 9.004, np.inf, 9.005, 9.006])
+    lons = np.array([38.753, 38.754, -np.inf, 38.755, np.nan, 38.756])
+    nearest, distances = index.nearest_many(lats, lons, chunk_size=2)
+
+    assert nearest[[1, 2, 3, 4]].tolist() == [-1] * 4
+    assert np.isinf(distances[[1, 2, 3, 4]]).all()
+    for row in (0, 5):
+        assert (nearest[row], distances[row]) == pytest.approx(index.nearest(lats[row], lons[row]))
+    assert index.nearest(np.nan, 38.75) is None and index.nearest_node(9.0, np.inf) is None
@@ -0,0 +1,94 @@
+"""Tests for hourly speed profiles and time-dependent A*."""
+
+import heapq
+import math
+from datetime import datetime, time
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from algorithms.time_dependent_astar import TimeDependentAStarAlgorithm
+from config.settings import ARTERIAL_HIGHWAY_CLASSES, FREE_FLOW_SPEED_KMH, HOURLY_SPEED_FACTORS
+from core.compact_graph import CompactGraph
+from core.speed_profiles import SECONDS_PER_DAY, SpeedProfileTable, seconds_after_midnight
+
+# Speeds collapse from full to a fifth between 07:00 and 08:00 and recover at 18:00
+STEEP_FACTORS = {
+    "arterial": (1.0,) * 7 + (1.0,) + (0.2,) * 10 + (1.0,) * 6,
+    "local": (1.0,) * 7 + (1.0,) + (0.2,) * 10 + (1.0,) * 6,
+}
+
+
+@pytest.fixture
+def profiles(compact):
+    return SpeedProfileTable.from_speeds(compact, FREE_FLOW_SPEED_KMH, HOURLY_SPEED_FACTORS,
+                                         ARTERIAL_HIGHWAY_CLASSES)
+
+
+def earliest_arrivals(table, source_index, departure):
+    """Reference time-dependent Dijkstra without a heuristic."""
+    compact = table.compact
+    arrivals = {source_index: departure}
+    heap = [(departure, source_index)]
+    offsets = compact.arc_offsets()
+    while heap:
+        arrival, node = heapq.heappop(heap)
+        if arrival > arrivals[node]:
+            continue
+        for position, neighbor in enumerate(compact.neighbor_lists()[node]):
+            reached = table.arrival_time(offsets[node] + position, arrival)
+            if reached < arrivals.get(neighbor, math.inf):
+                arrivals[neighbor] = reached
+                heapq.heappush(heap, (reached, neighbor))
+    return arrivals
+
+
+def test_departure_time_normalization():
+    assert seconds_after_midnight(time(7, 30, 15)) == 7 * 3600 + 30 * 60 + 15
+    assert seconds_after_midnight(datetime(2024, 5, 1, 17, 0)) == 17 * 3600
+    assert seconds_after_midnight(3600) == 3600.0
+
+
+def test_rush_hour_is_slower_than_night(profiles):
+    arc = 0
+    assert profiles.travel_time(arc, 8 * 3600) > profiles.travel_time(arc, 2 * 3600)
+    # The profile wraps around midnight
+    assert profiles.travel_time(arc, 2 * 3600 + SECONDS_PER_DAY) == pytest.approx(profiles.travel_time(arc, 2 * 3600))
+
+
+@pytest.mark.parametrize("length", [100.0, 5_000.0, 60_000.0])
+def test_arrival_is_fifo_even_on_long_arcs(length):
+    graph = nx.Graph()
+    graph.add_node(1, y=9.0, x=38.75)
+    graph.add_node(2, y=9.001, x=38.75)
+    graph.add_edge(1, 2, length=length, highway="primary")
+    table = SpeedProfileTable.from_speeds(CompactGraph.from_networkx(graph, version="v1"),
+                                          FREE_FLOW_SPEED_KMH, STEEP_FACTORS, ARTERIAL_HIGHWAY_CLASSES)
+
+    departures = np.arange(0.0, SECONDS_PER_DAY, 30.0)
+    arrivals = np.array([table.arrival_time(0, departure) for departure in departures])
+    assert (np.diff(arrivals) >= -1e-6).all()
+    assert (arrivals >= departures).all()
+
+
+@pytest.mark.parametrize("departure", [3 * 3600, 8 * 3600, 17.5 * 3600])
+def test_search_matches_time_dependent_dijkstra(profiles, departure):
+    compact = profiles.compact
+    search = TimeDependentAStarAlgorithm(profiles)
+    reference = earliest_arrivals(profiles, compact.index_of(1000), departure)
+
+    for goal in (1143, 1077, 1011):
+        route = search.find_route(1000, goal, departure)
+        assert route["arrival_time"] == pytest.approx(reference[compact.index_of(goal)])
+        # Reported times are those of driving the returned path
+        indices = [compact.index_of(node) for node in route["path"]]
+        assert route["arrival_times"] == pytest.approx(profiles.path_arrival_times(indices, departure))
+
+
+def test_profiles_round_trip_and_reject_other_settings(profiles, tmp_path):
+    profiles.save(tmp_path)
+    loaded = SpeedProfileTable.load(tmp_path, profiles.compact, profiles.fingerprint)
+
+    np.testing.assert_array_equal(loaded.pace, profiles.pace)
+    assert SpeedProfileTable.load(tmp_path, profiles.compact, "other settings") is None
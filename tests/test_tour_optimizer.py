@@ -0,0 +1,94 @@
+"""Tests for the multi-stop tour optimizer against brute force."""
+
+import itertools
+import math
+import random
+import time
+
+import pytest
+
+from algorithms.tour_optimizer import TourOptimizer, TourProblem
+
+
+def random_matrix(size, seed, symmetric=True):
+    rng = random.Random(seed)
+    costs = [[0.0 if i == j else rng.uniform(1.0, 100.0) for j in range(size)] for i in range(size)]
+    if symmetric:
+        for i in range(size):
+            for j in range(i):
+                costs[i][j] = costs[j][i]
+    return costs
+
+
+def objective(optimizer, problem, order):
+    cost, lateness, _, _ = optimizer.evaluate(problem, order)
+    return cost + optimizer.lateness_penalty * lateness
+
+
+def brute_force_cost(optimizer, problem):
+    return min(objective(optimizer, problem, list(order))
+               for order in itertools.permutations(range(1, problem.size)))
+
+
+@pytest.mark.parametrize("symmetric", [True, False])
+@pytest.mark.parametrize("return_to_start", [True, False])
+def test_reported_cost_is_exact_and_improves_construction(symmetric, return_to_start):
+    optimizer = TourOptimizer(time_budget=1.0)
+    for seed in range(20):
+        problem = TourProblem(random_matrix(8, seed, symmetric), return_to_start=return_to_start)
+        solution = optimizer.solve(problem)
+        construction = TourOptimizer(time_budget=0.0).solve(problem)
+
+        assert sorted(solution.order) == list(range(1, 8))
+        assert solution.cost == pytest.approx(optimizer.evaluate(problem, solution.order)[0])
+        assert brute_force_cost(optimizer, problem) - 1e-9 <= solution.cost <= construction.cost + 1e-9
+
+
+def test_finds_optimum_for_points_on_a_circle():
+    # Any tour without crossings is optimal for points in convex position, and 2-opt removes crossings
+    rng = random.Random(3)
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(9))
+    rng.shuffle(angles)
+    points = [(math.cos(angle), math.sin(angle)) for angle in angles]
+    costs = [[math.dist(a, b) for b in points] for a in points]
+    optimizer = TourOptimizer(time_budget=1.0)
+    problem = TourProblem(costs)
+
+    assert optimizer.solve(problem).cost == pytest.approx(brute_force_cost(optimizer, problem))
+
+
+def test_capacity_splits_into_feasible_trips():
+    problem = TourProblem(random_matrix(9, 4), demands=[0, 2, 1, 3, 2, 1, 2, 3, 1], capacity=5)
+    solution = TourOptimizer(time_budget=1.0).solve(problem)
+
+    assert sorted(stop for trip in solution.trips for stop in trip) == list(range(1, 9))
+    assert all(sum(problem.demands[stop] for stop in trip) <= 5 for trip in solution.trips)
+
+
+def test_time_windows_are_met_when_possible():
+    # Stops on a line; the windows require visiting them from the far end back
+    positions = [0.0, 10.0, 20.0, 30.0, 40.0]
+    costs = [[abs(a - b) for b in positions] for a in positions]
+    windows = [None, (75.0, 85.0), (65.0, 75.0), (55.0, 65.0), (0.0, 45.0)]
+    problem = TourProblem(costs, time_windows=windows, return_to_start=False)
+    optimizer = TourOptimizer(time_budget=1.0)
+    solution = optimizer.solve(problem)
+
+    assert solution.feasible
+    assert solution.order == [4, 3, 2, 1]
+    assert objective(optimizer, problem, solution.order) == pytest.approx(brute_force_cost(optimizer, problem))
+
+
+def test_rejects_demand_above_capacity():
+    problem = TourProblem(random_matrix(4, 1), demands=[0, 1, 9, 1], capacity=5)
+    with pytest.raises(ValueError):
+        TourOptimizer().solve(problem)
+
+
+def test_stops_at_time_budget():
+    problem = TourProblem(random_matrix(400, 9), demands=[0] + [1] * 399, capacity=20)
+    started = time.perf_counter()
+    solution = TourOptimizer(time_budget=0.2).solve(problem)
+
+    assert time.perf_counter() - started < 2.0
+    assert sorted(solution.order) == list(range(1, 400))
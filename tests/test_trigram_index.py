@@ -0,0 +1,50 @@
+"""Tests for the trigram index against scoring every name."""
+
+import math
+
+import pytest
+
+from services.trigram_index import TrigramIndex, name_trigrams
+
+QUERIES = ["piaza", "Piassa Mall", "merkatto", "arat kilo", "kasanchis hotel", "bole 12", "cafe", "zzz", "",
+           "medane alem", "sarris"]
+
+
+def brute_force(names, query, cutoff):
+    """(name, score) of every name holding at least the cutoff share of the query's trigrams."""
+    query_grams = name_trigrams(query)
+    if not query_grams:
+        return {}
+    needed = max(1, math.ceil(cutoff * len(query_grams)))
+    matches = {}
+    for name in names:
+        shared = len(query_grams & name_trigrams(name))
+        if shared >= needed:
+            matches[name] = shared / len(query_grams)
+    return matches
+
+
+@pytest.mark.parametrize("cutoff", [0.3, 0.6, 1.0])
+def test_matches_brute_force(place_names, cutoff):
+    index = TrigramIndex(place_names)
+    for query in QUERIES:
+        expected = brute_force(place_names, query, cutoff)
+        found = index.search(query, limit=len(place_names), cutoff=cutoff)
+
+        assert dict(found) == pytest.approx(expected)
+        scores = [score for _, score in found]
+        assert scores == sorted(scores, reverse=True)
+
+
+def test_limit_keeps_best_scores(place_names):
+    index = TrigramIndex(place_names)
+    everything = index.search("piaza mall", limit=len(place_names), cutoff=0.3)
+    top = index.search("piaza mall", limit=5, cutoff=0.3)
+
+    assert top == everything[:5]
+
+
+def test_spelling_variants_score_full():
+    index = TrigramIndex(["Piassa", "Bole"])
+    assert index.search("Piazza") == [("Piassa", 1.0)]
+    assert index.search("piaza", cutoff=1.0) == [("Piassa", 1.0)]
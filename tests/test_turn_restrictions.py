@@ -0,0 +1,143 @@
+"""Tests for turn restrictions, turn costs and turn-aware A*."""
+
+import heapq
+import json
+import math
+
+import pytest
+
+from algorithms.turn_aware_astar import TurnAwareAStarAlgorithm
+from config.settings import MAJOR_ROAD_CLASSES, MAJOR_ROAD_LEFT_TURN_PENALTY, TURN_PENALTIES, TURN_PENALTY_ROAD_CLASSES
+from core.compact_graph import CompactGraph
+from core.edge_based_graph import EdgeBasedGraph, parse_way_ids
+from core.turn_restrictions import TurnRestriction, load_turn_restrictions
+
+SIZE = 12
+
+
+def node(row, column):
+    return 1000 + row * SIZE + column
+
+
+@pytest.fixture
+def way_graph(grid_graph):
+    """The grid with OSM way ids: way 10 + row along rows, way 100 + column along columns."""
+    graph = grid_graph.copy()
+    for u, v, data in graph.edges(data=True):
+        row_u, column_u = divmod(u - 1000, SIZE)
+        row_v, _ = divmod(v - 1000, SIZE)
+        data["osmid"] = 10 + row_u if row_u == row_v else 100 + column_u
+    return graph
+
+
+def reference_cost(edge_graph, start, goal, scale=1.0):
+    """Dijkstra with one state per arc everywhere, the textbook edge-based expansion."""
+    compact = edge_graph.compact
+    lengths = compact.arc_lengths()
+    source, target = compact.index_of(start), compact.index_of(goal)
+    heap = []
+    best = {}
+    for arc in range(compact.indptr[source], compact.indptr[source + 1]):
+        best[arc] = lengths[arc]
+        heapq.heappush(heap, (lengths[arc], arc))
+    while heap:
+        cost, arc = heapq.heappop(heap)
+        if cost > best[arc]:
+            continue
+        head = int(compact.indices[arc])
+        if head == target:
+            return cost
+        for out_arc in range(compact.indptr[head], compact.indptr[head + 1]):
+            turn = edge_graph.turn_cost(arc, out_arc)
+            if turn == math.inf:
+                continue
+            reached = cost + turn * scale + lengths[out_arc]
+            if reached < best.get(out_arc, math.inf):
+                best[out_arc] = reached
+                heapq.heappush(heap, (reached, out_arc))
+    return math.inf
+
+
+def uses_turn(path, turn):
+    return any(tuple(path[i:i + 3]) == turn for i in range(len(path) - 2))
+
+
+@pytest.mark.parametrize("penalized", [None, TURN_PENALTY_ROAD_CLASSES], ids=["everywhere", "major-roads"])
+def test_costs_match_full_edge_based_search(compact, penalized):
+    edge_graph = EdgeBasedGraph(compact, TURN_PENALTIES, MAJOR_ROAD_CLASSES, MAJOR_ROAD_LEFT_TURN_PENALTY,
+                                penalized_road_classes=penalized)
+    search = TurnAwareAStarAlgorithm(edge_graph)
+
+    for start, goal in ((node(0, 0), node(11, 11)), (node(3, 9), node(10, 1)), (node(6, 6), node(6, 0))):
+        route = search.find_route(start, goal, turn_cost_scale=10.0)
+        assert route["cost"] == pytest.approx(reference_cost(edge_graph, start, goal, scale=10.0))
+        assert route["cost"] == pytest.approx(route["distance"] + route["turn_cost"])
+
+
+def test_prohibited_turn_is_never_taken(way_graph):
+    compact = CompactGraph.from_networkx(way_graph, version="v1")
+    start, goal = node(5, 0), node(11, 5)
+    free = TurnAwareAStarAlgorithm(EdgeBasedGraph(compact, {})).find_route(start, goal)
+
+    # Ban the first turn the free route takes from a row onto a column
+    path = free["path"]
+    i = next(i for i in range(1, len(path) - 1)
+             if way_graph[path[i - 1]][path[i]]["osmid"] < 100 <= way_graph[path[i]][path[i + 1]]["osmid"])
+    restriction = TurnRestriction("no_left_turn", from_way=way_graph[path[i - 1]][path[i]]["osmid"],
+                                  via_node=path[i], to_way=way_graph[path[i]][path[i + 1]]["osmid"])
+    edge_graph = EdgeBasedGraph.from_restrictions(compact, way_graph, [restriction], {})
+
+    # The ways run through the via node, so the ban covers both directions of each
+    row, column = divmod(path[i] - 1000, SIZE)
+    banned = {(node(row, a), path[i], node(b, column)) for a in (column - 1, column + 1) for b in (row - 1, row + 1)}
+    assert edge_graph.num_restricted_turns == len(banned)
+
+    route = TurnAwareAStarAlgorithm(edge_graph).find_route(start, goal)
+    assert not any(uses_turn(route["path"], turn) for turn in banned)
+    assert route["cost"] >= free["cost"]
+    assert route["cost"] == pytest.approx(reference_cost(edge_graph, start, goal))
+
+
+def test_mandatory_turn_bans_every_other_exit(way_graph):
+    compact = CompactGraph.from_networkx(way_graph, version="v1")
+    via = node(5, 5)
+    restriction = TurnRestriction("only_straight_on", from_way=15, via_node=via, to_way=15)
+    edge_graph = EdgeBasedGraph.from_restrictions(compact, way_graph, [restriction], {})
+
+    via_index = compact.index_of(via)
+    in_arc = compact.arc_between(compact.index_of(node(5, 4)), via_index)
+    allowed = {
+        int(compact.node_ids[compact.indices[out_arc]])
+        for out_arc in range(compact.indptr[via_index], compact.indptr[via_index + 1])
+        if edge_graph.turn_cost(in_arc, out_arc) != math.inf
+    }
+    assert allowed == {node(5, 6)}
+
+
+def test_restriction_files_in_both_layouts(tmp_path):
+    plain = tmp_path / "plain.json"
+    plain.write_text(json.dumps([
+        {"restriction": "no_u_turn", "from_way": 1, "via_node": 2, "to_way": 1},
+        {"restriction": "no_parking", "from_way": 1, "via_node": 2, "to_way": 3},
+    ]))
+    overpass = tmp_path / "overpass.json"
+    overpass.write_text(json.dumps({"elements": [
+        {"type": "relation", "tags": {"restriction": "only_left_turn"},
+         "members": [{"type": "way", "ref": 7, "role": "from"}, {"type": "node", "ref": 8, "role": "via"},
+                     {"type": "way", "ref": 9, "role": "to"}]},
+        # Via-way restrictions are skipped
+        {"type": "relation", "tags": {"restriction": "no_left_turn"},
+         "members": [{"type": "way", "ref": 7, "role": "from"}, {"type": "way", "ref": 8, "role": "via"},
+                     {"type": "way", "ref": 9, "role": "to"}]},
+    ]}))
+
+    assert load_turn_restrictions(plain) == [TurnRestriction("no_u_turn", 1, 2, 1)]
+    assert load_turn_restrictions(overpass) == [TurnRestriction("only_left_turn", 7, 8, 9)]
+    assert load_turn_restrictions(tmp_path / "missing.json") == []
+
+
+@pytest.mark.parametrize("value, expected", [
+    (42, {42}), ([1, 2], {1, 2}), ("[3, 4]", {3, 4}), ("5", {5}), (None, set()), ("not ids", set()),
+])
+def test_parse_way_ids(value, expected):
+    assert parse_way_ids(value) == expected
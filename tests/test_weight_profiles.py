@@ -0,0 +1,74 @@
+"""Tests for weight profiles and their cached per-arc arrays."""
+
+import math
+
+import numpy as np
+import pytest
+
+from core.compact_graph import HIGHWAY_CLASSES
+from core.weight_profiles import WeightProfile, WeightProfileRegistry
+
+SPEEDS = {"primary": 50.0, "secondary": 40.0, "tertiary": 30.0, "residential": 20.0, "other": 25.0}
+
+
+def test_travel_time_is_length_over_speed(compact):
+    weights = WeightProfile.travel_time(SPEEDS).compute(compact)
+    speeds = np.array([SPEEDS.get(highway, SPEEDS["other"]) for highway in HIGHWAY_CLASSES])
+
+    np.testing.assert_allclose(weights, compact.length / (speeds[compact.highway] / 3.6))
+    assert weights.flags["C_CONTIGUOUS"]
+
+
+def test_forbidden_class_costs_infinity(compact):
+    profile = WeightProfile("no_primary", {"primary": math.inf})
+    weights = profile.compute(compact)
+    primary = compact.highway == HIGHWAY_CLASSES.index("primary")
+
+    assert primary.any() and np.isinf(weights[primary]).all()
+    np.testing.assert_array_equal(weights[~primary], compact.length[~primary])
+
+
+@pytest.mark.parametrize("change", [
+    lambda profile: setattr(profile, "unit", "seconds"),
+    lambda profile: profile.cost_per_meter.update(primary=2.0),
+    lambda profile: setattr(profile, "default_cost_per_meter", 1.5),
+])
+def test_fingerprint_covers_costs_and_unit(change):
+    profile = WeightProfile("custom", {"residential": 1.2})
+    before = profile.fingerprint
+    assert WeightProfile("custom", {"residential": 1.2}).fingerprint == before
+
+    change(profile)
+    assert profile.fingerprint != before
+
+
+def test_registry_reuses_cached_arrays_until_the_model_changes(compact, tmp_path, monkeypatch):
+    registry = WeightProfileRegistry(compact, cache_dir=tmp_path)
+    registry.register(WeightProfile("custom", {"residential": 2.0}))
+    expected = registry.weights("custom")
+
+    computed = []
+    original = WeightProfile.compute
+    monkeypatch.setattr(WeightProfile, "compute",
+                        lambda self, graph: computed.append(self.name) or original(self, graph))
+
+    reloaded = WeightProfileRegistry(compact, cache_dir=tmp_path)
+    reloaded.register(WeightProfile("custom", {"residential": 2.0}))
+    np.testing.assert_array_equal(reloaded.weights("custom"), expected)
+    assert computed == []
+
+    # Same per-class costs in another unit must not reuse the cached array
+    relabeled = WeightProfileRegistry(compact, cache_dir=tmp_path)
+    relabeled.register(WeightProfile("custom", {"residential": 2.0}, unit="seconds"))
+    relabeled.weights("custom")
+    assert computed == ["custom"]
+
+
+def test_weight_list_matches_array_and_unknown_names_raise(compact):
+    registry = WeightProfileRegistry(compact)
+    registry.register(WeightProfile.distance())
+
+    assert registry.weight_list("distance") == compact.length.tolist()
+    assert registry.names() == ["distance"]
+    with pytest.raises(KeyError):
+        registry.weights("travel_time")